@@ -9,23 +9,31 @@ if not os.environ.get("BEARTYPE_DISABLE"):
 
     beartype_this_package()
 
+from .common.Relationship import ChildOf, Relationship
+from .common.Transform import GlobalTransform, LocalTransform
 from .common.Types import UUID4, Component, Entity, SuccessOrFailure
 from .containers.Archetype import Archetype
 from .containers.ComponentStorage import ComponentStorage
+from .containers.Prefab import Prefab
 from .core.World import ECSWorld
 from .exceptions import (
     ComponentNotFoundError,
     EntityNotFoundError,
     OperationFailedError,
     PyECSError,
+    SystemOrderError,
 )
+from .exporting.Export import ArchetypeExport
 from .helpers.Statuses import StatusCodes
 from .managers.EntityManager import EntityManager
+from .processing.TransformSystem import TransformSystem
 from .querying.Query import Query
 
 __all__ = [
     "UUID4",
     "Archetype",
+    "ArchetypeExport",
+    "ChildOf",
     "Component",
     "ComponentNotFoundError",
     "ComponentStorage",
@@ -33,11 +41,18 @@ __all__ = [
     "Entity",
     "EntityManager",
     "EntityNotFoundError",
+    "GlobalTransform",
+    "LocalTransform",
     "OperationFailedError",
+    "Prefab",
     "PyECSError",
     "Query",
+    "Relationship",
     "StatusCodes",
     "SuccessOrFailure",
+    "SystemOrderError",
+    "TransformSystem",
+    "__version__",
 ]
 
 __version__ = "0.1.0"
@@ -0,0 +1,79 @@
+from dataclasses import dataclass
+from typing import Literal
+
+from pyecs.benchmarks.Results import SuiteResults
+
+type Verdict = Literal["regressed", "improved", "unchanged", "missing"]
+
+DEFAULT_THRESHOLD: float = 0.10
+
+
+@dataclass(frozen=True)
+class Comparison:
+    scenario: str
+    size: str
+    baseline: float
+    candidate: float
+    ratio: float
+    verdict: Verdict
+
+
+def compare(
+    baseline: SuiteResults, candidate: SuiteResults, threshold: float = DEFAULT_THRESHOLD
+) -> list[Comparison]:
+    """
+    Compare two benchmark result files scenario by scenario.
+
+    A measurement regressed when its candidate mean is more than threshold
+    above the baseline mean and the two 95% confidence intervals do not
+    overlap, so noise alone does not fail a run. Improvements use the same
+    rule in the other direction. Sizes only present in the baseline are
+    reported as missing; new scenarios are ignored.
+
+    Returns one Comparison per baseline scenario and size.
+    """
+    comparisons: list[Comparison] = []
+
+    for name, scenario in baseline["scenarios"].items():
+        candidate_scenario = candidate["scenarios"].get(name)
+        candidate_sizes = candidate_scenario["sizes"] if candidate_scenario else {}
+
+        for size, measured in scenario["sizes"].items():
+            before = measured["summary"]
+            candidate_measured = candidate_sizes.get(size)
+
+            if candidate_measured is None:
+                comparisons.append(Comparison(name, size, before["mean"], 0.0, 0.0, "missing"))
+                continue
+
+            after = candidate_measured["summary"]
+            ratio = after["mean"] / before["mean"] if before["mean"] else 1.0
+            verdict: Verdict = "unchanged"
+            if ratio > 1 + threshold and after["ci_low"] > before["ci_high"]:
+                verdict = "regressed"
+            elif ratio < 1 - threshold and after["ci_high"] < before["ci_low"]:
+                verdict = "improved"
+
+            comparisons.append(
+                Comparison(name, size, before["mean"], after["mean"], ratio, verdict)
+            )
+
+    return comparisons
+
+
+def format_table(comparisons: list[Comparison]) -> str:
+    """
+    Render comparisons as a fixed-width text table.
+    """
+    header = (
+        f"{'scenario':<36} {'size':>8} {'baseline':>12} {'candidate':>12} {'ratio':>7}  verdict"
+    )
+    lines = [header, "-" * len(header)]
+
+    for row in comparisons:
+        lines.append(
+            f"{row.scenario:<36} {row.size:>8} {row.baseline:>12.6g} "
+            + f"{row.candidate:>12.6g} {row.ratio:>7.3f}  {row.verdict}"
+        )
+
+    return "\n".join(lines)
@@ -0,0 +1,66 @@
+from dataclasses import dataclass
+
+
+@dataclass
+class Position:
+    x: float = 0.0
+    y: float = 0.0
+    z: float = 0.0
+
+
+@dataclass
+class Velocity:
+    dx: float = 0.0
+    dy: float = 0.0
+    dz: float = 0.0
+
+
+@dataclass
+class Health:
+    current: int = 100
+    max: int = 100
+
+
+@dataclass
+class Name:
+    value: str = "Entity"
+
+
+@dataclass
+class Boid:
+    flock: int = 0
+
+
+@dataclass
+class Lifetime:
+    frames: int = 30
+
+
+@dataclass
+class StatusEffect:
+    remaining: int = 5
+
+
+@dataclass
+class Burning(StatusEffect):
+    pass
+
+
+@dataclass
+class Frozen(StatusEffect):
+    pass
+
+
+@dataclass
+class Poisoned(StatusEffect):
+    pass
+
+
+@dataclass
+class Hasted(StatusEffect):
+    pass
+
+
+@dataclass
+class Shielded(StatusEffect):
+    pass
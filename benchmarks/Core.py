@@ -0,0 +1,174 @@
+import random
+from collections.abc import Callable
+
+from pyecs.benchmarks.Components import Health, Name, Position, Velocity
+from pyecs.benchmarks.Registry import scenario
+from pyecs.common.Types import Entity
+from pyecs.core.World import ECSWorld
+from pyecs.helpers.Statuses import StatusCodes
+from pyecs.querying.Query import Query
+
+ENTITY_SIZES: tuple[int, ...] = (100, 1000, 10000, 50000)
+QUICK_ENTITY_SIZES: tuple[int, ...] = (100, 1000, 5000)
+OPERATION_SIZES: tuple[int, ...] = (100, 1000, 5000)
+QUICK_OPERATION_SIZES: tuple[int, ...] = (100, 500)
+
+
+def populate(world: ECSWorld, count: int, rng: random.Random) -> list[Entity]:
+    """
+    Create entities with the mix of components the core benchmarks query.
+
+    Every entity has a Position; Velocity, Health and Name are added to
+    about a half, a third and a quarter of them.
+    """
+    entities: list[Entity] = []
+
+    for i in range(count):
+        entity = world.create_entity()
+        if entity == StatusCodes.FAILURE:
+            continue
+
+        world.add_component(entity, Position(rng.random(), rng.random(), rng.random()))
+        if rng.random() < 0.5:
+            world.add_component(entity, Velocity(rng.random(), rng.random(), rng.random()))
+        if rng.random() < 0.33:
+            world.add_component(entity, Health(rng.randint(1, 100), 100))
+        if rng.random() < 0.25:
+            world.add_component(entity, Name(f"Entity_{i}"))
+        entities.append(entity)
+
+    return entities
+
+
+@scenario("core.entity_creation", ENTITY_SIZES, QUICK_ENTITY_SIZES)
+def entity_creation(size: int, rng: random.Random) -> Callable[[], object]:
+    """Create a world and populate it with entities and components."""
+    return lambda: populate(ECSWorld(), size, rng)
+
+
+@scenario("core.query_single", ENTITY_SIZES, QUICK_ENTITY_SIZES)
+def query_single(size: int, rng: random.Random) -> Callable[[], object]:
+    """Query Position and read it from every match."""
+    world = ECSWorld()
+    _ = populate(world, size, rng)
+
+    def run() -> float:
+        total = 0.0
+        for entity in Query().with_components(Position).execute(world):
+            position = world.get_component(entity, Position)
+            if isinstance(position, Position):
+                total += position.x + position.y + position.z
+        return total
+
+    return run
+
+
+@scenario("core.query_two", ENTITY_SIZES, QUICK_ENTITY_SIZES)
+def query_two(size: int, rng: random.Random) -> Callable[[], object]:
+    """Query Position and Velocity and read both from every match."""
+    world = ECSWorld()
+    _ = populate(world, size, rng)
+
+    def run() -> float:
+        total = 0.0
+        for entity in Query().with_components(Position, Velocity).execute(world):
+            position = world.get_component(entity, Position)
+            velocity = world.get_component(entity, Velocity)
+            if isinstance(position, Position) and isinstance(velocity, Velocity):
+                total += position.x * velocity.dx
+        return total
+
+    return run
+
+
+@scenario("core.query_three", ENTITY_SIZES, QUICK_ENTITY_SIZES)
+def query_three(size: int, rng: random.Random) -> Callable[[], object]:
+    """Query Position, Velocity and Health and read all three from every match."""
+    world = ECSWorld()
+    _ = populate(world, size, rng)
+
+    def run() -> float:
+        total = 0.0
+        for entity in Query().with_components(Position, Velocity, Health).execute(world):
+            position = world.get_component(entity, Position)
+            velocity = world.get_component(entity, Velocity)
+            health = world.get_component(entity, Health)
+            if (
+                isinstance(position, Position)
+                and isinstance(velocity, Velocity)
+                and isinstance(health, Health)
+            ):
+                total += position.x * velocity.dx * health.current / health.max
+        return total
+
+    return run
+
+
+def _positioned_world(rng: random.Random, count: int = 1000) -> tuple[ECSWorld, list[Entity]]:
+    world = ECSWorld()
+    entities: list[Entity] = []
+
+    for _ in range(count):
+        entity = world.create_entity()
+        if entity != StatusCodes.FAILURE:
+            world.add_component(entity, Position(rng.random(), rng.random(), rng.random()))
+            entities.append(entity)
+
+    return world, entities
+
+
+@scenario("core.add_component", OPERATION_SIZES, QUICK_OPERATION_SIZES)
+def add_component(size: int, rng: random.Random) -> Callable[[], object]:
+    """Add a Velocity to entities that only have a Position."""
+    world, entities = _positioned_world(rng, max(size, 1000))
+    targets = rng.sample(entities, size)
+
+    def run() -> None:
+        for entity in targets:
+            world.add_component(entity, Velocity(1.0, 1.0, 1.0))
+
+    return run
+
+
+@scenario("core.remove_component", OPERATION_SIZES, QUICK_OPERATION_SIZES)
+def remove_component(size: int, rng: random.Random) -> Callable[[], object]:
+    """Remove Health from entities that have a Position and Health."""
+    world, entities = _positioned_world(rng, max(size, 1000))
+    targets = rng.sample(entities, size)
+    for entity in targets:
+        world.add_component(entity, Health())
+
+    def run() -> None:
+        for entity in targets:
+            world.remove_component(entity, Health)
+
+    return run
+
+
+@scenario("core.get_component", OPERATION_SIZES, QUICK_OPERATION_SIZES)
+def get_component(size: int, rng: random.Random) -> Callable[[], object]:
+    """Read a Position from randomly chosen entities."""
+    world, entities = _positioned_world(rng)
+    targets = [rng.choice(entities) for _ in range(size)]
+
+    def run() -> float:
+        total = 0.0
+        for entity in targets:
+            position = world.get_component(entity, Position)
+            if isinstance(position, Position):
+                total += position.x
+        return total
+
+    return run
+
+
+@scenario("core.memory", ENTITY_SIZES, QUICK_ENTITY_SIZES, metric="bytes")
+def memory(size: int, rng: random.Random) -> Callable[[], object]:
+    """Bytes still allocated after populating a world."""
+
+    def run() -> ECSWorld:
+        world = ECSWorld()
+        _ = populate(world, size, rng)
+        return world
+
+    return run
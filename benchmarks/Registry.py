@@ -0,0 +1,80 @@
+import random
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Literal
+
+type Metric = Literal["seconds", "bytes"]
+type Setup = Callable[[int, random.Random], Callable[[], object]]
+
+SCENARIOS: dict[str, "Scenario"] = {}
+
+
+@dataclass(frozen=True)
+class Scenario:
+    name: str
+    setup: Setup
+    sizes: tuple[int, ...]
+    quick_sizes: tuple[int, ...]
+    metric: Metric = "seconds"
+    description: str = ""
+    repeats: int | None = None
+    warmup: int | None = None
+
+
+def scenario(
+    name: str,
+    sizes: tuple[int, ...],
+    quick_sizes: tuple[int, ...] | None = None,
+    metric: Metric = "seconds",
+    repeats: int | None = None,
+    warmup: int | None = None,
+) -> Callable[[Setup], Setup]:
+    """
+    Register a benchmark scenario under a dotted name such as 'core.query_single'.
+
+    The decorated setup function receives a size and a seeded random.Random
+    and returns the callable to measure, so that building the world is not
+    part of the measurement. The callable may return a dict of details,
+    such as per-system timings; a 'frames' entry adds a frames per second
+    summary. Scenarios run at every size in sizes, or at quick_sizes in
+    quick mode. Long-running scenarios can fix their own repeats and warmup
+    counts, which then override the runner's. The setup's docstring becomes
+    the scenario's description.
+
+    Returns a decorator that registers the setup function and returns it unchanged.
+    """
+
+    def register(setup: Setup) -> Setup:
+        if name in SCENARIOS:
+            raise ValueError(f"Benchmark scenario {name!r} is already registered")
+
+        SCENARIOS[name] = Scenario(
+            name,
+            setup,
+            sizes,
+            quick_sizes or sizes[:2],
+            metric,
+            (setup.__doc__ or "").strip(),
+            repeats,
+            warmup,
+        )
+        return setup
+
+    return register
+
+
+def select(patterns: list[str] | None = None) -> list[Scenario]:
+    """
+    Return registered scenarios whose name starts with any of the given prefixes.
+
+    Returns every registered scenario, in registration order, when no
+    prefixes are given.
+    """
+    if not patterns:
+        return list(SCENARIOS.values())
+
+    return [
+        registered
+        for name, registered in SCENARIOS.items()
+        if any(name.startswith(pattern) for pattern in patterns)
+    ]
@@ -0,0 +1,165 @@
+import random
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import cast
+
+from pyecs.benchmarks.Registry import Scenario
+from pyecs.common.Relationship import Relationship
+from pyecs.common.Types import Entity
+from pyecs.core.World import ECSWorld
+from pyecs.helpers.Statuses import StatusCodes
+from pyecs.profiling.Histogram import LatencyHistogram
+from pyecs.profiling.Trace import TraceOp, TraceRecord, read_trace
+from pyecs.querying.Query import Query
+
+REPLAY_CHUNK_CAPACITIES: tuple[int, ...] = (256, 4096, 16384)
+
+
+def load_trace(path: str | Path) -> tuple[list[TraceRecord], list[TraceRecord]]:
+    """
+    Read a trace file and split it at the end of its setup prologue.
+
+    QUERY records are turned into Query objects here so that building them
+    is not part of a replay.
+
+    Returns the prologue records and the recorded operation records.
+    """
+    with open(path, "rb") as file:
+        records = list(read_trace(file))
+
+    prologue: list[TraceRecord] = []
+    operations: list[TraceRecord] = []
+
+    for op, args in records:
+        if op is TraceOp.SNAPSHOT:
+            prologue, operations = operations, []
+        elif op is TraceOp.QUERY:
+            included, excluded = cast(tuple[tuple[type, ...], tuple[type, ...]], args)
+            query = Query().with_components(*included).without_components(*excluded)
+            operations.append((op, (query,)))
+        else:
+            operations.append((op, args))
+
+    return prologue, operations
+
+
+def apply(
+    world: ECSWorld,
+    records: list[TraceRecord],
+    entities: dict[object, Entity],
+    timings: dict[str, LatencyHistogram] | None = None,
+) -> int:
+    """
+    Execute trace records against a world.
+
+    Trace entity IDs, including the targets of added relationships, are
+    mapped to the world's entities as they are created; records naming an
+    entity the trace never created act on an unknown entity and fail as
+    they did when recorded. When timings is given, every record's wall
+    time is added to the histogram of its operation name.
+
+    Returns the number of updates executed.
+    """
+    frames = 0
+
+    for op, args in records:
+        start = time.perf_counter_ns() if timings is not None else 0
+
+        if op is TraceOp.CREATE:
+            entity = world.create_entity()
+            if entity != StatusCodes.FAILURE:
+                entities[args[0]] = entity
+        elif op is TraceOp.DESTROY:
+            world.destroy_entity(entities.get(args[0], ""))
+        elif op is TraceOp.ADD:
+            component = args[1]
+            if isinstance(component, Relationship):
+                component = type(component)(entities.get(component.target, ""))
+            world.add_component(entities.get(args[0], ""), component)
+        elif op is TraceOp.REMOVE:
+            world.remove_component(entities.get(args[0], ""), cast(type, args[1]))
+        elif op is TraceOp.GET:
+            entity = entities.get(args[0], "")
+            for component_type in cast(tuple[type, ...], args[1]):
+                _ = world.get_component(entity, component_type)
+        elif op is TraceOp.ENABLE:
+            world.set_enabled(entities.get(args[0], ""), cast(bool, args[1]))
+        elif op is TraceOp.QUERY:
+            _ = cast(Query, args[0]).execute(world)
+        elif op is TraceOp.UPDATE:
+            world.update(cast(float, args[0]))
+            frames += 1
+
+        if timings is not None:
+            name = op.name.lower()
+            if name not in timings:
+                timings[name] = LatencyHistogram()
+            timings[name].record(time.perf_counter_ns() - start)
+
+    return frames
+
+
+def prepare(
+    prologue: list[TraceRecord], chunk_capacity: int
+) -> tuple[ECSWorld, dict[object, Entity]]:
+    """
+    Build a world with the given chunk capacity from a trace's prologue.
+
+    Returns the world and the mapping from trace entity IDs to its entities.
+    """
+    world = ECSWorld(chunk_capacity)
+    entities: dict[object, Entity] = {}
+    _ = apply(world, prologue, entities)
+
+    return world, entities
+
+
+def replay_scenario(path: str | Path, chunk_capacities: tuple[int, ...]) -> Scenario:
+    """
+    Wrap a trace file as a benchmark scenario sized by chunk capacity.
+
+    Each run replays the prologue untimed into a fresh world with the
+    size as its chunk capacity, then times the recorded operations.
+    Updates run no systems, since the operations the systems made were
+    recorded themselves; they still mark frames, so results include a
+    frames per second summary.
+
+    Returns a Scenario named 'replay.<trace file stem>'.
+    """
+    prologue, operations = load_trace(path)
+
+    def setup(size: int, rng: random.Random) -> Callable[[], object]:  # pyright: ignore[reportUnusedParameter]
+        world, entities = prepare(prologue, size)
+
+        def run() -> dict[str, int]:
+            frames = apply(world, operations, entities)
+            return {"frames": frames, "operations": len(operations)}
+
+        return run
+
+    return Scenario(
+        f"replay.{Path(path).stem}",
+        setup,
+        chunk_capacities,
+        chunk_capacities,
+        description=f"Replay of {len(operations)} recorded operations from {Path(path).name}",
+    )
+
+
+def replay_breakdown(path: str | Path, chunk_capacity: int) -> dict[str, dict[str, float | int]]:
+    """
+    Replay a trace once with per-operation timing.
+
+    Timing every record adds clock overhead, so the breakdown shows where a
+    replay spends its time rather than how long it takes.
+
+    Returns a dict mapping operation names to histogram summaries in
+    nanoseconds.
+    """
+    prologue, operations = load_trace(path)
+    world, entities = prepare(prologue, chunk_capacity)
+    timings: dict[str, LatencyHistogram] = {}
+    _ = apply(world, operations, entities, timings)
+
+    return {name: histogram.to_dict() for name, histogram in sorted(timings.items())}
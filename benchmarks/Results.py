@@ -0,0 +1,60 @@
+from collections.abc import Mapping
+from typing import Literal, NotRequired, TypedDict
+
+from pyecs.benchmarks.Registry import Metric
+
+type Details = Mapping[str, object]
+type ScalingVerdict = Literal["ok", "grows"]
+
+
+class Summary(TypedDict):
+    n: int
+    mean: float
+    median: float
+    stdev: float
+    min: float
+    max: float
+    ci_low: float
+    ci_high: float
+
+
+class Measurement(TypedDict):
+    samples: list[float]
+    summary: Summary
+    details: NotRequired[Details]
+    fps: NotRequired[Summary]
+
+
+class ScenarioResults(TypedDict):
+    metric: Metric
+    description: str
+    sizes: dict[str, Measurement]
+
+
+class Metadata(TypedDict):
+    timestamp: str
+    system: str
+    version: str
+    python: str
+    implementation: str
+    platform: str
+    beartype: bool
+    repeats: int
+    warmup: int
+    seed: int
+    quick: bool
+    tolerance: NotRequired[float]
+
+
+class ScalingRow(TypedDict):
+    case: str
+    dimension: str
+    expected: float
+    exponent: float
+    verdict: ScalingVerdict
+
+
+class SuiteResults(TypedDict):
+    metadata: Metadata
+    scenarios: dict[str, ScenarioResults]
+    scaling: NotRequired[list[ScalingRow]]
@@ -0,0 +1,159 @@
+import gc
+import os
+import platform
+import random
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable
+from datetime import UTC, datetime
+from typing import cast
+
+from pyecs.benchmarks.Registry import Scenario
+from pyecs.benchmarks.Results import Details, Measurement, Metadata, ScenarioResults, SuiteResults
+from pyecs.benchmarks.Statistics import summarize
+
+DEFAULT_SEED: int = 20240101
+DEFAULT_REPEATS: int = 10
+DEFAULT_WARMUP: int = 2
+
+
+def measure(timed: Callable[[], object], metric: str) -> tuple[float, object]:
+    """
+    Run a prepared benchmark callable once and measure it.
+
+    Time is measured with the garbage collector disabled so a collection
+    triggered by earlier allocations does not land in the sample. Memory
+    is the traced allocation still held when the callable returns.
+
+    Returns seconds or bytes, depending on the metric, and the callable's result.
+    """
+    _ = gc.collect()
+
+    if metric == "bytes":
+        tracemalloc.start()
+        try:
+            result = timed()
+            current, _ = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        return float(current), result
+
+    gc.disable()
+    try:
+        start = time.perf_counter()
+        result = timed()
+        return time.perf_counter() - start, result
+    finally:
+        gc.enable()
+
+
+def run_scenario(
+    scenario: Scenario,
+    size: int,
+    repeats: int = DEFAULT_REPEATS,
+    warmup: int = DEFAULT_WARMUP,
+    seed: int = DEFAULT_SEED,
+) -> tuple[list[float], Details]:
+    """
+    Collect samples for one scenario at one size.
+
+    Every run gets a freshly built setup whose random generator is seeded
+    from the seed, scenario name, size and run index, so the same command
+    measures the same workload on every machine. Warmup runs are discarded.
+
+    Returns one sample per repeat, and the details dict returned by the
+    last run, or an empty dict if the scenario returns no details.
+    """
+    samples: list[float] = []
+    details: Details = {}
+
+    for index in range(warmup + repeats):
+        rng = random.Random(f"{seed}:{scenario.name}:{size}:{index}")
+        sample, result = measure(scenario.setup(size, rng), scenario.metric)
+        if index >= warmup:
+            samples.append(sample)
+            details = cast(Details, result) if isinstance(result, dict) else {}
+
+    return samples, details
+
+
+def metadata(repeats: int, warmup: int, seed: int, quick: bool) -> Metadata:
+    """
+    Describe the environment a benchmark run was taken in.
+    """
+    from pyecs import __version__
+
+    return {
+        "timestamp": datetime.now(UTC).isoformat(),
+        "system": "PyECS",
+        "version": __version__,
+        "python": sys.version.split()[0],
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "beartype": not os.environ.get("BEARTYPE_DISABLE"),
+        "repeats": repeats,
+        "warmup": warmup,
+        "seed": seed,
+        "quick": quick,
+    }
+
+
+def run(
+    scenarios: list[Scenario],
+    repeats: int = DEFAULT_REPEATS,
+    warmup: int = DEFAULT_WARMUP,
+    seed: int = DEFAULT_SEED,
+    quick: bool = False,
+    report: Callable[[str], None] | None = None,
+) -> SuiteResults:
+    """
+    Run scenarios at each of their sizes and summarize the samples.
+
+    Progress lines are passed to report when it is given. When a timed
+    scenario's details report how many frames a run updated, a frames per
+    second summary is added for that size.
+
+    Returns JSON-compatible SuiteResults with metadata and, per scenario name,
+    its metric and description and the raw samples, summary and details
+    per size.
+    """
+    results: dict[str, ScenarioResults] = {}
+
+    for scenario in scenarios:
+        sizes: dict[str, Measurement] = {}
+
+        for size in scenario.quick_sizes if quick else scenario.sizes:
+            samples, details = run_scenario(
+                scenario,
+                size,
+                repeats if scenario.repeats is None else scenario.repeats,
+                warmup if scenario.warmup is None else scenario.warmup,
+                seed,
+            )
+            summary = summarize(samples)
+            measured: Measurement = {"samples": samples, "summary": summary}
+            line = (
+                f"{scenario.name} [{size}]: mean {summary['mean']:.6g} "
+                f"± {summary['mean'] - summary['ci_low']:.2g} {scenario.metric}"
+            )
+
+            if details:
+                measured["details"] = details
+            frames = details.get("frames")
+            if scenario.metric == "seconds" and isinstance(frames, int) and frames:
+                fps = summarize([frames / sample for sample in samples])
+                measured["fps"] = fps
+                line += f", {fps['mean']:.1f} fps"
+
+            sizes[str(size)] = measured
+            if report is not None:
+                report(line)
+
+        results[scenario.name] = {
+            "metric": scenario.metric,
+            "description": scenario.description,
+            "sizes": sizes,
+        }
+
+    return {"metadata": metadata(repeats, warmup, seed, quick), "scenarios": results}
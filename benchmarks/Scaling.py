@@ -0,0 +1,344 @@
+import math
+import random
+import statistics
+from collections.abc import Callable
+from dataclasses import dataclass, make_dataclass
+from itertools import combinations
+from typing import Literal
+
+from pyecs.benchmarks.Components import Health, Position, Velocity
+from pyecs.benchmarks.Registry import Scenario, Setup
+from pyecs.benchmarks.Results import (
+    Measurement,
+    ScalingRow,
+    ScalingVerdict,
+    ScenarioResults,
+    SuiteResults,
+)
+from pyecs.benchmarks.Runner import metadata, run_scenario
+from pyecs.benchmarks.Statistics import summarize
+from pyecs.common.Types import Entity
+from pyecs.core.World import ECSWorld
+from pyecs.helpers.Statuses import StatusCodes
+from pyecs.querying.Query import Query
+
+type Dimension = Literal["entities", "archetypes", "systems"]
+
+SCALING_SIZES: dict[Dimension, tuple[int, ...]] = {
+    "entities": (1000, 4000, 16000, 64000),
+    "archetypes": (1, 4, 16, 64, 256),
+    "systems": (400, 1600, 6400, 25600),
+}
+QUICK_SCALING_SIZES: dict[Dimension, tuple[int, ...]] = {
+    "entities": (500, 2000, 8000),
+    "archetypes": (1, 8, 64),
+    "systems": (400, 1600, 6400),
+}
+SCALING_CALLS: int = 200
+SCALING_REPEATS: int = 5
+SCALING_TOLERANCE: float = 0.25
+ARCHETYPE_ENTITIES: int = 1024
+TAGS: tuple[type[object], ...] = tuple(make_dataclass(f"Tag{i}", []) for i in range(8))
+
+SCALING_CASES: dict[str, "ScalingCase"] = {}
+
+
+@dataclass(frozen=True)
+class ScalingCase:
+    name: str
+    dimension: Dimension
+    expected: float
+    setup: Setup
+    description: str = ""
+
+
+def scaling_case(
+    name: str, dimension: Dimension, expected: float = 0.0
+) -> Callable[[Setup], Setup]:
+    """
+    Register an operation whose per-call cost is checked for growth.
+
+    The setup receives the size of the dimension and a seeded random.Random
+    and returns a callable making SCALING_CALLS calls of the operation.
+    expected is the growth exponent the operation should have along the
+    dimension: 0 for O(1), 1 for O(n).
+
+    Returns a decorator that registers the setup function and returns it unchanged.
+    """
+
+    def register(setup: Setup) -> Setup:
+        if name in SCALING_CASES:
+            raise ValueError(f"Scaling case {name!r} is already registered")
+
+        SCALING_CASES[name] = ScalingCase(
+            name, dimension, expected, setup, (setup.__doc__ or "").strip()
+        )
+        return setup
+
+    return register
+
+
+def fit_exponent(sizes: list[int], costs: list[float]) -> float:
+    """
+    Fit cost = a * size ** k by least squares on log-log axes.
+
+    Returns the growth exponent k.
+    """
+    xs = [math.log(size) for size in sizes]
+    ys = [math.log(max(cost, 1e-12)) for cost in costs]
+    x_mean = statistics.fmean(xs)
+    y_mean = statistics.fmean(ys)
+    spread = sum((x - x_mean) ** 2 for x in xs)
+
+    if not spread:
+        return 0.0
+
+    return sum((x - x_mean) * (y - y_mean) for x, y in zip(xs, ys, strict=True)) / spread
+
+
+def run_scaling(
+    cases: list[ScalingCase],
+    quick: bool = False,
+    repeats: int = SCALING_REPEATS,
+    tolerance: float = SCALING_TOLERANCE,
+    seed: int = 0,
+    report: Callable[[str], None] | None = None,
+) -> SuiteResults:
+    """
+    Measure each case's per-call cost across geometrically growing sizes.
+
+    Per-call samples are the time of SCALING_CALLS calls divided by the call
+    count. The growth exponent is fitted to the median per-call cost at
+    each size, and a case is flagged as 'grows' when its exponent exceeds
+    the expected one by more than tolerance.
+
+    Returns SuiteResults whose scenarios hold the per-call samples and
+    whose 'scaling' list holds one row per case.
+    """
+    scenarios: dict[str, ScenarioResults] = {}
+    rows: list[ScalingRow] = []
+
+    for case in cases:
+        sizes = (QUICK_SCALING_SIZES if quick else SCALING_SIZES)[case.dimension]
+        scenario = Scenario(case.name, case.setup, sizes, sizes)
+        measured: dict[str, Measurement] = {}
+        medians: list[float] = []
+
+        for size in sizes:
+            samples, _ = run_scenario(scenario, size, repeats, 1, seed)
+            per_call = [sample / SCALING_CALLS for sample in samples]
+            measured[str(size)] = {"samples": per_call, "summary": summarize(per_call)}
+            medians.append(statistics.median(per_call))
+
+        exponent = fit_exponent(list(sizes), medians)
+        verdict: ScalingVerdict = "grows" if exponent > case.expected + tolerance else "ok"
+        rows.append(
+            {
+                "case": case.name,
+                "dimension": case.dimension,
+                "expected": case.expected,
+                "exponent": exponent,
+                "verdict": verdict,
+            }
+        )
+        scenarios[case.name] = {
+            "metric": "seconds",
+            "description": case.description,
+            "sizes": measured,
+        }
+
+        if report is not None:
+            report(f"{case.name} over {case.dimension}: exponent {exponent:.2f} ({verdict})")
+
+    return {
+        "metadata": {**metadata(repeats, 1, seed, quick), "tolerance": tolerance},
+        "scenarios": scenarios,
+        "scaling": rows,
+    }
+
+
+def format_scaling_table(rows: list[ScalingRow]) -> str:
+    """
+    Render scaling rows as a fixed-width text table.
+    """
+    header = f"{'case':<36} {'dimension':<11} {'expected':>8} {'exponent':>8}  verdict"
+    lines = [header, "-" * len(header)]
+
+    for row in rows:
+        lines.append(
+            f"{row['case']:<36} {row['dimension']:<11} {row['expected']:>8.2f} "
+            + f"{row['exponent']:>8.2f}  {row['verdict']}"
+        )
+
+    return "\n".join(lines)
+
+
+def populated(size: int, rng: random.Random) -> tuple[ECSWorld, list[Entity]]:
+    """
+    Build a world with size entities holding Position and, for half, Velocity.
+    """
+    world = ECSWorld()
+    entities: list[Entity] = []
+
+    for _ in range(size):
+        entity = world.create_entity()
+        if entity != StatusCodes.FAILURE:
+            world.add_component(entity, Position(rng.random(), rng.random()))
+            if rng.random() < 0.5:
+                world.add_component(entity, Velocity())
+            entities.append(entity)
+
+    return world, entities
+
+
+def tagged(archetypes: int, rng: random.Random) -> tuple[ECSWorld, list[Entity]]:
+    """
+    Build a world spreading ARCHETYPE_ENTITIES entities over archetypes archetypes.
+
+    Every entity has a Position plus one distinct combination of tag
+    components per archetype.
+    """
+    world = ECSWorld()
+    entities: list[Entity] = []
+    masks = [mask for count in range(len(TAGS) + 1) for mask in combinations(TAGS, count)][
+        :archetypes
+    ]
+
+    for index in range(ARCHETYPE_ENTITIES):
+        entity = world.create_entity()
+        if entity != StatusCodes.FAILURE:
+            world.add_component(entity, Position(rng.random(), rng.random()))
+            for tag in masks[index % len(masks)]:
+                world.add_component(entity, tag())
+            entities.append(entity)
+
+    return world, entities
+
+
+@scaling_case("scaling.create_entity", "entities")
+def create_entity(size: int, rng: random.Random) -> Callable[[], object]:
+    """Create an entity in a populated world."""
+    world, _ = populated(size, rng)
+    return lambda: [world.create_entity() for _ in range(SCALING_CALLS)]
+
+
+@scaling_case("scaling.destroy_entity", "entities")
+def destroy_entity(size: int, rng: random.Random) -> Callable[[], object]:
+    """Destroy an entity with components."""
+    world, entities = populated(size, rng)
+    targets = rng.sample(entities, SCALING_CALLS)
+
+    def run() -> None:
+        for entity in targets:
+            world.destroy_entity(entity)
+
+    return run
+
+
+@scaling_case("scaling.add_component", "entities")
+def add_component(size: int, rng: random.Random) -> Callable[[], object]:
+    """Add a component, moving the entity to another archetype."""
+    world, entities = populated(size, rng)
+    targets = rng.sample(entities, SCALING_CALLS)
+
+    def run() -> None:
+        for entity in targets:
+            world.add_component(entity, Health())
+
+    return run
+
+
+@scaling_case("scaling.remove_component", "entities")
+def remove_component(size: int, rng: random.Random) -> Callable[[], object]:
+    """Remove a component, moving the entity to another archetype."""
+    world, entities = populated(size, rng)
+    targets = rng.sample(entities, SCALING_CALLS)
+    for entity in targets:
+        world.add_component(entity, Health())
+
+    def run() -> None:
+        for entity in targets:
+            world.remove_component(entity, Health)
+
+    return run
+
+
+@scaling_case("scaling.get_component", "entities")
+def get_component(size: int, rng: random.Random) -> Callable[[], object]:
+    """Read a component from an entity."""
+    world, entities = populated(size, rng)
+    targets = rng.sample(entities, SCALING_CALLS)
+    return lambda: [world.get_component(entity, Position) for entity in targets]
+
+
+@scaling_case("scaling.update_component", "entities")
+def update_component(size: int, rng: random.Random) -> Callable[[], object]:
+    """Replace an existing component in place."""
+    world, entities = populated(size, rng)
+    targets = rng.sample(entities, SCALING_CALLS)
+
+    def run() -> None:
+        for entity in targets:
+            world.add_component(entity, Position(1.0, 1.0))
+
+    return run
+
+
+@scaling_case("scaling.query_all", "entities", expected=1.0)
+def query_all(size: int, rng: random.Random) -> Callable[[], object]:
+    """Execute a query matching every entity."""
+    world, _ = populated(size, rng)
+    query = Query().with_components(Position)
+    return lambda: [query.execute(world) for _ in range(SCALING_CALLS)]
+
+
+@scaling_case("scaling.query_one_archetype", "archetypes")
+def query_one_archetype(size: int, rng: random.Random) -> Callable[[], object]:
+    """Execute a query matching a single archetype among many."""
+    world, _ = tagged(size, rng)
+    query = Query().with_components(Position).without_components(*TAGS)
+    return lambda: [query.execute(world) for _ in range(SCALING_CALLS)]
+
+
+@scaling_case("scaling.move_between_archetypes", "archetypes")
+def move_between_archetypes(size: int, rng: random.Random) -> Callable[[], object]:
+    """Add a component to entities spread over many archetypes."""
+    world, entities = tagged(size, rng)
+    targets = rng.sample(entities, SCALING_CALLS)
+
+    def run() -> None:
+        for entity in targets:
+            world.add_component(entity, Velocity())
+
+    return run
+
+
+class IdleSystem(object):
+    @property
+    def required_components(self) -> set[type]:
+        return set()
+
+    def init(self, world: ECSWorld) -> None:  # pyright: ignore[reportUnusedParameter]
+        pass
+
+    def update(self, world: ECSWorld, dt: float) -> None:  # pyright: ignore[reportUnusedParameter]
+        pass
+
+    def cleanup(self, world: ECSWorld) -> None:  # pyright: ignore[reportUnusedParameter]
+        pass
+
+
+@scaling_case("scaling.remove_system", "systems")
+def remove_system(size: int, rng: random.Random) -> Callable[[], object]:
+    """Remove a registered system from the world."""
+    world = ECSWorld()
+    systems = [IdleSystem() for _ in range(size)]
+    for system in systems:
+        world.add_system(system)
+    targets = rng.sample(systems, SCALING_CALLS)
+
+    def run() -> None:
+        for system in targets:
+            world.remove_system(system)
+
+    return run
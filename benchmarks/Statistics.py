@@ -0,0 +1,54 @@
+import math
+import statistics
+from collections.abc import Sequence
+
+from pyecs.benchmarks.Results import Summary
+
+T_CRITICAL_95: tuple[float, ...] = (
+    12.706, 4.303, 3.182, 2.776, 2.571, 2.447, 2.365, 2.306, 2.262, 2.228,
+    2.201, 2.179, 2.160, 2.145, 2.131, 2.120, 2.110, 2.101, 2.093, 2.086,
+    2.080, 2.074, 2.069, 2.064, 2.060, 2.056, 2.052, 2.048, 2.045, 2.042,
+)  # fmt: skip
+Z_95: float = 1.960
+
+
+def t_critical(degrees_of_freedom: int) -> float:
+    """
+    Return the two-sided 95% Student's t critical value.
+
+    Falls back to the normal approximation above 30 degrees of freedom.
+    """
+    if degrees_of_freedom <= len(T_CRITICAL_95):
+        return T_CRITICAL_95[degrees_of_freedom - 1]
+
+    return Z_95
+
+
+def summarize(samples: Sequence[float]) -> Summary:
+    """
+    Summarize benchmark samples with a 95% confidence interval for the mean.
+
+    The interval uses Student's t distribution, so it stays honest for the
+    handful of repeats a local run takes. With a single sample the interval
+    collapses to that sample.
+
+    Returns a Summary with n, mean, median, stdev, min, max, ci_low and ci_high.
+    """
+    if not samples:
+        raise ValueError("Cannot summarize an empty list of samples")
+
+    n = len(samples)
+    mean = statistics.fmean(samples)
+    stdev = statistics.stdev(samples) if n > 1 else 0.0
+    margin = t_critical(n - 1) * stdev / math.sqrt(n) if n > 1 else 0.0
+
+    return {
+        "n": n,
+        "mean": mean,
+        "median": statistics.median(samples),
+        "stdev": stdev,
+        "min": min(samples),
+        "max": max(samples),
+        "ci_low": mean - margin,
+        "ci_high": mean + margin,
+    }
@@ -0,0 +1,149 @@
+import importlib.util
+from collections.abc import Callable
+from pathlib import Path
+from types import ModuleType
+from typing import Protocol, cast, runtime_checkable
+
+from pyecs.benchmarks.Results import SuiteResults
+
+type Samples = dict[str, list[float]]
+
+VISUALIZER_PATH: Path = (
+    Path(__file__).resolve().parent.parent / "docker" / "benchmark_visualizer.py"
+)
+
+LEGACY_SECTIONS: dict[str, tuple[str, str | None]] = {
+    "core.entity_creation": ("entity_creation", None),
+    "core.query_single": ("query_performance", "single_component"),
+    "core.query_two": ("query_performance", "two_components"),
+    "core.query_three": ("query_performance", "three_components"),
+    "core.add_component": ("component_operations", "add"),
+    "core.remove_component": ("component_operations", "remove"),
+    "core.get_component": ("component_operations", "get"),
+    "core.memory": ("memory_usage", None),
+}
+
+
+@runtime_checkable
+class Figure(Protocol):
+    def savefig(self, fname: Path, *, dpi: int, bbox_inches: str) -> None: ...
+
+
+@runtime_checkable
+class Renderer(Protocol):
+    def generate_report(self, data: dict[str, object], output_dir: str | Path) -> None: ...
+
+    def plot_comparison(
+        self, datasets: dict[str, dict[str, Samples]], benchmark_type: str
+    ) -> Figure: ...
+
+
+def to_visualizer(results: SuiteResults) -> dict[str, object]:
+    """
+    Convert suite results to the layout benchmark_visualizer.py reads.
+
+    Core scenarios map onto the visualizer's entity_creation,
+    query_performance, component_operations and memory_usage sections;
+    other scenarios are left out.
+
+    Returns a dict in the visualizer's input format.
+    """
+    sections: dict[str, Samples] = {}
+    grouped: dict[str, dict[str, Samples]] = {}
+
+    for name, (section, series) in LEGACY_SECTIONS.items():
+        if name not in results["scenarios"]:
+            continue
+
+        samples = {
+            size: measured["samples"]
+            for size, measured in results["scenarios"][name]["sizes"].items()
+        }
+        if series is None:
+            sections[section] = samples
+        else:
+            grouped.setdefault(section, {})[series] = samples
+
+    sizes = [int(size) for size in sections.get("entity_creation", {})]
+    operations = [int(size) for size in grouped.get("component_operations", {}).get("add", {})]
+
+    return {
+        **sections,
+        **grouped,
+        "metadata": {
+            **results["metadata"],
+            "iterations": results["metadata"]["repeats"],
+            "entity_counts": sizes,
+            "operation_counts": operations,
+        },
+    }
+
+
+def load_visualizer() -> ModuleType:
+    """
+    Import docker/benchmark_visualizer.py as a module.
+
+    The visualizer needs numpy, matplotlib and seaborn, which are only
+    installed in the benchmark image.
+
+    Raises ImportError if the visualizer or its dependencies are missing.
+    """
+    spec = importlib.util.spec_from_file_location("benchmark_visualizer", VISUALIZER_PATH)
+    if spec is None or spec.loader is None:
+        raise ImportError(f"benchmark_visualizer.py not found at {VISUALIZER_PATH}")
+
+    visualizer = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(visualizer)
+    return visualizer
+
+
+def renderer(visualizer: ModuleType) -> Renderer:
+    """
+    Create the BenchmarkVisualizer of a loaded visualizer module.
+    """
+    return cast(Callable[[], Renderer], visualizer.BenchmarkVisualizer)()
+
+
+def plot(results: SuiteResults, output_dir: str | Path) -> None:
+    """
+    Render suite results with docker/benchmark_visualizer.py.
+
+    Results from a scaling run are drawn with plot_scaling instead.
+
+    Raises ImportError if the visualizer or its dependencies are missing.
+    """
+    if "scaling" in results:
+        plot_scaling(results, output_dir)
+        return
+
+    renderer(load_visualizer()).generate_report(to_visualizer(results), output_dir)
+
+
+def plot_scaling(results: SuiteResults, output_dir: str | Path) -> None:
+    """
+    Draw per-call cost against size for every scaling case, one chart per dimension.
+
+    Each case is passed to the visualizer's comparison plot as its own
+    dataset, so cases share log-log axes and the second panel shows each
+    case relative to the first.
+
+    Raises ImportError if the visualizer or its dependencies are missing.
+    """
+    visualizer = load_visualizer()
+    comparison = renderer(visualizer)
+    pyplot = cast(ModuleType, visualizer.plt)
+    close = cast(Callable[[Figure], None], pyplot.close)
+    output = Path(output_dir)
+    output.mkdir(parents=True, exist_ok=True)
+
+    by_dimension: dict[str, dict[str, dict[str, Samples]]] = {}
+    for row in results.get("scaling", []):
+        sizes = results["scenarios"][row["case"]]["sizes"]
+        by_dimension.setdefault(row["dimension"], {})[row["case"]] = {
+            "scaling": {size: measured["samples"] for size, measured in sizes.items()}
+        }
+
+    for dimension, datasets in by_dimension.items():
+        figure = comparison.plot_comparison(datasets, "scaling")
+        figure.savefig(output / f"scaling_{dimension}.png", dpi=150, bbox_inches="tight")
+        close(figure)
@@ -0,0 +1,417 @@
+import math
+import random
+import time
+from collections.abc import Callable
+from typing import TypedDict, cast
+
+from pyecs.benchmarks.Components import (
+    Boid,
+    Burning,
+    Frozen,
+    Hasted,
+    Health,
+    Lifetime,
+    Poisoned,
+    Position,
+    Shielded,
+    StatusEffect,
+    Velocity,
+)
+from pyecs.benchmarks.Registry import scenario
+from pyecs.common.Types import Entity
+from pyecs.core.World import ECSWorld
+from pyecs.helpers.Statuses import StatusCodes
+from pyecs.profiling.Histogram import LatencyHistogram
+from pyecs.querying.Query import Query
+
+DT: float = 1 / 60
+BOID_FRAMES: int = 10
+PARTICLE_FRAMES: int = 120
+CHURN_FRAMES: int = 30
+SOAK_SAMPLES: int = 50
+EFFECTS: tuple[type[StatusEffect], ...] = (Burning, Frozen, Poisoned, Hasted, Shielded)
+
+
+class SystemTiming(TypedDict):
+    mean_ns: float
+    p99_ns: int
+    share: float
+
+
+class WorkloadDetails(TypedDict):
+    frames: int
+    frame_ns: dict[str, float | int]
+    systems: dict[str, SystemTiming]
+    entities: int
+
+
+class SoakSample(TypedDict):
+    tick: int
+    frame_p50_ns: int
+    frame_p99_ns: int
+    storage_bytes: int
+    archetypes: int
+    entities: int
+
+
+class SoakDetails(WorkloadDetails):
+    timeline: list[SoakSample]
+
+
+class MovementSystem(object):
+    def __init__(self, bounds: float = 0.0):
+        self.bounds: float = bounds
+
+    @property
+    def required_components(self) -> set[type]:
+        return {Position, Velocity}
+
+    def init(self, world: ECSWorld) -> None:  # pyright: ignore[reportUnusedParameter]
+        pass
+
+    def update(self, world: ECSWorld, dt: float) -> None:
+        for entity in Query().with_components(Position, Velocity).execute(world):
+            position = world.get_component(entity, Position)
+            velocity = world.get_component(entity, Velocity)
+            if isinstance(position, Position) and isinstance(velocity, Velocity):
+                position.x += velocity.dx * dt
+                position.y += velocity.dy * dt
+                if self.bounds:
+                    position.x %= self.bounds
+                    position.y %= self.bounds
+
+    def cleanup(self, world: ECSWorld) -> None:  # pyright: ignore[reportUnusedParameter]
+        pass
+
+
+class BoidsSystem(object):
+    def __init__(self, radius: float = 5.0, max_neighbours: int = 16):
+        self.radius: float = radius
+        self.max_neighbours: int = max_neighbours
+
+    @property
+    def required_components(self) -> set[type]:
+        return {Position, Velocity, Boid}
+
+    def init(self, world: ECSWorld) -> None:  # pyright: ignore[reportUnusedParameter]
+        pass
+
+    def update(self, world: ECSWorld, dt: float) -> None:  # pyright: ignore[reportUnusedParameter]
+        grid: dict[tuple[int, int], list[tuple[Position, Velocity]]] = {}
+
+        for entity in Query().with_components(Position, Velocity, Boid).execute(world):
+            position = world.get_component(entity, Position)
+            velocity = world.get_component(entity, Velocity)
+            if isinstance(position, Position) and isinstance(velocity, Velocity):
+                cell = (int(position.x // self.radius), int(position.y // self.radius))
+                grid.setdefault(cell, []).append((position, velocity))
+
+        steering: list[tuple[Velocity, float, float]] = []
+        for (cx, cy), members in grid.items():
+            nearby = [
+                boid
+                for dx in (-1, 0, 1)
+                for dy in (-1, 0, 1)
+                for boid in grid.get((cx + dx, cy + dy), ())
+            ]
+
+            for position, velocity in members:
+                count = 0
+                sx = sy = ax = ay = px = py = 0.0
+
+                for other_position, other_velocity in nearby:
+                    if other_position is position:
+                        continue
+                    ox = other_position.x - position.x
+                    oy = other_position.y - position.y
+                    distance = math.hypot(ox, oy)
+                    if distance > self.radius:
+                        continue
+
+                    count += 1
+                    sx += other_position.x
+                    sy += other_position.y
+                    ax += other_velocity.dx
+                    ay += other_velocity.dy
+                    if distance < self.radius / 4:
+                        px -= ox
+                        py -= oy
+                    if count == self.max_neighbours:
+                        break
+
+                if count:
+                    cohesion_x = sx / count - position.x
+                    cohesion_y = sy / count - position.y
+                    align_x = ax / count - velocity.dx
+                    align_y = ay / count - velocity.dy
+                    steering.append(
+                        (
+                            velocity,
+                            0.01 * cohesion_x + 0.125 * align_x + 0.05 * px,
+                            0.01 * cohesion_y + 0.125 * align_y + 0.05 * py,
+                        )
+                    )
+
+        for velocity, ddx, ddy in steering:
+            velocity.dx += ddx
+            velocity.dy += ddy
+
+    def cleanup(self, world: ECSWorld) -> None:  # pyright: ignore[reportUnusedParameter]
+        pass
+
+
+class EmitterSystem(object):
+    def __init__(self, rate: int, rng: random.Random):
+        self.rate: int = rate
+        self.rng: random.Random = rng
+
+    @property
+    def required_components(self) -> set[type]:
+        return set()
+
+    def init(self, world: ECSWorld) -> None:  # pyright: ignore[reportUnusedParameter]
+        pass
+
+    def update(self, world: ECSWorld, dt: float) -> None:  # pyright: ignore[reportUnusedParameter]
+        rng = self.rng
+        for _ in range(self.rate):
+            entity = world.create_entity()
+            if entity != StatusCodes.FAILURE:
+                world.add_component(entity, Position())
+                world.add_component(
+                    entity, Velocity(rng.uniform(-1, 1), rng.uniform(-1, 1), rng.uniform(0, 2))
+                )
+                world.add_component(entity, Lifetime(rng.randint(20, 40)))
+
+    def cleanup(self, world: ECSWorld) -> None:  # pyright: ignore[reportUnusedParameter]
+        pass
+
+
+class LifetimeSystem(object):
+    @property
+    def required_components(self) -> set[type]:
+        return {Lifetime}
+
+    def init(self, world: ECSWorld) -> None:  # pyright: ignore[reportUnusedParameter]
+        pass
+
+    def update(self, world: ECSWorld, dt: float) -> None:  # pyright: ignore[reportUnusedParameter]
+        expired: list[Entity] = []
+
+        for entity in Query().with_components(Lifetime).execute(world):
+            lifetime = world.get_component(entity, Lifetime)
+            if isinstance(lifetime, Lifetime):
+                lifetime.frames -= 1
+                if lifetime.frames <= 0:
+                    expired.append(entity)
+
+        for entity in expired:
+            world.destroy_entity(entity)
+
+    def cleanup(self, world: ECSWorld) -> None:  # pyright: ignore[reportUnusedParameter]
+        pass
+
+
+class ChurnSystem(object):
+    def __init__(self, entities: list[Entity], rate: float, rng: random.Random):
+        self.entities: list[Entity] = entities
+        self.rate: float = rate
+        self.rng: random.Random = rng
+
+    @property
+    def required_components(self) -> set[type]:
+        return {Health}
+
+    def init(self, world: ECSWorld) -> None:  # pyright: ignore[reportUnusedParameter]
+        pass
+
+    def update(self, world: ECSWorld, dt: float) -> None:  # pyright: ignore[reportUnusedParameter]
+        rng = self.rng
+        for entity in rng.sample(self.entities, int(len(self.entities) * self.rate)):
+            effect = rng.choice(EFFECTS)
+            if world.get_component(entity, effect) == StatusCodes.FAILURE:
+                world.add_component(entity, effect(rng.randint(2, 8)))
+            else:
+                world.remove_component(entity, effect)
+
+    def cleanup(self, world: ECSWorld) -> None:  # pyright: ignore[reportUnusedParameter]
+        pass
+
+
+class EffectSystem(object):
+    @property
+    def required_components(self) -> set[type]:
+        return {Health}
+
+    def init(self, world: ECSWorld) -> None:  # pyright: ignore[reportUnusedParameter]
+        pass
+
+    def update(self, world: ECSWorld, dt: float) -> None:  # pyright: ignore[reportUnusedParameter]
+        expired: list[tuple[Entity, type[StatusEffect]]] = []
+
+        for effect in EFFECTS:
+            for entity in Query().with_components(Health, effect).execute(world):
+                health = world.get_component(entity, Health)
+                status = world.get_component(entity, effect)
+                if isinstance(health, Health) and isinstance(status, StatusEffect):
+                    health.current = max(1, min(health.max, health.current + (effect is Hasted)))
+                    status.remaining -= 1
+                    if status.remaining <= 0:
+                        expired.append((entity, effect))
+
+        for entity, effect in expired:
+            world.remove_component(entity, effect)
+
+    def cleanup(self, world: ECSWorld) -> None:  # pyright: ignore[reportUnusedParameter]
+        pass
+
+
+def system_details(world: ECSWorld, frames: int) -> WorkloadDetails:
+    """
+    Collect the frame count and per-system timings of a profiled world.
+
+    Returns WorkloadDetails with frames, the frame time summary, the
+    per-system mean and p99 wall times in nanoseconds with each system's
+    share of the total system time, and the final entity count.
+    """
+    profiler = world.system_manager.profiler
+    systems = list(profiler.systems.values())
+    total = sum(system.histogram.total for system in systems) or 1
+
+    return {
+        "frames": frames,
+        "frame_ns": profiler.frame_histogram.to_dict(),
+        "systems": {
+            system.name: {
+                "mean_ns": system.histogram.mean(),
+                "p99_ns": system.histogram.percentile(99),
+                "share": system.histogram.total / total,
+            }
+            for system in systems
+        },
+        "entities": len(world.entity_manager.alive_entities),
+    }
+
+
+def run_frames(world: ECSWorld, frames: int) -> Callable[[], WorkloadDetails]:
+    """
+    Return a callable that profiles a world for a number of updates.
+    """
+    world.set_profiling(True)
+
+    def run() -> WorkloadDetails:
+        for _ in range(frames):
+            world.update(DT)
+        return system_details(world, frames)
+
+    return run
+
+
+def flock(world: ECSWorld, count: int, rng: random.Random) -> float:
+    """
+    Spawn boids at a constant density and return the side of their square.
+    """
+    bounds = math.sqrt(count) * 4.0
+
+    for _ in range(count):
+        entity = world.create_entity()
+        if entity != StatusCodes.FAILURE:
+            world.add_component(entity, Position(rng.uniform(0, bounds), rng.uniform(0, bounds)))
+            world.add_component(entity, Velocity(rng.uniform(-1, 1), rng.uniform(-1, 1)))
+            world.add_component(entity, Boid(rng.randrange(4)))
+
+    return bounds
+
+
+def afflicted(world: ECSWorld, count: int, rng: random.Random) -> list[Entity]:
+    """
+    Spawn entities with Position and Health and a random set of status effects.
+    """
+    entities: list[Entity] = []
+
+    for _ in range(count):
+        entity = world.create_entity()
+        if entity != StatusCodes.FAILURE:
+            world.add_component(entity, Position(rng.random(), rng.random()))
+            world.add_component(entity, Health(rng.randint(50, 100), 100))
+            for effect in EFFECTS:
+                if rng.random() < 0.3:
+                    world.add_component(entity, effect(rng.randint(2, 8)))
+            entities.append(entity)
+
+    return entities
+
+
+@scenario("workload.boids", (500, 2000, 5000), (200, 1000))
+def boids(size: int, rng: random.Random) -> Callable[[], object]:
+    """Flocking boids steering from grid-bucketed neighbour queries."""
+    world = ECSWorld()
+    bounds = flock(world, size, rng)
+    world.add_system(BoidsSystem())
+    world.add_system(MovementSystem(bounds))
+
+    return run_frames(world, BOID_FRAMES)
+
+
+@scenario("workload.particles", (50, 200, 500), (20, 100))
+def particles(size: int, rng: random.Random) -> Callable[[], object]:
+    """Particles spawned at size per frame and destroyed after 20-40 frames."""
+    world = ECSWorld()
+    world.add_system(EmitterSystem(size, rng))
+    world.add_system(MovementSystem())
+    world.add_system(LifetimeSystem())
+
+    return run_frames(world, PARTICLE_FRAMES)
+
+
+@scenario("workload.status_effects", (500, 2000, 5000), (200, 1000))
+def status_effects(size: int, rng: random.Random) -> Callable[[], object]:
+    """Status effects toggled on 5% of entities per frame across 32 archetypes."""
+    world = ECSWorld()
+    entities = afflicted(world, size, rng)
+    world.add_system(ChurnSystem(entities, 0.05, rng))
+    world.add_system(EffectSystem())
+
+    return run_frames(world, CHURN_FRAMES)
+
+
+@scenario("workload.soak", (100_000,), (2_000,), repeats=1, warmup=0)
+def soak(size: int, rng: random.Random) -> Callable[[], object]:
+    """Mixed particles, movement and effect churn for size ticks, tracking drift."""
+    world = ECSWorld()
+    entities = afflicted(world, 200, rng)
+    world.add_system(EmitterSystem(5, rng))
+    world.add_system(MovementSystem())
+    world.add_system(LifetimeSystem())
+    world.add_system(ChurnSystem(entities, 0.05, rng))
+    world.add_system(EffectSystem())
+    world.set_profiling(True)
+    window = max(1, size // SOAK_SAMPLES)
+
+    def run() -> SoakDetails:
+        timeline: list[SoakSample] = []
+        frame_times = LatencyHistogram()
+
+        for tick in range(1, size + 1):
+            start = time.perf_counter_ns()
+            world.update(DT)
+            frame_times.record(time.perf_counter_ns() - start)
+
+            if tick % window == 0:
+                timeline.append(
+                    {
+                        "tick": tick,
+                        "frame_p50_ns": frame_times.percentile(50),
+                        "frame_p99_ns": frame_times.percentile(99),
+                        "storage_bytes": cast(
+                            int, world.memory_report(sample_size=32)["total_bytes"]
+                        ),
+                        "archetypes": len(world.component_storage.archetypes),
+                        "entities": len(world.entity_manager.alive_entities),
+                    }
+                )
+                frame_times = LatencyHistogram()
+
+        return {**system_details(world, size), "timeline": timeline}
+
+    return run
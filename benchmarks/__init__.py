@@ -0,0 +1,17 @@
+from .Compare import Comparison, compare, format_table
+from .Registry import SCENARIOS, Scenario, scenario, select
+from .Runner import run, run_scenario
+from .Statistics import summarize
+
+__all__ = [
+    "SCENARIOS",
+    "Comparison",
+    "Scenario",
+    "compare",
+    "format_table",
+    "run",
+    "run_scenario",
+    "scenario",
+    "select",
+    "summarize",
+]
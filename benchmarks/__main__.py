@@ -0,0 +1,201 @@
+# pyright: reportUnusedCallResult=false, reportUninitializedInstanceVariable=false
+import argparse
+import json
+import sys
+from collections.abc import Callable
+from pathlib import Path
+from typing import cast
+
+from pyecs.benchmarks import Core, Workloads  # noqa: F401  # pyright: ignore[reportUnusedImport]
+from pyecs.benchmarks.Compare import DEFAULT_THRESHOLD, compare, format_table
+from pyecs.benchmarks.Registry import SCENARIOS, select
+from pyecs.benchmarks.Replay import REPLAY_CHUNK_CAPACITIES, replay_breakdown, replay_scenario
+from pyecs.benchmarks.Results import SuiteResults
+from pyecs.benchmarks.Runner import DEFAULT_REPEATS, DEFAULT_SEED, DEFAULT_WARMUP, run
+from pyecs.benchmarks.Scaling import (
+    SCALING_CASES,
+    SCALING_REPEATS,
+    SCALING_TOLERANCE,
+    format_scaling_table,
+    run_scaling,
+)
+from pyecs.benchmarks.Visualizer import plot
+
+
+class Arguments(argparse.Namespace):
+    handler: Callable[["Arguments"], int]
+    scenarios: list[str]
+    cases: list[str]
+    output: str
+    repeats: int
+    warmup: int
+    seed: int
+    quick: bool
+    plot: str | None
+    baseline: str
+    candidate: str
+    threshold: float
+    tolerance: float
+    trace: str
+    chunk_capacity: list[int]
+    results: str
+
+
+def _load(path: str) -> SuiteResults:
+    with open(path) as file:
+        return cast(SuiteResults, json.load(file))
+
+
+def command_list(args: Arguments) -> int:  # pyright: ignore[reportUnusedParameter]
+    for name, registered in SCENARIOS.items():
+        print(f"{name:<36} {registered.metric:<8} {registered.description}")
+    return 0
+
+
+def command_run(args: Arguments) -> int:
+    scenarios = select(args.scenarios)
+    if not scenarios:
+        print(f"No scenarios match {args.scenarios}", file=sys.stderr)
+        return 2
+
+    results = run(scenarios, args.repeats, args.warmup, args.seed, args.quick, report=print)
+
+    output = Path(args.output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(results, indent=2))
+    print(f"Results saved to: {output}")
+
+    if args.plot:
+        plot(results, args.plot)
+    return 0
+
+
+def command_compare(args: Arguments) -> int:
+    baseline = _load(args.baseline)
+    candidate = _load(args.candidate)
+
+    for key in ("python", "beartype", "quick", "seed"):
+        before = baseline["metadata"].get(key)
+        after = candidate["metadata"].get(key)
+        if before != after:
+            print(f"warning: {key} differs ({before} vs {after})", file=sys.stderr)
+
+    comparisons = compare(baseline, candidate, args.threshold)
+    print(format_table(comparisons))
+
+    regressed = [row for row in comparisons if row.verdict == "regressed"]
+    if regressed:
+        print(f"\n{len(regressed)} measurement(s) regressed by more than {args.threshold:.0%}")
+        return 1
+    return 0
+
+
+def command_scaling(args: Arguments) -> int:
+    cases = [
+        case
+        for name, case in SCALING_CASES.items()
+        if not args.cases or any(name.startswith(pattern) for pattern in args.cases)
+    ]
+    results = run_scaling(cases, args.quick, args.repeats, args.tolerance, args.seed, print)
+    rows = results.get("scaling", [])
+    print(format_scaling_table(rows))
+
+    output = Path(args.output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(results, indent=2))
+    print(f"Results saved to: {output}")
+
+    if args.plot:
+        plot(results, args.plot)
+
+    flagged = [row for row in rows if row["verdict"] == "grows"]
+    if flagged:
+        print(f"\n{len(flagged)} operation(s) grow faster than expected")
+        return 1
+    return 0
+
+
+def command_replay(args: Arguments) -> int:
+    scenario = replay_scenario(args.trace, tuple(args.chunk_capacity))
+    results = run([scenario], args.repeats, args.warmup, report=print)
+
+    sizes = results["scenarios"][scenario.name]["sizes"]
+    for capacity in args.chunk_capacity:
+        measured = sizes[str(capacity)]
+        measured["details"] = {
+            **measured.get("details", {}),
+            "ops": replay_breakdown(args.trace, capacity),
+        }
+
+    output = Path(args.output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(results, indent=2))
+    print(f"Results saved to: {output}")
+    return 0
+
+
+def command_plot(args: Arguments) -> int:
+    plot(_load(args.results), args.output)
+    return 0
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m pyecs.benchmarks", description="PyECS benchmark suite"
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    list_parser = commands.add_parser("list", help="List registered scenarios")
+    list_parser.set_defaults(handler=command_list)
+
+    run_parser = commands.add_parser("run", help="Run scenarios and save results as JSON")
+    run_parser.add_argument("scenarios", nargs="*", help="Scenario name prefixes, e.g. core.query")
+    run_parser.add_argument("--output", "-o", default="benchmark_results/results.json")
+    run_parser.add_argument("--repeats", "-r", type=int, default=DEFAULT_REPEATS)
+    run_parser.add_argument("--warmup", "-w", type=int, default=DEFAULT_WARMUP)
+    run_parser.add_argument("--seed", "-s", type=int, default=DEFAULT_SEED)
+    run_parser.add_argument("--quick", "-q", action="store_true", help="Use the smaller sizes")
+    run_parser.add_argument("--plot", metavar="DIR", help="Also render plots into DIR")
+    run_parser.set_defaults(handler=command_run)
+
+    compare_parser = commands.add_parser("compare", help="Fail if the candidate regressed")
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("candidate")
+    compare_parser.add_argument("--threshold", "-t", type=float, default=DEFAULT_THRESHOLD)
+    compare_parser.set_defaults(handler=command_compare)
+
+    scaling_parser = commands.add_parser(
+        "scaling", help="Fit per-call cost growth and flag super-linear operations"
+    )
+    scaling_parser.add_argument("cases", nargs="*", help="Case name prefixes")
+    scaling_parser.add_argument("--output", "-o", default="benchmark_results/scaling.json")
+    scaling_parser.add_argument("--repeats", "-r", type=int, default=SCALING_REPEATS)
+    scaling_parser.add_argument("--tolerance", type=float, default=SCALING_TOLERANCE)
+    scaling_parser.add_argument("--seed", "-s", type=int, default=DEFAULT_SEED)
+    scaling_parser.add_argument("--quick", "-q", action="store_true", help="Use the smaller sizes")
+    scaling_parser.add_argument("--plot", metavar="DIR", help="Also render plots into DIR")
+    scaling_parser.set_defaults(handler=command_scaling)
+
+    replay_parser = commands.add_parser(
+        "replay", help="Time a recorded trace against storage configurations"
+    )
+    replay_parser.add_argument("trace", help="Trace file written by ECSWorld.start_recording")
+    replay_parser.add_argument(
+        "--chunk-capacity", "-c", type=int, nargs="+", default=list(REPLAY_CHUNK_CAPACITIES)
+    )
+    replay_parser.add_argument("--output", "-o", default="benchmark_results/replay.json")
+    replay_parser.add_argument("--repeats", "-r", type=int, default=DEFAULT_REPEATS)
+    replay_parser.add_argument("--warmup", "-w", type=int, default=DEFAULT_WARMUP)
+    replay_parser.set_defaults(handler=command_replay)
+
+    plot_parser = commands.add_parser("plot", help="Render results with benchmark_visualizer.py")
+    plot_parser.add_argument("results")
+    plot_parser.add_argument("--output", "-o", default="benchmark_results")
+    plot_parser.set_defaults(handler=command_plot)
+
+    args = parser.parse_args(argv, namespace=Arguments())
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
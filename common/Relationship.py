@@ -0,0 +1,15 @@
+from dataclasses import dataclass
+from typing import ClassVar
+
+from pyecs.common.Types import Entity
+
+
+@dataclass(frozen=True, slots=True)
+class Relationship(object):
+    target: Entity
+    cascade: ClassVar[bool] = False
+
+
+@dataclass(frozen=True, slots=True)
+class ChildOf(Relationship):
+    cascade: ClassVar[bool] = True
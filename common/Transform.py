@@ -0,0 +1,37 @@
+import math
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True, slots=True)
+class Transform(object):
+    x: float | int = 0.0
+    y: float | int = 0.0
+    rotation: float | int = 0.0
+    scale: float | int = 1.0
+
+    def compose(self, local: "Transform") -> "GlobalTransform":
+        """
+        Place a transform given relative to this one in world space.
+
+        The local offset is scaled and rotated by this transform before it
+        is added to this transform's position.
+
+        Returns the combined transform as a GlobalTransform.
+        """
+        cos, sin = math.cos(self.rotation), math.sin(self.rotation)
+        return GlobalTransform(
+            self.x + self.scale * (cos * local.x - sin * local.y),
+            self.y + self.scale * (sin * local.x + cos * local.y),
+            self.rotation + local.rotation,
+            self.scale * local.scale,
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class LocalTransform(Transform):
+    pass
+
+
+@dataclass(frozen=True, slots=True)
+class GlobalTransform(Transform):
+    pass
@@ -1,3 +1,15 @@
+from .Relationship import ChildOf, Relationship
+from .Transform import GlobalTransform, LocalTransform, Transform
 from .Types import UUID4, Component, Entity, SuccessOrFailure
 
-__all__ = ["UUID4", "Component", "Entity", "SuccessOrFailure"]
+__all__ = [
+    "UUID4",
+    "ChildOf",
+    "Component",
+    "Entity",
+    "GlobalTransform",
+    "LocalTransform",
+    "Relationship",
+    "SuccessOrFailure",
+    "Transform",
+]
@@ -1,22 +1,157 @@
-from collections.abc import Iterator
-from typing import Literal
+import weakref
+from collections.abc import Iterator, Mapping, Sequence
+from itertools import chain
+from typing import Literal, overload, override
 
 from pyecs.common.Types import UUID4, Component, Entity, SuccessOrFailure
+from pyecs.containers.ArchetypeChunk import CHUNK_CAPACITY, ArchetypeChunk, is_frozen
 from pyecs.helpers.Statuses import StatusCodes
 
 
+class ArchetypeEntities(Sequence[Entity]):
+    """Read-only flat view over the entity lists of an archetype's chunks."""
+
+    def __init__(self, archetype: "Archetype"):
+        self._archetype: Archetype = archetype
+
+    @override
+    def __len__(self) -> int:
+        return self._archetype.row_count()
+
+    @override
+    def __contains__(self, entity: object) -> bool:
+        return entity in self._archetype.entity_indices
+
+    @override
+    def __iter__(self) -> Iterator[Entity]:
+        return self._archetype.iter_entities()
+
+    @overload
+    def __getitem__(self, index: int) -> Entity: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[Entity]: ...
+
+    @override
+    def __getitem__(self, index: int | slice) -> Entity | list[Entity]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+
+        chunk, offset = self._archetype.locate(index)
+        return chunk.entities[offset]
+
+
+class ArchetypeColumn(Sequence[Component]):
+    """Read-only flat view over one component column of an archetype's chunks."""
+
+    def __init__(self, archetype: "Archetype", component_type: type[Component]):
+        self._archetype: Archetype = archetype
+        self._component_type: type[Component] = component_type
+
+    @override
+    def __len__(self) -> int:
+        return self._archetype.row_count()
+
+    @override
+    def __iter__(self) -> Iterator[Component]:
+        return self._archetype.iter_components(self._component_type)
+
+    @overload
+    def __getitem__(self, index: int) -> Component: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[Component]: ...
+
+    @override
+    def __getitem__(self, index: int | slice) -> Component | list[Component]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+
+        chunk, offset = self._archetype.locate(index)
+        return self._archetype.handout_column(chunk, self._component_type)[offset]
+
+
+class ArchetypeColumns(Mapping[type, ArchetypeColumn]):
+    """Read-only mapping from component type to its flat column view."""
+
+    def __init__(self, archetype: "Archetype"):
+        self._archetype: Archetype = archetype
+
+    @override
+    def __len__(self) -> int:
+        return len(self._archetype.component_types)
+
+    @override
+    def __iter__(self) -> Iterator[type]:
+        return iter(list(self._archetype.component_types))
+
+    @override
+    def __getitem__(self, component_type: type) -> ArchetypeColumn:
+        if component_type not in self._archetype.component_types:
+            raise KeyError(component_type)
+
+        return ArchetypeColumn(self._archetype, component_type)
+
+
 class Archetype(object):
-    def __init__(self):
-        self.entities: list[UUID4] = []
+    def __init__(self, chunk_capacity: int = CHUNK_CAPACITY):
+        self.chunk_capacity: int = chunk_capacity
+        self.chunks: list[ArchetypeChunk] = []
         self.entity_indices: dict[UUID4, int] = {}
-        self.components: dict[type, list[Component]] = {}
+        self.component_types: list[type] = []
+        self._index_shared: bool = False
+        self._index_lender: Archetype | None = None
+        self._borrowers: weakref.WeakSet[Archetype] = weakref.WeakSet()
+
+    @property
+    def entities(self) -> ArchetypeEntities:
+        """
+        Flat, read-only view of every entity in this archetype in row order.
+        """
+        return ArchetypeEntities(self)
+
+    @property
+    def components(self) -> ArchetypeColumns:
+        """
+        Flat, read-only view of every component column in this archetype.
+        """
+        return ArchetypeColumns(self)
+
+    def row_count(self) -> int:
+        """
+        Return the number of entities stored in this archetype.
+
+        Rows are kept dense, so every chunk but the last one is full.
+        """
+        if not self.chunks:
+            return 0
+
+        return (len(self.chunks) - 1) * self.chunk_capacity + len(self.chunks[-1].entities)
+
+    def locate(self, row: int) -> tuple[ArchetypeChunk, int]:
+        """
+        Find the chunk and offset holding a row.
+
+        Returns a (chunk, offset) pair. Raises IndexError if the row is out
+        of range.
+        """
+        if row < 0:
+            row += self.row_count()
+
+        chunk_index, offset = divmod(row, self.chunk_capacity)
+        if row < 0 or chunk_index >= len(self.chunks) or offset >= len(self.chunks[chunk_index]):
+            raise IndexError("archetype row out of range")
+
+        return self.chunks[chunk_index], offset
 
     def add_entity(self, entity: Entity, components: list[Component]) -> SuccessOrFailure:
         """
         Add an entity and its components to this archetype.
 
-        This method stores the entity and its components in parallel arrays,
-        maintaining alignment between entity indices and component indices.
+        This method appends the entity and its components to the last chunk,
+        starting a new fixed-capacity chunk when the last one is full, and
+        keeps every column of the chunk aligned with its entity list. Columns
+        the entity has no component for hold None.
 
         Returns SUCCESS if the entity was added, or FAILURE if the entity
         already exists in this archetype.
@@ -24,17 +159,84 @@ class Archetype(object):
         if entity in self.entity_indices:
             return StatusCodes.FAILURE
 
-        entity_index = len(self.entities)
-        self.entities.append(entity)
-        self.entity_indices[entity] = entity_index
+        if self._index_shared:
+            self._unshare_index()
+
+        row = self.row_count()
+        provided: dict[type, Component] = {
+            component.__class__: component for component in components
+        }
+
+        for comp_type in provided:
+            if comp_type not in self.component_types:
+                self._add_column(comp_type)
+
+        if not self.chunks or self.chunks[-1].is_full():
+            chunk = ArchetypeChunk(self.chunk_capacity)
+            chunk.columns = {comp_type: [] for comp_type in self.component_types}
+            self.chunks.append(chunk)
+
+        chunk = self.chunks[-1]
+        chunk.detach()
+        chunk.entities.append(entity)
+        chunk.enabled.append(1)
+
+        for comp_type, column in chunk.columns.items():
+            column.append(provided.get(comp_type))
+
+        chunk.version += 1
+        self.entity_indices[entity] = row
+
+        return StatusCodes.SUCCESS
+
+    def add_entities(
+        self, entities: list[Entity], columns: dict[type, list[Component]]
+    ) -> SuccessOrFailure:
+        """
+        Append several entities and their components to this archetype.
+
+        Each column holds one component per entity, in the same order as
+        entities. Rows are appended a chunk at a time by extending the
+        chunk's entity list, enabled mask and columns with slices, starting
+        new chunks as needed. Columns without components hold None.
+
+        Returns SUCCESS if the entities were added, or FAILURE if any of them
+        already exists in this archetype.
+        """
+        if any(entity in self.entity_indices for entity in entities):
+            return StatusCodes.FAILURE
+
+        if self._index_shared:
+            self._unshare_index()
+
+        for comp_type in columns:
+            if comp_type not in self.component_types:
+                self._add_column(comp_type)
+
+        row = self.row_count()
+        total = len(entities)
+        done = 0
 
-        for component in components:
-            comp_type: type[object] = component.__class__
+        while done < total:
+            if not self.chunks or self.chunks[-1].is_full():
+                chunk = ArchetypeChunk(self.chunk_capacity)
+                chunk.columns = {comp_type: [] for comp_type in self.component_types}
+                self.chunks.append(chunk)
 
-            if comp_type not in self.components:
-                self.components[comp_type] = [None] * entity_index
+            chunk = self.chunks[-1]
+            chunk.detach()
+            stop = min(total, done + chunk.capacity - len(chunk.entities))
+            chunk.entities.extend(entities[done:stop])
+            chunk.enabled.extend(b"\x01" * (stop - done))
 
-            self.components[comp_type].append(component)
+            for comp_type, column in chunk.columns.items():
+                values = columns.get(comp_type)
+                column.extend([None] * (stop - done) if values is None else values[done:stop])
+
+            chunk.version += 1
+            done = stop
+
+        self.entity_indices.update(zip(entities, range(row, row + total), strict=True))
 
         return StatusCodes.SUCCESS
 
@@ -42,8 +244,9 @@ class Archetype(object):
         """
         Remove an entity and all its component data from this archetype.
 
-        This method maintains the parallel array structure by removing the
-        entity and its components from the same index across all arrays.
+        This method keeps rows dense by moving the archetype's last row into
+        the removed entity's slot. A last chunk left empty is dropped so its
+        memory is released.
 
         Returns SUCCESS if the entity was removed, or FAILURE if the entity
         does not exist in this archetype.
@@ -51,22 +254,38 @@ class Archetype(object):
         if entity not in self.entity_indices:
             return StatusCodes.FAILURE
 
-        entity_index = self.entity_indices[entity]
-        last_index = len(self.entities) - 1
+        if self._index_shared:
+            self._unshare_index()
+
+        row = self.entity_indices.pop(entity)
+        last_row = self.row_count() - 1
+        last_chunk = self.chunks[-1]
+        last_chunk.detach()
+
+        if row != last_row:
+            chunk, offset = self.locate(row)
+            chunk.detach()
 
-        if entity_index != last_index:
-            last_entity = self.entities[last_index]
-            self.entities[entity_index] = last_entity
-            self.entity_indices[last_entity] = entity_index
+            last_entity = last_chunk.entities[-1]
+            chunk.entities[offset] = last_entity
+            chunk.enabled[offset] = last_chunk.enabled[-1]
 
-            for _, comp_list in self.components.items():
-                comp_list[entity_index] = comp_list[last_index]
+            for comp_type, column in chunk.columns.items():
+                column[offset] = last_chunk.columns[comp_type][-1]
 
-        _ = self.entities.pop()
-        del self.entity_indices[entity]
+            self.entity_indices[last_entity] = row
+            chunk.version += 1
 
-        for _, comp_list in self.components.items():
-            _ = comp_list.pop()
+        _ = last_chunk.entities.pop()
+        _ = last_chunk.enabled.pop()
+
+        for column in last_chunk.columns.values():
+            _ = column.pop()
+
+        last_chunk.version += 1
+
+        if not last_chunk.entities:
+            _ = self.chunks.pop()
 
         return StatusCodes.SUCCESS
 
@@ -76,8 +295,8 @@ class Archetype(object):
         """
         Retrieve a specific component for an entity.
 
-        This method uses the parallel array structure to efficiently locate
-        the requested component by finding the entity's index.
+        This method locates the entity's chunk and offset from its row index
+        and reads the component from that chunk's column.
 
         Returns the component instance if found, or FAILURE if the entity
         doesn't exist or doesn't have the specified component type.
@@ -85,34 +304,213 @@ class Archetype(object):
         if entity not in self.entity_indices:
             return StatusCodes.FAILURE
 
-        entity_index = self.entity_indices[entity]
+        chunk_index, offset = divmod(self.entity_indices[entity], self.chunk_capacity)
+        chunk = self.chunks[chunk_index]
 
-        if component_type in self.components.keys():
-            return self.components[component_type][entity_index]
+        if component_type in chunk.columns:
+            return self.handout_column(chunk, component_type)[offset]
 
         return StatusCodes.FAILURE
 
+    def set_component(self, entity: Entity, component: Component) -> SuccessOrFailure:
+        """
+        Replace an existing component of an entity in place.
+
+        This method overwrites the slot for the component's type at the
+        entity's row without changing the archetype's layout.
+
+        Returns SUCCESS if the component was replaced, or FAILURE if the entity
+        doesn't exist or this archetype has no column for the component type.
+        """
+        if entity not in self.entity_indices:
+            return StatusCodes.FAILURE
+
+        comp_type: type[object] = component.__class__
+        if comp_type not in self.component_types:
+            return StatusCodes.FAILURE
+
+        chunk, offset = self.locate(self.entity_indices[entity])
+        chunk.column(comp_type)[offset] = component
+        chunk.version += 1
+
+        return StatusCodes.SUCCESS
+
+    def set_enabled(self, entity: Entity, enabled: bool) -> SuccessOrFailure:
+        """
+        Enable or disable an entity without changing its archetype.
+
+        Disabled entities keep their components but are skipped by queries.
+
+        Returns SUCCESS if the flag was set, or FAILURE if the entity does not
+        exist in this archetype.
+        """
+        if entity not in self.entity_indices:
+            return StatusCodes.FAILURE
+
+        chunk, offset = self.locate(self.entity_indices[entity])
+        chunk.set_enabled(offset, enabled)
+        chunk.version += 1
+
+        return StatusCodes.SUCCESS
+
+    def is_enabled(self, entity: Entity) -> bool:
+        """
+        Check whether an entity in this archetype is enabled.
+
+        Returns True if the entity exists here and is enabled, False otherwise.
+        """
+        if entity not in self.entity_indices:
+            return False
+
+        chunk, offset = self.locate(self.entity_indices[entity])
+        return bool(chunk.enabled[offset])
+
     def iter_entities(self) -> Iterator[Entity]:
         """
         Iterate over all entities in this archetype.
 
-        This method provides direct iteration over the entities list,
+        This method chains the entity lists of every chunk in row order,
         useful for systems that need to process all entities with a
         specific component combination.
 
         Returns an iterator over all entity UUIDs in this archetype.
         """
-        return iter(self.entities)
+        return chain.from_iterable([chunk.entities for chunk in self.chunks])
 
     def iter_components(self, component_type: type) -> Iterator[Component]:
         """
         Iterate over all components of a specific type.
 
         This method yields all component instances of the requested type
-        stored in this archetype, in the same order as their entities.
+        stored in this archetype, chunk by chunk, in the same order as
+        their entities.
 
         Yields component instances if the archetype contains the specified
         component type, otherwise yields nothing.
         """
-        if component_type in self.components:
-            yield from self.components[component_type]
+        if component_type in self.component_types:
+            for chunk in list(self.chunks):
+                yield from self.handout_column(chunk, component_type)
+
+    def slice_column(
+        self, component_type: type[Component], start: int, stop: int
+    ) -> list[Component] | Literal[StatusCodes.FAILURE]:
+        """
+        Copy a contiguous range of rows out of one component column.
+
+        The returned list is new, but the component instances in it are the
+        ones stored in this archetype. The range may span several chunks.
+
+        Returns the list of components for rows start to stop, or FAILURE if
+        this archetype has no column for the component type.
+        """
+        if component_type not in self.component_types:
+            return StatusCodes.FAILURE
+
+        result: list[Component] = []
+        row = max(start, 0)
+        stop = min(stop, self.row_count())
+
+        while row < stop:
+            chunk, offset = self.locate(row)
+            count = min(stop - row, len(chunk) - offset)
+            result.extend(self.handout_column(chunk, component_type)[offset : offset + count])
+            row += count
+
+        return result
+
+    def write_column(
+        self, component_type: type[Component], start: int, components: list[Component]
+    ) -> SuccessOrFailure:
+        """
+        Overwrite a contiguous range of rows in one component column.
+
+        This method replaces the components at rows start onwards with the
+        given components without changing the archetype's layout. The range
+        may span several chunks.
+
+        Returns SUCCESS if the rows were written, or FAILURE if this archetype
+        has no column for the component type or the range runs past the end.
+        """
+        if component_type not in self.component_types:
+            return StatusCodes.FAILURE
+
+        stop = start + len(components)
+        if start < 0 or stop > self.row_count():
+            return StatusCodes.FAILURE
+
+        row = start
+        while row < stop:
+            chunk, offset = self.locate(row)
+            count = min(stop - row, len(chunk) - offset)
+            chunk.column(component_type)[offset : offset + count] = components[
+                row - start : row - start + count
+            ]
+            chunk.version += 1
+            row += count
+
+        return StatusCodes.SUCCESS
+
+    def handout_column(
+        self, chunk: ArchetypeChunk, component_type: type[Component]
+    ) -> list[Component]:
+        """
+        Return a chunk column whose components may be handed out to callers.
+
+        Callers may change the components they get in place, so a column
+        shared with a fork is copied first. Frozen components cannot be
+        changed and are read from the shared column without copying it.
+
+        Raises KeyError if the chunk has no column for the component type.
+        """
+        if is_frozen(component_type):
+            return chunk.read_column(component_type)
+
+        return chunk.column(component_type)
+
+    def fork(self) -> "Archetype":
+        """
+        Create a copy-on-write fork of this archetype.
+
+        Every chunk is forked, so entity lists, enabled masks and component
+        columns are shared per chunk and only the chunk column an operation
+        touches is copied. The entity index dict is shared until either side
+        adds or removes an entity.
+
+        Returns the forked archetype.
+        """
+        forked = Archetype(self.chunk_capacity)
+        forked.chunks = [chunk.fork() for chunk in self.chunks]
+        forked.component_types = list(self.component_types)
+        forked.entity_indices = self.entity_indices
+
+        lender = self._index_lender or self
+        forked._index_shared = True
+        forked._index_lender = lender
+        lender._index_shared = True
+        lender._borrowers.add(forked)
+
+        return forked
+
+    def _add_column(self, component_type: type) -> None:
+        """
+        Add an empty column for a new component type to every chunk.
+        """
+        self.component_types.append(component_type)
+
+        for chunk in self.chunks:
+            chunk.columns[component_type] = [None] * len(chunk.entities)
+
+    def _unshare_index(self) -> None:
+        """
+        Give this archetype and its forks separate entity index dicts.
+        """
+        self._index_shared = False
+
+        if self._index_lender is not None:
+            self._index_lender = None
+            self.entity_indices = dict(self.entity_indices)
+
+        for borrower in list(self._borrowers):
+            if borrower._index_lender is self:
+                borrower._unshare_index()
@@ -0,0 +1,164 @@
+import copy
+import functools
+import weakref
+from typing import cast
+
+from pyecs.common.Types import UUID4, Component
+
+CHUNK_CAPACITY: int = 16384
+
+
+@functools.cache
+def is_frozen(component_type: type) -> bool:
+    """
+    Check whether a component type is a frozen dataclass.
+
+    Frozen components cannot be changed in place, so a column of them can
+    be handed out while it is still shared with forked chunks.
+
+    Returns True if instances of the type are frozen dataclasses.
+    """
+    params = cast(object, getattr(component_type, "__dataclass_params__", None))
+    return getattr(params, "frozen", False) is True
+
+
+class ArchetypeChunk(object):
+    def __init__(self, capacity: int = CHUNK_CAPACITY):
+        self.capacity: int = capacity
+        self.entities: list[UUID4] = []
+        self.enabled: bytearray = bytearray()
+        self.columns: dict[type, list[Component]] = {}
+        self.version: int = 0
+        self._shared: set[type] = set()
+        self._rows_shared: bool = False
+        self._lenders: dict[type, ArchetypeChunk] = {}
+        self._rows_lender: ArchetypeChunk | None = None
+        self._borrowers: weakref.WeakSet[ArchetypeChunk] = weakref.WeakSet()
+
+    def __len__(self) -> int:
+        return len(self.entities)
+
+    def is_full(self) -> bool:
+        """
+        Check whether this chunk has reached its row capacity.
+
+        Returns True if no more rows can be appended to this chunk.
+        """
+        return len(self.entities) >= self.capacity
+
+    def read_column(self, component_type: type[Component]) -> list[Component]:
+        """
+        Return one column of this chunk for reading.
+
+        The list may still be shared with forked chunks, so neither it nor
+        the components in it may be changed; use column for that.
+
+        Raises KeyError if this chunk has no column for the component type.
+        """
+        return self.columns[component_type]
+
+    def column(self, component_type: type[Component]) -> list[Component]:
+        """
+        Return one column of this chunk for writing.
+
+        A column shared with a forked chunk is copied first, so the caller
+        may mutate the returned list and the components in it.
+
+        Raises KeyError if this chunk has no column for the component type.
+        """
+        if component_type in self._shared:
+            self._unshare_column(component_type)
+
+        return self.columns[component_type]
+
+    def set_enabled(self, row: int, enabled: bool) -> None:
+        """
+        Set the enabled flag of one row, copying a shared enabled mask first.
+
+        Raises IndexError if the row is out of range.
+        """
+        if self._rows_shared:
+            self._unshare_rows()
+
+        self.enabled[row] = int(enabled)
+
+    def detach(self) -> None:
+        """
+        Take private copies of the rows and every column before a structural change.
+        """
+        if self._shared or self._rows_shared:
+            for component_type in list(self._shared):
+                self._unshare_column(component_type)
+
+            if self._rows_shared:
+                self._unshare_rows()
+
+    def fork(self) -> "ArchetypeChunk":
+        """
+        Create a copy-on-write fork of this chunk.
+
+        The fork shares the entity list, the enabled mask and every component
+        column with this chunk, so forking costs O(columns) instead of
+        O(rows). A shared column is copied the first time either side touches
+        it; when the original is touched first, its forks receive the copy so
+        component objects already handed out by the original stay valid.
+
+        Returns the forked chunk.
+        """
+        forked = ArchetypeChunk(self.capacity)
+        forked.entities = self.entities
+        forked.enabled = self.enabled
+        forked.columns = dict(self.columns)
+        forked.version = self.version
+        forked._shared = set(self.columns)
+        forked._rows_shared = True
+        forked._rows_lender = self._rows_lender or self
+
+        for comp_type in self.columns:
+            forked._lenders[comp_type] = self._lenders.get(comp_type, self)
+
+        for lender in {forked._rows_lender, *forked._lenders.values()}:
+            lender._shared.update(
+                comp_type for comp_type, owner in forked._lenders.items() if owner is lender
+            )
+            lender._rows_shared = lender._rows_shared or lender is forked._rows_lender
+            lender._borrowers.add(forked)
+
+        return forked
+
+    def _unshare_column(self, component_type: type) -> None:
+        """
+        Give this chunk and its forks separate copies of a shared column.
+
+        A borrowed column is replaced by a shallow copy of each component, or
+        by a copy of the list alone for frozen components, which keep their
+        identity. A column lent to forks stays in place and every fork
+        borrowing it is made to copy it first.
+        """
+        self._shared.discard(component_type)
+
+        if self._lenders.pop(component_type, None) is not None:
+            column = self.columns[component_type]
+            if is_frozen(component_type):
+                self.columns[component_type] = list(column)
+            else:
+                self.columns[component_type] = [copy.copy(component) for component in column]
+
+        for borrower in list(self._borrowers):
+            if borrower._lenders.get(component_type) is self:
+                borrower._unshare_column(component_type)
+
+    def _unshare_rows(self) -> None:
+        """
+        Give this chunk and its forks separate entity lists and enabled masks.
+        """
+        self._rows_shared = False
+
+        if self._rows_lender is not None:
+            self._rows_lender = None
+            self.entities = list(self.entities)
+            self.enabled = bytearray(self.enabled)
+
+        for borrower in list(self._borrowers):
+            if borrower._rows_lender is self:
+                borrower._unshare_rows()
@@ -0,0 +1,70 @@
+from itertools import compress, islice
+
+from pyecs.common.Types import Entity
+from pyecs.containers.Archetype import Archetype
+from pyecs.containers.ComponentStorage import ComponentStorage
+
+
+class CachedQuery(object):
+    def __init__(self, with_types: frozenset[type], without_types: frozenset[type] | None = None):
+        self.with_types: frozenset[type] = with_types
+        self.without_types: frozenset[type] = without_types or frozenset()
+        self.archetypes: list[Archetype] = []
+        self.storage: ComponentStorage | None = None
+        self.scanned: int = 0
+
+    def matches(self, mask: frozenset[type]) -> bool:
+        """
+        Check whether an archetype mask satisfies this query.
+        """
+        return self.with_types.issubset(mask) and self.without_types.isdisjoint(mask)
+
+    def refresh(self, storage: ComponentStorage) -> list[Archetype]:
+        """
+        Bring the cached archetypes up to date with a storage.
+
+        Archetypes are never removed from a storage and its archetype dict
+        keeps insertion order, so only the archetypes created since the last
+        refresh are checked against the query. A different storage, such as
+        a forked world's, starts the cache over.
+
+        Returns the matching archetypes in creation order.
+        """
+        if storage is not self.storage:
+            self.storage = storage
+            self.archetypes = []
+            self.scanned = 0
+
+        archetypes = storage.archetypes
+        if len(archetypes) != self.scanned:
+            for mask, archetype in islice(archetypes.items(), self.scanned, None):
+                if self.matches(mask):
+                    self.archetypes.append(archetype)
+            self.scanned = len(archetypes)
+
+        return self.archetypes
+
+    def entities(self) -> list[Entity]:
+        """
+        List the enabled entities of every cached archetype.
+
+        Call refresh first to pick up archetypes created since the last one.
+
+        Returns the entities in archetype and row order.
+        """
+        matching: list[Entity] = []
+
+        for archetype in self.archetypes:
+            for chunk in archetype.chunks:
+                if 0 in chunk.enabled:
+                    matching.extend(compress(chunk.entities, chunk.enabled))
+                else:
+                    matching.extend(chunk.entities)
+
+        return matching
+
+    def row_count(self) -> int:
+        """
+        Return the number of rows, enabled or not, in every cached archetype.
+        """
+        return sum(archetype.row_count() for archetype in self.archetypes)
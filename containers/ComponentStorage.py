@@ -1,15 +1,26 @@
+import sys
 from typing import Literal
 
+from pyecs.common.Relationship import Relationship
 from pyecs.common.Types import UUID4, Component, Entity, SuccessOrFailure
 from pyecs.containers.Archetype import Archetype
+from pyecs.containers.ArchetypeChunk import CHUNK_CAPACITY
+from pyecs.containers.Observer import Observer
+from pyecs.containers.RelationshipIndex import RelationshipIndex
+from pyecs.containers.StorageCounters import StorageCounters
 from pyecs.helpers.Deprecation import deprecated_external
 from pyecs.helpers.Statuses import StatusCodes
 
 
 class ComponentStorage(object):
-    def __init__(self):
+    def __init__(self, chunk_capacity: int = CHUNK_CAPACITY):
+        self.chunk_capacity: int = chunk_capacity
         self.archetypes: dict[frozenset[type], Archetype] = {}
         self.entity_to_archetype: dict[UUID4, frozenset[type]] = {}
+        self.counters: StorageCounters = StorageCounters()
+        self.on_add: dict[type, list[Observer]] = {}
+        self.on_remove: dict[type, list[Observer]] = {}
+        self.relationships: RelationshipIndex = RelationshipIndex()
 
     def add_component(
         self, entity: Entity, component: Component
@@ -19,7 +30,10 @@ class ComponentStorage(object):
 
         If the component type doesn't exist on the entity, adds it and transitions
         the entity to a new archetype. If the component type already exists,
-        updates the existing component in place.
+        updates the existing component in place. Observers of the type being
+        added are notified once the entity has moved; updates notify nobody.
+        Relationship components are added to or moved in the relationship
+        index.
 
         Returns COMPONENT_ADDED for new components, COMPONENT_UPDATED for existing
         components, or FAILURE if the entity doesn't exist.
@@ -30,6 +44,9 @@ class ComponentStorage(object):
         mask: frozenset[type] = self.entity_to_archetype[entity]
         current_archetype: Archetype = self.archetypes[mask]
 
+        if isinstance(component, Relationship):
+            self.relationships.link(entity, component)
+
         if component.__class__ not in mask:
             new_mask: frozenset[type] = mask | {component.__class__}
 
@@ -38,10 +55,13 @@ class ComponentStorage(object):
 
             _ = self.move_entity_to_archetype(entity, new_mask, components)
 
+            if self.on_add and component.__class__ in self.on_add:
+                for observer in tuple(self.on_add[component.__class__]):
+                    observer.notify(entity, component)
+
             return StatusCodes.COMPONENT_ADDED
         else:
-            entity_index: int = current_archetype.entity_indices[entity]
-            current_archetype.components[component.__class__][entity_index] = component
+            _ = current_archetype.set_component(entity, component)
             return StatusCodes.COMPONENT_UPDATED
 
     @deprecated_external(
@@ -56,7 +76,9 @@ class ComponentStorage(object):
         Remove a component type from an entity.
 
         Transitions the entity to a new archetype without the specified component.
-        If this was the last component, removes the entity entirely.
+        If this was the last component, removes the entity entirely. Observers
+        of the removed type are notified with the removed component once the
+        entity has moved. A removed relationship leaves the relationship index.
 
         Returns COMPONENT_REMOVED on success, or FAILURE if the entity doesn't
         exist or doesn't have the specified component type.
@@ -73,14 +95,21 @@ class ComponentStorage(object):
         new_mask: frozenset[type] = mask - {component_type}
 
         if new_mask:
+            self.relationships.unlink(entity, component_type)
+            removed = current_archetype.get_component(entity, component_type)
             components: list[Component] = []
             for comp_type in mask:
                 if comp_type != component_type:
                     comp = current_archetype.get_component(entity, comp_type)
                     components.append(comp)
+            self.counters.components_copied += len(components)
 
             _ = self.move_entity_to_archetype(entity, new_mask, components)
 
+            if self.on_remove and component_type in self.on_remove:
+                for observer in tuple(self.on_remove[component_type]):
+                    observer.notify(entity, removed)
+
             return StatusCodes.COMPONENT_REMOVED
         else:
             _ = self.remove_entity(entity)
@@ -118,6 +147,19 @@ class ComponentStorage(object):
         mask: frozenset[type] = self.entity_to_archetype[entity]
         return component_type in mask
 
+    def set_enabled(self, entity: Entity, enabled: bool) -> SuccessOrFailure:
+        """
+        Enable or disable an entity in its current archetype.
+
+        Disabled entities keep their components but are skipped by queries.
+
+        Returns SUCCESS if the flag was set, or FAILURE if the entity doesn't exist.
+        """
+        if entity not in self.entity_to_archetype:
+            return StatusCodes.FAILURE
+
+        return self.archetypes[self.entity_to_archetype[entity]].set_enabled(entity, enabled)
+
     def move_entity_to_archetype(
         self, entity: Entity, new_mask: frozenset[type], components: list[Component] | None = None
     ) -> SuccessOrFailure:
@@ -126,9 +168,13 @@ class ComponentStorage(object):
 
         Handles the transition of an entity between archetypes when components
         are added or removed. Creates the target archetype if it doesn't exist.
+        A disabled entity stays disabled in its new archetype.
 
         Returns SUCCESS after moving the entity to the new archetype.
         """
+        self.counters.archetype_moves += 1
+        enabled = True
+
         if entity in self.entity_to_archetype:
             current_mask = self.entity_to_archetype[entity]
             current_archetype = self.archetypes[current_mask]
@@ -136,27 +182,80 @@ class ComponentStorage(object):
             if components is None:
                 components = self.get_entity_components(entity)
 
+            if entity in current_archetype.entity_indices:
+                enabled = current_archetype.is_enabled(entity)
             _ = current_archetype.remove_entity(entity)
         else:
             if components is None:
                 components = []
 
-        if new_mask not in self.archetypes:
-            self.archetypes[new_mask] = Archetype()
-
-        target_archetype = self.archetypes[new_mask]
+        target_archetype = self.get_or_create_archetype(new_mask)
         _ = target_archetype.add_entity(entity, components)
 
+        if not enabled:
+            _ = target_archetype.set_enabled(entity, False)
+
         self.entity_to_archetype[entity] = new_mask
 
         return StatusCodes.SUCCESS
 
+    def get_or_create_archetype(self, mask: frozenset[type]) -> Archetype:
+        """
+        Return the archetype for a component mask, creating it if needed.
+
+        New archetypes use this storage's chunk capacity.
+        """
+        if mask not in self.archetypes:
+            self.archetypes[mask] = Archetype(self.chunk_capacity)
+            self.counters.archetypes_created += 1
+
+        return self.archetypes[mask]
+
+    def add_entities(
+        self, entities: list[Entity], columns: dict[type, list[Component]]
+    ) -> SuccessOrFailure:
+        """
+        Store several new entities that share one set of component types.
+
+        Each column holds one component per entity, in the same order as
+        entities, and the column types form the archetype mask. The rows are
+        appended to that archetype in bulk without any intermediate moves.
+        Relationship components are indexed, then addition observers are
+        notified column by column.
+
+        Returns SUCCESS if the entities were stored, or FAILURE if any of
+        them is already stored.
+        """
+        if any(entity in self.entity_to_archetype for entity in entities):
+            return StatusCodes.FAILURE
+
+        mask: frozenset[type] = frozenset(columns)
+        archetype = self.get_or_create_archetype(mask)
+        if archetype.add_entities(entities, columns) == StatusCodes.FAILURE:
+            return StatusCodes.FAILURE
+
+        self.entity_to_archetype.update(dict.fromkeys(entities, mask))
+
+        for comp_type, column in columns.items():
+            if issubclass(comp_type, Relationship):
+                for entity, component in zip(entities, column, strict=True):
+                    self.relationships.link(entity, component)  # pyright: ignore[reportArgumentType]
+            if self.on_add and comp_type in self.on_add:
+                for observer in tuple(self.on_add[comp_type]):
+                    for entity, component in zip(entities, column, strict=True):
+                        observer.notify(entity, component)
+
+        return StatusCodes.SUCCESS
+
     def remove_entity(self, entity: Entity) -> SuccessOrFailure:
         """
         Remove an entity and all its components from storage.
 
         Removes the entity from its current archetype and clears all
-        component data associated with it.
+        component data associated with it. Removal observers of each of the
+        entity's component types are notified afterwards. Relationships the
+        entity holds leave the relationship index; relationships pointing at
+        it are left to the caller.
 
         Returns SUCCESS on removal, or FAILURE if the entity doesn't exist.
         """
@@ -165,11 +264,62 @@ class ComponentStorage(object):
 
         mask: frozenset[type] = self.entity_to_archetype[entity]
         archetype = self.archetypes[mask]
+        removed: list[tuple[Observer, Component]] = []
+        if self.on_remove:
+            removed = [
+                (observer, archetype.get_component(entity, component_type))
+                for component_type in mask
+                for observer in self.on_remove.get(component_type, ())
+            ]
+
         _ = archetype.remove_entity(entity)
         del self.entity_to_archetype[entity]
+        if self.relationships.targets:
+            self.relationships.unlink_all(entity, mask)
+
+        for observer, component in removed:
+            observer.notify(entity, component)
+
+        return StatusCodes.SUCCESS
+
+    def add_observer(self, observer: Observer) -> None:
+        """
+        Start notifying an observer when its component type is added or removed.
+        """
+        hooks = self.on_add if observer.event == "add" else self.on_remove
+        hooks.setdefault(observer.component_type, []).append(observer)
+
+    def remove_observer(self, observer: Observer) -> SuccessOrFailure:
+        """
+        Stop notifying an observer, dropping any notifications it has queued.
+
+        Returns SUCCESS if the observer was removed, or FAILURE if it was
+        not registered.
+        """
+        hooks = self.on_add if observer.event == "add" else self.on_remove
+        observers = hooks.get(observer.component_type, [])
+        if observer not in observers:
+            return StatusCodes.FAILURE
+
+        observers.remove(observer)
+        if not observers:
+            del hooks[observer.component_type]
+        observer.pending = []
 
         return StatusCodes.SUCCESS
 
+    def flush_observers(self) -> None:
+        """
+        Deliver the notifications queued by every batched observer.
+
+        Addition observers are flushed before removal observers.
+        """
+        for hooks in (self.on_add, self.on_remove):
+            for observers in list(hooks.values()):
+                for observer in list(observers):
+                    if observer.batched:
+                        observer.flush()
+
     def get_entity_components(self, entity: Entity) -> list[Component]:
         """
         Retrieve all components for an entity.
@@ -185,4 +335,57 @@ class ComponentStorage(object):
             component: Component = archetype.get_component(entity, component_type)
             components.append(component)
 
+        self.counters.components_copied += len(components)
         return components
+
+    def column_bytes(self) -> dict[str, int]:
+        """
+        Measure the list storage held by each component type's columns.
+
+        Sums sys.getsizeof of every chunk column list per component type,
+        which covers the row slots but not the component objects they point
+        to.
+
+        Returns a dict mapping component type names to bytes.
+        """
+        sizes: dict[str, int] = {}
+        for archetype in self.archetypes.values():
+            for chunk in archetype.chunks:
+                for component_type, column in chunk.columns.items():
+                    name = component_type.__name__
+                    sizes[name] = sizes.get(name, 0) + sys.getsizeof(column)
+
+        return sizes
+
+    def metrics(self) -> dict[str, object]:
+        """
+        Return a JSON-compatible snapshot of storage counters and sizes.
+
+        The snapshot holds the counters' tick count, running totals and last
+        tick growth, plus the current number of archetypes, stored entities
+        and column bytes per component type.
+        """
+        return {
+            **self.counters.snapshot(),
+            "archetypes": len(self.archetypes),
+            "entities": len(self.entity_to_archetype),
+            "column_bytes": self.column_bytes(),
+        }
+
+    def fork(self) -> "ComponentStorage":
+        """
+        Create a copy-on-write fork of this storage.
+
+        Every archetype is forked so component columns are shared with this
+        storage until either side touches them. Only the entity-to-archetype
+        map and relationship index are copied eagerly. The fork starts with
+        fresh counters and without observers.
+
+        Returns the forked storage.
+        """
+        forked = ComponentStorage(self.chunk_capacity)
+        forked.archetypes = {mask: archetype.fork() for mask, archetype in self.archetypes.items()}
+        forked.entity_to_archetype = dict(self.entity_to_archetype)
+        forked.relationships = self.relationships.fork()
+
+        return forked
@@ -0,0 +1,274 @@
+import dataclasses
+from array import array
+from collections.abc import Iterable, Iterator
+from itertools import islice
+from typing import cast, final, override
+
+from pyecs.exporting.Export import component_schema
+
+type Column = array[int] | array[float]
+
+
+class EventChannel[T]:
+    def __init__(self, event_type: type[T]):
+        self.event_type: type[T] = event_type
+        self.front: list[T] = []
+        self.back: list[T] = []
+        self.readable: int = 0
+        self.pending: int = 0
+        self.sent: int = 0
+
+    def __len__(self) -> int:
+        return self.readable
+
+    def send(self, event: T) -> None:
+        """
+        Queue an event for readers in the next frame.
+
+        Slots left over from earlier frames are overwritten before the
+        buffer grows, so a steady event rate stops allocating once the
+        buffers have grown to the peak rate.
+        """
+        if self.pending < len(self.back):
+            self.back[self.pending] = event
+        else:
+            self.back.append(event)
+
+        self.pending += 1
+        self.sent += 1
+
+    def send_batch(self, events: Iterable[T]) -> None:
+        """
+        Queue several events for readers in the next frame.
+        """
+        for event in events:
+            self.send(event)
+
+    def read(self) -> Iterator[T]:
+        """
+        Iterate over the events sent during the previous frame.
+
+        Every reader sees the same events, in the order they were sent,
+        until the next swap.
+        """
+        return islice(self.front, self.readable)
+
+    def swap(self) -> None:
+        """
+        Make this frame's events readable and start an empty write buffer.
+
+        The two buffers trade places instead of being reallocated. Events
+        of the frame before stay referenced by the new write buffer until
+        they are overwritten or the channel is cleared.
+        """
+        self.front, self.back = self.back, self.front
+        self.readable = self.pending
+        self.pending = 0
+
+    def clear(self) -> None:
+        """
+        Drop every readable and pending event and release the buffers.
+        """
+        self.front = []
+        self.back = []
+        self.readable = 0
+        self.pending = 0
+
+    def fork(self) -> "EventChannel[T]":
+        """
+        Create a copy of this channel with the same readable and pending events.
+
+        Returns the forked channel.
+        """
+        forked = EventChannel(self.event_type)
+        forked.front = self.front[: self.readable]
+        forked.back = self.back[: self.pending]
+        forked.readable = self.readable
+        forked.pending = self.pending
+        forked.sent = self.sent
+
+        return forked
+
+
+@final
+class SchemaEventChannel[T](EventChannel[T]):
+    def __init__(self, event_type: type[T]):
+        super().__init__(event_type)
+        self.schema: dict[str, str] = component_schema(event_type)
+        self.fields: tuple[str, ...] = tuple(self.schema)
+        self.front_columns: dict[str, Column] = {
+            field: array(typecode) for field, typecode in self.schema.items()
+        }
+        self.back_columns: dict[str, Column] = {
+            field: array(typecode) for field, typecode in self.schema.items()
+        }
+        self.front_capacity: int = 0
+        self.back_capacity: int = 0
+
+    @override
+    def send(self, event: T) -> None:
+        """
+        Queue an event by copying its fields into the write columns.
+        """
+        self.send_values(*[cast(object, getattr(event, field)) for field in self.fields])
+
+    def send_values(self, *values: object) -> None:
+        """
+        Queue an event given as field values in declaration order.
+
+        This skips building an event object for high-volume senders. A
+        value the columns cannot store, or a column view still held from
+        before a swap, raises and leaves the channel as it was.
+        """
+        if len(values) != len(self.fields):
+            raise ValueError(f"{self.event_type.__name__} takes {len(self.fields)} field values")
+
+        pending = self.pending
+        if pending < self.back_capacity:
+            for column, value in zip(self.back_columns.values(), values, strict=True):
+                column[pending] = value  # pyright: ignore[reportArgumentType, reportCallIssue]
+        else:
+            try:
+                for column, value in zip(self.back_columns.values(), values, strict=True):
+                    column.append(value)  # pyright: ignore[reportArgumentType]
+            except BaseException:
+                self._truncate_back()
+                raise
+            self.back_capacity += 1
+
+        self.pending = pending + 1
+        self.sent += 1
+
+    def send_columns(self, **columns: Iterable[int | float]) -> None:
+        """
+        Queue a batch of events given as one iterable of values per field.
+
+        Every field must be given and every iterable must hold the same
+        number of values. Values are packed into arrays and copied into the
+        write columns a field at a time, so this is the fastest way to send
+        many events. A failure while copying leaves the pending events as
+        they were.
+        """
+        if set(columns) != set(self.fields):
+            raise ValueError(
+                f"{self.event_type.__name__} takes the fields {', '.join(self.fields)}"
+            )
+
+        batch: dict[str, Column] = {
+            field: array(self.schema[field], columns[field]) for field in self.fields
+        }
+        count = len(batch[self.fields[0]])
+        if any(len(values) != count for values in batch.values()):
+            raise ValueError("every field needs the same number of values")
+
+        pending = self.pending
+        try:
+            for field, values in batch.items():
+                self.back_columns[field][pending : pending + count] = values  # pyright: ignore[reportArgumentType, reportCallIssue]
+        except BaseException:
+            self._truncate_back()
+            raise
+
+        self.pending = pending + count
+        self.back_capacity = max(self.back_capacity, self.pending)
+        self.sent += count
+
+    def _truncate_back(self) -> None:
+        for column in self.back_columns.values():
+            del column[self.pending :]
+        self.back_capacity = self.pending
+
+    @override
+    def read(self) -> Iterator[T]:
+        """
+        Iterate over the events sent during the previous frame.
+
+        Events are rebuilt from the columns, turning bool fields stored as
+        bytes back into bools; use column for bulk access.
+        """
+        columns = [(self.front_columns[field], self.schema[field] == "b") for field in self.fields]
+        for row in range(self.readable):
+            yield self.event_type(
+                *[bool(column[row]) if flag else column[row] for column, flag in columns]
+            )
+
+    def column(self, field: str) -> memoryview:
+        """
+        Return one field of the previous frame's events as a flat buffer.
+
+        The view is valid until the next swap and must be released before
+        then, since the column becomes the write buffer and a view held on
+        it would stop it from growing.
+        """
+        return memoryview(self.front_columns[field])[: self.readable]
+
+    @override
+    def swap(self) -> None:
+        """
+        Make this frame's events readable and start an empty write buffer.
+
+        The two sets of columns trade places instead of being reallocated.
+        """
+        self.front_columns, self.back_columns = self.back_columns, self.front_columns
+        self.front_capacity, self.back_capacity = self.back_capacity, self.front_capacity
+        self.readable = self.pending
+        self.pending = 0
+
+    @override
+    def clear(self) -> None:
+        """
+        Drop every readable and pending event and release the columns.
+        """
+        self.front_columns = {field: array(code) for field, code in self.schema.items()}
+        self.back_columns = {field: array(code) for field, code in self.schema.items()}
+        self.front_capacity = 0
+        self.back_capacity = 0
+        self.readable = 0
+        self.pending = 0
+
+    @override
+    def fork(self) -> "SchemaEventChannel[T]":
+        """
+        Create a copy of this channel with the same readable and pending events.
+
+        Returns the forked channel.
+        """
+        forked = SchemaEventChannel(self.event_type)
+        forked.front_columns = {
+            field: column[: self.readable] for field, column in self.front_columns.items()
+        }
+        forked.back_columns = {
+            field: column[: self.pending] for field, column in self.back_columns.items()
+        }
+        forked.front_capacity = self.readable
+        forked.back_capacity = self.pending
+        forked.readable = self.readable
+        forked.pending = self.pending
+        forked.sent = self.sent
+
+        return forked
+
+
+def event_channel[T](event_type: type[T]) -> EventChannel[T]:
+    """
+    Create the channel for an event type.
+
+    Event types declaring columnar = True get a SchemaEventChannel storing
+    each field in an array column, which readers can take whole and
+    senders can fill in bulk; they must be dataclasses whose fields are all
+    float, int or bool. Any other event type gets a list-backed
+    EventChannel, the fastest for sending events one at a time.
+
+    Returns the new channel. Raises TypeError for a columnar event type
+    with fields that cannot be stored in arrays.
+    """
+    if not getattr(event_type, "columnar", False):
+        return EventChannel(event_type)
+
+    fields = dataclasses.fields(event_type) if dataclasses.is_dataclass(event_type) else ()
+    if not fields or len(component_schema(event_type)) != len(fields):
+        raise TypeError(
+            f"columnar event {event_type.__name__} must be a dataclass of float, int and bool fields"
+        )
+
+    return SchemaEventChannel(event_type)
@@ -0,0 +1,51 @@
+from collections.abc import Callable
+from typing import Literal
+
+from pyecs.common.Types import Component, Entity
+
+type ObserverEvent = Literal["add", "remove"]
+type ObserverCallback = Callable[..., object]
+
+
+class Observer(object):
+    def __init__(
+        self,
+        event: ObserverEvent,
+        component_type: type,
+        callback: ObserverCallback,
+        batched: bool = False,
+    ):
+        self.event: ObserverEvent = event
+        self.component_type: type = component_type
+        self.callback: ObserverCallback = callback
+        self.batched: bool = batched
+        self.pending: list[tuple[Entity, Component]] = []
+        self.notified: int = 0
+
+    def notify(self, entity: Entity, component: Component) -> None:
+        """
+        Report one entity gaining or losing the observed component.
+
+        Unbatched observers call back with the entity and the component
+        straight away. Batched observers queue the pair until flush.
+        """
+        self.notified += 1
+        if self.batched:
+            self.pending.append((entity, component))
+        else:
+            _ = self.callback(entity, component)
+
+    def flush(self) -> None:
+        """
+        Deliver the queued notifications of a batched observer.
+
+        The callback receives one list of (entity, component) pairs in the
+        order the changes happened. Changes the callback itself causes are
+        queued for the next flush.
+        """
+        if not self.pending:
+            return
+
+        batch = self.pending
+        self.pending = []
+        _ = self.callback(batch)
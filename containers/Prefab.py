@@ -0,0 +1,93 @@
+import copy
+from collections.abc import Callable, Iterable
+from typing import cast
+
+from pyecs.common.Types import Component
+from pyecs.containers.ArchetypeChunk import is_frozen
+
+type Cloner = Callable[[int], list[Component]]
+
+
+def prototype_cloner(prototype: Component) -> Cloner:
+    """
+    Build a function that makes a number of shallow copies of a component.
+
+    Instances of frozen dataclasses cannot change, so the prototype itself
+    is repeated. Plain objects are copied by creating bare instances and
+    filling their __dict__ and __slots__ from the prototype, skipping
+    __init__, which is several times faster than copy.copy. Types defining
+    __copy__ or their own __new__ fall back to copy.copy. Copies share any
+    mutable values the prototype's fields refer to.
+
+    Returns a function taking a count and returning that many copies.
+    """
+    cls = prototype.__class__
+    if is_frozen(cls):
+        return lambda count: [prototype] * count
+
+    if hasattr(cls, "__copy__") or cls.__new__ is not object.__new__:
+        return lambda count: [copy.copy(prototype) for _ in range(count)]
+
+    slots = [name for name in _slot_names(cls) if hasattr(prototype, name)]
+    state = cast(dict[str, object] | None, getattr(prototype, "__dict__", None))
+    new = object.__new__
+    setter = object.__setattr__
+
+    def clone(count: int) -> list[Component]:
+        clones = [new(cls) for _ in range(count)]
+        if state:
+            for instance in clones:
+                instance.__dict__.update(state)
+        for name in slots:
+            value = cast(object, getattr(prototype, name))
+            for instance in clones:
+                setter(instance, name, value)
+        return clones
+
+    return clone
+
+
+def _slot_names(cls: type) -> list[str]:
+    names: list[str] = []
+    for klass in cls.__mro__:
+        slots = cast(str | Iterable[str], klass.__dict__.get("__slots__", ()))
+        names.extend((slots,) if isinstance(slots, str) else slots)
+
+    return [name for name in names if name not in ("__dict__", "__weakref__")]
+
+
+class Prefab(object):
+    def __init__(self, *components: Component):
+        self.prototypes: dict[type, Component] = {}
+        for component in components:
+            if component.__class__ in self.prototypes:
+                raise ValueError(f"prefab has two {component.__class__.__name__} components")
+            self.prototypes[component.__class__] = component
+
+        self.mask: frozenset[type] = frozenset(self.prototypes)
+        self.cloners: dict[type, Cloner] = {
+            comp_type: prototype_cloner(component)
+            for comp_type, component in self.prototypes.items()
+        }
+
+    def variant(self, *components: Component) -> "Prefab":
+        """
+        Create a prefab with some components added or replaced.
+
+        Returns a new prefab holding this prefab's prototypes, with the given
+        components taking the place of prototypes of the same type.
+        """
+        prototypes = dict(self.prototypes)
+        for component in components:
+            prototypes[component.__class__] = component
+
+        return Prefab(*prototypes.values())
+
+    def columns(self, count: int) -> dict[type, list[Component]]:
+        """
+        Build one column of count prototype copies per component type.
+
+        Returns the columns keyed by component type, ready to be appended to
+        the prefab's archetype.
+        """
+        return {comp_type: clone(count) for comp_type, clone in self.cloners.items()}
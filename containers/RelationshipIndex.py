@@ -0,0 +1,112 @@
+from collections.abc import Iterable
+
+from pyecs.common.Relationship import Relationship
+from pyecs.common.Types import Entity
+
+
+class RelationshipIndex(object):
+    def __init__(self):
+        self.targets: dict[type[Relationship], dict[Entity, Entity]] = {}
+        self.sources: dict[type[Relationship], dict[Entity, dict[Entity, None]]] = {}
+        self.version: int = 0
+
+    def link(self, source: Entity, relationship: Relationship) -> None:
+        """
+        Index a relationship held by source, replacing one of the same type.
+
+        The index version advances unless the relationship was already indexed.
+        """
+        relation_type = relationship.__class__
+        targets = self.targets.get(relation_type)
+        if targets is None:
+            targets = self.targets[relation_type] = {}
+            self.sources[relation_type] = {}
+
+        previous = targets.get(source)
+        if previous == relationship.target:
+            return
+        if previous is not None:
+            self._drop_source(relation_type, previous, source)
+
+        targets[source] = relationship.target
+        self.version += 1
+        self.sources[relation_type].setdefault(relationship.target, {})[source] = None
+
+    def unlink(self, source: Entity, relation_type: type) -> None:
+        """
+        Drop the relationship of a type held by source from the index.
+        """
+        targets = self.targets.get(relation_type)
+        if targets is None:
+            return
+
+        target = targets.pop(source, None)
+        if target is not None:
+            self._drop_source(relation_type, target, source)
+            self.version += 1
+
+    def unlink_all(self, source: Entity, relation_types: Iterable[type]) -> None:
+        """
+        Drop every relationship held by source among the given component types.
+        """
+        for relation_type in relation_types:
+            if relation_type in self.targets:
+                self.unlink(source, relation_type)
+
+    def target_of(self, source: Entity, relation_type: type) -> Entity | None:
+        """
+        Return the target of the relationship of a type held by source, or None.
+        """
+        targets = self.targets.get(relation_type)
+        return None if targets is None else targets.get(source)
+
+    def sources_of(self, relation_type: type, target: Entity) -> list[Entity]:
+        """
+        List the entities holding a relationship of a type to target.
+
+        The lookup costs one dict access plus the number of sources, and
+        sources are listed in the order they were linked.
+        """
+        sources = self.sources.get(relation_type)
+        if sources is None:
+            return []
+
+        return list(sources.get(target, ()))
+
+    def relations_to(self, target: Entity) -> list[tuple[type[Relationship], list[Entity]]]:
+        """
+        List every relationship type pointing at target with its sources.
+
+        The cost grows with the number of relationship types in use, not
+        with the number of entities.
+        """
+        return [
+            (relation_type, list(sources[target]))
+            for relation_type, sources in self.sources.items()
+            if target in sources
+        ]
+
+    def fork(self) -> "RelationshipIndex":
+        """
+        Create a copy of this index that can be changed independently.
+
+        Returns the forked index.
+        """
+        forked = RelationshipIndex()
+        forked.targets = {
+            relation_type: dict(targets) for relation_type, targets in self.targets.items()
+        }
+        forked.sources = {
+            relation_type: {target: dict(sources) for target, sources in by_target.items()}
+            for relation_type, by_target in self.sources.items()
+        }
+        forked.version = self.version
+
+        return forked
+
+    def _drop_source(self, relation_type: type, target: Entity, source: Entity) -> None:
+        sources = self.sources[relation_type]
+        by_target = sources[target]
+        del by_target[source]
+        if not by_target:
+            del sources[target]
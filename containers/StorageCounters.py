@@ -0,0 +1,58 @@
+COUNTER_FIELDS: tuple[str, ...] = (
+    "archetype_moves",
+    "archetypes_created",
+    "components_copied",
+    "queries",
+    "archetypes_scanned",
+    "archetypes_matched",
+    "rows_matched",
+)
+
+
+class StorageCounters(object):
+    def __init__(self):
+        self.archetype_moves: int = 0
+        self.archetypes_created: int = 0
+        self.components_copied: int = 0
+        self.queries: int = 0
+        self.archetypes_scanned: int = 0
+        self.archetypes_matched: int = 0
+        self.rows_matched: int = 0
+        self.ticks: int = 0
+        self.last_tick: dict[str, int] = dict.fromkeys(COUNTER_FIELDS, 0)
+        self._tick_start: dict[str, int] = dict.fromkeys(COUNTER_FIELDS, 0)
+
+    def totals(self) -> dict[str, int]:
+        """
+        Return every counter's value since creation or the last reset.
+        """
+        return {field: getattr(self, field) for field in COUNTER_FIELDS}
+
+    def end_tick(self) -> None:
+        """
+        Close the current tick and store how much each counter grew during it.
+        """
+        totals = self.totals()
+        self.last_tick = {field: totals[field] - self._tick_start[field] for field in totals}
+        self._tick_start = totals
+        self.ticks += 1
+
+    def reset(self) -> None:
+        """
+        Set every counter back to zero.
+        """
+        for field in COUNTER_FIELDS:
+            setattr(self, field, 0)
+
+        self.ticks = 0
+        self.last_tick = dict.fromkeys(COUNTER_FIELDS, 0)
+        self._tick_start = dict.fromkeys(COUNTER_FIELDS, 0)
+
+    def snapshot(self) -> dict[str, object]:
+        """
+        Return the counters as a JSON-compatible dict.
+
+        The dict holds the number of completed ticks, the running totals and
+        the growth of each counter during the last completed tick.
+        """
+        return {"ticks": self.ticks, "totals": self.totals(), "last_tick": dict(self.last_tick)}
@@ -1,4 +1,32 @@
-from .Archetype import Archetype
+from .Archetype import Archetype, ArchetypeColumn, ArchetypeColumns, ArchetypeEntities
+from .ArchetypeChunk import CHUNK_CAPACITY, ArchetypeChunk
+from .CachedQuery import CachedQuery
 from .ComponentStorage import ComponentStorage
+from .EventChannel import EventChannel, SchemaEventChannel, event_channel
+from .Observer import Observer, ObserverCallback, ObserverEvent
+from .Prefab import Cloner, Prefab, prototype_cloner
+from .RelationshipIndex import RelationshipIndex
+from .StorageCounters import COUNTER_FIELDS, StorageCounters
 
-__all__ = ["Archetype", "ComponentStorage"]
+__all__ = [
+    "CHUNK_CAPACITY",
+    "COUNTER_FIELDS",
+    "Archetype",
+    "ArchetypeChunk",
+    "ArchetypeColumn",
+    "ArchetypeColumns",
+    "ArchetypeEntities",
+    "CachedQuery",
+    "Cloner",
+    "ComponentStorage",
+    "EventChannel",
+    "Observer",
+    "ObserverCallback",
+    "ObserverEvent",
+    "Prefab",
+    "RelationshipIndex",
+    "SchemaEventChannel",
+    "StorageCounters",
+    "event_channel",
+    "prototype_cloner",
+]
@@ -1,23 +1,40 @@
 # pyright: reportImportCycles=false
-from typing import Literal
+from collections.abc import Iterator, Mapping, Sequence
+from typing import Literal, cast
 
+from pyecs.common.Relationship import ChildOf, Relationship
 from pyecs.common.Types import Component, Entity
-from pyecs.containers.Archetype import Archetype
+from pyecs.containers.ArchetypeChunk import CHUNK_CAPACITY
 from pyecs.containers.ComponentStorage import ComponentStorage
+from pyecs.containers.EventChannel import EventChannel
+from pyecs.containers.Observer import Observer, ObserverCallback
+from pyecs.containers.Prefab import Prefab
+from pyecs.exporting.Export import ArchetypeExport
+from pyecs.exporting.Shared import SharedWorldWriter
 from pyecs.helpers.Deprecation import warn_deprecated
 from pyecs.helpers.Statuses import StatusCodes
 from pyecs.helpers.Unsafe import auto_unsafe  # pyright: ignore[reportUnknownVariableType]
 from pyecs.managers.EntityManager import EntityManager
+from pyecs.managers.EventManager import EventManager
 from pyecs.managers.SystemManager import SystemManager
+from pyecs.processing.FrameBudget import MAX_DEFERRED_FRAMES, FrameBudget
+from pyecs.processing.Scheduler import DEFAULT_TICK_RATE, MAX_CATCH_UP_STEPS, FixedStepScheduler
 from pyecs.processing.System import System
+from pyecs.profiling.Memory import MEMORY_SAMPLE_SIZE, memory_report
+from pyecs.profiling.Trace import TraceRecorder, TraceStream
 
 
 @auto_unsafe  # pyright: ignore[reportUntypedClassDecorator]
 class ECSWorld(object):
-    def __init__(self):
+    def __init__(self, chunk_capacity: int = CHUNK_CAPACITY):
         self.entity_manager: EntityManager = EntityManager()
-        self.component_storage: ComponentStorage = ComponentStorage()
+        self.component_storage: ComponentStorage = ComponentStorage(chunk_capacity)
         self.system_manager: SystemManager = SystemManager()
+        self.event_manager: EventManager = EventManager()
+        self.shared_writer: SharedWorldWriter | None = None
+        self.shared_component_types: tuple[type[Component], ...] = ()
+        self.trace_recorder: TraceRecorder | None = None
+        self.scheduler: FixedStepScheduler = FixedStepScheduler()
 
     def create_entity(self) -> Entity | Literal[StatusCodes.FAILURE]:
         """
@@ -34,13 +51,70 @@ class ECSWorld(object):
             entity = result[1]
             empty_mask: frozenset[type] = frozenset()
 
-            if empty_mask not in self.component_storage.archetypes:
-                self.component_storage.archetypes[empty_mask] = Archetype()
-
+            _ = self.component_storage.get_or_create_archetype(empty_mask)
             self.component_storage.entity_to_archetype[entity] = empty_mask
+
+            if self.trace_recorder is not None:
+                self.trace_recorder.record_create(entity)
             return entity
         return result
 
+    def instantiate(
+        self,
+        prefab: Prefab,
+        count: int = 1,
+        overrides: Mapping[type[Component], Sequence[Component]] | None = None,
+    ) -> list[Entity] | Literal[StatusCodes.FAILURE]:
+        """
+        Create count entities from a prefab in one bulk operation.
+
+        Every entity gets a shallow copy of each of the prefab's prototype
+        components. Overrides map a component type to a sequence of count
+        components, one per entity in creation order, used as they are
+        instead of copies; they may also add component types the prefab
+        lacks. The entities are appended straight into the archetype for
+        the combined mask, a chunk at a time, without passing through the
+        empty archetype or any intermediate ones.
+
+        Returns the new entities, or FAILURE without creating any if the
+        component storage rejects them. Raises ValueError if an override
+        does not hold count components of its type, or if a relationship
+        among the components targets an entity that is not alive.
+        """
+        if count <= 0:
+            return []
+
+        columns = prefab.columns(count)
+        for component_type, components in (overrides or {}).items():
+            column = list(components)
+            if len(column) != count or any(
+                component.__class__ is not component_type for component in column
+            ):
+                name = component_type.__name__
+                raise ValueError(f"override for {name} needs {count} {name} components")
+            columns[component_type] = column
+
+        for component_type, column in columns.items():
+            if issubclass(component_type, Relationship) and not all(
+                self.entity_manager.is_alive(target)
+                for target in {component.target for component in cast(list[Relationship], column)}
+            ):
+                raise ValueError(f"{component_type.__name__} targets an entity that is not alive")
+
+        entities = self.entity_manager.create_entities(count)
+        if self.component_storage.add_entities(entities, columns) == StatusCodes.FAILURE:
+            for entity in entities:
+                _ = self.entity_manager.destroy_entity(entity)
+            return StatusCodes.FAILURE
+
+        if self.trace_recorder is not None:
+            for row, entity in enumerate(entities):
+                self.trace_recorder.record_create(entity)
+                for column in columns.values():
+                    self.trace_recorder.record_add(entity, column[row])
+
+        return entities
+
     def destroy_entity(self, entity: Entity) -> None:
         """
         Remove an entity and all its components from the world.
@@ -50,11 +124,33 @@ class ECSWorld(object):
 
         The entity becomes invalid after this operation and should not be
         used in subsequent operations.
+
+        Relationships pointing at the entity are resolved through the
+        relationship index without scanning the world: sources of cascading
+        relationships such as ChildOf are destroyed as well, down the whole
+        hierarchy, and other relationships are removed from their sources.
         """
-        result = self.entity_manager.destroy_entity(entity)
-        if result == StatusCodes.ENTITY_DESTROYED:
+        relationships = self.component_storage.relationships
+        doomed = [entity]
+
+        while doomed:
+            entity = doomed.pop()
+            result = self.entity_manager.destroy_entity(entity)
+            if result != StatusCodes.ENTITY_DESTROYED:
+                continue
+
+            for relation_type, sources in relationships.relations_to(entity):
+                if relation_type.cascade:
+                    doomed.extend(sources)
+                else:
+                    for source in sources:
+                        self.remove_component(source, relation_type)
+
             _ = self.component_storage.remove_entity(entity)
 
+            if self.trace_recorder is not None:
+                self.trace_recorder.record_destroy(entity)
+
     def add_component(self, entity: Entity, component: Component) -> None:
         """
         Add a component to an existing entity.
@@ -62,11 +158,19 @@ class ECSWorld(object):
         This method attaches the specified component to the entity, potentially
         moving the entity to a different archetype based on its new component set.
 
-        Only adds the component if the entity is currently alive in the world.
+        Only adds the component if the entity is currently alive in the world,
+        and a Relationship only if its target is alive as well.
         """
         if self.entity_manager.is_alive(entity):
+            if isinstance(component, Relationship) and not self.entity_manager.is_alive(
+                component.target
+            ):
+                return
             _ = self.component_storage.add_component(entity, component)
 
+            if self.trace_recorder is not None:
+                self.trace_recorder.record_add(entity, component)
+
     def remove_component(self, entity: Entity, component_type: type[Component]) -> None:
         """
         Remove a component type from an entity.
@@ -79,6 +183,25 @@ class ECSWorld(object):
         if self.entity_manager.is_alive(entity):
             _ = self.component_storage.remove_component(entity, component_type)
 
+            if self.trace_recorder is not None:
+                self.trace_recorder.record_remove(entity, component_type)
+
+    def set_enabled(self, entity: Entity, enabled: bool) -> None:
+        """
+        Enable or disable an entity without changing its components.
+
+        This method flips the entity's flag in its archetype chunk's enabled
+        mask, so no archetype move happens. Disabled entities are skipped by
+        queries until they are enabled again.
+
+        Only changes the flag if the entity is currently alive in the world.
+        """
+        if self.entity_manager.is_alive(entity):
+            _ = self.component_storage.set_enabled(entity, enabled)
+
+            if self.trace_recorder is not None:
+                self.trace_recorder.record_enabled(entity, enabled)
+
     def get_component(
         self, entity: Entity, component_type: type[Component]
     ) -> Component | Literal[StatusCodes.FAILURE]:
@@ -92,6 +215,8 @@ class ECSWorld(object):
         doesn't exist or doesn't have the specified component type.
         """
         if self.entity_manager.is_alive(entity):
+            if self.trace_recorder is not None:
+                self.trace_recorder.record_get(entity, (component_type,))
             return self.component_storage.get_component(entity, component_type)
         return StatusCodes.FAILURE
 
@@ -117,6 +242,9 @@ class ECSWorld(object):
         if not self.entity_manager.is_alive(entity):
             return StatusCodes.FAILURE
 
+        if self.trace_recorder is not None:
+            self.trace_recorder.record_get(entity, component_types)
+
         result: list[Component] = []
         for component_type in component_types:
             component = self.component_storage.get_component(entity, component_type)
@@ -126,6 +254,105 @@ class ECSWorld(object):
 
         return tuple(result)
 
+    def send_event(self, event: object) -> None:
+        """
+        Send an event to every reader of its type in the next frame.
+
+        Events are transient messages such as damage dealt or collisions.
+        Unlike marker components they never move entities between
+        archetypes. An event sent during a frame becomes readable once that
+        frame ends and stays readable for the whole of the next frame.
+        """
+        self.event_manager.send(event)
+
+    def read_events[T](self, event_type: type[T]) -> Iterator[T]:
+        """
+        Iterate over the events of a type sent during the previous frame.
+        """
+        return self.event_manager.read(event_type)
+
+    def event_channel[T](self, event_type: type[T]) -> EventChannel[T]:
+        """
+        Return the channel of an event type for batched sending and reading.
+
+        Event dataclasses declaring columnar = True, with only float, int
+        and bool fields, get a channel that stores each field in an array,
+        so readers can take a whole column at once and senders can fill
+        columns in bulk without building event objects.
+        """
+        return self.event_manager.channel(event_type)
+
+    def children_of(
+        self, parent: Entity, relation_type: type[Relationship] = ChildOf
+    ) -> list[Entity]:
+        """
+        List the entities holding a relationship of a type to parent.
+
+        This reads the relationship index, so it costs time proportional to
+        the number of children rather than the size of the world. Children
+        are listed in the order they were attached.
+
+        Returns the children, or an empty list if there are none.
+        """
+        return self.component_storage.relationships.sources_of(relation_type, parent)
+
+    def parent_of(
+        self, child: Entity, relation_type: type[Relationship] = ChildOf
+    ) -> Entity | None:
+        """
+        Return the target of the relationship of a type held by child.
+
+        Returns the parent entity, or None if child holds no such relationship.
+        """
+        return self.component_storage.relationships.target_of(child, relation_type)
+
+    def observe(
+        self,
+        callback: ObserverCallback,
+        *,
+        on_add: type[Component] | None = None,
+        on_remove: type[Component] | None = None,
+        batched: bool = False,
+    ) -> Observer:
+        """
+        Call back whenever entities gain or lose a component type.
+
+        Exactly one of on_add and on_remove names the component type to
+        watch. The callback is called with the entity and the component
+        right after the change, or, with batched=True, once at the end of
+        each frame with a list of (entity, component) pairs for every
+        change in that frame. Removals pass the component that was removed,
+        including those dropped when an entity is destroyed. Replacing a
+        component with one of the same type is not an addition.
+
+        Returns the registered observer, which can be passed to unobserve.
+        Raises ValueError unless exactly one of on_add and on_remove is set.
+        """
+        if on_add is not None and on_remove is None:
+            observer = Observer("add", on_add, callback, batched)
+        elif on_remove is not None and on_add is None:
+            observer = Observer("remove", on_remove, callback, batched)
+        else:
+            raise ValueError("observe needs exactly one of on_add and on_remove")
+
+        self.component_storage.add_observer(observer)
+        return observer
+
+    def unobserve(self, observer: Observer) -> None:
+        """
+        Stop calling an observer back, dropping any batch it has queued.
+        """
+        _ = self.component_storage.remove_observer(observer)
+
+    def flush_observers(self) -> None:
+        """
+        Deliver the batches queued by batched observers now.
+
+        Batches are delivered at the end of every frame without this call;
+        use it to react before the frame ends.
+        """
+        self.component_storage.flush_observers()
+
     def add_system(self, system: System) -> None:
         """
         Register a system with the world.
@@ -157,7 +384,256 @@ class ECSWorld(object):
 
         This method calls the update method on all registered systems in
         registration order, passing the delta time for frame-independent updates.
+        Batched observers are then called back, event channels swap their
+        buffers, storage counters close their tick, a recording trace closes
+        its frame, and if the world is shared, a new frame is published
+        afterwards.
 
         This is typically called once per frame in the main game loop.
         """
+        self.system_manager.start_frame()
         self.system_manager.update_all(self, dt)  # pyright: ignore[reportUnknownMemberType]
+        self._end_frame(dt)
+
+    async def update_async(self, dt: float) -> None:
+        """
+        Execute one update cycle, awaiting asynchronous systems.
+
+        Systems defining async def update are awaited, and neighbouring
+        asynchronous systems with no before or after relation between them
+        run concurrently with asyncio.gather, so I/O-bound systems overlap
+        their waits. Synchronous systems run on the same fast path as in
+        update. The frame is then closed exactly as update closes it.
+
+        This is meant to be awaited once per frame from a loop running on
+        asyncio.
+        """
+        self.system_manager.start_frame()
+        await self.system_manager.update_all_async(self, dt)  # pyright: ignore[reportUnknownMemberType]
+        self._end_frame(dt)
+
+    def step(self, elapsed: float | int) -> int:
+        """
+        Advance the world by real elapsed time using the fixed-step scheduler.
+
+        Simulation systems run once per fixed step with the scheduler's step
+        as dt, catching up by at most the scheduler's max_steps per call.
+        Systems declaring phase = "frame" then run once with the elapsed
+        time, and can read scheduler.alpha to interpolate between the last
+        two fixed states. Storage counters, trace recording and shared
+        memory publishing close one frame per call, as with update.
+
+        Returns the number of fixed steps run.
+        """
+        self.system_manager.start_frame()
+        steps = self.scheduler.advance(elapsed)
+        for _ in range(steps):
+            self.system_manager.update_all(self, self.scheduler.step, "fixed")  # pyright: ignore[reportUnknownMemberType]
+
+        self.system_manager.update_all(self, elapsed, "frame")  # pyright: ignore[reportUnknownMemberType]
+        self._end_frame(elapsed)
+
+        return steps
+
+    def set_timestep(
+        self, tick_rate: float | int = DEFAULT_TICK_RATE, max_steps: int = MAX_CATCH_UP_STEPS
+    ) -> None:
+        """
+        Configure the fixed-step scheduler used by step.
+
+        tick_rate is the number of fixed steps per second and max_steps the
+        most steps one call to step may run. Time accumulated under the
+        previous configuration is discarded.
+        """
+        self.scheduler = FixedStepScheduler(tick_rate, max_steps)
+
+    def set_frame_budget(
+        self, budget: float | int | None, max_deferred: int = MAX_DEFERRED_FRAMES
+    ) -> None:
+        """
+        Set the wall time, in seconds, one frame of systems should take.
+
+        Systems declaring a priority below zero are deferred while running
+        them would take the frame over budget, judged by a moving average
+        of their previous runs, and get the time they missed once they run
+        again. A system is never deferred more than max_deferred frames in
+        a row. Higher-priority systems always run. Passing None removes the
+        budget.
+        """
+        self.system_manager.budget = (
+            FrameBudget(budget, max_deferred) if budget is not None else None
+        )
+
+    def _end_frame(self, dt: float | int) -> None:
+        self.component_storage.flush_observers()
+        self.system_manager.end_frame()
+        self.event_manager.swap()
+        self.component_storage.counters.end_tick()
+
+        if self.trace_recorder is not None:
+            self.trace_recorder.record_update(dt)
+
+        if self.shared_writer is not None:
+            _ = self.shared_writer.publish(self.export_columns(*self.shared_component_types))
+
+    def set_profiling(self, enabled: bool) -> None:
+        """
+        Turn per-system profiling on or off.
+
+        While profiling is enabled, every update records each system's wall
+        time, call count and processed entity count, and the wall time of
+        the whole frame. Disabling keeps the samples recorded so far; a
+        disabled profiler costs one branch per update.
+        """
+        self.system_manager.profiler.enabled = enabled
+
+    def stats(self) -> dict[str, object]:
+        """
+        Return the profiling statistics recorded so far.
+
+        The result holds plain values only and can be passed to json.dumps
+        directly. Frame and system wall times are summarized as count,
+        total, min, max, mean, p50, p95 and p99 in nanoseconds, and the last
+        frame's per-system breakdown is included.
+
+        Returns a JSON-compatible dict of profiling statistics.
+        """
+        return self.system_manager.profiler.snapshot()
+
+    def metrics(self) -> dict[str, object]:
+        """
+        Return a snapshot of storage and query counters.
+
+        Counters cover archetype moves, archetypes created, components copied
+        while moving entities, and query calls with the archetypes they
+        scanned and matched and the rows they returned. Each counter is
+        reported as a running total and as its growth during the last
+        update. The snapshot also holds the archetype and entity counts and
+        the column list bytes per component type.
+
+        Returns a JSON-compatible dict of storage metrics.
+        """
+        return self.component_storage.metrics()
+
+    def memory_report(self, sample_size: int = MEMORY_SAMPLE_SIZE) -> dict[str, object]:
+        """
+        Estimate the memory held by component storage.
+
+        This method walks every archetype and reports, per archetype and per
+        component type, row counts, allocated list slots, list bytes and the
+        deep size of the component objects, plus the overhead of entity ID
+        strings, entity lists, enabled masks and index dicts. Columns longer
+        than sample_size are measured on an evenly spaced sample and scaled.
+
+        Returns a JSON-compatible dict with archetypes, components, overhead
+        and total_bytes.
+        """
+        return memory_report(self.component_storage, sample_size)
+
+    def export_columns(self, *component_types: type[Component]) -> list[ArchetypeExport]:
+        """
+        Export numeric component fields as packed per-archetype columns.
+
+        Every non-empty archetype holding all of the given component types
+        produces one ArchetypeExport containing its entity IDs and one typed
+        buffer per float, int or bool field. Without component types, every
+        archetype is exported with all of its components.
+
+        Returns a list of ArchetypeExport objects, one per matching archetype.
+        """
+        required: frozenset[type] = frozenset(component_types)
+        exports: list[ArchetypeExport] = []
+
+        for mask, archetype in self.component_storage.archetypes.items():
+            if archetype.entities and required.issubset(mask):
+                exports.append(ArchetypeExport.from_archetype(archetype, component_types or mask))
+
+        return exports
+
+    def share_columns(
+        self, *component_types: type[Component], name: str | None = None
+    ) -> SharedWorldWriter:
+        """
+        Publish component columns to shared memory after every update.
+
+        This method creates a SharedWorldWriter and publishes the current
+        state immediately. Each later update publishes a new frame once all
+        systems have run. Other processes attach with SharedWorldReader
+        using the writer's name and read the columns without copying.
+
+        Returns the writer; its name identifies the shared world to readers.
+        """
+        self.stop_sharing()
+
+        self.shared_writer = SharedWorldWriter(name)
+        self.shared_component_types = component_types
+        _ = self.shared_writer.publish(self.export_columns(*component_types))
+
+        return self.shared_writer
+
+    def stop_sharing(self) -> None:
+        """
+        Stop publishing to shared memory and release the shared segments.
+
+        Does nothing if the world is not being shared.
+        """
+        if self.shared_writer is not None:
+            self.shared_writer.close()
+            self.shared_writer = None
+
+    def start_recording(self, stream: TraceStream) -> TraceRecorder:
+        """
+        Record the world's public operations to a binary trace.
+
+        The current entities and components are written first as a setup
+        prologue. From then on, entity creation and destruction, component
+        adds, removes and lookups, enable flag changes, query executions and
+        updates are appended to the stream in call order, with entities and
+        component types replaced by compact integer IDs. Component field
+        values are stored with marshal, so a trace replays without the code
+        that recorded it.
+
+        Returns the recorder; the caller owns and closes the stream.
+        """
+        self.stop_recording()
+
+        self.trace_recorder = TraceRecorder(stream)
+        self.trace_recorder.snapshot(self.component_storage)
+
+        return self.trace_recorder
+
+    def stop_recording(self) -> None:
+        """
+        Stop recording operations and flush the trace stream.
+
+        Does nothing if the world is not recording.
+        """
+        if self.trace_recorder is not None:
+            self.trace_recorder.flush()
+            self.trace_recorder = None
+
+    def fork(self) -> "ECSWorld":
+        """
+        Create a copy-on-write fork of this world.
+
+        The fork starts with the same entities, components and systems.
+        Archetype columns are shared with this world and only the column an
+        operation touches is copied, so forks are cheap to create and cheap
+        to discard.
+
+        Registered systems are shared with the fork and their init method is
+        not called again. The fork's scheduler continues from this world's
+        accumulated time, and it gets copies of the readable and pending
+        events. Observers are not carried over to the fork. The fork is
+        neither shared to memory nor recorded even if this world is.
+
+        Returns the forked world.
+        """
+        forked = ECSWorld(self.component_storage.chunk_capacity)
+        forked.entity_manager = self.entity_manager.fork()
+        forked.component_storage = self.component_storage.fork()
+        forked.system_manager = self.system_manager.fork()
+        forked.event_manager = self.event_manager.fork()
+        forked.scheduler = self.scheduler.fork()
+
+        return forked
@@ -20,3 +20,9 @@ class OperationFailedError(PyECSError):
     """Raised when an ECS operation fails."""
 
     pass
+
+
+class SystemOrderError(PyECSError):
+    """Raised when system ordering constraints cannot be satisfied."""
+
+    pass
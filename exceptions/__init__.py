@@ -3,6 +3,7 @@ from .Exceptions import (
     EntityNotFoundError,
     OperationFailedError,
     PyECSError,
+    SystemOrderError,
 )
 
 __all__ = [
@@ -10,4 +11,5 @@ __all__ = [
     "EntityNotFoundError",
     "OperationFailedError",
     "PyECSError",
+    "SystemOrderError",
 ]
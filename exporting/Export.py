@@ -0,0 +1,156 @@
+# pyright: reportMissingImports=false, reportUnknownMemberType=false, reportUnknownVariableType=false
+from __future__ import annotations
+
+import typing
+from array import array
+from collections.abc import Iterable, Sequence
+from itertools import chain
+from operator import attrgetter
+from typing import TYPE_CHECKING
+
+from pyecs.common.Types import Component, Entity
+from pyecs.containers.Archetype import Archetype
+from pyecs.exceptions import OperationFailedError
+
+if TYPE_CHECKING:
+    import numpy
+    import pyarrow
+
+FIELD_TYPECODES: dict[type, str] = {float: "d", int: "q", bool: "b"}
+
+_schemas: dict[type, dict[str, str]] = {}
+
+
+def component_schema(component_type: type[Component]) -> dict[str, str]:
+    """
+    Derive the exportable column schema of a component type.
+
+    Fields annotated as float, int or bool map to the array typecodes 'd',
+    'q' and 'b', and fields annotated float | int are stored as 'd'. Fields
+    of any other type are left out of exports.
+
+    Returns a dict mapping field name to typecode, in declaration order.
+    """
+    if component_type not in _schemas:
+        try:
+            hints: dict[str, object] = typing.get_type_hints(component_type)
+        except (NameError, TypeError):
+            hints = {}
+
+        schema: dict[str, str] = {}
+        for name, hint in hints.items():
+            typecode = _field_typecode(hint)
+            if typecode is not None:
+                schema[name] = typecode
+        _schemas[component_type] = schema
+
+    return _schemas[component_type]
+
+
+def _field_typecode(hint: object) -> str | None:
+    if isinstance(hint, type):
+        return FIELD_TYPECODES.get(hint)
+
+    if set(typing.get_args(hint)) == {float, int}:
+        return FIELD_TYPECODES[float]
+
+    return None
+
+
+def pack_column(components: Iterable[Component], field: str, typecode: str) -> memoryview:
+    """
+    Pack one field of a component column into a contiguous typed buffer.
+
+    The values are gathered in a single pass without going through the
+    world's per-entity lookups.
+
+    Returns a memoryview over the packed array.
+    """
+    return memoryview(array(typecode, map(attrgetter(field), components)))
+
+
+class ArchetypeExport(object):
+    def __init__(self, entities: Sequence[Entity], columns: dict[str, memoryview]):
+        self.entities: Sequence[Entity] = entities
+        self.columns: dict[str, memoryview] = columns
+
+    @classmethod
+    def from_archetype(
+        cls, archetype: Archetype, component_types: Iterable[type[Component]]
+    ) -> ArchetypeExport:
+        """
+        Pack the exportable fields of an archetype's components.
+
+        Columns are named '<Component>.<field>' and ordered by component
+        name, then by field declaration order.
+
+        Returns a new ArchetypeExport holding a copy of the entity IDs.
+        Raises OperationFailedError naming the column if a value does not
+        fit its field's typecode, such as None or an int out of range.
+        """
+        columns: dict[str, memoryview] = {}
+
+        for component_type in sorted(component_types, key=lambda t: t.__qualname__):
+            if component_type not in archetype.component_types:
+                continue
+
+            for field, typecode in component_schema(component_type).items():
+                column = chain.from_iterable(
+                    [chunk.columns[component_type] for chunk in archetype.chunks]
+                )
+                name = f"{component_type.__name__}.{field}"
+                try:
+                    columns[name] = pack_column(column, field, typecode)
+                except (TypeError, OverflowError) as error:
+                    raise OperationFailedError(f"Cannot export {name}: {error}") from error
+
+        return cls(list(archetype.iter_entities()), columns)
+
+    def column(self, component_type: type[Component], field: str) -> memoryview:
+        """
+        Return the packed buffer for one component field.
+
+        Raises KeyError if the field was not exported.
+        """
+        return self.columns[f"{component_type.__name__}.{field}"]
+
+    def to_numpy(self) -> dict[str, numpy.ndarray]:
+        """
+        View every exported column as a NumPy array.
+
+        The arrays wrap the packed buffers directly, no data is copied.
+
+        Returns a dict mapping column name to array. Requires numpy.
+        """
+        try:
+            import numpy
+        except ImportError as error:
+            raise ImportError("to_numpy requires numpy (pip install pyecs[export])") from error
+
+        return {name: numpy.asarray(view) for name, view in self.columns.items()}
+
+    def to_arrow(self) -> pyarrow.RecordBatch:  # pyright: ignore[reportUnknownParameterType]
+        """
+        View this export as an Arrow record batch.
+
+        The batch has an 'entity' string column followed by one column per
+        exported field. Field columns wrap the packed buffers without copying.
+
+        Returns a pyarrow.RecordBatch. Requires pyarrow.
+        """
+        try:
+            import pyarrow
+        except ImportError as error:
+            raise ImportError("to_arrow requires pyarrow (pip install pyecs[export])") from error
+
+        arrow_types = {"d": pyarrow.float64(), "q": pyarrow.int64(), "b": pyarrow.int8()}
+
+        arrays = [pyarrow.array(list(self.entities), type=pyarrow.string())]
+        for view in self.columns.values():
+            arrays.append(
+                pyarrow.Array.from_buffers(  # pyright: ignore[reportUnknownArgumentType]
+                    arrow_types[view.format], len(view), [None, pyarrow.py_buffer(view)]
+                )
+            )
+
+        return pyarrow.RecordBatch.from_arrays(arrays, names=["entity", *self.columns])
@@ -0,0 +1,441 @@
+# pyright: reportPrivateUsage=false
+from __future__ import annotations
+
+import functools
+import json
+import struct
+import sys
+import time
+from collections.abc import Sequence
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+from types import TracebackType
+from typing import TypedDict, cast, overload, override
+
+from pyecs.common.Types import Entity
+from pyecs.exceptions import OperationFailedError
+from pyecs.exporting.Export import ArchetypeExport
+
+HEADER_SIZE: int = 1 << 16
+HEADER_FORMAT: str = "<QQ"
+ENTITY_ID_SIZE: int = 36
+ALIGNMENT: int = 8
+
+_created: set[str] = set()
+
+
+class ArchetypeLayout(TypedDict):
+    count: int
+    entities: int
+    columns: dict[str, tuple[int, str]]
+
+
+class FrameLayout(TypedDict):
+    segment: str
+    archetypes: list[ArchetypeLayout]
+
+
+def _align(offset: int) -> int:
+    return (offset + ALIGNMENT - 1) & ~(ALIGNMENT - 1)
+
+
+@functools.cache
+def _inherits_tracker() -> bool:
+    """
+    Check whether this process shares its parent's resource tracker.
+
+    Only needed before Python 3.13, where attaching to a segment cannot opt
+    out of tracking. Reads a private attribute of the tracker, treating a
+    tracker without it as not inherited. Must be evaluated before this
+    process registers any segment itself.
+    """
+    fd = cast(object, getattr(resource_tracker._resource_tracker, "_fd", None))
+    return fd is not None
+
+
+def _buffer(segment: SharedMemory) -> memoryview:
+    buffer = segment.buf
+    if buffer is None:
+        raise OperationFailedError(f"Shared memory segment {segment.name} is closed")
+
+    return buffer
+
+
+def _expect[T](value: object, kind: type[T]) -> T:
+    if not isinstance(value, kind):
+        raise OperationFailedError(f"Malformed shared frame layout: expected {kind.__name__}")
+
+    return value
+
+
+def _mapping(value: object) -> dict[str, object]:
+    return cast(dict[str, object], _expect(value, dict))
+
+
+def _items(value: object) -> list[object]:
+    return cast(list[object], _expect(value, list))
+
+
+def _parse_layout(raw: bytes) -> FrameLayout:
+    """
+    Decode and validate a frame layout read from the header segment.
+
+    Returns the layout as a FrameLayout. Raises OperationFailedError if the
+    layout does not have the shape written by SharedWorldWriter.
+    """
+    layout = _mapping(cast(object, json.loads(raw)))
+    archetypes: list[ArchetypeLayout] = []
+
+    for entry in _items(layout.get("archetypes")):
+        archetype = _mapping(entry)
+        columns: dict[str, tuple[int, str]] = {}
+        for column_name, placement in _mapping(archetype.get("columns")).items():
+            offset, typecode = _items(placement)
+            columns[column_name] = (_expect(offset, int), _expect(typecode, str))
+
+        archetypes.append(
+            {
+                "count": _expect(archetype.get("count"), int),
+                "entities": _expect(archetype.get("entities"), int),
+                "columns": columns,
+            }
+        )
+
+    return {"segment": _expect(layout.get("segment"), str), "archetypes": archetypes}
+
+
+def _create(name: str | None, size: int) -> SharedMemory:
+    if sys.version_info < (3, 13):
+        _ = _inherits_tracker()
+    segment = SharedMemory(name=name, create=True, size=size)
+    _created.add(segment.name)
+    return segment
+
+
+def _attach(name: str) -> SharedMemory:
+    """
+    Attach to an existing shared memory segment without tracking it.
+
+    Readers must not unlink segments owned by the writer when they exit,
+    so the segment is kept out of this process's resource tracker unless
+    this process created it or shares the tracker with the writer.
+    """
+    if sys.version_info >= (3, 13):
+        return SharedMemory(name=name, track=False)  # pyright: ignore[reportUnreachable]
+
+    inherited = _inherits_tracker()
+    segment = SharedMemory(name=name)
+    if name not in _created and not inherited:
+        resource_tracker.unregister(segment._name, "shared_memory")  # pyright: ignore[reportAttributeAccessIssue, reportUnknownMemberType, reportUnknownArgumentType]
+
+    return segment
+
+
+def _try_close(segment: SharedMemory) -> bool:
+    """
+    Close a segment unless memoryviews into it are still held.
+
+    Returns True if the segment was closed.
+    """
+    try:
+        segment.close()
+    except BufferError:
+        return False
+
+    return True
+
+
+class SharedEntityIds(Sequence[Entity]):
+    def __init__(self, view: memoryview, count: int):
+        self._view: memoryview = view
+        self._count: int = count
+
+    @override
+    def __len__(self) -> int:
+        return self._count
+
+    @overload
+    def __getitem__(self, index: int) -> Entity: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[Entity]: ...
+
+    @override
+    def __getitem__(self, index: int | slice) -> Entity | list[Entity]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._count))]
+
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("entity index out of range")
+
+        start = index * ENTITY_ID_SIZE
+        return bytes(self._view[start : start + ENTITY_ID_SIZE]).decode("ascii")
+
+
+class SharedWorldWriter(object):
+    def __init__(self, name: str | None = None, header_size: int = HEADER_SIZE):
+        self.header: SharedMemory = _create(name, header_size)
+        self.name: str = self.header.name
+        self.sequence: int = 0
+        self._slots: list[SharedMemory | None] = [None, None]
+        struct.pack_into(HEADER_FORMAT, _buffer(self.header), 0, 0, 0)
+
+    def publish(self, exports: list[ArchetypeExport]) -> int:
+        """
+        Publish one frame of packed archetype columns to shared memory.
+
+        Frames alternate between two data segments, so a frame a reader is
+        working on stays intact while the next one is written. The header
+        sequence number is odd while a frame is being written and even once
+        it is complete. Entity IDs and columns are checked before the
+        sequence turns odd, and an error while writing restores the previous
+        sequence, so readers never wait on a frame that will not finish.
+
+        Returns the sequence number of the published frame. Raises
+        OperationFailedError if an entity ID is not a 36-character ASCII
+        string, a column does not have one value per entity, or the layout
+        does not fit in the header segment.
+        """
+        slot = (self.sequence // 2) % 2
+        placements: list[tuple[int, bytes, list[tuple[int, memoryview]]]] = []
+        archetypes: list[ArchetypeLayout] = []
+        offset = 0
+
+        for export in exports:
+            for entity in export.entities:
+                if len(entity) != ENTITY_ID_SIZE or not entity.isascii():
+                    raise OperationFailedError(
+                        f"Entity ID {entity!r} is not a {ENTITY_ID_SIZE}-character ASCII string"
+                    )
+
+            entities_offset = offset
+            entity_ids = "".join(export.entities).encode("ascii")
+            offset = _align(offset + len(entity_ids))
+
+            column_offsets: dict[str, int] = {}
+            column_bytes: list[tuple[int, memoryview]] = []
+            for column_name, view in export.columns.items():
+                if len(view) != len(export.entities):
+                    raise OperationFailedError(
+                        f"Column {column_name} has {len(view)} values for {len(export.entities)} entities"
+                    )
+                column_offsets[column_name] = offset
+                column_bytes.append((offset, view.cast("B")))
+                offset = _align(offset + view.nbytes)
+
+            placements.append((entities_offset, entity_ids, column_bytes))
+            archetypes.append(
+                {
+                    "count": len(export.entities),
+                    "entities": entities_offset,
+                    "columns": {
+                        column_name: (column_offsets[column_name], view.format)
+                        for column_name, view in export.columns.items()
+                    },
+                }
+            )
+
+        segment = self._segment(slot, offset)
+        frame: FrameLayout = {"segment": segment.name, "archetypes": archetypes}
+        layout = json.dumps(frame).encode()
+        header_offset = struct.calcsize(HEADER_FORMAT)
+
+        if header_offset + len(layout) > self.header.size:
+            raise OperationFailedError("Shared world layout does not fit in the header segment")
+
+        previous = self.sequence
+        self._write_sequence(previous + 1)
+
+        try:
+            data = _buffer(segment)
+            for entities_offset, entity_ids, column_bytes in placements:
+                data[entities_offset : entities_offset + len(entity_ids)] = entity_ids
+
+                for start, view in column_bytes:
+                    data[start : start + view.nbytes] = view
+
+            header = _buffer(self.header)
+            header[header_offset : header_offset + len(layout)] = layout
+            struct.pack_into("<Q", header, 8, len(layout))
+        except BaseException:
+            self._write_sequence(previous)
+            raise
+
+        self._write_sequence(previous + 2)
+        return self.sequence
+
+    def close(self) -> None:
+        """
+        Close and unlink the header and all data segments.
+
+        Readers that are still attached keep their existing mappings, but no
+        new frames can be published or read afterwards.
+        """
+        for segment in [self.header, *self._slots]:
+            if segment is not None:
+                segment.close()
+                segment.unlink()
+                _created.discard(segment.name)
+
+        self._slots = [None, None]
+
+    def _segment(self, slot: int, size: int) -> SharedMemory:
+        """
+        Return the data segment for a slot, replacing it if it is too small.
+
+        Segments grow geometrically so resizes stay rare.
+        """
+        segment = self._slots[slot]
+
+        if segment is None or segment.size < size:
+            if segment is not None:
+                segment.close()
+                segment.unlink()
+                _created.discard(segment.name)
+            segment = _create(None, max(size * 2, 4096))
+            self._slots[slot] = segment
+
+        return segment
+
+    def _write_sequence(self, sequence: int) -> None:
+        self.sequence = sequence
+        struct.pack_into("<Q", _buffer(self.header), 0, sequence)
+
+    def __enter__(self) -> SharedWorldWriter:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+
+class SharedFrame(object):
+    def __init__(self, reader: SharedWorldReader, sequence: int, archetypes: list[ArchetypeExport]):
+        self.reader: SharedWorldReader = reader
+        self.sequence: int = sequence
+        self.archetypes: list[ArchetypeExport] = archetypes
+
+    def valid(self) -> bool:
+        """
+        Check whether this frame's data is still intact.
+
+        The writer reuses a frame's data segment two publishes later, so a
+        frame stays valid until the writer starts on the frame after next.
+        Readers should discard results computed from an invalid frame.
+
+        Returns True if the frame has not been overwritten.
+        """
+        return self.reader.current_sequence() <= self.sequence + 2
+
+
+class SharedWorldReader(object):
+    def __init__(self, name: str):
+        self.name: str = name
+        self.header: SharedMemory = _attach(name)
+        self._segments: dict[str, SharedMemory] = {}
+        self._stale: list[SharedMemory] = []
+
+    def current_sequence(self) -> int:
+        """
+        Return the writer's current sequence number.
+        """
+        sequence: int = struct.unpack_from("<Q", _buffer(self.header), 0)[0]
+        return sequence
+
+    def read(self, timeout: float | None = None) -> SharedFrame:
+        """
+        Read the latest complete frame published by the writer.
+
+        Waits while a frame is being written and retries if the writer
+        started a new frame while the layout was being read. Columns are
+        memoryviews into shared memory, nothing is copied.
+
+        Returns a SharedFrame with one ArchetypeExport per published archetype.
+        Raises OperationFailedError if no complete frame appears within timeout
+        seconds.
+        """
+        header_offset = struct.calcsize(HEADER_FORMAT)
+        deadline = None if timeout is None else time.monotonic() + timeout
+        header = _buffer(self.header)
+
+        while True:
+            sequence, length = cast(tuple[int, int], struct.unpack_from(HEADER_FORMAT, header, 0))
+            if sequence & 1:
+                if deadline is not None and time.monotonic() > deadline:
+                    raise OperationFailedError("Timed out waiting for a complete shared frame")
+                time.sleep(0)
+                continue
+
+            layout = bytes(header[header_offset : header_offset + length])
+            if self.current_sequence() == sequence:
+                break
+
+        if not sequence:
+            return SharedFrame(self, sequence, [])
+
+        decoded = _parse_layout(layout)
+        buffer = _buffer(self._attach_segment(decoded["segment"]))
+        archetypes: list[ArchetypeExport] = []
+
+        for archetype in decoded["archetypes"]:
+            count = archetype["count"]
+            start = archetype["entities"]
+            entities = SharedEntityIds(buffer[start : start + count * ENTITY_ID_SIZE], count)
+
+            columns: dict[str, memoryview] = {}
+            for column_name, (offset, typecode) in archetype["columns"].items():
+                size = struct.calcsize(typecode) * count
+                columns[column_name] = buffer[offset : offset + size].cast(typecode)  # pyright: ignore[reportCallIssue, reportArgumentType]
+
+            archetypes.append(ArchetypeExport(entities, columns))
+
+        return SharedFrame(self, sequence, archetypes)
+
+    def close(self) -> None:
+        """
+        Detach from the header and every data segment this reader mapped.
+
+        All memoryviews obtained from frames must be released first.
+        """
+        for segment in [self.header, *self._segments.values(), *self._stale]:
+            segment.close()
+
+        self._segments.clear()
+        self._stale.clear()
+
+    def _attach_segment(self, name: str) -> SharedMemory:
+        """
+        Return the mapping of a data segment, attaching to it if needed.
+
+        The writer keeps two data segments and unlinks one whenever it
+        grows, so only the two most recently used mappings are kept. Older
+        ones are closed once the memoryviews of frames read from them have
+        been released.
+        """
+        segment = self._segments.pop(name, None)
+        if segment is None:
+            segment = _attach(name)
+        self._segments[name] = segment
+
+        while len(self._segments) > 2:
+            self._stale.append(self._segments.pop(next(iter(self._segments))))
+        self._stale = [stale for stale in self._stale if not _try_close(stale)]
+
+        return segment
+
+    def __enter__(self) -> SharedWorldReader:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
@@ -0,0 +1,12 @@
+from .Export import ArchetypeExport, component_schema, pack_column
+from .Shared import SharedEntityIds, SharedFrame, SharedWorldReader, SharedWorldWriter
+
+__all__ = [
+    "ArchetypeExport",
+    "SharedEntityIds",
+    "SharedFrame",
+    "SharedWorldReader",
+    "SharedWorldWriter",
+    "component_schema",
+    "pack_column",
+]
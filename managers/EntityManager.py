@@ -54,6 +54,22 @@ class EntityManager(object):
 
             return (StatusCodes.ENTITY_CREATED, new_entity)
 
+    def create_entities(self, count: int) -> list[Entity]:
+        """
+        Create several entities at once.
+
+        This method generates count unique UUID4 identifiers and registers
+        them in the alive_entities set under a single lock acquisition.
+
+        Returns the new entity UUIDs in creation order.
+        """
+        with self._lock:
+            new_entities: list[UUID4] = [self._unique_id() for _ in range(count)]
+
+            self.alive_entities.update(new_entities)
+
+            return new_entities
+
     def destroy_entity(
         self, entity: Entity
     ) -> Literal[StatusCodes.ENTITY_DESTROYED, StatusCodes.FAILURE]:
@@ -84,3 +100,19 @@ class EntityManager(object):
         """
         with self._lock:
             return entity in self.alive_entities
+
+    def fork(self) -> "EntityManager":
+        """
+        Create an independent copy of this entity manager.
+
+        The fork starts with the same set of alive entities; creating or
+        destroying entities afterwards only affects the side that did it.
+
+        Returns the forked entity manager.
+        """
+        forked = EntityManager()
+
+        with self._lock:
+            forked.alive_entities = set(self.alive_entities)
+
+        return forked
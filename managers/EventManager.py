@@ -0,0 +1,59 @@
+from collections.abc import Iterator
+from typing import cast
+
+from pyecs.containers.EventChannel import EventChannel, event_channel
+
+
+class EventManager(object):
+    def __init__(self):
+        self.channels: dict[type, EventChannel[object]] = {}
+
+    def channel[T](self, event_type: type[T]) -> EventChannel[T]:
+        """
+        Return the channel for an event type, creating it on first use.
+        """
+        channel = self.channels.get(event_type)
+        if channel is None:
+            channel = self.channels[event_type] = cast(
+                EventChannel[object], event_channel(event_type)
+            )
+
+        return cast(EventChannel[T], channel)
+
+    def send(self, event: object) -> None:
+        """
+        Queue an event on the channel of its type for the next frame.
+        """
+        channel = self.channels.get(type(event))
+        if channel is None:
+            channel = self.channel(type(event))
+
+        channel.send(event)
+
+    def read[T](self, event_type: type[T]) -> Iterator[T]:
+        """
+        Iterate over the events of a type sent during the previous frame.
+        """
+        return self.channel(event_type).read()
+
+    def swap(self) -> None:
+        """
+        Swap the buffers of every channel at the end of a frame.
+        """
+        for channel in self.channels.values():
+            channel.swap()
+
+    def fork(self) -> "EventManager":
+        """
+        Create a copy of this event manager with copies of every channel.
+
+        Events sent or swapped afterwards only affect the side that did it.
+
+        Returns the forked event manager.
+        """
+        forked = EventManager()
+        forked.channels = {
+            event_type: channel.fork() for event_type, channel in self.channels.items()
+        }
+
+        return forked
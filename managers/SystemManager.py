@@ -1,20 +1,114 @@
 # pyright: reportMissingParameterType=false
 # pyright: reportUnknownParameterType=false
+# pyright: reportUnknownArgumentType=false, reportUnknownMemberType=false
 from __future__ import annotations
 
+import asyncio
+import multiprocessing
+import time
+from collections.abc import Coroutine, Iterable
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 from random import randbytes
-from typing import Literal
+from typing import Literal, cast
 
-from pyecs.common.Types import UUID4
+from pyecs.common.Types import UUID4, Component
+from pyecs.containers.Archetype import Archetype
+from pyecs.containers.CachedQuery import CachedQuery
 from pyecs.helpers.Statuses import StatusCodes
-from pyecs.processing.System import System
+from pyecs.processing.ExecutionPlan import ExecutionPlan, SystemBatch, build_batches, build_plan
+from pyecs.processing.FrameBudget import DEFAULT_PRIORITY, FrameBudget, system_priority
+from pyecs.processing.Parallel import (
+    PROCESS_CHUNK_SIZE,
+    Kernel,
+    RowChunk,
+    detached,
+    merge_rows,
+    partition_rows,
+)
+from pyecs.processing.System import (
+    System,
+    SystemPhase,
+    accepts_archetypes,
+    declared_components,
+    is_async_system,
+    system_phase,
+)
+from pyecs.processing.SystemSchedule import SystemSchedule, declared_schedule
+from pyecs.profiling.SystemProfiler import SystemProfiler
 
 
 class SystemManager(object):
-    def __init__(self):
-        self.systems: list[System] = []
+    def __init__(self, process_workers: int | None = None, process_start_method: str | None = None):
         self.system_to_id: dict[System, UUID4] = {}
         self.id_to_system: dict[UUID4, System] = {}
+        self.process_workers: int | None = process_workers
+        self.process_start_method: str | None = process_start_method
+        self._process_pool: ProcessPoolExecutor | None = None
+        self.profiler: SystemProfiler = SystemProfiler()
+        self.schedules: dict[System, SystemSchedule] = {}
+        self.queries: dict[System, CachedQuery] = {}
+        self.archetype_systems: set[System] = set()
+        self.async_systems: set[System] = set()
+        self.deferrable: set[System] = set()
+        self.budget: FrameBudget | None = None
+        self._plan: ExecutionPlan | None = None
+        self._ordered: tuple[System, ...] = ()
+        self._batches: list[SystemBatch] | None = None
+
+    @property
+    def systems(self) -> tuple[System, ...]:
+        return self.execution_order()
+
+    def execution_plan(self) -> ExecutionPlan:
+        """
+        Return the cached execution plan, building it if systems changed.
+
+        The plan groups systems into the pre_update, update and post_update
+        stages and orders each stage by the systems' before and after
+        relations, falling back to registration order. It is rebuilt only
+        after a system is registered or removed.
+
+        Returns a list of (stage, systems) pairs. Raises SystemOrderError if
+        the relations cannot be satisfied.
+        """
+        if self._plan is None:
+            self._plan = build_plan(list(self.system_to_id))
+            self._ordered = tuple(
+                system for _, stage_systems in self._plan for system in stage_systems
+            )
+            self._batches = None
+
+        return self._plan
+
+    def execution_order(self) -> tuple[System, ...]:
+        """
+        Return every registered system in the order updates run them.
+
+        The order is a tuple, so forks can share it without a caller's
+        changes reaching the cached plan.
+        """
+        if self._plan is None:
+            _ = self.execution_plan()
+
+        return self._ordered
+
+    def execution_batches(self) -> list[SystemBatch]:
+        """
+        Return the cached batches used by update_all_async.
+
+        Asynchronous systems that are next to each other in the execution
+        plan, in the same stage and without a before or after relation
+        between them, share a batch and run concurrently. Every other batch
+        holds synchronous systems that run one after another.
+
+        Returns a list of (concurrent, systems) pairs in run order.
+        """
+        plan = self.execution_plan()
+        if self._batches is None:
+            self._batches = build_batches(plan, self.async_systems)
+
+        return self._batches
 
     def _unique_id(self) -> UUID4:
         """
@@ -45,19 +139,52 @@ class SystemManager(object):
         """
         Register a new system with the system manager.
 
-        This method assigns a unique UUID to the system and adds it to the
-        systems list for execution during world updates.
+        This method assigns a unique UUID to the system and invalidates the
+        execution plan so the next update places it. Systems declaring a
+        tick_interval, time_interval or run_if get a schedule, staggered
+        against systems already registered with the same intervals. Systems
+        declaring required components get a cached query over them, and
+        systems whose update takes an archetypes parameter are passed its
+        archetypes on every update. Systems defining async def update are
+        marked to be awaited, and systems declaring a priority below
+        DEFAULT_PRIORITY are marked as deferrable under a frame budget.
 
         Returns a tuple containing SYSTEM_REGISTERED status and the system on success,
-        or FAILURE if the system is already registered.
+        or FAILURE if the system is already registered. Raises ValueError,
+        without registering the system, if it declares a tick_interval
+        below 1 or a negative time_interval.
         """
         if system in self.system_to_id:
             return StatusCodes.FAILURE
 
+        schedule = declared_schedule(system)
+
         system_id: UUID4 = self._unique_id()
-        self.systems.append(system)
         self.system_to_id[system] = system_id
         self.id_to_system[system_id] = system
+        self._plan = None
+
+        if schedule is not None:
+            schedule.stagger(
+                sum(
+                    1
+                    for other in self.schedules.values()
+                    if (other.tick_interval, other.time_interval)
+                    == (schedule.tick_interval, schedule.time_interval)
+                )
+            )
+            self.schedules[system] = schedule
+
+        takes_archetypes = accepts_archetypes(system)
+        mask = declared_components(system)
+        if mask or takes_archetypes:
+            self.queries[system] = CachedQuery(mask or frozenset())
+        if takes_archetypes:
+            self.archetype_systems.add(system)
+        if is_async_system(system):
+            self.async_systems.add(system)
+        if system_priority(system) < DEFAULT_PRIORITY:
+            self.deferrable.add(system)
 
         return (StatusCodes.SYSTEM_REGISTERED, system)
 
@@ -68,7 +195,8 @@ class SystemManager(object):
         Remove a system from the system manager by UUID.
 
         This method removes the specified system from all tracking structures
-        and prevents it from being executed during world updates.
+        and invalidates the execution plan, so it is no longer executed
+        during world updates.
 
         Returns SYSTEM_UNREGISTERED on successful removal, or FAILURE if
         the system ID does not exist.
@@ -77,9 +205,16 @@ class SystemManager(object):
             return StatusCodes.FAILURE
 
         system: System = self.id_to_system[id]
-        self.systems.remove(system)
         del self.system_to_id[system]
         del self.id_to_system[id]
+        _ = self.schedules.pop(system, None)
+        _ = self.queries.pop(system, None)
+        self.archetype_systems.discard(system)
+        self.async_systems.discard(system)
+        self.deferrable.discard(system)
+        if self.budget is not None:
+            self.budget.forget(system)
+        self._plan = None
 
         return StatusCodes.SYSTEM_UNREGISTERED
 
@@ -100,15 +235,296 @@ class SystemManager(object):
             return self.unregister_system(system_id)
         return StatusCodes.FAILURE
 
-    def update_all(self, world, dt: float) -> None:
+    def fork(self) -> SystemManager:
+        """
+        Create a copy of this system manager that shares its systems.
+
+        The fork runs the same system instances in the same order and
+        shares the current execution plan until either side changes, but
+        registering or removing systems afterwards only affects the side
+        that did it. Schedules and the frame budget are copied with their
+        progress and cached queries start over, since they belong to another
+        world. The fork's profiler keeps the enabled flag but starts without
+        samples.
+
+        Returns the forked system manager.
+        """
+        forked = SystemManager(self.process_workers, self.process_start_method)
+        forked.profiler.enabled = self.profiler.enabled
+        forked.system_to_id = dict(self.system_to_id)
+        forked.id_to_system = dict(self.id_to_system)
+        forked.schedules = {system: schedule.fork() for system, schedule in self.schedules.items()}
+        forked.queries = {
+            system: CachedQuery(query.with_types, query.without_types)
+            for system, query in self.queries.items()
+        }
+        forked.archetype_systems = set(self.archetype_systems)
+        forked.async_systems = set(self.async_systems)
+        forked.deferrable = set(self.deferrable)
+        forked.budget = self.budget.fork() if self.budget is not None else None
+        forked._plan = self._plan
+        forked._ordered = self._ordered
+        forked._batches = self._batches
+
+        return forked
+
+    def start_frame(self) -> None:
+        """
+        Start timing a frame against the frame budget, if one is set.
+        """
+        if self.budget is not None:
+            self.budget.start_frame()
+
+    def end_frame(self) -> None:
+        """
+        Close the frame budget's current frame, if one is set.
+        """
+        if self.budget is not None:
+            self.budget.end_frame()
+
+    def update_all(self, world, dt: float, phase: SystemPhase | None = None) -> None:
         """
         Execute the update method for all registered systems.
 
         This method calls the update method on each registered system in
-        registration order, passing the world instance and delta time.
+        execution plan order, passing the world instance and delta time. When
+        a phase is given, only systems running in that phase are updated.
+        Scheduled systems are skipped until they are due and then receive
+        the time since they last ran as their delta time. Systems taking an
+        archetypes parameter get their cached query's archetypes, refreshed
+        just before they run. Asynchronous systems are run to completion
+        with asyncio.run, one at a time; use update_all_async to await them
+        on a running event loop instead. Under a frame budget, deferrable
+        systems are skipped while the frame cannot fit them and later run
+        with the time they missed.
 
         Systems are responsible for querying entities and performing their
-        specific logic during this update cycle.
+        specific logic during this update cycle. While the profiler is enabled
+        the frame is timed by update_all_profiled instead.
+        """
+        if self.profiler.enabled:
+            self.update_all_profiled(world, dt, phase)
+            return
+
+        self._update_systems(world, dt, phase)
+
+    def update_all_profiled(self, world, dt: float, phase: SystemPhase | None = None) -> None:
+        """
+        Execute all registered systems while recording their wall time.
+
+        This method runs systems exactly like update_all and records each
+        system's wall time and the number of entities in archetypes holding
+        its required components, then the wall time of the whole frame.
+        Deferrable systems' wall times also feed the frame budget.
+        """
+        frame_start = time.perf_counter_ns()
+        self._update_systems(world, dt, phase)
+        self.profiler.record_frame(time.perf_counter_ns() - frame_start)
+
+    def _update_systems(
+        self, world, dt: float, phase: SystemPhase | None, systems: list[System] | None = None
+    ) -> None:
+        for system in self.systems if systems is None else systems:
+            system_dt = self._due(system, world, dt, phase)
+            if system_dt is not None:
+                self._run(system, world, system_dt)
+
+    def _due(self, system: System, world, dt: float, phase: SystemPhase | None) -> float | None:
+        """
+        Decide whether a system runs in this update and with which delta time.
+
+        Systems outside the given phase are skipped, scheduled systems run
+        once they are due, and deferrable systems must be admitted by the
+        frame budget.
+
+        Returns the delta time to pass to the system, or None to skip it.
+        """
+        if phase is not None and system_phase(system) != phase:
+            return None
+
+        system_dt: float | None = dt
+        schedule = self.schedules.get(system)
+        if schedule is not None:
+            system_dt = schedule.due(world, dt)
+
+        if system_dt is not None and self.budget is not None and system in self.deferrable:
+            system_dt = self.budget.admit(system, system_dt)
+
+        return system_dt
+
+    def _run(self, system: System, world, dt: float) -> None:
+        """
+        Run one due system to completion.
+
+        Asynchronous systems are run with asyncio.run. While the profiler is
+        enabled, or for deferrable systems under a frame budget, the run is
+        timed and recorded.
+        """
+        if not self.profiler.enabled and (self.budget is None or system not in self.deferrable):
+            self._complete(self.invoke(system, world, dt))
+            return
+
+        entities = self._matching_rows(world, system) if self.profiler.enabled else 0
+        start = time.perf_counter_ns()
+
+        self._complete(self.invoke(system, world, dt))
+
+        self._record(system, time.perf_counter_ns() - start, entities)
+
+    def _complete(self, result: Coroutine[object, object, None] | None) -> None:
+        if result is not None:
+            asyncio.run(result)
+
+    async def update_all_async(self, world, dt: float, phase: SystemPhase | None = None) -> None:
+        """
+        Execute all registered systems, awaiting asynchronous ones.
+
+        Systems run batch by batch in execution_batches order, honouring
+        the phase filter and schedules like update_all. Synchronous batches
+        run on the calling thread exactly as update_all runs them, while
+        the updates of an asynchronous batch are awaited together with
+        asyncio.gather, so their I/O waits overlap. A batch finishes before
+        the next one starts.
+
+        While the profiler is enabled each system's wall time is recorded,
+        which for concurrent systems includes time spent waiting on the
+        others, followed by the wall time of the whole frame. Deferrable
+        systems in an asynchronous batch are admitted against the frame
+        budget before the batch starts.
+        """
+        profiled = self.profiler.enabled
+        frame_start = time.perf_counter_ns()
+
+        for concurrent, batch in self.execution_batches():
+            if not concurrent:
+                self._update_systems(world, dt, phase, batch)
+                continue
+
+            due = [
+                (system, system_dt)
+                for system in batch
+                if (system_dt := self._due(system, world, dt, phase)) is not None
+            ]
+            _ = await asyncio.gather(
+                *(self._run_async(system, world, system_dt) for system, system_dt in due)
+            )
+
+        if profiled:
+            self.profiler.record_frame(time.perf_counter_ns() - frame_start)
+
+    async def _run_async(self, system: System, world, dt: float) -> None:
+        entities = self._matching_rows(world, system) if self.profiler.enabled else 0
+        start = time.perf_counter_ns()
+
+        result = self.invoke(system, world, dt)
+        if result is not None:
+            await result
+
+        self._record(system, time.perf_counter_ns() - start, entities)
+
+    def _record(self, system: System, elapsed: int, entities: int) -> None:
+        if self.profiler.enabled:
+            self.profiler.record_system(
+                self.system_to_id[system], type(system).__name__, elapsed, entities
+            )
+        if self.budget is not None and system in self.deferrable:
+            self.budget.record(system, elapsed)
+
+    def invoke(self, system: System, world, dt: float) -> Coroutine[object, object, None] | None:
+        """
+        Call one system's update, or its kernel for process-parallel systems.
+
+        Systems taking an archetypes parameter are passed their cached
+        query's archetypes, refreshed against the world's storage.
+
+        Every update_all variant runs systems through this method. Returns
+        the coroutine of an asynchronous system's update for the caller to
+        run or await, or None.
+        """
+        if getattr(system, "process_parallel", False):
+            self.run_process_parallel(system, world, dt)
+            return None
+
+        if system in self.archetype_systems:
+            archetypes = self.queries[system].refresh(world.component_storage)
+            return system.update(world, dt, archetypes=archetypes)  # pyright: ignore[reportCallIssue, reportUnknownVariableType]
+
+        return system.update(world, dt)
+
+    def _matching_rows(self, world, system: System) -> int:
+        """
+        Count the rows of every archetype holding a system's required components.
+
+        Returns 0 for systems that do not declare required components.
+        """
+        query = self.queries.get(system)
+        if query is None or not query.with_types:
+            return 0
+
+        _ = query.refresh(world.component_storage)
+        return query.row_count()
+
+    def run_process_parallel(self, system: System, world, dt: float) -> None:
+        """
+        Run a process-parallel system's kernel across a process pool.
+
+        Rows of every archetype in the system's cached query are split into
+        chunks of the system's chunk_size (PROCESS_CHUNK_SIZE by default).
+        Disabled rows are skipped. Each chunk is passed to the system's
+        kernel together with dt, and the columns the kernel returns are
+        written back into the rows it was given. A single chunk runs in this
+        process to avoid the round trip, on a copy as a worker would get, so
+        kernels never change live components in either case.
+
+        The kernel must be picklable, such as a staticmethod of a module-level
+        class, and must not change which components entities have.
+
+        Raises OperationFailedError if a kernel returns a column that does
+        not fit the rows it was given.
+        """
+        required: frozenset[type] = frozenset(system.required_components)
+        query = self.queries.get(system) or CachedQuery(required)
+        chunk_size: int = getattr(system, "chunk_size", PROCESS_CHUNK_SIZE)
+        kernel = cast(Kernel, system.kernel)  # pyright: ignore[reportAttributeAccessIssue]
+
+        targets: list[tuple[Archetype, int]] = []
+        chunks: list[RowChunk] = []
+        for archetype in query.refresh(world.component_storage):
+            for start, chunk in partition_rows(archetype, required, chunk_size):
+                targets.append((archetype, start))
+                chunks.append(chunk)
+
+        results: Iterable[dict[type, list[Component]]]
+        if len(chunks) == 1:
+            results = [kernel(detached(chunks[0]), dt)]
+        else:
+            results = self.process_pool().map(kernel, chunks, repeat(dt))
+
+        for (archetype, start), chunk, written in zip(targets, chunks, results, strict=True):
+            merge_rows(archetype, start, len(chunk.entities), written)
+
+    def process_pool(self) -> ProcessPoolExecutor:
+        """
+        Return the process pool used for process-parallel systems.
+
+        The pool is created on first use with process_workers workers, using
+        process_start_method ('fork', 'spawn' or 'forkserver') when set and
+        the platform default otherwise.
+        """
+        if self._process_pool is None:
+            self._process_pool = ProcessPoolExecutor(
+                max_workers=self.process_workers,
+                mp_context=multiprocessing.get_context(self.process_start_method),
+            )
+
+        return self._process_pool
+
+    def shutdown_process_pool(self) -> None:
+        """
+        Shut down the process pool, waiting for running kernels to finish.
+
+        A new pool is created if a process-parallel system runs again.
         """
-        for system in self.systems:
-            system.update(world, dt)  # pyright: ignore[reportUnknownMemberType, reportUnknownArgumentType]
+        if self._process_pool is not None:
+            self._process_pool.shutdown()
+            self._process_pool = None
@@ -1,4 +1,5 @@
 from .EntityManager import EntityManager
+from .EventManager import EventManager
 from .SystemManager import SystemManager
 
-__all__ = ["EntityManager", "SystemManager"]
+__all__ = ["EntityManager", "EventManager", "SystemManager"]
@@ -0,0 +1,152 @@
+import heapq
+from collections.abc import Iterable
+from typing import Literal, cast
+
+from pyecs.exceptions import SystemOrderError
+from pyecs.processing.System import System
+
+type SystemStage = Literal["pre_update", "update", "post_update"]
+
+STAGES: tuple[SystemStage, ...] = ("pre_update", "update", "post_update")
+
+type ExecutionPlan = list[tuple[SystemStage, list[System]]]
+
+type SystemBatch = tuple[bool, list[System]]
+
+
+def system_stage(system: System) -> SystemStage:
+    """
+    Return the stage a system declares, "update" by default.
+
+    Raises SystemOrderError for a stage that is not one of STAGES.
+    """
+    stage = getattr(system, "stage", None) or "update"
+    if stage not in STAGES:
+        raise SystemOrderError(f"{type(system).__name__} declares unknown stage {stage!r}")
+    return stage
+
+
+def _resolve(targets: Iterable[object], systems: list[System]) -> list[System]:
+    resolved: list[System] = []
+    for target in targets:
+        if isinstance(target, type):
+            resolved.extend(system for system in systems if isinstance(system, target))
+        else:
+            resolved.extend(system for system in systems if system is target)
+    return resolved
+
+
+def _ordering(system: System, name: Literal["before", "after"]) -> Iterable[object]:
+    return cast(Iterable[object], getattr(system, name, ()))
+
+
+def _targets(system: System, other: System) -> bool:
+    return any(
+        target is other or (isinstance(target, type) and isinstance(other, target))
+        for target in (*_ordering(system, "before"), *_ordering(system, "after"))
+    )
+
+
+def constrained(first: System, second: System) -> bool:
+    """
+    Check whether either system names the other in its before or after.
+
+    Returns True if the two systems have an ordering relation and must not
+    run concurrently.
+    """
+    return _targets(first, second) or _targets(second, first)
+
+
+def build_plan(systems: list[System]) -> ExecutionPlan:
+    """
+    Order systems into stages honouring their before and after relations.
+
+    Systems are grouped by their stage in STAGES order. A system's before
+    and after attributes list system classes, matching every registered
+    instance, or system instances; targets that are not registered are
+    ignored. Within a stage, systems are topologically sorted and ties are
+    broken by registration order, so unconstrained systems keep running in
+    the order they were added. Relations between systems in different
+    stages must agree with the stage order.
+
+    Returns a list of (stage, systems) pairs for the non-empty stages.
+    Raises SystemOrderError if the relations contradict the stage order or
+    form a cycle.
+    """
+    order = {system: index for index, system in enumerate(systems)}
+    stages = {system: STAGES.index(system_stage(system)) for system in systems}
+    successors: dict[System, list[System]] = {system: [] for system in systems}
+    incoming: dict[System, int] = dict.fromkeys(systems, 0)
+
+    for system in systems:
+        edges = [(system, other) for other in _resolve(_ordering(system, "before"), systems)]
+        edges += [(other, system) for other in _resolve(_ordering(system, "after"), systems)]
+
+        for first, second in edges:
+            if first is second:
+                continue
+            if stages[first] > stages[second]:
+                earlier, later = type(first).__name__, type(second).__name__
+                raise SystemOrderError(
+                    f"{earlier} must run before {later}, but is in a later stage"
+                )
+            if stages[first] == stages[second]:
+                successors[first].append(second)
+                incoming[second] += 1
+
+    ready = [(stages[system], order[system], system) for system in systems if not incoming[system]]
+    heapq.heapify(ready)
+    plan: ExecutionPlan = []
+
+    while ready:
+        stage, _, system = heapq.heappop(ready)
+        if not plan or plan[-1][0] != STAGES[stage]:
+            plan.append((STAGES[stage], []))
+        plan[-1][1].append(system)
+
+        for successor in successors[system]:
+            incoming[successor] -= 1
+            if not incoming[successor]:
+                heapq.heappush(ready, (stages[successor], order[successor], successor))
+
+    if sum(len(stage_systems) for _, stage_systems in plan) != len(systems):
+        cycle = sorted({type(system).__name__ for system in systems if incoming[system]})
+        raise SystemOrderError(f"System ordering has a cycle between {', '.join(cycle)}")
+
+    return plan
+
+
+def build_batches(plan: ExecutionPlan, async_systems: set[System]) -> list[SystemBatch]:
+    """
+    Split an execution plan into batches for an asynchronous update.
+
+    Each stage is walked in plan order and consecutive systems are grouped
+    while they are all synchronous or all asynchronous. An asynchronous
+    batch is also closed before a system constrained against one already in
+    it, so systems with a before or after relation never overlap. Batches
+    never span stages.
+
+    Returns a list of (concurrent, systems) pairs in run order, where
+    concurrent is True for batches of asynchronous systems.
+    """
+    batches: list[SystemBatch] = []
+
+    for _, stage_systems in plan:
+        current: list[System] = []
+        concurrent = False
+
+        for system in stage_systems:
+            is_async = system in async_systems
+            if current and (
+                is_async != concurrent
+                or (is_async and any(constrained(system, other) for other in current))
+            ):
+                batches.append((concurrent, current))
+                current = []
+            concurrent = is_async
+            current.append(system)
+
+        if current:
+            batches.append((concurrent, current))
+
+    return batches
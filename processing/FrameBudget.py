@@ -0,0 +1,134 @@
+import time
+
+DEFAULT_PRIORITY: int = 0
+MAX_DEFERRED_FRAMES: int = 4
+COST_SMOOTHING: float = 0.25
+
+
+def system_priority(system: object) -> int:
+    """
+    Return the priority a system declares, DEFAULT_PRIORITY by default.
+
+    Systems with a priority below DEFAULT_PRIORITY, such as AI planning or
+    cosmetic effects, may be deferred when a frame runs over its budget.
+    """
+    priority = getattr(system, "priority", None)
+    return DEFAULT_PRIORITY if priority is None else priority
+
+
+class FrameBudget(object):
+    def __init__(self, budget: float | int, max_deferred: int = MAX_DEFERRED_FRAMES):
+        if budget <= 0 or max_deferred < 0:
+            raise ValueError("budget must be positive and max_deferred non-negative")
+
+        self.budget: float | int = budget
+        self.budget_ns: int = int(budget * 1_000_000_000)
+        self.max_deferred: int = max_deferred
+        self.frame_start: int = time.perf_counter_ns()
+        self.costs: dict[object, float] = {}
+        self.deferred: dict[object, int] = {}
+        self.owed: dict[object, float | int] = {}
+        self.frames: int = 0
+        self.deferrals: int = 0
+        self.overruns: int = 0
+        self.last_frame_ns: int = 0
+
+    def start_frame(self) -> None:
+        """
+        Start timing a new frame against the budget.
+        """
+        self.frame_start = time.perf_counter_ns()
+
+    def end_frame(self) -> None:
+        """
+        Close the current frame, counting it as an overrun if it went over budget.
+        """
+        self.last_frame_ns = time.perf_counter_ns() - self.frame_start
+        self.frames += 1
+        if self.last_frame_ns > self.budget_ns:
+            self.overruns += 1
+
+    def remaining(self) -> float:
+        """
+        Return the seconds left in the current frame's budget.
+
+        Systems splitting their work across frames can stop once this
+        reaches zero. The result is negative once the frame is over budget.
+        """
+        return (self.budget_ns - (time.perf_counter_ns() - self.frame_start)) / 1_000_000_000
+
+    def admit(self, system: object, dt: float | int) -> float | int | None:
+        """
+        Decide whether a low-priority system runs in the current frame.
+
+        The system runs if the time already spent this frame plus its
+        expected cost, a moving average of its previous runs, fits in the
+        budget, or if it has already been deferred max_deferred frames in a
+        row, so it cannot starve. The dt of deferred frames is owed to the
+        system and added to the dt it runs with.
+
+        Returns the dt to run the system with, or None to defer it.
+        """
+        owed = self.owed.get(system, 0.0) + dt
+        deferred = self.deferred.get(system, 0)
+        spent = time.perf_counter_ns() - self.frame_start
+
+        if deferred < self.max_deferred and spent + self.costs.get(system, 0.0) > self.budget_ns:
+            self.deferred[system] = deferred + 1
+            self.owed[system] = owed
+            self.deferrals += 1
+            return None
+
+        self.deferred[system] = 0
+        self.owed[system] = 0.0
+        return owed
+
+    def record(self, system: object, elapsed_ns: int) -> None:
+        """
+        Fold one run's wall time into a system's expected cost.
+        """
+        cost = self.costs.get(system)
+        self.costs[system] = (
+            float(elapsed_ns) if cost is None else cost + COST_SMOOTHING * (elapsed_ns - cost)
+        )
+
+    def forget(self, system: object) -> None:
+        """
+        Drop everything recorded for a system that is no longer registered.
+        """
+        _ = self.costs.pop(system, None)
+        _ = self.deferred.pop(system, None)
+        _ = self.owed.pop(system, None)
+
+    def snapshot(self) -> dict[str, object]:
+        """
+        Return the budget and its counters as a JSON-compatible dict.
+
+        The dict holds the budget in seconds, the number of frames timed,
+        how many of them ran over, the last frame's wall time in
+        nanoseconds and the total number of system runs deferred.
+        """
+        return {
+            "budget": self.budget,
+            "frames": self.frames,
+            "overruns": self.overruns,
+            "last_frame_ns": self.last_frame_ns,
+            "deferrals": self.deferrals,
+        }
+
+    def fork(self) -> "FrameBudget":
+        """
+        Create a copy of this budget with the same costs and deferrals.
+
+        Returns the forked budget.
+        """
+        forked = FrameBudget(self.budget, self.max_deferred)
+        forked.costs = dict(self.costs)
+        forked.deferred = dict(self.deferred)
+        forked.owed = dict(self.owed)
+        forked.frames = self.frames
+        forked.deferrals = self.deferrals
+        forked.overruns = self.overruns
+        forked.last_frame_ns = self.last_frame_ns
+
+        return forked
@@ -0,0 +1,114 @@
+import pickle
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass, field
+from typing import cast
+
+from pyecs.common.Types import Component, Entity
+from pyecs.containers.Archetype import Archetype
+from pyecs.exceptions import OperationFailedError
+from pyecs.helpers.Statuses import StatusCodes
+
+PROCESS_CHUNK_SIZE: int = 4096
+
+
+@dataclass
+class RowChunk:
+    """A contiguous range of archetype rows shipped to a system kernel."""
+
+    entities: list[Entity]
+    columns: dict[type, list[Component]] = field(default_factory=dict)
+
+
+type Kernel = Callable[[RowChunk, float], dict[type, list[Component]]]
+
+
+def partition_rows(
+    archetype: Archetype, component_types: frozenset[type], chunk_size: int
+) -> Iterator[tuple[int, RowChunk]]:
+    """
+    Split an archetype's enabled rows into chunks holding the given component columns.
+
+    Row chunks follow the archetype's storage chunks and the runs of enabled
+    rows within them, and are split further so that each carries at most
+    chunk_size contiguous rows: the entity IDs and one list per requested
+    component type. Disabled rows are left out, as queries skip them.
+    Columns are read without copying ones shared with a forked world, so
+    the chunks must be detached before a kernel runs on them.
+
+    Yields (start_row, chunk) pairs in row order.
+    """
+    for chunk_index, storage_chunk in enumerate(archetype.chunks):
+        base = chunk_index * archetype.chunk_capacity
+
+        for run_start, run_stop in enabled_runs(storage_chunk.enabled):
+            for offset in range(run_start, run_stop, chunk_size):
+                stop = min(offset + chunk_size, run_stop)
+                chunk = RowChunk(storage_chunk.entities[offset:stop])
+
+                for component_type in component_types:
+                    if component_type in storage_chunk.columns:
+                        column = storage_chunk.read_column(component_type)
+                        chunk.columns[component_type] = column[offset:stop]
+
+                yield base + offset, chunk
+
+
+def enabled_runs(enabled: bytearray) -> Iterator[tuple[int, int]]:
+    """
+    Find the runs of consecutive enabled rows in an enabled mask.
+
+    Yields (start, stop) row ranges in order.
+    """
+    if 0 not in enabled:
+        if enabled:
+            yield 0, len(enabled)
+        return
+
+    stop = 0
+    while (start := enabled.find(1, stop)) != -1:
+        stop = enabled.find(0, start)
+        if stop == -1:
+            stop = len(enabled)
+        yield start, stop
+
+
+def detached(chunk: RowChunk) -> RowChunk:
+    """
+    Copy a row chunk the way a worker process receives it.
+
+    Kernels run in this process get the copy too, so changing the
+    components they are given never reaches the world, with one chunk or
+    many.
+
+    Returns the copied chunk.
+    """
+    return cast(RowChunk, pickle.loads(pickle.dumps(chunk, pickle.HIGHEST_PROTOCOL)))
+
+
+def merge_rows(
+    archetype: Archetype, start: int, count: int, written: dict[type, list[Component]]
+) -> None:
+    """
+    Write the columns returned by a kernel back into their archetype rows.
+
+    Every column is checked before any is written, so a bad result leaves
+    the archetype unchanged.
+
+    Raises OperationFailedError if a column is not one of the archetype's,
+    does not hold count components, or holds components of another type.
+    """
+    for component_type, components in written.items():
+        if component_type not in archetype.component_types:
+            raise OperationFailedError(
+                f"Kernel returned a {component_type.__name__} column the archetype lacks"
+            )
+        if len(components) != count or any(
+            component.__class__ is not component_type for component in components
+        ):
+            raise OperationFailedError(
+                f"Kernel must return {count} {component_type.__name__} components"
+            )
+
+    for component_type, components in written.items():
+        if archetype.write_column(component_type, start, components) == StatusCodes.FAILURE:
+            raise OperationFailedError(f"Could not write the {component_type.__name__} column")
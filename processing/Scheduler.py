@@ -0,0 +1,68 @@
+DEFAULT_TICK_RATE: int = 60
+MAX_CATCH_UP_STEPS: int = 5
+STEP_EPSILON: float = 1e-9
+
+
+class FixedStepScheduler(object):
+    def __init__(
+        self, tick_rate: float | int = DEFAULT_TICK_RATE, max_steps: int = MAX_CATCH_UP_STEPS
+    ):
+        if tick_rate <= 0 or max_steps < 1:
+            raise ValueError("tick_rate must be positive and max_steps at least 1")
+
+        self.tick_rate: float | int = tick_rate
+        self.step: float = 1 / tick_rate
+        self.max_steps: int = max_steps
+        self.accumulator: float = 0.0
+        self.alpha: float = 0.0
+        self.ticks: int = 0
+        self.frames: int = 0
+        self.dropped_steps: int = 0
+
+    def advance(self, elapsed: float | int) -> int:
+        """
+        Account for real elapsed time and decide how many fixed steps to run.
+
+        Elapsed time is added to the accumulator and one step is taken for
+        every whole step it holds, up to max_steps per frame. When a frame
+        falls further behind than that, the surplus whole steps are dropped
+        and counted in dropped_steps instead of being carried over, so a
+        slow frame cannot trigger ever longer catch-up frames. The leftover
+        fraction of a step is kept, and alpha is set to it as a share of a
+        step for interpolating between the last two fixed states.
+
+        Returns the number of fixed steps to run this frame.
+        """
+        if elapsed < 0:
+            raise ValueError("elapsed time cannot be negative")
+
+        self.accumulator += elapsed
+        steps = min(int(self.accumulator / self.step + STEP_EPSILON), self.max_steps)
+        self.accumulator -= steps * self.step
+
+        if self.accumulator / self.step + STEP_EPSILON >= 1:
+            surplus = int(self.accumulator / self.step + STEP_EPSILON)
+            self.dropped_steps += surplus
+            self.accumulator -= surplus * self.step
+
+        self.accumulator = max(self.accumulator, 0.0)
+        self.alpha = self.accumulator / self.step
+        self.ticks += steps
+        self.frames += 1
+
+        return steps
+
+    def fork(self) -> "FixedStepScheduler":
+        """
+        Create a copy of this scheduler with the same rate and accumulated time.
+
+        Returns the forked scheduler.
+        """
+        forked = FixedStepScheduler(self.tick_rate, self.max_steps)
+        forked.accumulator = self.accumulator
+        forked.alpha = self.alpha
+        forked.ticks = self.ticks
+        forked.frames = self.frames
+        forked.dropped_steps = self.dropped_steps
+
+        return forked
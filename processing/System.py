@@ -2,11 +2,15 @@
 # pyright: reportUnknownParameterType=false
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Protocol, runtime_checkable
+import inspect
+from collections.abc import Callable, Iterable
+from typing import TYPE_CHECKING, Literal, Protocol, cast, runtime_checkable
 
 if TYPE_CHECKING:
     from pyecs.core.World import ECSWorld  # pyright: ignore[reportUnusedImport]  # noqa: F401
 
+type SystemPhase = Literal["fixed", "frame"]
+
 
 @runtime_checkable
 class System(Protocol):
@@ -16,8 +20,9 @@ class System(Protocol):
         Define which component types this system requires.
 
         Systems will only process entities that have ALL of the specified
-        component types. This allows the world to efficiently query and
-        cache relevant entities for each system.
+        component types. The system manager turns them into a cached query
+        when the system is registered, which only checks archetypes created
+        since the previous update.
 
         Returns a set of component types that entities must have to be
         processed by this system.
@@ -47,6 +52,10 @@ class System(Protocol):
 
         The dt parameter represents delta time in seconds since the last frame,
         enabling frame-rate independent updates for physics and animations.
+
+        Systems whose update also accepts an archetypes parameter are passed
+        the list of archetypes holding their required components, kept up to
+        date by the system manager, instead of having to run a query.
         """
         ...
 
@@ -62,3 +71,57 @@ class System(Protocol):
         system resources.
         """
         ...
+
+
+def declared_components(system: System) -> frozenset[type] | None:
+    """
+    Return the component types a system declares through required_components.
+
+    Systems that subclass System without overriding required_components, or
+    whose required_components is missing or None, declare nothing.
+
+    Returns a frozenset of component types, or None if nothing is declared.
+    """
+    declared = cast(object, getattr(type(system), "required_components", None))
+    if declared is cast(object, System.__dict__["required_components"]):
+        return None
+
+    required = cast(Iterable[type] | None, getattr(system, "required_components", None))
+    return frozenset(required) if required is not None else None
+
+
+def system_phase(system: System) -> SystemPhase:
+    """
+    Return the phase a system runs in under a fixed-step world.
+
+    Systems declaring phase = "frame", such as rendering or interpolation,
+    run once per real frame. Every other system is a simulation system and
+    runs once per fixed step.
+
+    Returns "frame" or "fixed".
+    """
+    return "frame" if getattr(system, "phase", "fixed") == "frame" else "fixed"
+
+
+def accepts_archetypes(system: System) -> bool:
+    """
+    Check whether a system's update method takes an archetypes parameter.
+
+    Returns True if the system manager should pass the system its cached
+    archetypes on every update.
+    """
+    try:
+        parameters = inspect.signature(cast(Callable[..., object], system.update)).parameters
+    except (TypeError, ValueError):
+        return False
+
+    return "archetypes" in parameters
+
+
+def is_async_system(system: System) -> bool:
+    """
+    Check whether a system's update method is a coroutine function.
+
+    Returns True for systems defining async def update.
+    """
+    return inspect.iscoroutinefunction(getattr(system, "update", None))
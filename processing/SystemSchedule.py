@@ -0,0 +1,114 @@
+from collections.abc import Callable
+
+STAGGER_RATIO: float = 0.6180339887498949
+
+type RunCondition = Callable[..., bool]
+
+
+class SystemSchedule(object):
+    def __init__(
+        self,
+        tick_interval: int = 1,
+        time_interval: float | int = 0.0,
+        condition: RunCondition | None = None,
+        offset: int = 0,
+        elapsed: float | int = 0.0,
+        head_start: float | int = 0.0,
+    ):
+        if tick_interval < 1 or time_interval < 0:
+            raise ValueError("tick_interval must be at least 1 and time_interval non-negative")
+
+        self.tick_interval: int = tick_interval
+        self.time_interval: float | int = time_interval
+        self.condition: RunCondition | None = condition
+        self.offset: int = offset % tick_interval
+        self.calls: int = 0
+        self.elapsed: float | int = elapsed
+        self.head_start: float | int = head_start
+        self.runs: int = 0
+
+    def stagger(self, index: int) -> None:
+        """
+        Spread this schedule's runs against others with the same intervals.
+
+        index is the number of schedules already registered with the same
+        intervals. Tick intervals are offset round-robin by pass, and time
+        intervals get a head start of successive multiples of the golden
+        ratio of the interval, so runs do not all land on the same frame.
+        The head start only brings the first run forward; the elapsed time
+        a run receives is always real.
+        """
+        self.offset = index % self.tick_interval
+        self.head_start = self.time_interval * ((index * STAGGER_RATIO) % 1)
+
+    def due(self, world: object, dt: float | int) -> float | int | None:
+        """
+        Decide whether the system runs in this update pass.
+
+        dt is added to the time since the system last ran on every pass.
+        The system is due when its tick interval has come round, counting
+        passes from its stagger offset, and the time since it last ran plus
+        any stagger head start has reached its time interval, and its run
+        condition, if any, returns True for the world. The condition is only
+        evaluated once both intervals have elapsed.
+
+        Returns the time since the system last ran when it is due, which
+        becomes its dt, or None when it should be skipped.
+        """
+        self.calls += 1
+        self.elapsed += dt
+
+        if (self.calls + self.offset) % self.tick_interval:
+            return None
+        if self.elapsed + self.head_start < self.time_interval:
+            return None
+        if self.condition is not None and not self.condition(world):
+            return None
+
+        elapsed = self.elapsed
+        self.elapsed = 0.0
+        self.head_start = 0.0
+        self.runs += 1
+        return elapsed
+
+    def fork(self) -> "SystemSchedule":
+        """
+        Create a copy of this schedule with the same intervals and progress.
+
+        Returns the forked schedule.
+        """
+        forked = SystemSchedule(
+            self.tick_interval,
+            self.time_interval,
+            self.condition,
+            self.offset,
+            self.elapsed,
+            self.head_start,
+        )
+        forked.calls = self.calls
+        forked.runs = self.runs
+
+        return forked
+
+
+def declared_schedule(system: object) -> SystemSchedule | None:
+    """
+    Build the schedule a system declares, if any.
+
+    Systems declare tick_interval (run every N update passes),
+    time_interval (run once at least that many seconds have passed) and
+    run_if (a callable taking the world and returning whether to run).
+
+    Returns a SystemSchedule, or None for systems that run on every pass.
+    Raises ValueError if tick_interval is below 1 or time_interval is
+    negative.
+    """
+    declared_ticks: int | None = getattr(system, "tick_interval", None)
+    tick_interval = 1 if declared_ticks is None else declared_ticks
+    time_interval: float | int = getattr(system, "time_interval", None) or 0.0
+    condition: RunCondition | None = getattr(system, "run_if", None)
+
+    if tick_interval == 1 and not time_interval and condition is None:
+        return None
+
+    return SystemSchedule(tick_interval, time_interval, condition)
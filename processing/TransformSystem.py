@@ -0,0 +1,200 @@
+from typing import cast
+
+from pyecs.common.Relationship import ChildOf
+from pyecs.common.Transform import GlobalTransform, LocalTransform
+from pyecs.common.Types import Entity
+from pyecs.containers.Archetype import Archetype
+from pyecs.containers.ArchetypeChunk import ArchetypeChunk
+from pyecs.containers.CachedQuery import CachedQuery
+from pyecs.containers.ComponentStorage import ComponentStorage
+from pyecs.core.World import ECSWorld
+from pyecs.processing.ExecutionPlan import SystemStage
+
+
+class TransformSystem(object):
+    stage: SystemStage = "post_update"
+
+    def __init__(self):
+        self.query: CachedQuery = CachedQuery(frozenset({LocalTransform}))
+        self.storage: ComponentStorage | None = None
+        self.relationships_version: int = -1
+        self.versions: dict[ArchetypeChunk, int] = {}
+        self.locals: dict[Entity, LocalTransform] = {}
+        self.globals: dict[Entity, GlobalTransform] = {}
+        self.parents: dict[Entity, Entity | None] = {}
+        self.children: dict[Entity, list[Entity]] = {}
+        self.depths: dict[Entity, int] = {}
+        self.levels: list[list[Entity]] = []
+        self.rebuilds: int = 0
+        self.last_updated: int = 0
+
+    @property
+    def required_components(self) -> set[type]:
+        return {LocalTransform}
+
+    def init(self, world: ECSWorld) -> None:  # pyright: ignore[reportUnusedParameter]
+        pass
+
+    def update(
+        self,
+        world: ECSWorld,
+        dt: float | int,  # pyright: ignore[reportUnusedParameter]
+        archetypes: list[Archetype] | None = None,
+    ) -> None:
+        """
+        Bring the GlobalTransform of every entity with a LocalTransform up to date.
+
+        An entity's global transform is its parent's global transform, the
+        target of its ChildOf relationship, composed with its own local
+        transform; entities whose parent has no LocalTransform are roots.
+        Global transforms are written straight into their chunk columns,
+        bumping the chunk version, and entities missing a GlobalTransform
+        are given one through add_component.
+
+        Only chunks whose version changed since the last update are checked
+        for new local transforms, and only the subtrees below entities whose
+        local transform was replaced are recomputed, parents before
+        children. Local transforms are frozen, so they can only change
+        through add_component or a column write, both of which bump the
+        chunk version. When the hierarchy changes or entities with a
+        LocalTransform come or go, the depth-sorted hierarchy is rebuilt
+        from the relationship index and every transform is recomputed.
+        """
+        storage = world.component_storage
+        if storage is not self.storage:
+            self.storage = storage
+            self.versions = {}
+            self.locals = {}
+            self.relationships_version = -1
+
+        if archetypes is None:
+            archetypes = self.query.refresh(storage)
+
+        changed: set[Entity] = set()
+        rebuild = storage.relationships.version != self.relationships_version
+        rows = 0
+
+        for archetype in archetypes:
+            rows += archetype.row_count()
+            for chunk in archetype.chunks:
+                if self.versions.get(chunk) == chunk.version:
+                    continue
+                column = cast(list[LocalTransform], chunk.read_column(LocalTransform))
+                for entity, local in zip(chunk.entities, column, strict=True):
+                    known = self.locals.get(entity)
+                    if known is not local:
+                        rebuild = rebuild or known is None
+                        self.locals[entity] = local
+                        changed.add(entity)
+
+        if rebuild or rows != len(self.locals):
+            self._rebuild(storage, archetypes)
+            self._propagate(world, [entity for level in self.levels for entity in level])
+        elif changed:
+            self._propagate(world, self._subtrees(changed))
+        else:
+            self.last_updated = 0
+
+        self.versions = {
+            chunk: chunk.version for archetype in archetypes for chunk in archetype.chunks
+        }
+
+    def cleanup(self, world: ECSWorld) -> None:  # pyright: ignore[reportUnusedParameter]
+        pass
+
+    def _rebuild(self, storage: ComponentStorage, archetypes: list[Archetype]) -> None:
+        self.locals = {
+            entity: cast(LocalTransform, local)
+            for archetype in archetypes
+            for chunk in archetype.chunks
+            for entity, local in zip(chunk.entities, chunk.read_column(LocalTransform), strict=True)
+        }
+        relationships = storage.relationships
+        self.parents = {}
+        self.children = {}
+        self.depths = {}
+        self.levels = []
+
+        level: list[Entity] = []
+        for entity in self.locals:
+            parent = relationships.target_of(entity, ChildOf)
+            if parent not in self.locals:
+                self.parents[entity] = None
+                level.append(entity)
+
+        while level:
+            depth = len(self.levels)
+            self.levels.append(level)
+            next_level: list[Entity] = []
+            for entity in level:
+                self.depths[entity] = depth
+                children = [
+                    child
+                    for child in relationships.sources_of(ChildOf, entity)
+                    if child in self.locals
+                ]
+                self.children[entity] = children
+                for child in children:
+                    self.parents[child] = entity
+                next_level.extend(children)
+            level = next_level
+
+        self.globals = {
+            entity: transform for entity, transform in self.globals.items() if entity in self.depths
+        }
+        self.relationships_version = relationships.version
+        self.rebuilds += 1
+
+    def _subtrees(self, changed: set[Entity]) -> list[Entity]:
+        depths = self.depths
+        ordered: list[Entity] = []
+        visited: set[Entity] = set()
+
+        for root in sorted(changed & depths.keys(), key=depths.__getitem__):
+            if root in visited:
+                continue
+            start = len(ordered)
+            ordered.append(root)
+            visited.add(root)
+            while start < len(ordered):
+                for child in self.children[ordered[start]]:
+                    if child not in visited:
+                        visited.add(child)
+                        ordered.append(child)
+                start += 1
+
+        return ordered
+
+    def _propagate(self, world: ECSWorld, entities: list[Entity]) -> None:
+        storage = world.component_storage
+        masks = storage.entity_to_archetype
+        recorder = world.trace_recorder
+        parents = self.parents
+        transforms = self.globals
+        missing: list[Entity] = []
+
+        for entity in entities:
+            local = self.locals[entity]
+            parent = parents[entity]
+            if parent is None:
+                transform = GlobalTransform(local.x, local.y, local.rotation, local.scale)
+            else:
+                transform = transforms[parent].compose(local)
+            transforms[entity] = transform
+
+            mask = masks[entity]
+            if GlobalTransform not in mask:
+                missing.append(entity)
+                continue
+
+            archetype = storage.archetypes[mask]
+            chunk, offset = archetype.locate(archetype.entity_indices[entity])
+            chunk.column(GlobalTransform)[offset] = transform
+            chunk.version += 1
+            if recorder is not None:
+                recorder.record_add(entity, transform)
+
+        for entity in missing:
+            world.add_component(entity, transforms[entity])
+
+        self.last_updated = len(entities)
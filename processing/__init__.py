@@ -1,3 +1,69 @@
-from .System import System
+from .ExecutionPlan import (
+    STAGES,
+    ExecutionPlan,
+    SystemBatch,
+    SystemStage,
+    build_batches,
+    build_plan,
+    constrained,
+    system_stage,
+)
+from .FrameBudget import (
+    DEFAULT_PRIORITY,
+    MAX_DEFERRED_FRAMES,
+    FrameBudget,
+    system_priority,
+)
+from .Parallel import (
+    PROCESS_CHUNK_SIZE,
+    Kernel,
+    RowChunk,
+    detached,
+    enabled_runs,
+    merge_rows,
+    partition_rows,
+)
+from .Scheduler import DEFAULT_TICK_RATE, MAX_CATCH_UP_STEPS, FixedStepScheduler
+from .System import (
+    System,
+    SystemPhase,
+    accepts_archetypes,
+    declared_components,
+    is_async_system,
+    system_phase,
+)
+from .SystemSchedule import RunCondition, SystemSchedule, declared_schedule
 
-__all__ = ["System"]
+__all__ = [
+    "DEFAULT_PRIORITY",
+    "DEFAULT_TICK_RATE",
+    "MAX_CATCH_UP_STEPS",
+    "MAX_DEFERRED_FRAMES",
+    "PROCESS_CHUNK_SIZE",
+    "STAGES",
+    "ExecutionPlan",
+    "FixedStepScheduler",
+    "FrameBudget",
+    "Kernel",
+    "RowChunk",
+    "RunCondition",
+    "System",
+    "SystemBatch",
+    "SystemPhase",
+    "SystemSchedule",
+    "SystemStage",
+    "accepts_archetypes",
+    "build_batches",
+    "build_plan",
+    "constrained",
+    "declared_components",
+    "declared_schedule",
+    "detached",
+    "enabled_runs",
+    "is_async_system",
+    "merge_rows",
+    "partition_rows",
+    "system_phase",
+    "system_priority",
+    "system_stage",
+]
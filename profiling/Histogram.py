@@ -0,0 +1,106 @@
+SUB_BUCKET_BITS: int = 3
+SUB_BUCKETS: int = 1 << SUB_BUCKET_BITS
+
+
+class LatencyHistogram(object):
+    def __init__(self):
+        self.counts: list[int] = []
+        self.count: int = 0
+        self.total: int = 0
+        self.min: int = 0
+        self.max: int = 0
+
+    def record(self, value: int) -> None:
+        """
+        Record one non-negative sample, usually a duration in nanoseconds.
+
+        Samples fall into log-linear buckets with SUB_BUCKETS buckets per
+        power of two, so recording is O(1), memory grows with the logarithm
+        of the largest sample and percentiles are within 1/SUB_BUCKETS of
+        the true value.
+        """
+        index = self._bucket(value)
+        if index >= len(self.counts):
+            self.counts.extend([0] * (index + 1 - len(self.counts)))
+
+        self.counts[index] += 1
+        if not self.count or value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+        self.count += 1
+        self.total += value
+
+    def percentile(self, percent: float | int) -> int:
+        """
+        Estimate the value below which the given percentage of samples fall.
+
+        Returns the upper bound of the bucket holding that sample, capped at
+        the largest recorded sample, or 0 if nothing has been recorded.
+        """
+        if not self.count:
+            return 0
+
+        rank = max(1, -(-self.count * percent // 100))
+        seen = 0
+        for index, bucket_count in enumerate(self.counts):
+            seen += bucket_count
+            if seen >= rank:
+                return min(self._upper_bound(index), self.max)
+
+        return self.max
+
+    def mean(self) -> float:
+        """
+        Return the mean of all recorded samples, or 0.0 if there are none.
+        """
+        return self.total / self.count if self.count else 0.0
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        """
+        Add every sample recorded by another histogram to this one.
+        """
+        if len(other.counts) > len(self.counts):
+            self.counts.extend([0] * (len(other.counts) - len(self.counts)))
+
+        for index, bucket_count in enumerate(other.counts):
+            self.counts[index] += bucket_count
+
+        if other.count and (not self.count or other.min < self.min):
+            self.min = other.min
+        self.max = max(self.max, other.max)
+        self.count += other.count
+        self.total += other.total
+
+    def to_dict(self) -> dict[str, float | int]:
+        """
+        Summarize the histogram as plain numbers.
+
+        Returns a dict with count, total, min, max, mean, p50, p95 and p99.
+        """
+        return {
+            "count": self.count,
+            "total": self.total,
+            "min": self.min,
+            "max": self.max,
+            "mean": self.mean(),
+            "p50": self.percentile(50),
+            "p95": self.percentile(95),
+            "p99": self.percentile(99),
+        }
+
+    @staticmethod
+    def _bucket(value: int) -> int:
+        if value < 2 * SUB_BUCKETS:
+            return value
+
+        shift = value.bit_length() - SUB_BUCKET_BITS - 1
+        return shift * SUB_BUCKETS + (value >> shift)
+
+    @staticmethod
+    def _upper_bound(index: int) -> int:
+        if index < 2 * SUB_BUCKETS:
+            return index
+
+        shift = index // SUB_BUCKETS - 1
+        return ((index - shift * SUB_BUCKETS + 1) << shift) - 1
@@ -0,0 +1,185 @@
+import sys
+from collections.abc import Iterable, Mapping
+from types import FunctionType, ModuleType
+from typing import cast
+
+from pyecs.containers.Archetype import Archetype
+from pyecs.containers.ComponentStorage import ComponentStorage
+
+MEMORY_SAMPLE_SIZE: int = 256
+POINTER_SIZE: int = sys.getsizeof([None]) - sys.getsizeof([])
+
+_OPAQUE = (type, ModuleType, FunctionType, str, bytes, int, float, bool, type(None))
+
+
+def deep_sizeof(obj: object, seen: set[int] | None = None) -> int:
+    """
+    Estimate the bytes held by an object and everything it references.
+
+    Follows containers, instance dicts and slots. Objects reached twice are
+    counted once, and types, modules and functions are not counted.
+
+    Returns the estimated size in bytes.
+    """
+    if seen is None:
+        seen = set()
+
+    if id(obj) in seen or isinstance(obj, (type, ModuleType, FunctionType)):
+        return 0
+
+    seen.add(id(obj))
+    size = sys.getsizeof(obj)
+
+    if isinstance(obj, _OPAQUE):
+        return size
+
+    if hasattr(obj, "__dict__"):
+        size += deep_sizeof(vars(obj), seen)
+
+    slots = cast(str | Iterable[str], getattr(type(obj), "__slots__", ()))
+    for slot in [slots] if isinstance(slots, str) else slots:
+        if hasattr(obj, slot):
+            size += deep_sizeof(cast(object, getattr(obj, slot)), seen)
+
+    if isinstance(obj, Mapping):
+        for key, value in cast(Mapping[object, object], obj).items():
+            size += deep_sizeof(key, seen) + deep_sizeof(value, seen)
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        for item in cast(Iterable[object], obj):
+            size += deep_sizeof(item, seen)
+
+    return size
+
+
+def sampled_sizeof(
+    items: list[object], sample_size: int = MEMORY_SAMPLE_SIZE, seen: set[int] | None = None
+) -> tuple[int, bool]:
+    """
+    Estimate the deep size of every item in a list.
+
+    Items are measured with one shared seen set, so objects referenced by
+    several items, such as a prefab's frozen prototype, are counted once.
+    Lists longer than sample_size are measured on sample_size evenly spaced
+    items. Only the bytes each sampled item adds after the first are scaled
+    up to the rest of the list, so shared objects are not multiplied by
+    the row count. Pass seen to also skip objects already counted elsewhere.
+
+    Returns the estimated bytes and whether the estimate was sampled.
+    """
+    if seen is None:
+        seen = set()
+
+    if len(items) <= sample_size:
+        return sum(deep_sizeof(item, seen) for item in items), False
+
+    step = len(items) / sample_size
+    sizes = [deep_sizeof(items[int(i * step)], seen) for i in range(sample_size)]
+    measured = sum(sizes)
+    added = sizes[0] if sample_size == 1 else (measured - sizes[0]) / (sample_size - 1)
+    return round(measured + added * (len(items) - sample_size)), True
+
+
+def list_capacity(items: list[object]) -> int:
+    """
+    Return how many slots a list has allocated, including unused ones.
+    """
+    return (sys.getsizeof(items) - sys.getsizeof([])) // POINTER_SIZE
+
+
+def column_report(
+    archetype: Archetype, sample_size: int = MEMORY_SAMPLE_SIZE
+) -> dict[str, dict[str, int]]:
+    """
+    Measure every component column of an archetype across its chunks.
+
+    Each column reports its rows, allocated list slots, list bytes, the
+    estimated deep size of its component objects, and whether that
+    estimate was extrapolated from a sample.
+
+    Returns a dict mapping component type names to their measurements.
+    """
+    columns: dict[str, dict[str, int]] = {}
+    for component_type in archetype.component_types:
+        measured = {"rows": 0, "capacity": 0, "list_bytes": 0, "object_bytes": 0, "sampled": False}
+
+        seen: set[int] = set()
+        for chunk in archetype.chunks:
+            column = chunk.columns[component_type]
+            object_bytes, sampled = sampled_sizeof(column, sample_size, seen)
+            measured["rows"] += len(column)
+            measured["capacity"] += list_capacity(column)
+            measured["list_bytes"] += sys.getsizeof(column)
+            measured["object_bytes"] += object_bytes
+            measured["sampled"] = measured["sampled"] or sampled
+
+        columns[component_type.__name__] = measured
+
+    return columns
+
+
+def archetype_report(
+    archetype: Archetype, sample_size: int = MEMORY_SAMPLE_SIZE
+) -> dict[str, object]:
+    """
+    Report the memory held by one archetype.
+
+    Columns are measured by column_report. Overhead covers the entity ID
+    strings, the per-chunk entity lists and enabled masks, and the entity
+    index dict.
+
+    Returns a JSON-compatible dict describing the archetype.
+    """
+    columns = column_report(archetype, sample_size)
+    overhead = {
+        "entity_ids": sum(sys.getsizeof(entity) for entity in archetype.iter_entities()),
+        "entity_lists": sum(sys.getsizeof(chunk.entities) for chunk in archetype.chunks),
+        "enabled_masks": sum(sys.getsizeof(chunk.enabled) for chunk in archetype.chunks),
+        "entity_index": sys.getsizeof(archetype.entity_indices),
+    }
+    column_bytes = sum(column["list_bytes"] + column["object_bytes"] for column in columns.values())
+
+    return {
+        "components": sorted(columns),
+        "rows": archetype.row_count(),
+        "chunks": len(archetype.chunks),
+        "columns": columns,
+        "overhead": overhead,
+        "total_bytes": column_bytes + sum(overhead.values()),
+    }
+
+
+def memory_report(
+    storage: ComponentStorage, sample_size: int = MEMORY_SAMPLE_SIZE
+) -> dict[str, object]:
+    """
+    Report the memory held by every archetype in a component storage.
+
+    Per-archetype reports come from archetype_report. Component totals sum
+    each component type's rows, list bytes and object bytes over all
+    archetypes, and the entity-to-archetype dict is reported as storage
+    overhead.
+
+    Returns a JSON-compatible dict with archetypes, components, overhead
+    and total_bytes.
+    """
+    archetypes: list[dict[str, object]] = []
+    components: dict[str, dict[str, int]] = {}
+    mapping_bytes = sys.getsizeof(storage.entity_to_archetype)
+    total = mapping_bytes
+
+    for archetype in storage.archetypes.values():
+        report = archetype_report(archetype, sample_size)
+        archetypes.append(report)
+        total += cast(int, report["total_bytes"])
+
+        for name, column in cast(dict[str, dict[str, int]], report["columns"]).items():
+            totals = components.setdefault(name, {"rows": 0, "list_bytes": 0, "object_bytes": 0})
+            for field in totals:
+                totals[field] += column[field]
+
+    return {
+        "archetypes": archetypes,
+        "components": components,
+        "overhead": {"entity_to_archetype": mapping_bytes},
+        "total_bytes": total,
+    }
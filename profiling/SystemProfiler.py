@@ -0,0 +1,105 @@
+import json
+from collections import deque
+
+from pyecs.common.Types import UUID4
+from pyecs.profiling.Histogram import LatencyHistogram
+
+FRAME_HISTORY: int = 120
+
+
+class SystemStats(object):
+    def __init__(self, system_id: UUID4, name: str):
+        self.system_id: UUID4 = system_id
+        self.name: str = name
+        self.calls: int = 0
+        self.entities: int = 0
+        self.last_ns: int = 0
+        self.histogram: LatencyHistogram = LatencyHistogram()
+
+    def to_dict(self) -> dict[str, object]:
+        """
+        Summarize this system's timings as plain values.
+
+        Returns a dict with the system's id, name, call count, entities
+        processed, the last call's wall time and its wall time histogram
+        summary in nanoseconds.
+        """
+        return {
+            "id": self.system_id,
+            "name": self.name,
+            "calls": self.calls,
+            "entities": self.entities,
+            "last_ns": self.last_ns,
+            "wall_ns": self.histogram.to_dict(),
+        }
+
+
+class SystemProfiler(object):
+    def __init__(self, enabled: bool = False, frame_history: int = FRAME_HISTORY):
+        self.enabled: bool = enabled
+        self.frames: int = 0
+        self.systems: dict[UUID4, SystemStats] = {}
+        self.frame_histogram: LatencyHistogram = LatencyHistogram()
+        self.history: deque[dict[str, int]] = deque(maxlen=frame_history)
+        self._current: dict[str, int] = {}
+
+    def record_system(self, system_id: UUID4, name: str, elapsed_ns: int, entities: int) -> None:
+        """
+        Record one call of a system during the current frame.
+        """
+        stats = self.systems.get(system_id)
+        if stats is None:
+            stats = self.systems[system_id] = SystemStats(system_id, name)
+
+        stats.calls += 1
+        stats.entities += entities
+        stats.last_ns = elapsed_ns
+        stats.histogram.record(elapsed_ns)
+        self._current[name] = self._current.get(name, 0) + elapsed_ns
+
+    def record_frame(self, elapsed_ns: int) -> None:
+        """
+        Close the current frame and store its per-system breakdown.
+
+        The last frame_history breakdowns are kept; each maps system names
+        to their wall time in nanoseconds, plus the frame's total under
+        'frame'.
+        """
+        self._current["frame"] = elapsed_ns
+        self.history.append(self._current)
+        self._current = {}
+        self.frames += 1
+        self.frame_histogram.record(elapsed_ns)
+
+    def reset(self) -> None:
+        """
+        Discard every recorded sample without changing whether profiling is enabled.
+        """
+        self.frames = 0
+        self.systems.clear()
+        self.frame_histogram = LatencyHistogram()
+        self.history.clear()
+        self._current = {}
+
+    def snapshot(self) -> dict[str, object]:
+        """
+        Return the recorded statistics as a JSON-compatible dict.
+
+        The dict holds whether profiling is enabled, the number of profiled
+        frames, the frame wall time histogram summary, the last frame's
+        per-system breakdown and one entry per profiled system in execution
+        order. All times are in nanoseconds.
+        """
+        return {
+            "enabled": self.enabled,
+            "frames": self.frames,
+            "frame_ns": self.frame_histogram.to_dict(),
+            "last_frame": dict(self.history[-1]) if self.history else {},
+            "systems": [stats.to_dict() for stats in self.systems.values()],
+        }
+
+    def to_json(self, indent: int | None = None) -> str:
+        """
+        Serialize the current snapshot to a JSON string.
+        """
+        return json.dumps(self.snapshot(), indent=indent)
@@ -0,0 +1,346 @@
+import dataclasses
+import io
+import marshal
+import struct
+from collections.abc import Iterable, Iterator
+from enum import IntEnum
+from types import SimpleNamespace
+from typing import cast
+
+from pyecs.common.Relationship import Relationship
+from pyecs.common.Types import Component, Entity
+from pyecs.containers.ComponentStorage import ComponentStorage
+
+TRACE_MAGIC: bytes = b"PYECSTR"
+TRACE_VERSION: int = 2
+MARSHAL_VERSION: int = 4
+TYPE_RELATIONSHIP: int = 1
+TYPE_CASCADE: int = 2
+
+type TraceRecord = tuple["TraceOp", tuple[object, ...]]
+type TraceStream = io.BufferedIOBase | io.RawIOBase
+
+
+class TraceOp(IntEnum):
+    TYPE = 1
+    CREATE = 2
+    DESTROY = 3
+    ADD = 4
+    REMOVE = 5
+    GET = 6
+    ENABLE = 7
+    QUERY = 8
+    UPDATE = 9
+    SNAPSHOT = 10
+    FIELDS = 11
+
+
+def component_fields(component: Component) -> tuple[str, ...]:
+    """
+    List the field names recorded for a component.
+
+    Dataclass fields are used when the component is a dataclass, otherwise
+    its instance attributes or slots.
+
+    Returns the field names in declaration order.
+    """
+    if dataclasses.is_dataclass(component):
+        return tuple(field.name for field in dataclasses.fields(component))
+    if hasattr(component, "__dict__"):
+        return tuple(vars(component))
+    return tuple(getattr(component, "__slots__", ()))
+
+
+def encode_values(values: list[object]) -> bytes:
+    """
+    Encode component field values as one marshalled tuple.
+
+    Values marshal cannot encode, such as instances of user classes, are
+    stored as None.
+
+    Returns the encoded bytes.
+    """
+    try:
+        return marshal.dumps(tuple(values), MARSHAL_VERSION)  # pyright: ignore[reportArgumentType]
+    except ValueError:
+        encodable: list[object] = []
+        for value in values:
+            try:
+                _ = marshal.dumps(value, MARSHAL_VERSION)  # pyright: ignore[reportArgumentType]
+                encodable.append(value)
+            except ValueError:
+                encodable.append(None)
+        return marshal.dumps(tuple(encodable), MARSHAL_VERSION)  # pyright: ignore[reportArgumentType]
+
+
+class TraceRecorder(object):
+    def __init__(self, stream: TraceStream):
+        self.stream: TraceStream = stream
+        self.entity_ids: dict[Entity, int] = {}
+        self.type_ids: dict[type, int] = {}
+        self.type_fields: dict[type, tuple[str, ...]] = {}
+        self.operations: int = 0
+        _ = stream.write(TRACE_MAGIC + struct.pack("<B", TRACE_VERSION))
+
+    def _entity(self, entity: Entity) -> int:
+        entity_id = self.entity_ids.get(entity)
+        if entity_id is None:
+            entity_id = self.entity_ids[entity] = len(self.entity_ids)
+        return entity_id
+
+    def _type(self, component_type: type) -> int:
+        type_id = self.type_ids.get(component_type)
+        if type_id is None:
+            type_id = self.type_ids[component_type] = len(self.type_ids)
+            name = f"{component_type.__module__}.{component_type.__qualname__}".encode()
+            flags = 0
+            if issubclass(component_type, Relationship):
+                flags = TYPE_RELATIONSHIP | (TYPE_CASCADE if component_type.cascade else 0)
+            _ = self.stream.write(
+                struct.pack("<BHBH", TraceOp.TYPE, type_id, flags, len(name)) + name
+            )
+        return type_id
+
+    def _fields(self, component: Component) -> tuple[str, ...]:
+        component_type = component.__class__
+        fields = self.type_fields.get(component_type)
+        if fields is None:
+            fields = self.type_fields[component_type] = component_fields(component)
+            parts = [struct.pack("<BHB", TraceOp.FIELDS, self._type(component_type), len(fields))]
+            for field in fields:
+                encoded = field.encode()
+                parts.append(struct.pack("<B", len(encoded)) + encoded)
+            _ = self.stream.write(b"".join(parts))
+        return fields
+
+    def _write(self, data: bytes) -> None:
+        _ = self.stream.write(data)
+        self.operations += 1
+
+    def record_create(self, entity: Entity) -> None:
+        """
+        Record the creation of an entity.
+        """
+        self._write(struct.pack("<BI", TraceOp.CREATE, self._entity(entity)))
+
+    def record_destroy(self, entity: Entity) -> None:
+        """
+        Record the destruction of an entity.
+        """
+        self._write(struct.pack("<BI", TraceOp.DESTROY, self._entity(entity)))
+
+    def record_add(self, entity: Entity, component: Component) -> None:
+        """
+        Record a component being added to or replaced on an entity.
+
+        The component is stored as its type and its field values, and the
+        type's field names are written the first time it is added. A
+        Relationship's target is stored as the trace's ID of that entity.
+        """
+        type_id = self._type(component.__class__)
+        values: list[object] = [
+            cast(object, getattr(component, field, None)) for field in self._fields(component)
+        ]
+        if isinstance(component, Relationship):
+            values[self._fields(component).index("target")] = self._entity(component.target)
+        payload = encode_values(values)
+        self._write(
+            struct.pack("<BIHI", TraceOp.ADD, self._entity(entity), type_id, len(payload)) + payload
+        )
+
+    def record_remove(self, entity: Entity, component_type: type[Component]) -> None:
+        """
+        Record a component type being removed from an entity.
+        """
+        self._write(
+            struct.pack("<BIH", TraceOp.REMOVE, self._entity(entity), self._type(component_type))
+        )
+
+    def record_get(self, entity: Entity, component_types: Iterable[type[Component]]) -> None:
+        """
+        Record a lookup of one or more component types on an entity.
+        """
+        type_ids = [self._type(component_type) for component_type in component_types]
+        self._write(
+            struct.pack(
+                f"<BIB{len(type_ids)}H", TraceOp.GET, self._entity(entity), len(type_ids), *type_ids
+            )
+        )
+
+    def record_enabled(self, entity: Entity, enabled: bool) -> None:
+        """
+        Record an entity being enabled or disabled.
+        """
+        self._write(struct.pack("<BIB", TraceOp.ENABLE, self._entity(entity), enabled))
+
+    def record_query(
+        self, with_types: Iterable[type[Component]], without_types: Iterable[type[Component]]
+    ) -> None:
+        """
+        Record the execution of a query by its included and excluded types.
+        """
+        included = [self._type(component_type) for component_type in with_types]
+        excluded = [self._type(component_type) for component_type in without_types]
+        self._write(
+            struct.pack(
+                f"<BBB{len(included) + len(excluded)}H",
+                TraceOp.QUERY,
+                len(included),
+                len(excluded),
+                *included,
+                *excluded,
+            )
+        )
+
+    def record_update(self, dt: float | int) -> None:
+        """
+        Record the end of a world update, which closes a frame.
+        """
+        self._write(struct.pack("<Bd", TraceOp.UPDATE, dt))
+
+    def snapshot(self, storage: ComponentStorage) -> None:
+        """
+        Record the current contents of a storage as a setup prologue.
+
+        Every stored entity is recorded as created before any component is
+        added, so relationships can target entities stored after their
+        source. Components are then added and disabled entities recorded as
+        disabled. A SNAPSHOT record marks the end of the prologue, so
+        replays can build the starting state without timing it.
+        """
+        for entity in storage.entity_to_archetype:
+            self.record_create(entity)
+
+        for entity, mask in storage.entity_to_archetype.items():
+            archetype = storage.archetypes[mask]
+            for component_type in mask:
+                self.record_add(entity, archetype.get_component(entity, component_type))
+            if entity in archetype.entity_indices and not archetype.is_enabled(entity):
+                self.record_enabled(entity, False)
+
+        _ = self.stream.write(struct.pack("<B", TraceOp.SNAPSHOT))
+
+    def flush(self) -> None:
+        """
+        Flush the underlying stream.
+        """
+        self.stream.flush()
+
+
+def _read(stream: TraceStream, size: int) -> bytes:
+    data = stream.read(size)
+    if len(data) != size:
+        raise ValueError("Trace ended in the middle of a record")
+    return data
+
+
+def _unpack(stream: TraceStream, layout: str) -> tuple[object, ...]:
+    return struct.unpack(layout, _read(stream, struct.calcsize(layout)))
+
+
+def stand_in_type(name: str, flags: int = 0) -> type:
+    """
+    Build a class standing in for a recorded component type.
+
+    The stand-in has the recorded type's short name and takes its fields
+    as keyword arguments, so a trace replays without importing the code
+    that recorded it. Relationship types are stood in for by Relationship
+    subclasses with the recorded cascade flag, so replayed worlds index
+    them as relationships.
+
+    Returns the new SimpleNamespace or Relationship subclass.
+    """
+    short_name = name.rsplit(".", 1)[-1]
+    if flags & TYPE_RELATIONSHIP:
+        return type(
+            short_name, (Relationship,), {"__slots__": (), "cascade": bool(flags & TYPE_CASCADE)}
+        )
+
+    return type(short_name, (SimpleNamespace,), {})
+
+
+def decode_component(
+    component_type: type, fields: tuple[str, ...], values: tuple[object, ...]
+) -> Component:
+    """
+    Build a stand-in component from its recorded field values.
+
+    A relationship stand-in is created without running its initializer,
+    since its target is the trace's integer ID of the entity rather than
+    an entity of a world.
+
+    Returns the stand-in component.
+    """
+    recorded = dict(zip(fields, values, strict=True))
+    if not issubclass(component_type, Relationship):
+        return cast(Component, component_type(**recorded))
+
+    component = object.__new__(component_type)
+    object.__setattr__(component, "target", recorded["target"])
+    return component
+
+
+def read_trace(stream: TraceStream) -> Iterator[TraceRecord]:
+    """
+    Decode a binary trace written by TraceRecorder.
+
+    TYPE and FIELDS records are consumed by the reader: every recorded
+    component type is replaced by a stand-in class, and ADD records carry
+    stand-in component instances. Entities, including relationship
+    targets, are the trace's integer entity IDs.
+
+    Returns an iterator of (TraceOp, arguments) records. Raises ValueError
+    if the stream is not a trace of a supported version.
+    """
+    header = stream.read(len(TRACE_MAGIC) + 1)
+    if header[: len(TRACE_MAGIC)] != TRACE_MAGIC or header[len(TRACE_MAGIC) :] != bytes(
+        [TRACE_VERSION]
+    ):
+        raise ValueError("Not a pyecs trace, or an unsupported trace version")
+
+    types: list[type] = []
+    fields: dict[int, tuple[str, ...]] = {}
+
+    while opcode := stream.read(1):
+        op = TraceOp(opcode[0])
+
+        if op is TraceOp.TYPE:
+            _, flags, name_length = cast(tuple[int, int, int], _unpack(stream, "<HBH"))
+            types.append(stand_in_type(_read(stream, name_length).decode(), flags))
+        elif op is TraceOp.FIELDS:
+            type_id, field_count = cast(tuple[int, int], _unpack(stream, "<HB"))
+            names: list[str] = []
+            for _ in range(field_count):
+                (length,) = cast(tuple[int], _unpack(stream, "<B"))
+                names.append(_read(stream, length).decode())
+            fields[type_id] = tuple(names)
+        elif op in (TraceOp.CREATE, TraceOp.DESTROY):
+            yield op, _unpack(stream, "<I")
+        elif op is TraceOp.ADD:
+            entity, type_id, length = cast(tuple[int, int, int], _unpack(stream, "<IHI"))
+            values = cast(tuple[object, ...], marshal.loads(_read(stream, length)))
+            yield op, (entity, decode_component(types[type_id], fields[type_id], values))
+        elif op is TraceOp.REMOVE:
+            entity, type_id = cast(tuple[int, int], _unpack(stream, "<IH"))
+            yield op, (entity, types[type_id])
+        elif op is TraceOp.GET:
+            entity, count = cast(tuple[int, int], _unpack(stream, "<IB"))
+            type_ids = cast(tuple[int, ...], _unpack(stream, f"<{count}H"))
+            yield op, (entity, tuple(types[type_id] for type_id in type_ids))
+        elif op is TraceOp.ENABLE:
+            entity, enabled = cast(tuple[int, int], _unpack(stream, "<IB"))
+            yield op, (entity, bool(enabled))
+        elif op is TraceOp.QUERY:
+            included, excluded = cast(tuple[int, int], _unpack(stream, "<BB"))
+            type_ids = cast(tuple[int, ...], _unpack(stream, f"<{included + excluded}H"))
+            yield (
+                op,
+                (
+                    tuple(types[type_id] for type_id in type_ids[:included]),
+                    tuple(types[type_id] for type_id in type_ids[included:]),
+                ),
+            )
+        elif op is TraceOp.UPDATE:
+            yield op, _unpack(stream, "<d")
+        else:
+            yield op, ()
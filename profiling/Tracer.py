@@ -0,0 +1,317 @@
+import inspect
+import json
+import os
+import sys
+import threading
+import time
+from collections import deque
+from collections.abc import Mapping
+from types import CodeType
+from typing import Literal, NamedTuple, cast
+
+from beartype import BeartypeConf, BeartypeStrategy, beartype
+from pyecs.containers.Archetype import Archetype
+from pyecs.containers.ComponentStorage import ComponentStorage
+from pyecs.core.World import ECSWorld
+from pyecs.managers.SystemManager import SystemManager
+from pyecs.profiling.SystemProfiler import FRAME_HISTORY
+from pyecs.querying.Query import Query
+
+type TraceFormat = Literal["chrome", "collapsed"]
+
+MONITORING = sys.monitoring
+SPAN_EVENTS: int = (
+    MONITORING.events.PY_START
+    | MONITORING.events.PY_RESUME
+    | MONITORING.events.PY_RETURN
+    | MONITORING.events.PY_YIELD
+)
+unchecked = beartype(conf=BeartypeConf(strategy=BeartypeStrategy.O0))
+
+
+class Span(NamedTuple):
+    name: str
+    thread: int
+    start_ns: int
+    duration_ns: int
+    self_ns: int
+    depth: int
+    stack: tuple[str, ...]
+
+
+class OpenSpan(object):
+    def __init__(self, code: CodeType, start_ns: int, path: tuple[str, ...]):
+        self.code: CodeType = code
+        self.start_ns: int = start_ns
+        self.children_ns: int = 0
+        self.path: tuple[str, ...] = path
+
+
+def traced_classes() -> tuple[type, ...]:
+    """
+    Return the pyecs classes whose methods the tracer instruments.
+    """
+    return (ECSWorld, SystemManager, ComponentStorage, Archetype, Query)
+
+
+def code_objects(target: object) -> list[CodeType]:
+    """
+    Collect the code objects of a function, method, property or class.
+
+    Decorator wrappers such as beartype's are unwrapped so the original
+    function body is instrumented. Classes contribute every function,
+    static method, class method and property accessor they define.
+
+    Returns the code objects found, possibly none.
+    """
+    if isinstance(target, type):
+        members = cast(Mapping[str, object], vars(target))
+        return [code for member in members.values() for code in code_objects(member)]
+    if isinstance(target, property):
+        return [code for accessor in (target.fget, target.fset) for code in code_objects(accessor)]
+    if isinstance(target, (staticmethod, classmethod)):
+        return code_objects(target.__func__)  # pyright: ignore[reportUnknownMemberType, reportUnknownArgumentType]
+    if inspect.ismethod(target):
+        return code_objects(cast(object, target.__func__))
+    if inspect.isfunction(target):
+        unwrapped = cast(object, inspect.unwrap(target))
+        code = cast(object, getattr(unwrapped, "__code__", None))
+        return [code] if isinstance(code, CodeType) else []
+    return []
+
+
+class MonitoringTracer(object):
+    def __init__(self, frame_history: int = FRAME_HISTORY):
+        self.tool_id: int | None = None
+        self.codes: dict[CodeType, str] = {}
+        self.frame_codes: set[CodeType] = set()
+        self.frames: deque[list[Span]] = deque(maxlen=frame_history)
+        self._current: list[Span] = []
+        self._stacks: dict[int, list[OpenSpan]] = {}
+        self._lock: threading.Lock = threading.Lock()
+
+    @property
+    def attached(self) -> bool:
+        return self.tool_id is not None
+
+    def instrument(self, *targets: object) -> None:
+        """
+        Add functions, methods or classes to the set of instrumented code.
+
+        Targets added while the tracer is attached start emitting spans
+        immediately.
+        """
+        for target in targets:
+            for code in code_objects(target):
+                if code not in self.codes:
+                    self.codes[code] = code.co_qualname
+                    if self.tool_id is not None:
+                        MONITORING.set_local_events(self.tool_id, code, SPAN_EVENTS)
+
+    def attach(self, world: ECSWorld | None = None) -> None:
+        """
+        Start emitting spans for pyecs hot paths using sys.monitoring.
+
+        The methods of ECSWorld, SystemManager, ComponentStorage, Archetype
+        and Query are instrumented, plus the update method of every system
+        registered with world when one is given. Only those code objects
+        receive events, so the rest of the program runs unmonitored. A
+        returning span of ECSWorld.update, ECSWorld.step or
+        ECSWorld.update_async closes a frame; an await suspending
+        update_async does not.
+
+        Raises RuntimeError if every sys.monitoring tool ID is in use.
+        """
+        self.instrument(*traced_classes())
+        if world is not None:
+            self.instrument(
+                *(cast(object, system.update) for system in world.system_manager.systems)
+            )
+        for entry in (ECSWorld.update, ECSWorld.step, ECSWorld.update_async):
+            self.frame_codes.update(code_objects(entry))
+
+        if self.tool_id is not None:
+            return
+
+        self.tool_id = self._acquire_tool_id()
+        events = MONITORING.events
+        _ = MONITORING.register_callback(self.tool_id, events.PY_START, self._on_start)
+        _ = MONITORING.register_callback(self.tool_id, events.PY_RESUME, self._on_start)
+        _ = MONITORING.register_callback(self.tool_id, events.PY_RETURN, self._on_return)
+        _ = MONITORING.register_callback(self.tool_id, events.PY_YIELD, self._on_yield)
+        _ = MONITORING.register_callback(self.tool_id, events.PY_UNWIND, self._on_unwind)
+        MONITORING.set_events(self.tool_id, events.PY_UNWIND)
+
+        for code in self.codes:
+            MONITORING.set_local_events(self.tool_id, code, SPAN_EVENTS)
+
+    def detach(self) -> None:
+        """
+        Stop emitting spans and release the sys.monitoring tool ID.
+
+        Instrumented code objects have their events removed, so a detached
+        tracer costs nothing. Recorded frames are kept.
+        """
+        if self.tool_id is None:
+            return
+
+        for code in self.codes:
+            MONITORING.set_local_events(self.tool_id, code, 0)
+        MONITORING.set_events(self.tool_id, 0)
+        for event in (
+            MONITORING.events.PY_START,
+            MONITORING.events.PY_RESUME,
+            MONITORING.events.PY_RETURN,
+            MONITORING.events.PY_YIELD,
+            MONITORING.events.PY_UNWIND,
+        ):
+            _ = MONITORING.register_callback(self.tool_id, event, None)
+        MONITORING.free_tool_id(self.tool_id)
+
+        self.tool_id = None
+        self._stacks.clear()
+
+    def _acquire_tool_id(self) -> int:
+        for tool_id in (MONITORING.PROFILER_ID, *range(6)):
+            if MONITORING.get_tool(tool_id) is None:
+                MONITORING.use_tool_id(tool_id, "pyecs")
+                return tool_id
+
+        raise RuntimeError("No free sys.monitoring tool ID")
+
+    @unchecked
+    def _on_start(self, code: CodeType, offset: int) -> None:  # pyright: ignore[reportUnusedParameter]
+        stack = self._stacks.setdefault(threading.get_ident(), [])
+        path = stack[-1].path if stack else ()
+        stack.append(OpenSpan(code, time.perf_counter_ns(), (*path, self.codes[code])))
+
+    @unchecked
+    def _on_return(self, code: CodeType, offset: int, value: object) -> None:  # pyright: ignore[reportUnusedParameter]
+        self._close(code, True)
+
+    @unchecked
+    def _on_yield(self, code: CodeType, offset: int, value: object) -> None:  # pyright: ignore[reportUnusedParameter]
+        self._close(code, False)
+
+    @unchecked
+    def _on_unwind(self, code: CodeType, offset: int, exception: BaseException) -> None:  # pyright: ignore[reportUnusedParameter]
+        if code in self.codes:
+            self._close(code, True)
+
+    @unchecked
+    def _close(self, code: CodeType, finished: bool) -> None:
+        end = time.perf_counter_ns()
+        thread = threading.get_ident()
+        stack = self._stacks.get(thread)
+        if not stack or stack[-1].code is not code:
+            return
+
+        closed = stack.pop()
+        path = closed.path
+        duration = end - closed.start_ns
+        if stack:
+            stack[-1].children_ns += duration
+
+        span = Span(
+            path[-1],
+            thread,
+            closed.start_ns,
+            duration,
+            duration - closed.children_ns,
+            len(stack),
+            path[:-1],
+        )
+
+        with self._lock:
+            self._current.append(span)
+            if finished and not stack and code in self.frame_codes:
+                self.frames.append(self._current)
+                self._current = []
+
+    def reset(self) -> None:
+        """
+        Discard all recorded frames and spans.
+        """
+        with self._lock:
+            self.frames.clear()
+            self._current = []
+
+    def spans(self) -> list[Span]:
+        """
+        Return the spans of every kept frame followed by the open frame's spans.
+        """
+        with self._lock:
+            return [span for frame in self.frames for span in frame] + list(self._current)
+
+    def to_chrome_trace(self) -> dict[str, object]:
+        """
+        Export the recorded spans in Chrome trace-event format.
+
+        Every span becomes a complete ('X') event with microsecond
+        timestamps, and every frame an instant ('i') event at its end, so
+        the result loads in chrome://tracing and Perfetto.
+
+        Returns a JSON-compatible dict.
+        """
+        pid = os.getpid()
+        events: list[dict[str, object]] = []
+
+        with self._lock:
+            frames = [*self.frames, self._current]
+
+        for index, frame in enumerate(frames):
+            for span in frame:
+                events.append(
+                    {
+                        "name": span.name,
+                        "cat": "pyecs",
+                        "ph": "X",
+                        "ts": span.start_ns / 1000,
+                        "dur": span.duration_ns / 1000,
+                        "pid": pid,
+                        "tid": span.thread,
+                        "args": {"frame": index},
+                    }
+                )
+            if frame and index < len(frames) - 1:
+                last = frame[-1]
+                events.append(
+                    {
+                        "name": "frame",
+                        "cat": "pyecs",
+                        "ph": "i",
+                        "s": "p",
+                        "ts": (last.start_ns + last.duration_ns) / 1000,
+                        "pid": pid,
+                        "tid": last.thread,
+                    }
+                )
+
+        return {"traceEvents": events, "displayTimeUnit": "ns"}
+
+    def to_collapsed(self) -> str:
+        """
+        Export the recorded spans as collapsed stacks.
+
+        Each line is a semicolon-separated stack followed by the total self
+        time in nanoseconds spent in its innermost function, the input
+        format of flamegraph.pl and speedscope.
+
+        Returns the collapsed stack text.
+        """
+        self_ns: dict[tuple[str, ...], int] = {}
+        for span in self.spans():
+            stack = (*span.stack, span.name)
+            self_ns[stack] = self_ns.get(stack, 0) + span.self_ns
+
+        return "\n".join(f"{';'.join(stack)} {value}" for stack, value in self_ns.items())
+
+    def save(self, path: str, format: TraceFormat = "chrome") -> None:
+        """
+        Write the recorded spans to a file in Chrome trace or collapsed format.
+        """
+        with open(path, "w") as file:
+            if format == "chrome":
+                json.dump(self.to_chrome_trace(), file)
+            else:
+                _ = file.write(self.to_collapsed())
@@ -0,0 +1,26 @@
+from .Histogram import LatencyHistogram
+from .Memory import (
+    MEMORY_SAMPLE_SIZE,
+    archetype_report,
+    column_report,
+    deep_sizeof,
+    memory_report,
+    sampled_sizeof,
+)
+from .SystemProfiler import SystemProfiler, SystemStats
+from .Trace import TraceOp, TraceRecorder, read_trace
+
+__all__ = [
+    "MEMORY_SAMPLE_SIZE",
+    "LatencyHistogram",
+    "SystemProfiler",
+    "SystemStats",
+    "TraceOp",
+    "TraceRecorder",
+    "archetype_report",
+    "column_report",
+    "deep_sizeof",
+    "memory_report",
+    "read_trace",
+    "sampled_sizeof",
+]
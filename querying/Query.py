@@ -1,17 +1,21 @@
 from __future__ import annotations
 
+from itertools import compress
 from typing import overload
 
+from pyecs.common.Relationship import Relationship
 from pyecs.common.Types import Component, Entity
 from pyecs.containers.ComponentStorage import ComponentStorage
 from pyecs.core.World import ECSWorld
 from pyecs.helpers.Deprecation import warn_deprecated
+from pyecs.querying.QueryCursor import QueryCursor
 
 
 class Query(object):
     def __init__(self):
         self._with: set[type[Component]] = set()
         self._without: set[type[Component]] = set()
+        self._relations: dict[type[Relationship], Entity] = {}
 
     def with_components(self, *types: type[Component]) -> Query:
         self._with.update(types)
@@ -21,6 +25,27 @@ class Query(object):
         self._without.update(types)
         return self
 
+    def with_relation(self, relation_type: type[Relationship], target: Entity) -> Query:
+        """Match only entities holding a relationship of a type to target.
+
+        Queries with a relationship filter start from the relationship
+        index instead of scanning archetypes, so they cost time proportional
+        to the number of related entities rather than the size of the world.
+        """
+        self._with.add(relation_type)
+        self._relations[relation_type] = target
+        return self
+
+    def cursor(self) -> QueryCursor:
+        """Create a cursor that sweeps this query's rows a slice at a time.
+
+        Raises ValueError if the query filters by relationship target, which
+        cursors do not support.
+        """
+        if self._relations:
+            raise ValueError("cursors cannot filter by relationship target")
+        return QueryCursor(self._with, self._without)
+
     @overload
     def execute(self, storage_or_world: ComponentStorage) -> list[Entity]: ...
 
@@ -28,7 +53,12 @@ class Query(object):
     def execute(self, storage_or_world: ECSWorld) -> list[Entity]: ...
 
     def execute(self, storage_or_world: ComponentStorage | ECSWorld) -> list[Entity]:
-        """Execute the query on either a ComponentStorage or ECSWorld instance."""
+        """Execute the query on either a ComponentStorage or ECSWorld instance.
+
+        Disabled entities are skipped. Every call adds the number of
+        archetypes scanned and matched and the rows matched to the storage's
+        counters, and is recorded when the world is recording a trace.
+        """
         if isinstance(storage_or_world, ComponentStorage):
             warn_deprecated(
                 "Passing ComponentStorage directly is deprecated",
@@ -37,11 +67,58 @@ class Query(object):
             storage = storage_or_world
         else:
             storage = storage_or_world.component_storage
+            if storage_or_world.trace_recorder is not None:
+                storage_or_world.trace_recorder.record_query(self._with, self._without)
+
+        if self._relations:
+            return self._execute_related(storage)
 
         matching: list[Entity] = []
+        matched = 0
 
         for mask, archetype in storage.archetypes.items():
             if self._with.issubset(mask) and not self._without.intersection(mask):
-                matching.extend(archetype.entities)
+                matched += 1
+                for chunk in archetype.chunks:
+                    if 0 in chunk.enabled:
+                        matching.extend(compress(chunk.entities, chunk.enabled))
+                    else:
+                        matching.extend(chunk.entities)
+
+        counters = storage.counters
+        counters.queries += 1
+        counters.archetypes_scanned += len(storage.archetypes)
+        counters.archetypes_matched += matched
+        counters.rows_matched += len(matching)
+
+        return matching
+
+    def _execute_related(self, storage: ComponentStorage) -> list[Entity]:
+        relationships = storage.relationships
+        candidates = min(
+            (
+                relationships.sources_of(relation_type, target)
+                for relation_type, target in self._relations.items()
+            ),
+            key=len,
+        )
+
+        matching: list[Entity] = []
+        for entity in candidates:
+            mask = storage.entity_to_archetype[entity]
+            if (
+                self._with.issubset(mask)
+                and not self._without.intersection(mask)
+                and all(
+                    relationships.target_of(entity, relation_type) == target
+                    for relation_type, target in self._relations.items()
+                )
+                and storage.archetypes[mask].is_enabled(entity)
+            ):
+                matching.append(entity)
+
+        counters = storage.counters
+        counters.queries += 1
+        counters.rows_matched += len(matching)
 
         return matching
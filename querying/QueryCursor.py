@@ -0,0 +1,124 @@
+import time
+from collections.abc import Iterable, Iterator
+from itertools import compress
+from typing import NamedTuple
+
+from pyecs.common.Types import Entity
+from pyecs.containers.Archetype import Archetype
+from pyecs.containers.ArchetypeChunk import ArchetypeChunk
+from pyecs.containers.CachedQuery import CachedQuery
+from pyecs.core.World import ECSWorld
+
+
+class CursorSlice(NamedTuple):
+    archetype: Archetype
+    chunk: ArchetypeChunk
+    start: int
+    stop: int
+
+    def entities(self) -> list[Entity]:
+        """
+        List the enabled entities in this slice's rows of its chunk.
+        """
+        chunk = self.chunk
+        return list(
+            compress(chunk.entities[self.start : self.stop], chunk.enabled[self.start : self.stop])
+        )
+
+
+class QueryCursor(object):
+    def __init__(self, with_types: Iterable[type], without_types: Iterable[type] = ()):
+        self.query: CachedQuery = CachedQuery(frozenset(with_types), frozenset(without_types))
+        self.archetype_index: int = 0
+        self.row: int | None = None
+        self.sweeps: int = 0
+
+    def reset(self) -> None:
+        """
+        Restart the current sweep from the first matching archetype.
+        """
+        self.archetype_index = 0
+        self.row = None
+
+    def advance(
+        self,
+        world: ECSWorld,
+        max_rows: int | None = None,
+        max_time: float | int | None = None,
+    ) -> Iterator[CursorSlice]:
+        """
+        Continue the sweep over matching rows where the last call stopped.
+
+        Slices are yielded lazily, each covering rows of a single chunk,
+        until max_rows rows have been handed out, max_time seconds have
+        passed since the call started, or the sweep finishes. The time limit
+        is checked before every slice but the first, so it includes the
+        caller's work on the slices already yielded and every call makes
+        progress. A finished sweep increments sweeps and the next call
+        starts a new one.
+
+        Archetypes are swept in creation order, and each archetype from its
+        last row down. Removing an entity moves the archetype's last row
+        into its slot, so walking down means rows not yet visited are never
+        moved out of reach; rows already visited may be pulled back in and
+        seen twice in a sweep. Archetypes created during a sweep are
+        included when the sweep reaches them, while entities added to an
+        archetype already being swept wait for the next sweep. Using the
+        cursor on a different world's storage, such as a fork's, starts the
+        sweep over.
+
+        Returns an iterator of CursorSlice tuples of archetype, chunk and
+        the start and stop offsets of the rows in the chunk.
+        """
+        storage = world.component_storage
+        if storage is not self.query.storage:
+            self.reset()
+
+        archetypes = self.query.refresh(storage)
+        deadline = None if max_time is None else time.perf_counter_ns() + int(max_time * 1e9)
+        remaining = max_rows
+        yielded = False
+
+        while self.archetype_index < len(archetypes):
+            if remaining is not None and remaining <= 0:
+                return
+            if yielded and deadline is not None and time.perf_counter_ns() >= deadline:
+                return
+
+            archetype = archetypes[self.archetype_index]
+            row = (
+                archetype.row_count() if self.row is None else min(self.row, archetype.row_count())
+            )
+            if not row:
+                if self._next_archetype(len(archetypes)):
+                    return
+                continue
+
+            chunk_index = (row - 1) // archetype.chunk_capacity
+            chunk_start = chunk_index * archetype.chunk_capacity
+            start = chunk_start if remaining is None else max(chunk_start, row - remaining)
+            if remaining is not None:
+                remaining -= row - start
+
+            self.row = start
+            finished = False
+            if not start:
+                finished = self._next_archetype(len(archetypes))
+
+            yielded = True
+            yield CursorSlice(
+                archetype, archetype.chunks[chunk_index], start - chunk_start, row - chunk_start
+            )
+
+            if finished:
+                return
+
+    def _next_archetype(self, count: int) -> bool:
+        self.archetype_index += 1
+        self.row = None
+        if self.archetype_index < count:
+            return False
+
+        self.reset()
+        self.sweeps += 1
+        return True
@@ -1,3 +1,4 @@
 from .Query import Query
+from .QueryCursor import CursorSlice, QueryCursor
 
-__all__ = ["Query"]
+__all__ = ["CursorSlice", "Query", "QueryCursor"]
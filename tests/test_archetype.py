@@ -1,6 +1,6 @@
 import uuid
 
-from pyecs import StatusCodes
+from pyecs import LocalTransform, StatusCodes
 from pyecs.containers.Archetype import Archetype
 
 from .conftest import Health, Position, Velocity
@@ -224,3 +224,241 @@ class TestArchetypeParallelArrays:
         assert len(archetype.components[Position]) == 100
         assert len(archetype.components[Velocity]) == 100
         assert len(archetype.entities) == 100
+
+
+class TestArchetypeFork:
+    def test_fork_shares_columns_until_touched(self):
+        archetype = Archetype()
+        entity = str(uuid.uuid4())
+        archetype.add_entity(entity, [Position(1, 0, 0), Velocity(2, 0, 0)])
+
+        forked = archetype.fork()
+        chunk, forked_chunk = archetype.chunks[0], forked.chunks[0]
+
+        assert forked_chunk.entities is chunk.entities
+        assert forked_chunk.columns[Position] is chunk.columns[Position]
+
+        forked.get_component(entity, Position)
+
+        assert forked_chunk.columns[Position] is not chunk.columns[Position]
+        assert forked_chunk.columns[Velocity] is chunk.columns[Velocity]
+
+    def test_chunk_column_reads_do_not_copy(self):
+        archetype = Archetype()
+        archetype.add_entity(str(uuid.uuid4()), [Position(1, 0, 0)])
+
+        forked = archetype.fork()
+        chunk, forked_chunk = archetype.chunks[0], forked.chunks[0]
+
+        assert forked_chunk.read_column(Position) is chunk.columns[Position]
+        assert forked_chunk.column(Position) is not chunk.columns[Position]
+
+    def test_fork_reads_of_frozen_components_share_columns(self):
+        archetype = Archetype()
+        entity = str(uuid.uuid4())
+        local = LocalTransform(1, 2)
+        archetype.add_entity(entity, [local])
+
+        forked = archetype.fork()
+
+        assert forked.get_component(entity, LocalTransform) is local
+        assert list(forked.iter_components(LocalTransform)) == [local]
+        assert (
+            forked.chunks[0].columns[LocalTransform] is archetype.chunks[0].columns[LocalTransform]
+        )
+
+    def test_fork_keeps_frozen_components_after_a_write_on_the_other_side(self):
+        archetype = Archetype()
+        first, second = str(uuid.uuid4()), str(uuid.uuid4())
+        local = LocalTransform(1, 2)
+        archetype.add_entity(first, [local])
+        archetype.add_entity(second, [LocalTransform(3, 4)])
+
+        forked = archetype.fork()
+        archetype.set_component(second, LocalTransform(5, 6))
+
+        assert forked.get_component(first, LocalTransform) is local
+        assert forked.get_component(second, LocalTransform) == LocalTransform(3, 4)
+        assert archetype.get_component(first, LocalTransform) is local
+
+    def test_fork_set_enabled_is_isolated(self):
+        archetype = Archetype()
+        entity = str(uuid.uuid4())
+        archetype.add_entity(entity, [Position()])
+
+        forked = archetype.fork()
+        forked.set_enabled(entity, False)
+
+        assert archetype.is_enabled(entity)
+        assert not forked.is_enabled(entity)
+
+    def test_fork_component_mutation_is_isolated(self):
+        archetype = Archetype()
+        entity = str(uuid.uuid4())
+        archetype.add_entity(entity, [Position(1, 0, 0)])
+
+        forked = archetype.fork()
+        forked.get_component(entity, Position).x = 99
+
+        assert archetype.get_component(entity, Position).x == 1
+        assert forked.get_component(entity, Position).x == 99
+
+    def test_parent_touch_keeps_handed_out_components_valid(self):
+        archetype = Archetype()
+        entity = str(uuid.uuid4())
+        position = Position(1, 0, 0)
+        archetype.add_entity(entity, [position])
+
+        forked = archetype.fork()
+        archetype.get_component(entity, Position).x = 5
+
+        assert archetype.get_component(entity, Position) is position
+        assert forked.get_component(entity, Position).x == 1
+
+    def test_fork_structural_changes_are_isolated(self):
+        archetype = Archetype()
+        entity1 = str(uuid.uuid4())
+        entity2 = str(uuid.uuid4())
+        archetype.add_entity(entity1, [Position(1, 0, 0)])
+
+        forked = archetype.fork()
+        forked.add_entity(entity2, [Position(2, 0, 0)])
+        archetype.remove_entity(entity1)
+
+        assert list(archetype.entities) == []
+        assert list(forked.entities) == [entity1, entity2]
+        assert forked.get_component(entity1, Position).x == 1
+
+    def test_fork_of_fork_is_isolated(self):
+        archetype = Archetype()
+        entity = str(uuid.uuid4())
+        archetype.add_entity(entity, [Position(1, 0, 0)])
+
+        child = archetype.fork()
+        grandchild = child.fork()
+        archetype.set_component(entity, Position(7, 0, 0))
+        child.get_component(entity, Position).x = 3
+
+        assert archetype.get_component(entity, Position).x == 7
+        assert child.get_component(entity, Position).x == 3
+        assert grandchild.get_component(entity, Position).x == 1
+
+    def test_fork_touch_copies_only_the_touched_chunk(self):
+        archetype = Archetype(chunk_capacity=2)
+        entities = [str(uuid.uuid4()) for _ in range(4)]
+        for i, entity in enumerate(entities):
+            archetype.add_entity(entity, [Position(i, 0, 0)])
+
+        forked = archetype.fork()
+        forked.get_component(entities[3], Position).x = 30
+
+        assert forked.chunks[0].columns[Position] is archetype.chunks[0].columns[Position]
+        assert forked.chunks[1].columns[Position] is not archetype.chunks[1].columns[Position]
+        assert archetype.get_component(entities[3], Position).x == 3
+
+
+class TestArchetypeChunks:
+    def test_rows_spill_into_new_chunk_at_capacity(self):
+        archetype = Archetype(chunk_capacity=3)
+        entities = [str(uuid.uuid4()) for _ in range(7)]
+
+        for i, entity in enumerate(entities):
+            archetype.add_entity(entity, [Position(i, 0, 0)])
+
+        assert [len(chunk) for chunk in archetype.chunks] == [3, 3, 1]
+        assert list(archetype.entities) == entities
+        assert archetype.entity_indices[entities[4]] == 4
+        assert archetype.get_component(entities[4], Position).x == 4
+
+    def test_remove_moves_last_row_across_chunks(self):
+        archetype = Archetype(chunk_capacity=2)
+        entities = [str(uuid.uuid4()) for _ in range(5)]
+        for i, entity in enumerate(entities):
+            archetype.add_entity(entity, [Position(i, 0, 0)])
+
+        archetype.remove_entity(entities[1])
+
+        assert archetype.entity_indices[entities[4]] == 1
+        assert archetype.chunks[0].entities == [entities[0], entities[4]]
+        assert archetype.get_component(entities[4], Position).x == 4
+        assert len(archetype.chunks) == 2
+
+    def test_empty_last_chunk_is_released(self):
+        archetype = Archetype(chunk_capacity=2)
+        entities = [str(uuid.uuid4()) for _ in range(3)]
+        for entity in entities:
+            archetype.add_entity(entity, [Position()])
+
+        archetype.remove_entity(entities[2])
+
+        assert len(archetype.chunks) == 1
+
+        archetype.remove_entity(entities[0])
+        archetype.remove_entity(entities[1])
+
+        assert archetype.chunks == []
+        assert Position in archetype.components
+
+    def test_chunk_versions_advance_on_writes(self):
+        archetype = Archetype(chunk_capacity=2)
+        entities = [str(uuid.uuid4()) for _ in range(3)]
+        for entity in entities:
+            archetype.add_entity(entity, [Position()])
+        versions = [chunk.version for chunk in archetype.chunks]
+
+        archetype.set_component(entities[2], Position(1, 1, 1))
+
+        assert archetype.chunks[0].version == versions[0]
+        assert archetype.chunks[1].version > versions[1]
+
+    def test_slice_and_write_column_span_chunks(self):
+        archetype = Archetype(chunk_capacity=2)
+        entities = [str(uuid.uuid4()) for _ in range(5)]
+        for i, entity in enumerate(entities):
+            archetype.add_entity(entity, [Position(i, 0, 0)])
+
+        assert [p.x for p in archetype.slice_column(Position, 1, 4)] == [1, 2, 3]
+
+        result = archetype.write_column(Position, 1, [Position(10, 0, 0), Position(20, 0, 0)])
+
+        assert result == StatusCodes.SUCCESS
+        assert [p.x for p in archetype.iter_components(Position)] == [0, 10, 20, 3, 4]
+        assert archetype.write_column(Position, 4, [Position(), Position()]) == (
+            StatusCodes.FAILURE
+        )
+
+    def test_add_entities_fills_chunks_in_bulk(self):
+        archetype = Archetype(chunk_capacity=3)
+        archetype.add_entity("first", [Position()])
+        entities = [str(uuid.uuid4()) for _ in range(5)]
+
+        result = archetype.add_entities(entities, {Position: [Position(i, 0, 0) for i in range(5)]})
+
+        assert result == StatusCodes.SUCCESS
+        assert [len(chunk) for chunk in archetype.chunks] == [3, 3]
+        assert archetype.entity_indices[entities[4]] == 5
+        assert archetype.get_component(entities[4], Position).x == 4
+        assert archetype.chunks[1].enabled == bytearray(b"\x01\x01\x01")
+        assert archetype.add_entities(["first"], {Position: [Position()]}) == StatusCodes.FAILURE
+
+
+class TestArchetypeEnabledMask:
+    def test_entities_start_enabled(self):
+        archetype = Archetype()
+        entity = str(uuid.uuid4())
+        archetype.add_entity(entity, [Position()])
+
+        assert archetype.is_enabled(entity)
+
+    def test_disable_survives_swap_remove(self):
+        archetype = Archetype()
+        entity1 = str(uuid.uuid4())
+        entity2 = str(uuid.uuid4())
+        archetype.add_entity(entity1, [Position()])
+        archetype.add_entity(entity2, [Position()])
+
+        archetype.set_enabled(entity2, False)
+        archetype.remove_entity(entity1)
+
+        assert not archetype.is_enabled(entity2)
+        assert archetype.set_enabled(entity1, True) == StatusCodes.FAILURE
@@ -0,0 +1,271 @@
+import random
+
+import pytest
+
+from pyecs.benchmarks import Core  # noqa: F401
+from pyecs.benchmarks import Workloads
+from pyecs.benchmarks.Compare import compare
+from pyecs.benchmarks.Registry import SCENARIOS, Scenario, scenario, select
+from pyecs.benchmarks.Replay import apply, load_trace, prepare, replay_breakdown, replay_scenario
+from pyecs.benchmarks.Runner import run, run_scenario
+from pyecs.benchmarks.Scaling import SCALING_CASES, ScalingCase, fit_exponent, run_scaling
+from pyecs.benchmarks.Statistics import summarize
+from pyecs.benchmarks.Visualizer import to_visualizer
+from pyecs.common.Relationship import ChildOf, Relationship
+from pyecs.core.World import ECSWorld
+
+
+def _result(name: str, size: str, samples: list[float]) -> dict:
+    return {
+        "metadata": {"repeats": len(samples)},
+        "scenarios": {name: {"sizes": {size: {"samples": samples, "summary": summarize(samples)}}}},
+    }
+
+
+class TestSummarize:
+    def test_confidence_interval_contains_mean(self):
+        summary = summarize([1.0, 2.0, 3.0, 4.0])
+
+        assert summary["mean"] == 2.5
+        assert summary["median"] == 2.5
+        assert summary["ci_low"] < 2.5 < summary["ci_high"]
+
+    def test_single_sample_has_no_interval(self):
+        summary = summarize([5.0])
+
+        assert summary["ci_low"] == summary["ci_high"] == 5.0
+
+    def test_empty_samples_raise(self):
+        with pytest.raises(ValueError):
+            summarize([])
+
+
+class TestRegistry:
+    def test_duplicate_names_are_rejected(self):
+        register = scenario("test.duplicate", (1,))
+        register(lambda size, rng: lambda: None)
+
+        with pytest.raises(ValueError):
+            register(lambda size, rng: lambda: None)
+
+        del SCENARIOS["test.duplicate"]
+
+    def test_select_matches_prefixes(self):
+        names = [registered.name for registered in select(["core.query"])]
+
+        assert names == ["core.query_single", "core.query_two", "core.query_three"]
+        assert len(select()) == len(SCENARIOS)
+
+
+class TestRunner:
+    def test_runs_are_seeded(self):
+        drawn: list[float] = []
+
+        def setup(size: int, rng: random.Random):
+            drawn.append(rng.random())
+            return lambda: None
+
+        registered = Scenario("test.seeded", setup, (1,), (1,))
+        _ = run_scenario(registered, 1, repeats=2, warmup=1, seed=7)
+        first = list(drawn)
+        drawn.clear()
+        _ = run_scenario(registered, 1, repeats=2, warmup=1, seed=7)
+
+        assert drawn == first
+        assert len(set(first)) == 3
+
+    def test_warmup_samples_are_discarded(self):
+        registered = Scenario("test.sized", lambda size, rng: lambda: None, (1, 2), (1,))
+
+        results = run([registered], repeats=3, warmup=2, quick=True)
+        sizes = results["scenarios"]["test.sized"]["sizes"]
+
+        assert list(sizes) == ["1"]
+        assert len(sizes["1"]["samples"]) == 3
+        assert results["metadata"]["seed"] is not None
+
+    def test_frame_details_add_fps(self):
+        registered = Scenario("test.frames", lambda size, rng: lambda: {"frames": 10}, (1,), (1,))
+
+        samples, details = run_scenario(registered, 1, repeats=2, warmup=0)
+        measured = run([registered], repeats=2, warmup=0)["scenarios"]["test.frames"]["sizes"]["1"]
+
+        assert len(samples) == 2
+        assert details == {"frames": 10}
+        assert measured["fps"]["mean"] > 0
+        assert measured["details"] == {"frames": 10}
+
+
+class TestCompare:
+    def test_slower_candidate_regresses(self):
+        baseline = _result("core.x", "10", [1.0, 1.01, 0.99, 1.0])
+        candidate = _result("core.x", "10", [1.5, 1.51, 1.49, 1.5])
+
+        [row] = compare(baseline, candidate, threshold=0.1)
+
+        assert row.verdict == "regressed"
+        assert row.ratio == pytest.approx(1.5)
+
+    def test_noise_within_intervals_is_unchanged(self):
+        baseline = _result("core.x", "10", [1.0, 2.0, 0.5, 1.5])
+        candidate = _result("core.x", "10", [1.5, 2.5, 0.6, 1.6])
+
+        [row] = compare(baseline, candidate, threshold=0.1)
+
+        assert row.verdict == "unchanged"
+
+    def test_missing_candidate_measurement(self):
+        baseline = _result("core.x", "10", [1.0, 1.0])
+        candidate = _result("core.y", "10", [1.0, 1.0])
+
+        [row] = compare(baseline, candidate)
+
+        assert row.verdict == "missing"
+
+
+class TestVisualizerExport:
+    def test_core_scenarios_map_to_legacy_sections(self):
+        results = _result("core.query_two", "100", [0.1, 0.2])
+
+        data = to_visualizer(results)
+
+        assert data["query_performance"]["two_components"]["100"] == [0.1, 0.2]
+        assert data["metadata"]["iterations"] == 2
+
+
+class TestWorkloads:
+    def test_boids_report_per_system_time(self):
+        details = Workloads.boids(30, random.Random(1))()
+
+        assert details["frames"] == Workloads.BOID_FRAMES
+        assert set(details["systems"]) == {"BoidsSystem", "MovementSystem"}
+        assert sum(system["share"] for system in details["systems"].values()) == pytest.approx(1)
+
+    def test_particles_reach_a_steady_population(self):
+        details = Workloads.particles(10, random.Random(1))()
+
+        assert 200 <= details["entities"] <= 400
+
+    def test_status_effects_spread_across_archetypes(self):
+        details = Workloads.status_effects(100, random.Random(1))()
+
+        assert details["entities"] == 100
+        assert details["systems"]["ChurnSystem"]["mean_ns"] > 0
+
+    def test_soak_records_a_timeline(self):
+        details = Workloads.soak(100, random.Random(1))()
+
+        assert len(details["timeline"]) == Workloads.SOAK_SAMPLES
+        assert details["timeline"][-1]["tick"] == 100
+        assert details["timeline"][-1]["storage_bytes"] > 0
+
+
+class TestScaling:
+    def test_fit_exponent_recovers_power_law(self):
+        sizes = [10, 100, 1000]
+
+        assert fit_exponent(sizes, [3.0 * size for size in sizes]) == pytest.approx(1.0)
+        assert fit_exponent(sizes, [5.0, 5.0, 5.0]) == pytest.approx(0.0)
+
+    def test_linear_operation_is_flagged(self):
+        def setup(size: int, rng: random.Random):
+            return lambda: sum(range(size * 50))
+
+        case = ScalingCase("test.linear", "systems", 0.0, setup)
+        results = run_scaling([case], quick=True, repeats=2)
+        [row] = results["scaling"]
+
+        assert row["verdict"] == "grows"
+        assert row["exponent"] > 0.5
+        assert set(results["scenarios"]["test.linear"]["sizes"]) == {"400", "1600", "6400"}
+
+    def test_core_operations_are_registered(self):
+        assert SCALING_CASES["scaling.get_component"].expected == 0.0
+        assert SCALING_CASES["scaling.query_all"].expected == 1.0
+        assert SCALING_CASES["scaling.remove_system"].dimension == "systems"
+
+
+def _record_particles(path) -> None:
+    world = ECSWorld()
+    Workloads.afflicted(world, 20, random.Random(1))
+    world.add_system(Workloads.EmitterSystem(3, random.Random(2)))
+    world.add_system(Workloads.LifetimeSystem())
+    world.add_system(Workloads.MovementSystem())
+
+    with open(path, "wb") as file:
+        world.start_recording(file)
+        for _ in range(30):
+            world.update(Workloads.DT)
+        world.stop_recording()
+
+
+class TestReplay:
+    def test_trace_splits_at_the_prologue(self, tmp_path):
+        path = tmp_path / "particles.trace"
+        _record_particles(path)
+
+        prologue, operations = load_trace(path)
+
+        assert sum(1 for op, _ in prologue if op.name == "CREATE") == 20
+        assert sum(1 for op, _ in operations if op.name == "UPDATE") == 30
+
+    def test_replay_runs_at_each_chunk_capacity(self, tmp_path):
+        path = tmp_path / "particles.trace"
+        _record_particles(path)
+
+        results = run([replay_scenario(path, (8, 64))], repeats=2, warmup=0)
+        sizes = results["scenarios"]["replay.particles"]["sizes"]
+
+        assert set(sizes) == {"8", "64"}
+        assert sizes["8"]["details"]["frames"] == 30
+        assert sizes["8"]["fps"]["mean"] > 0
+
+    def test_replay_reproduces_the_recorded_world(self, tmp_path):
+        path = tmp_path / "particles.trace"
+        _record_particles(path)
+
+        breakdown = replay_breakdown(path, 16)
+
+        assert breakdown["update"]["count"] == 30
+        assert breakdown["query"]["count"] == 60
+        assert breakdown["create"]["count"] == 90
+
+    def test_replay_keeps_relationships(self, tmp_path):
+        world = ECSWorld()
+        parent = world.create_entity()
+        child = world.create_entity()
+        world.add_component(child, ChildOf(parent))
+        path = tmp_path / "hierarchy.trace"
+
+        with open(path, "wb") as file:
+            world.start_recording(file)
+            late = world.create_entity()
+            world.add_component(late, ChildOf(parent))
+            world.stop_recording()
+
+        prologue, operations = load_trace(path)
+        replayed, entities = prepare(prologue, 16)
+        apply(replayed, operations, entities)
+        relation = next(type(args[1]) for op, args in operations if op.name == "ADD")
+
+        assert issubclass(relation, Relationship) and relation.cascade
+        assert len(replayed.children_of(entities[0], relation)) == 2
+        replayed.destroy_entity(entities[0])
+        assert not replayed.entity_manager.alive_entities
+
+    def test_replay_prologue_creates_targets_before_relationships(self, tmp_path):
+        world = ECSWorld()
+        child = world.create_entity()
+        parent = world.create_entity()
+        world.add_component(child, ChildOf(parent))
+        path = tmp_path / "hierarchy.trace"
+
+        with open(path, "wb") as file:
+            world.start_recording(file)
+            world.stop_recording()
+
+        prologue, _ = load_trace(path)
+        replayed, entities = prepare(prologue, 16)
+        relation = next(type(args[1]) for op, args in prologue if op.name == "ADD")
+
+        assert replayed.parent_of(entities[0], relation) == entities[1]
@@ -260,3 +260,60 @@ class TestComponentStorageEdgeCases:
         assert pos_before.y == pos_after.y
         assert pos_before.z == pos_after.z
         assert name_before.value == name_after.value
+
+
+class TestComponentStorageCounters:
+    def test_moves_and_created_archetypes_are_counted(self):
+        storage = ComponentStorage()
+        entity = str(uuid.uuid4())
+
+        storage.entity_to_archetype[entity] = frozenset()
+        storage.archetypes[frozenset()] = Archetype()
+
+        storage.add_component(entity, Position())
+        storage.add_component(entity, Velocity())
+        storage.add_component(entity, Velocity(1, 1, 1))
+
+        assert storage.counters.archetype_moves == 2
+        assert storage.counters.archetypes_created == 2
+        assert storage.counters.components_copied == 1
+
+    def test_end_tick_reports_growth(self):
+        storage = ComponentStorage()
+        entity = str(uuid.uuid4())
+        storage.entity_to_archetype[entity] = frozenset()
+        storage.archetypes[frozenset()] = Archetype()
+
+        storage.add_component(entity, Position())
+        storage.counters.end_tick()
+        storage.add_component(entity, Velocity())
+        storage.add_component(entity, Health())
+        storage.counters.end_tick()
+
+        assert storage.counters.last_tick["archetype_moves"] == 2
+        assert storage.counters.totals()["archetype_moves"] == 3
+        assert storage.counters.ticks == 2
+
+    def test_metrics_reports_column_bytes(self):
+        storage = ComponentStorage()
+        entity = str(uuid.uuid4())
+        storage.entity_to_archetype[entity] = frozenset()
+        storage.archetypes[frozenset()] = Archetype()
+        storage.add_component(entity, Position())
+
+        metrics = storage.metrics()
+
+        assert metrics["archetypes"] == 2
+        assert metrics["entities"] == 1
+        assert metrics["column_bytes"]["Position"] > 0
+
+    def test_reset_clears_counters(self):
+        storage = ComponentStorage()
+        storage.counters.archetype_moves = 5
+        storage.counters.end_tick()
+
+        storage.counters.reset()
+
+        assert storage.counters.archetype_moves == 0
+        assert storage.counters.ticks == 0
+        assert storage.counters.last_tick["archetype_moves"] == 0
@@ -0,0 +1,225 @@
+from dataclasses import dataclass
+
+import pytest
+
+from pyecs.containers.EventChannel import EventChannel, SchemaEventChannel, event_channel
+
+from .conftest import Position
+
+
+@dataclass
+class DamageDealt:
+    columnar = True
+
+    amount: float = 0.0
+    critical: bool = False
+
+
+@dataclass
+class Scored:
+    columnar = True
+
+    points: int = 0
+    combo: int = 0
+
+
+@dataclass
+class Collision:
+    first: str = ""
+    second: str = ""
+
+
+class TestEventChannel:
+    def test_events_are_readable_after_swap(self):
+        channel = EventChannel(Collision)
+        channel.send(Collision("a", "b"))
+
+        assert list(channel.read()) == []
+
+        channel.swap()
+
+        assert list(channel.read()) == [Collision("a", "b")]
+        assert len(channel) == 1
+
+    def test_events_last_one_frame(self):
+        channel = EventChannel(Collision)
+        channel.send(Collision("a", "b"))
+        channel.swap()
+        channel.swap()
+
+        assert list(channel.read()) == []
+
+    def test_buffers_are_reused(self):
+        channel = EventChannel(Collision)
+        channel.send_batch([Collision(), Collision(), Collision()])
+        channel.swap()
+        channel.swap()
+        buffer = channel.back
+
+        channel.send(Collision("x", "y"))
+        channel.swap()
+
+        assert channel.front is buffer
+        assert len(buffer) == 3
+        assert list(channel.read()) == [Collision("x", "y")]
+
+    def test_clear_drops_everything(self):
+        channel = EventChannel(Collision)
+        channel.send(Collision())
+        channel.swap()
+        channel.send(Collision())
+        channel.clear()
+        channel.swap()
+
+        assert list(channel.read()) == []
+        assert channel.sent == 2
+
+
+class TestSchemaEventChannel:
+    def test_columnar_events_get_array_columns(self):
+        assert isinstance(event_channel(DamageDealt), SchemaEventChannel)
+        assert not isinstance(event_channel(Collision), SchemaEventChannel)
+        assert not isinstance(event_channel(str), SchemaEventChannel)
+
+    def test_columnar_events_need_numeric_fields(self):
+        @dataclass
+        class Named:
+            columnar = True
+
+            name: str = ""
+
+        with pytest.raises(TypeError):
+            event_channel(Named)
+
+    def test_events_round_trip_through_columns(self):
+        channel = event_channel(DamageDealt)
+        channel.send(DamageDealt(2.5, True))
+        channel.send_values(1.0, False)
+        channel.swap()
+
+        assert list(channel.read()) == [DamageDealt(2.5, True), DamageDealt(1.0, False)]
+
+    def test_column_is_a_view_of_the_previous_frame(self):
+        channel = event_channel(DamageDealt)
+        for amount in range(5):
+            channel.send_values(float(amount), False)
+        channel.swap()
+        channel.swap()
+        channel.send_values(9.0, True)
+        channel.swap()
+
+        with channel.column("amount") as amounts:
+            assert amounts.tolist() == [9.0]
+
+    def test_send_values_checks_field_count(self):
+        channel = event_channel(DamageDealt)
+
+        with pytest.raises(ValueError):
+            channel.send_values(1.0)
+
+    def test_failed_send_keeps_columns_aligned(self):
+        channel = event_channel(DamageDealt)
+
+        with pytest.raises(TypeError):
+            channel.send_values(1.0, "yes")
+        channel.send_values(2.0, True)
+        channel.swap()
+
+        assert list(channel.read()) == [DamageDealt(2.0, True)]
+
+    def test_out_of_range_send_keeps_columns_aligned(self):
+        channel = event_channel(Scored)
+
+        with pytest.raises(OverflowError):
+            channel.send_values(1, 2**70)
+        channel.send_values(3, 4)
+        channel.swap()
+
+        assert list(channel.read()) == [Scored(3, 4)]
+        with channel.column("points") as points:
+            assert points.tolist() == [3]
+
+    def test_send_with_a_held_column_view_keeps_columns_aligned(self):
+        channel = event_channel(DamageDealt)
+        channel.send_values(1.0, False)
+        channel.swap()
+        view = channel.column("critical")
+        channel.swap()
+        channel.send_values(2.0, True)
+
+        with pytest.raises(BufferError):
+            channel.send_values(3.0, True)
+        with pytest.raises(BufferError):
+            channel.send_columns(amount=[4.0, 5.0], critical=[False, False])
+        view.release()
+        channel.send_values(6.0, False)
+        channel.swap()
+
+        assert list(channel.read()) == [DamageDealt(2.0, True), DamageDealt(6.0, False)]
+
+    def test_send_columns_copies_a_batch(self):
+        channel = event_channel(DamageDealt)
+        channel.send_values(1.0, False)
+        channel.send_columns(amount=[2.0, 3.0], critical=[True, False])
+        channel.swap()
+
+        with channel.column("amount") as amounts:
+            assert amounts.tolist() == [1.0, 2.0, 3.0]
+        assert channel.sent == 3
+
+    def test_send_columns_rejects_ragged_batches(self):
+        channel = event_channel(DamageDealt)
+
+        with pytest.raises(ValueError):
+            channel.send_columns(amount=[1.0, 2.0], critical=[True])
+        with pytest.raises(ValueError):
+            channel.send_columns(amount=[1.0])
+        channel.swap()
+
+        assert len(channel) == 0
+
+
+class TestWorldEvents:
+    def test_events_are_read_in_the_next_frame(self, world):
+        world.send_event(DamageDealt(3.0))
+
+        assert list(world.read_events(DamageDealt)) == []
+
+        world.update(0.1)
+
+        assert list(world.read_events(DamageDealt)) == [DamageDealt(3.0)]
+
+        world.update(0.1)
+
+        assert list(world.read_events(DamageDealt)) == []
+
+    def test_events_do_not_create_archetypes(self, world):
+        entity = world.create_entity()
+        world.add_component(entity, Position())
+        archetypes = len(world.component_storage.archetypes)
+
+        for _ in range(100):
+            world.send_event(Collision(entity, entity))
+        world.update(0.1)
+
+        assert len(world.component_storage.archetypes) == archetypes
+        assert len(world.event_channel(Collision)) == 100
+
+    def test_step_swaps_once_per_frame(self, world):
+        world.set_timestep(tick_rate=10)
+        world.send_event(Collision())
+
+        world.step(0.3)
+
+        assert len(world.event_channel(Collision)) == 1
+
+    def test_fork_copies_events(self, world):
+        world.send_event(Collision("a", "b"))
+        forked = world.fork()
+        forked.send_event(Collision("c", "d"))
+
+        world.update(0.1)
+        forked.update(0.1)
+
+        assert list(world.read_events(Collision)) == [Collision("a", "b")]
+        assert list(forked.read_events(Collision)) == [Collision("a", "b"), Collision("c", "d")]
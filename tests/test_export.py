@@ -0,0 +1,101 @@
+import pytest
+
+from pyecs.common.Transform import Transform
+from pyecs.exceptions import OperationFailedError
+from pyecs.exporting.Export import ArchetypeExport, component_schema
+
+from .conftest import Health, Name, Position, Velocity
+
+
+class TestComponentSchema:
+    def test_numeric_fields_map_to_typecodes(self):
+        assert component_schema(Position) == {"x": "d", "y": "d", "z": "d"}
+        assert component_schema(Health) == {"current": "q", "max": "q"}
+
+    def test_non_numeric_fields_are_skipped(self):
+        assert component_schema(Name) == {}
+
+    def test_float_or_int_fields_are_stored_as_doubles(self):
+        assert component_schema(Transform) == {"x": "d", "y": "d", "rotation": "d", "scale": "d"}
+
+
+class TestWorldExportColumns:
+    def test_export_packs_fields_per_archetype(self, world):
+        entities = []
+        for i in range(3):
+            entity = world.create_entity()
+            world.add_component(entity, Position(i, i * 2, 0))
+            entities.append(entity)
+
+        exports = world.export_columns(Position)
+
+        assert len(exports) == 1
+        assert exports[0].entities == entities
+        assert exports[0].column(Position, "x").tolist() == [0.0, 1.0, 2.0]
+        assert exports[0].column(Position, "y").tolist() == [0.0, 2.0, 4.0]
+
+    def test_export_matches_archetypes_containing_all_types(self, world):
+        moving = world.create_entity()
+        world.add_component(moving, Position())
+        world.add_component(moving, Velocity(1, 0, 0))
+        still = world.create_entity()
+        world.add_component(still, Position())
+
+        assert len(world.export_columns(Position)) == 2
+
+        exports = world.export_columns(Position, Velocity)
+        assert len(exports) == 1
+        assert exports[0].entities == [moving]
+        assert exports[0].column(Velocity, "dx").tolist() == [1.0]
+
+    def test_unpackable_values_name_the_column(self, world):
+        entity = world.create_entity()
+        world.add_component(entity, Health(2**70, 100))
+
+        with pytest.raises(OperationFailedError, match=r"Health\.current"):
+            world.export_columns(Health)
+
+    def test_export_without_types_includes_every_component(self, world, entity_with_components):
+        exports = world.export_columns()
+
+        assert len(exports) == 1
+        assert set(exports[0].columns) == {
+            "Health.current",
+            "Health.max",
+            "Position.x",
+            "Position.y",
+            "Position.z",
+            "Velocity.dx",
+            "Velocity.dy",
+            "Velocity.dz",
+        }
+
+    def test_export_skips_empty_archetypes(self, world):
+        entity = world.create_entity()
+        world.add_component(entity, Position())
+        world.remove_component(entity, Position)
+
+        assert world.export_columns(Position) == []
+
+
+class TestArchetypeExportViews:
+    def test_to_numpy_wraps_packed_buffer(self, world, entity_with_components):
+        pytest.importorskip("numpy")
+        export: ArchetypeExport = world.export_columns(Position, Health)[0]
+
+        arrays = export.to_numpy()
+        arrays["Position.x"][0] = 42.0
+
+        assert export.column(Position, "x")[0] == 42.0
+        assert arrays["Health.current"].tolist() == [75]
+
+    def test_to_arrow_has_entity_and_field_columns(self, world, entity_with_components):
+        pytest.importorskip("pyarrow")
+        export: ArchetypeExport = world.export_columns(Position)[0]
+
+        batch = export.to_arrow()
+
+        assert batch.schema.names[0] == "entity"
+        assert batch.column("entity").to_pylist() == [entity_with_components]
+        assert batch.column("Position.z").to_pylist() == [3.0]
+        assert batch.num_rows == 1
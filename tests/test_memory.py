@@ -0,0 +1,96 @@
+import json
+import sys
+
+from pyecs.profiling.Memory import deep_sizeof, list_capacity, sampled_sizeof
+
+from .conftest import Health, Name, Position, Velocity
+
+
+class TestDeepSizeof:
+    def test_includes_referenced_objects(self):
+        name = Name("a" * 1000)
+
+        assert deep_sizeof(name) > sys.getsizeof(name) + 1000
+
+    def test_shared_objects_are_counted_once(self):
+        shared = [0] * 100
+        pair = [shared, shared]
+
+        assert deep_sizeof(pair) == sys.getsizeof(pair) + deep_sizeof(shared)
+
+    def test_types_are_not_counted(self):
+        assert deep_sizeof(Position) == 0
+
+
+class TestSampledSizeof:
+    def test_short_lists_are_measured_exactly(self):
+        items = [Position() for _ in range(10)]
+
+        size, sampled = sampled_sizeof(items, sample_size=16)
+
+        assert size == deep_sizeof(items) - sys.getsizeof(items)
+        assert sampled is False
+
+    def test_long_lists_are_sampled_and_scaled(self):
+        items = [Position() for _ in range(100)]
+
+        size, sampled = sampled_sizeof(items, sample_size=10)
+
+        assert sampled is True
+        assert size == deep_sizeof(items) - sys.getsizeof(items)
+
+    def test_shared_prototypes_are_not_scaled(self):
+        prototype = Name("a" * 10000)
+        items = [[prototype] for _ in range(100)]
+
+        size, sampled = sampled_sizeof(items, sample_size=10)
+
+        assert sampled is True
+        assert size == deep_sizeof(items) - sys.getsizeof(items)
+        assert size < 2 * deep_sizeof(prototype)
+
+    def test_list_capacity_counts_allocated_slots(self):
+        items = []
+        for i in range(17):
+            items.append(i)
+
+        assert list_capacity(items) >= 17
+
+
+class TestWorldMemoryReport:
+    def test_reports_archetypes_and_components(self, world):
+        for i in range(10):
+            entity = world.create_entity()
+            world.add_component(entity, Position())
+            if i % 2:
+                world.add_component(entity, Velocity())
+
+        report = world.memory_report()
+        archetypes = {tuple(a["components"]): a for a in report["archetypes"]}
+
+        assert archetypes[("Position",)]["rows"] == 5
+        assert archetypes[("Position", "Velocity")]["columns"]["Velocity"]["rows"] == 5
+        assert report["components"]["Position"]["rows"] == 10
+        assert report["components"]["Velocity"]["object_bytes"] > 0
+        assert archetypes[("Position",)]["overhead"]["entity_ids"] > 0
+
+    def test_total_covers_every_archetype(self, world):
+        entity = world.create_entity()
+        world.add_component(entity, Health())
+
+        report = world.memory_report()
+
+        assert report["total_bytes"] == report["overhead"]["entity_to_archetype"] + sum(
+            archetype["total_bytes"] for archetype in report["archetypes"]
+        )
+
+    def test_large_columns_are_sampled(self, world):
+        for _ in range(20):
+            entity = world.create_entity()
+            world.add_component(entity, Position())
+
+        report = world.memory_report(sample_size=4)
+        column = report["archetypes"][-1]["columns"]["Position"]
+
+        assert column["sampled"] is True
+        assert json.loads(json.dumps(report)) == report
@@ -0,0 +1,167 @@
+import pytest
+from pyecs import StatusCodes
+from pyecs.containers.Archetype import Archetype
+from pyecs.containers.ComponentStorage import ComponentStorage
+from pyecs.containers.Observer import Observer
+
+from .conftest import Health, Position, Velocity
+
+
+class TestObserver:
+    def test_unbatched_observer_calls_back_immediately(self):
+        calls = []
+        observer = Observer("add", Position, lambda entity, component: calls.append(entity))
+
+        observer.notify("e", Position())
+
+        assert calls == ["e"]
+        assert observer.pending == []
+
+    def test_batched_observer_queues_until_flush(self):
+        batches = []
+        observer = Observer("add", Position, batches.append, batched=True)
+
+        observer.notify("a", Position(1, 1))
+        observer.notify("b", Position(2, 2))
+
+        assert batches == []
+
+        observer.flush()
+        observer.flush()
+
+        assert batches == [[("a", Position(1, 1)), ("b", Position(2, 2))]]
+        assert observer.notified == 2
+
+
+def storage_with_entity(entity):
+    storage = ComponentStorage()
+    storage.entity_to_archetype[entity] = frozenset()
+    storage.archetypes[frozenset()] = Archetype()
+
+    return storage
+
+
+class TestStorageObservers:
+    def test_only_new_component_types_notify(self):
+        storage = storage_with_entity("e")
+        added = []
+        storage.add_observer(Observer("add", Position, lambda e, c: added.append(c)))
+
+        storage.add_component("e", Position(1, 1))
+        storage.add_component("e", Position(2, 2))
+        storage.add_component("e", Velocity())
+
+        assert added == [Position(1, 1)]
+
+    def test_remove_entity_reports_every_component(self):
+        storage = storage_with_entity("e")
+        removed = []
+        storage.add_observer(Observer("remove", Position, lambda e, c: removed.append(c)))
+        storage.add_observer(Observer("remove", Health, lambda e, c: removed.append(c)))
+        storage.add_component("e", Position(3, 4))
+        storage.add_component("e", Health(5))
+
+        storage.remove_entity("e")
+
+        assert sorted(removed, key=repr) == [Health(5), Position(3, 4)]
+
+    def test_remove_observer(self):
+        storage = storage_with_entity("e")
+        observer = Observer("add", Position, lambda e, c: None, batched=True)
+        storage.add_observer(observer)
+        storage.add_component("e", Position())
+
+        assert storage.remove_observer(observer) == StatusCodes.SUCCESS
+        assert storage.remove_observer(observer) == StatusCodes.FAILURE
+        assert observer.pending == []
+        assert Position not in storage.on_add
+
+
+class TestWorldObservers:
+    def test_observe_needs_one_hook(self, world):
+        with pytest.raises(ValueError):
+            world.observe(print)
+        with pytest.raises(ValueError):
+            world.observe(print, on_add=Position, on_remove=Position)
+
+    def test_removed_component_is_passed(self, world):
+        removed = []
+        world.observe(
+            lambda entity, component: removed.append((entity, component)), on_remove=Health
+        )
+        entity = world.create_entity()
+        world.add_component(entity, Position())
+        world.add_component(entity, Health(7))
+
+        world.remove_component(entity, Health)
+
+        assert removed == [(entity, Health(7))]
+
+    def test_destroyed_entities_notify_removal(self, world):
+        removed = []
+        world.observe(lambda entity, component: removed.append(entity), on_remove=Position)
+        entity = world.create_entity()
+        world.add_component(entity, Position())
+
+        world.destroy_entity(entity)
+
+        assert removed == [entity]
+
+    def test_batched_observers_flush_at_end_of_frame(self, world):
+        batches = []
+        world.observe(batches.append, on_add=Position, batched=True)
+        entities = [world.create_entity() for _ in range(3)]
+        for entity in entities:
+            world.add_component(entity, Position())
+
+        assert batches == []
+
+        world.update(0.1)
+        world.update(0.1)
+
+        assert len(batches) == 1
+        assert [entity for entity, _ in batches[0]] == entities
+
+    def test_flush_observers_delivers_early(self, world):
+        batches = []
+        world.observe(batches.append, on_add=Position, batched=True)
+        world.add_component(world.create_entity(), Position())
+
+        world.flush_observers()
+
+        assert len(batches) == 1
+
+    def test_unobserve_stops_callbacks(self, world):
+        added = []
+        observer = world.observe(lambda entity, component: added.append(entity), on_add=Position)
+        world.unobserve(observer)
+
+        world.add_component(world.create_entity(), Position())
+
+        assert added == []
+
+    def test_observer_can_unobserve_itself(self, world):
+        added = []
+
+        def once(entity, component):
+            added.append(entity)
+            world.unobserve(first)
+
+        first = world.observe(once, on_add=Position)
+        world.observe(lambda entity, component: added.append(component), on_add=Position)
+        entity = world.create_entity()
+
+        world.add_component(entity, Position())
+        world.add_component(world.create_entity(), Position())
+
+        assert len(added) == 3
+        assert added[:2] == [entity, Position()]
+
+    def test_fork_has_no_observers(self, world):
+        added = []
+        world.observe(lambda entity, component: added.append(entity), on_add=Position)
+        forked = world.fork()
+
+        forked.add_component(forked.create_entity(), Position())
+
+        assert added == []
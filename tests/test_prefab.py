@@ -0,0 +1,163 @@
+from dataclasses import dataclass
+
+import pytest
+from pyecs import ChildOf, LocalTransform, Prefab
+from pyecs.containers.Prefab import prototype_cloner
+from pyecs.helpers.Statuses import StatusCodes
+from pyecs.managers.EntityManager import EntityManager
+
+from .conftest import Health, Name, Position, Velocity
+
+
+@dataclass(slots=True)
+class Slotted:
+    value: int = 0
+
+
+class RecyclingEntityManager(EntityManager):
+    def __init__(self, recycled):
+        super().__init__()
+        self.recycled = recycled
+
+    def create_entities(self, count: int) -> list:
+        entities = [self.recycled, *super().create_entities(count - 1)]
+        self.alive_entities.add(self.recycled)
+        return entities
+
+
+class TestPrototypeCloner:
+    def test_plain_components_are_copied(self):
+        prototype = Position(1, 2, 3)
+
+        clones = prototype_cloner(prototype)(3)
+
+        assert clones == [Position(1, 2, 3)] * 3
+        assert all(clone is not prototype for clone in clones)
+        assert len({id(clone) for clone in clones}) == 3
+
+    def test_slotted_components_are_copied(self):
+        clones = prototype_cloner(Slotted(7))(2)
+
+        assert clones == [Slotted(7), Slotted(7)]
+        assert clones[0] is not clones[1]
+
+    def test_frozen_components_are_shared(self):
+        prototype = LocalTransform(1, 1)
+
+        assert prototype_cloner(prototype)(2) == [prototype, prototype]
+        assert prototype_cloner(prototype)(2)[0] is prototype
+
+    def test_later_prototype_changes_are_copied(self):
+        prototype = Health(10)
+        clone = prototype_cloner(prototype)
+
+        prototype.current = 5
+
+        assert clone(1) == [Health(5)]
+
+
+class TestPrefab:
+    def test_prefab_precomputes_its_mask(self):
+        prefab = Prefab(Position(), Health())
+
+        assert prefab.mask == frozenset({Position, Health})
+
+    def test_duplicate_types_are_rejected(self):
+        with pytest.raises(ValueError):
+            Prefab(Position(), Position())
+
+    def test_variant_replaces_and_adds(self):
+        prefab = Prefab(Position(), Health(50)).variant(Health(80), Name("goblin"))
+
+        assert prefab.prototypes[Health] == Health(80)
+        assert prefab.mask == frozenset({Position, Health, Name})
+
+
+class TestWorldInstantiate:
+    def test_instances_get_their_own_components(self, world):
+        prefab = Prefab(Position(1, 1, 1), Health(30))
+
+        entities = world.instantiate(prefab, 3)
+
+        assert len(entities) == 3
+        assert all(world.entity_manager.is_alive(entity) for entity in entities)
+        first = world.get_component(entities[0], Position)
+        first.x = 9
+        assert world.get_component(entities[1], Position) == Position(1, 1, 1)
+        assert world.get_component(entities[2], Health) == Health(30)
+
+    def test_instances_skip_intermediate_archetypes(self, world):
+        prefab = Prefab(Position(), Velocity(), Health())
+
+        world.instantiate(prefab, 100)
+
+        assert list(world.component_storage.archetypes) == [prefab.mask]
+        assert world.component_storage.counters.archetype_moves == 0
+
+    def test_instances_join_existing_rows(self, world):
+        entity = world.create_entity()
+        world.add_component(entity, Position())
+        world.add_component(entity, Health())
+
+        entities = world.instantiate(Prefab(Position(), Health()), 2)
+        archetype = world.component_storage.archetypes[frozenset({Position, Health})]
+
+        assert list(archetype.entities) == [entity, *entities]
+
+    def test_overrides_are_used_as_given(self, world):
+        positions = [Position(i, 0, 0) for i in range(3)]
+
+        entities = world.instantiate(
+            Prefab(Position(), Health()), 3, overrides={Position: positions, Name: [Name("a")] * 3}
+        )
+
+        assert world.get_component(entities[2], Position) is positions[2]
+        assert world.get_component(entities[0], Name) == Name("a")
+
+    def test_bad_overrides_are_rejected(self, world):
+        prefab = Prefab(Position())
+
+        with pytest.raises(ValueError):
+            world.instantiate(prefab, 2, overrides={Position: [Position()]})
+        with pytest.raises(ValueError):
+            world.instantiate(prefab, 1, overrides={Position: [Health()]})
+        assert world.entity_manager.alive_entities == set()
+
+    def test_relationships_are_indexed(self, world):
+        parent = world.create_entity()
+
+        children = world.instantiate(Prefab(Position(), ChildOf(parent)), 3)
+
+        assert world.children_of(parent) == children
+        world.destroy_entity(parent)
+        assert not any(world.entity_manager.is_alive(child) for child in children)
+
+    def test_dead_relationship_targets_are_rejected(self, world):
+        parent = world.create_entity()
+        world.destroy_entity(parent)
+
+        with pytest.raises(ValueError):
+            world.instantiate(Prefab(ChildOf(parent)), 2)
+
+    def test_observers_see_every_instance(self, world):
+        added = []
+        world.observe(lambda entity, component: added.append(entity), on_add=Health)
+
+        entities = world.instantiate(Prefab(Position(), Health()), 4)
+
+        assert added == entities
+
+    def test_rejected_instances_are_rolled_back(self, world):
+        stale = world.create_entity()
+        world.entity_manager.destroy_entity(stale)
+        world.entity_manager = RecyclingEntityManager(stale)
+
+        result = world.instantiate(Prefab(Position()), 3)
+
+        assert result == StatusCodes.FAILURE
+        assert world.entity_manager.alive_entities == set()
+        assert frozenset({Position}) not in world.component_storage.archetypes
+
+    def test_zero_count_creates_nothing(self, world):
+        assert world.instantiate(Prefab(Position()), 0) == []
+        assert world.component_storage.archetypes == {}
@@ -0,0 +1,135 @@
+import json
+
+from pyecs.profiling.Histogram import LatencyHistogram
+from pyecs.profiling.SystemProfiler import SystemProfiler
+
+from .conftest import Position, Velocity
+from .test_system import CountingSystem, MovementSystem, ParallelMovementSystem
+
+
+class TestLatencyHistogram:
+    def test_empty_histogram_reports_zero(self):
+        histogram = LatencyHistogram()
+
+        assert histogram.percentile(50) == 0
+        assert histogram.mean() == 0.0
+        assert histogram.to_dict()["count"] == 0
+
+    def test_small_values_are_exact(self):
+        histogram = LatencyHistogram()
+        for value in range(1, 11):
+            histogram.record(value)
+
+        assert histogram.percentile(50) == 5
+        assert histogram.percentile(100) == 10
+        assert histogram.min == 1
+        assert histogram.mean() == 5.5
+
+    def test_percentiles_are_within_bucket_error(self):
+        histogram = LatencyHistogram()
+        for value in range(1, 100001):
+            histogram.record(value * 1000)
+
+        for percent in (50, 95, 99):
+            exact = percent * 1000 * 1000
+            assert exact <= histogram.percentile(percent) <= exact * 1.125
+
+    def test_merge_combines_samples(self):
+        first = LatencyHistogram()
+        second = LatencyHistogram()
+        first.record(10)
+        second.record(1000)
+        second.record(3)
+
+        first.merge(second)
+
+        assert first.count == 3
+        assert first.min == 3
+        assert first.max == 1000
+        assert first.total == 1013
+
+
+class TestSystemProfiler:
+    def test_profiler_is_disabled_by_default(self, world):
+        world.add_system(MovementSystem())
+        world.update(0.016)
+
+        stats = world.stats()
+
+        assert stats["enabled"] is False
+        assert stats["frames"] == 0
+        assert stats["systems"] == []
+
+    def test_profiled_update_records_systems_and_frames(self, world):
+        movement = MovementSystem()
+        counting = CountingSystem()
+        world.add_system(movement)
+        world.add_system(counting)
+
+        world.set_profiling(True)
+        for _ in range(3):
+            world.update(0.016)
+
+        stats = world.stats()
+
+        assert movement.update_count == 3
+        assert stats["frames"] == 3
+        assert stats["frame_ns"]["count"] == 3
+        assert [system["name"] for system in stats["systems"]] == [
+            "MovementSystem",
+            "CountingSystem",
+        ]
+        assert all(system["calls"] == 3 for system in stats["systems"])
+        assert set(stats["last_frame"]) == {"MovementSystem", "CountingSystem", "frame"}
+
+    def test_entities_processed_counts_required_components(self, world):
+        for i in range(4):
+            entity = world.create_entity()
+            world.add_component(entity, Position())
+            if i % 2:
+                world.add_component(entity, Velocity())
+
+        world.add_system(ParallelMovementSystem())
+        world.set_profiling(True)
+        world.update(0.016)
+        world.update(0.016)
+
+        assert world.stats()["systems"][0]["entities"] == 4
+
+    def test_disabling_keeps_samples(self, world):
+        world.add_system(MovementSystem())
+        world.set_profiling(True)
+        world.update(0.016)
+        world.set_profiling(False)
+        world.update(0.016)
+
+        assert world.stats()["frames"] == 1
+
+    def test_snapshot_is_json_serializable(self, world):
+        world.add_system(MovementSystem())
+        world.set_profiling(True)
+        world.update(0.016)
+
+        decoded = json.loads(json.dumps(world.stats()))
+
+        assert decoded["systems"][0]["wall_ns"]["count"] == 1
+        assert json.loads(world.system_manager.profiler.to_json()) == decoded
+
+    def test_frame_history_is_bounded(self):
+        profiler = SystemProfiler(enabled=True, frame_history=2)
+        for elapsed in (10, 20, 30):
+            profiler.record_system("id", "System", elapsed, 0)
+            profiler.record_frame(elapsed)
+
+        assert len(profiler.history) == 2
+        assert profiler.snapshot()["last_frame"] == {"System": 30, "frame": 30}
+
+    def test_reset_clears_samples(self, world):
+        world.add_system(MovementSystem())
+        world.set_profiling(True)
+        world.update(0.016)
+
+        world.system_manager.profiler.reset()
+
+        assert world.stats()["frames"] == 0
+        assert world.stats()["enabled"] is True
@@ -242,3 +242,143 @@ class TestQueryEdgeCases:
 
         assert len(result) == 100
         assert all(e in result for e in target_entities)
+
+
+class TestQueryEnabledMask:
+    def test_disabled_entities_are_skipped(self, world):
+        entity1 = world.create_entity()
+        entity2 = world.create_entity()
+        world.add_component(entity1, Position())
+        world.add_component(entity2, Position())
+
+        world.set_enabled(entity1, False)
+        result = Query().with_components(Position).execute(world)
+
+        assert result == [entity2]
+
+        world.set_enabled(entity1, True)
+        result = Query().with_components(Position).execute(world)
+
+        assert len(result) == 2
+
+    def test_disabled_flag_follows_archetype_moves(self, world):
+        entity = world.create_entity()
+        world.add_component(entity, Position())
+        world.set_enabled(entity, False)
+
+        world.add_component(entity, Velocity())
+
+        assert Query().with_components(Position).execute(world) == []
+
+
+class TestQueryCounters:
+    def test_execute_counts_scanned_and_matched_archetypes(self, world):
+        entity1 = world.create_entity()
+        entity2 = world.create_entity()
+        world.add_component(entity1, Position())
+        world.add_component(entity2, Position())
+        world.add_component(entity2, Velocity())
+        counters = world.component_storage.counters
+        counters.reset()
+
+        Query().with_components(Position).execute(world)
+        Query().with_components(Velocity).execute(world)
+
+        assert counters.queries == 2
+        assert counters.archetypes_scanned == 2 * len(world.component_storage.archetypes)
+        assert counters.archetypes_matched == 3
+        assert counters.rows_matched == 3
+
+
+class TestQueryCursor:
+    def _spawn(self, world, count, *types):
+        entities = []
+        for _ in range(count):
+            entity = world.create_entity()
+            for component_type in types:
+                world.add_component(entity, component_type())
+            entities.append(entity)
+        return entities
+
+    def _take(self, cursor, world, **limits):
+        return [entity for part in cursor.advance(world, **limits) for entity in part.entities()]
+
+    def test_max_rows_limits_each_call_and_resumes(self, world):
+        entities = self._spawn(world, 10, Position)
+        cursor = Query().with_components(Position).cursor()
+
+        first = self._take(cursor, world, max_rows=4)
+        second = self._take(cursor, world, max_rows=4)
+        third = self._take(cursor, world, max_rows=4)
+
+        assert [len(first), len(second), len(third)] == [4, 4, 2]
+        assert sorted(first + second + third) == sorted(entities)
+        assert cursor.sweeps == 1
+
+    def test_slices_stay_within_one_chunk(self):
+        from pyecs import ECSWorld
+
+        world = ECSWorld(chunk_capacity=4)
+        self._spawn(world, 10, Position)
+        cursor = Query().with_components(Position).cursor()
+
+        parts = list(cursor.advance(world))
+
+        assert [(part.start, part.stop) for part in parts] == [(0, 2), (0, 4), (0, 4)]
+
+    def test_next_call_starts_a_new_sweep(self, world):
+        entities = self._spawn(world, 3, Position)
+        cursor = Query().with_components(Position).cursor()
+
+        assert sorted(self._take(cursor, world)) == sorted(entities)
+        assert sorted(self._take(cursor, world)) == sorted(entities)
+        assert cursor.sweeps == 2
+
+    def test_swap_removes_do_not_skip_unvisited_rows(self, world):
+        entities = self._spawn(world, 10, Position)
+        cursor = Query().with_components(Position).cursor()
+
+        seen = self._take(cursor, world, max_rows=3)
+        removed = [entities[0], entities[1], seen[0]]
+        for entity in removed:
+            world.destroy_entity(entity)
+        while cursor.sweeps == 0:
+            seen += self._take(cursor, world, max_rows=3)
+
+        assert set(entities) - set(removed) <= set(seen)
+
+    def test_archetypes_created_mid_sweep_are_included(self, world):
+        self._spawn(world, 4, Position)
+        cursor = Query().with_components(Position).cursor()
+        seen = self._take(cursor, world, max_rows=2)
+
+        late = self._spawn(world, 2, Position, Health)
+        while cursor.sweeps == 0:
+            seen += self._take(cursor, world, max_rows=2)
+
+        assert set(late) <= set(seen)
+
+    def test_excluded_types_and_disabled_rows_are_skipped(self, world):
+        kept = self._spawn(world, 2, Position)
+        self._spawn(world, 2, Position, Health)
+        world.set_enabled(kept[1], False)
+        cursor = Query().with_components(Position).without_components(Health).cursor()
+
+        assert self._take(cursor, world) == [kept[0]]
+
+    def test_time_limit_still_makes_progress(self):
+        from pyecs import ECSWorld
+
+        world = ECSWorld(chunk_capacity=2)
+        self._spawn(world, 6, Position)
+        cursor = Query().with_components(Position).cursor()
+
+        assert len(list(cursor.advance(world, max_time=0))) == 1
+        assert len(list(cursor.advance(world, max_time=0))) == 1
+
+    def test_fork_starts_the_sweep_over(self, world):
+        entities = self._spawn(world, 4, Position)
+        cursor = Query().with_components(Position).cursor()
+        self._take(cursor, world, max_rows=2)
+
+        assert sorted(self._take(cursor, world.fork())) == sorted(entities)
@@ -0,0 +1,154 @@
+from dataclasses import FrozenInstanceError
+
+import pytest
+from pyecs import ChildOf, Query, Relationship
+from pyecs.containers.RelationshipIndex import RelationshipIndex
+
+from .conftest import Health, Position
+
+
+class Targets(Relationship):
+    pass
+
+
+class TestRelationshipIndex:
+    def test_link_indexes_both_directions(self):
+        index = RelationshipIndex()
+        index.link("a", ChildOf("p"))
+        index.link("b", ChildOf("p"))
+
+        assert index.sources_of(ChildOf, "p") == ["a", "b"]
+        assert index.target_of("a", ChildOf) == "p"
+        assert index.sources_of(Targets, "p") == []
+
+    def test_relinking_moves_the_source(self):
+        index = RelationshipIndex()
+        index.link("a", ChildOf("p"))
+        index.link("a", ChildOf("q"))
+
+        assert index.sources_of(ChildOf, "p") == []
+        assert index.sources_of(ChildOf, "q") == ["a"]
+        assert "p" not in index.sources[ChildOf]
+
+    def test_unlink_all_only_drops_relationship_types(self):
+        index = RelationshipIndex()
+        index.link("a", ChildOf("p"))
+
+        index.unlink_all("a", [Position, ChildOf])
+
+        assert index.target_of("a", ChildOf) is None
+        assert index.relations_to("p") == []
+
+    def test_relationships_are_frozen(self):
+        with pytest.raises(FrozenInstanceError):
+            ChildOf("p").target = "q"
+
+
+class TestWorldRelationships:
+    def test_children_are_looked_up_from_the_index(self, world):
+        parent = world.create_entity()
+        children = [world.create_entity() for _ in range(3)]
+        for child in children:
+            world.add_component(child, ChildOf(parent))
+
+        assert world.children_of(parent) == children
+        assert world.parent_of(children[0]) == parent
+        assert world.parent_of(parent) is None
+
+    def test_reparenting_and_removal(self, world):
+        first, second, child = (world.create_entity() for _ in range(3))
+        world.add_component(child, Position())
+        world.add_component(child, ChildOf(first))
+
+        world.add_component(child, ChildOf(second))
+
+        assert world.children_of(first) == []
+        assert world.children_of(second) == [child]
+
+        world.remove_component(child, ChildOf)
+
+        assert world.children_of(second) == []
+
+    def test_dead_targets_are_rejected(self, world):
+        parent, child = world.create_entity(), world.create_entity()
+        world.destroy_entity(parent)
+
+        world.add_component(child, ChildOf(parent))
+
+        assert not world.component_storage.has_component(child, ChildOf)
+
+    def test_destroy_cascades_down_the_hierarchy(self, world):
+        root = world.create_entity()
+        child = world.create_entity()
+        grandchild = world.create_entity()
+        sibling = world.create_entity()
+        world.add_component(child, ChildOf(root))
+        world.add_component(grandchild, ChildOf(child))
+        world.add_component(sibling, Position())
+
+        world.destroy_entity(root)
+
+        for entity in (root, child, grandchild):
+            assert not world.entity_manager.is_alive(entity)
+            assert entity not in world.component_storage.entity_to_archetype
+        assert world.entity_manager.is_alive(sibling)
+        assert world.component_storage.relationships.relations_to(root) == []
+
+    def test_destroy_survives_cycles(self, world):
+        first, second = world.create_entity(), world.create_entity()
+        world.add_component(first, ChildOf(second))
+        world.add_component(second, ChildOf(first))
+
+        world.destroy_entity(first)
+
+        assert not world.entity_manager.is_alive(second)
+
+    def test_non_cascading_relationships_are_removed(self, world):
+        enemy, hunter = world.create_entity(), world.create_entity()
+        world.add_component(hunter, Position())
+        world.add_component(hunter, Targets(enemy))
+
+        world.destroy_entity(enemy)
+
+        assert world.entity_manager.is_alive(hunter)
+        assert not world.component_storage.has_component(hunter, Targets)
+
+    def test_fork_has_its_own_index(self, world):
+        parent, child = world.create_entity(), world.create_entity()
+        world.add_component(child, ChildOf(parent))
+        forked = world.fork()
+
+        forked.remove_component(child, ChildOf)
+
+        assert world.children_of(parent) == [child]
+        assert forked.children_of(parent) == []
+
+
+class TestRelationshipQueries:
+    def test_query_filters_by_target(self, world):
+        first, second = world.create_entity(), world.create_entity()
+        armed = world.create_entity()
+        world.add_component(armed, ChildOf(first))
+        world.add_component(armed, Health())
+        unarmed = world.create_entity()
+        world.add_component(unarmed, ChildOf(first))
+        world.add_component(world.create_entity(), ChildOf(second))
+
+        assert Query().with_relation(ChildOf, first).execute(world) == [armed, unarmed]
+        assert Query().with_relation(ChildOf, first).with_components(Health).execute(world) == [
+            armed
+        ]
+        assert Query().with_relation(ChildOf, first).without_components(Health).execute(world) == [
+            unarmed
+        ]
+
+    def test_query_skips_disabled_entities(self, world):
+        parent, child = world.create_entity(), world.create_entity()
+        world.add_component(child, ChildOf(parent))
+        world.set_enabled(child, False)
+
+        assert Query().with_relation(ChildOf, parent).execute(world) == []
+
+    def test_cursor_rejects_relationship_filters(self):
+        with pytest.raises(ValueError):
+            Query().with_relation(ChildOf, "p").cursor()
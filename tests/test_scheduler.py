@@ -0,0 +1,124 @@
+import pytest
+
+from pyecs.processing.FrameBudget import FrameBudget, system_priority
+from pyecs.processing.Scheduler import FixedStepScheduler
+
+
+class TestFixedStepScheduler:
+    def test_accumulates_partial_steps(self):
+        scheduler = FixedStepScheduler(tick_rate=10)
+
+        assert scheduler.advance(0.05) == 0
+        assert scheduler.advance(0.05) == 1
+        assert scheduler.accumulator == pytest.approx(0.0)
+
+    def test_whole_frames_at_tick_rate_take_one_step(self):
+        scheduler = FixedStepScheduler(tick_rate=60)
+
+        steps = [scheduler.advance(1 / 60) for _ in range(600)]
+
+        assert steps == [1] * 600
+        assert scheduler.ticks == 600
+
+    def test_catch_up_is_capped_and_surplus_dropped(self):
+        scheduler = FixedStepScheduler(tick_rate=10, max_steps=3)
+
+        assert scheduler.advance(1.05) == 3
+        assert scheduler.dropped_steps == 7
+        assert scheduler.alpha == pytest.approx(0.5)
+        assert scheduler.advance(0.05) == 1
+
+    def test_alpha_is_fraction_of_a_step(self):
+        scheduler = FixedStepScheduler(tick_rate=4)
+
+        scheduler.advance(0.375)
+
+        assert scheduler.alpha == pytest.approx(0.5)
+
+    def test_invalid_arguments_raise(self):
+        with pytest.raises(ValueError):
+            FixedStepScheduler(tick_rate=0)
+        with pytest.raises(ValueError):
+            FixedStepScheduler().advance(-1)
+
+    def test_fork_keeps_accumulated_time(self):
+        scheduler = FixedStepScheduler(tick_rate=10)
+        scheduler.advance(0.05)
+
+        forked = scheduler.fork()
+
+        assert forked.advance(0.05) == 1
+        assert scheduler.accumulator == pytest.approx(0.05)
+
+
+class TestFrameBudget:
+    def _overrun(self, budget):
+        budget.frame_start -= 1_000_000_000
+
+    def test_admits_within_budget(self):
+        budget = FrameBudget(1.0)
+        budget.start_frame()
+
+        assert budget.admit("ai", 0.1) == 0.1
+        assert budget.deferrals == 0
+
+    def test_defers_over_budget_and_owes_dt(self):
+        budget = FrameBudget(0.01)
+        budget.start_frame()
+        self._overrun(budget)
+
+        assert budget.admit("ai", 0.1) is None
+        assert budget.admit("ai", 0.1) is None
+
+        budget.start_frame()
+        assert budget.admit("ai", 0.1) == pytest.approx(0.3)
+        assert budget.deferrals == 2
+
+    def test_expected_cost_counts_against_budget(self):
+        budget = FrameBudget(0.01)
+        budget.record("ai", 50_000_000)
+        budget.start_frame()
+
+        assert budget.admit("ai", 0.1) is None
+
+    def test_deferral_is_bounded(self):
+        budget = FrameBudget(0.01, max_deferred=2)
+        budget.start_frame()
+        self._overrun(budget)
+
+        admitted = [budget.admit("ai", 0.1) for _ in range(3)]
+
+        assert admitted[:2] == [None, None]
+        assert admitted[2] == pytest.approx(0.3)
+
+    def test_cost_is_a_moving_average(self):
+        budget = FrameBudget(0.01)
+        budget.record("ai", 100)
+        budget.record("ai", 500)
+
+        assert budget.costs["ai"] == pytest.approx(200)
+
+    def test_end_frame_counts_overruns(self):
+        budget = FrameBudget(0.01)
+        budget.start_frame()
+        budget.end_frame()
+        budget.start_frame()
+        self._overrun(budget)
+        budget.end_frame()
+
+        assert budget.snapshot()["frames"] == 2
+        assert budget.snapshot()["overruns"] == 1
+
+    def test_system_priority_defaults_to_zero(self):
+        class Plain:
+            pass
+
+        class Cosmetic:
+            priority = -2
+
+        assert system_priority(Plain()) == 0
+        assert system_priority(Cosmetic()) == -2
+
+    def test_rejects_non_positive_budget(self):
+        with pytest.raises(ValueError):
+            FrameBudget(0)
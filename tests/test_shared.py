@@ -0,0 +1,145 @@
+import struct
+
+import pytest
+from pyecs.exceptions import OperationFailedError
+from pyecs.exporting.Export import ArchetypeExport
+from pyecs.exporting.Shared import HEADER_FORMAT, SharedWorldReader, SharedWorldWriter
+
+from .conftest import Health, Position, Velocity
+
+
+class TestSharedWorldWriter:
+    def test_reader_sees_nothing_before_first_publish(self):
+        with SharedWorldWriter() as writer, SharedWorldReader(writer.name) as reader:
+            frame = reader.read()
+
+            assert frame.sequence == 0
+            assert frame.archetypes == []
+
+    def test_publish_advances_sequence_by_two(self, world, entity_with_components):
+        with SharedWorldWriter() as writer:
+            first = writer.publish(world.export_columns(Position))
+            second = writer.publish(world.export_columns(Position))
+
+            assert first == 2
+            assert second == 4
+
+    def test_invalid_entity_id_leaves_sequence_even(self, world, entity_with_components):
+        with SharedWorldWriter() as writer, SharedWorldReader(writer.name) as reader:
+            writer.publish(world.export_columns(Position))
+            export = world.export_columns(Position)[0]
+
+            with pytest.raises(OperationFailedError):
+                writer.publish([ArchetypeExport(["é" * 36], export.columns)])
+            with pytest.raises(OperationFailedError):
+                writer.publish([ArchetypeExport([*export.entities] * 2, export.columns)])
+
+            assert reader.read(timeout=1.0).sequence == 2
+            assert writer.publish(world.export_columns(Position)) == 4
+
+
+class TestSharedWorldReader:
+    def test_reader_sees_published_columns(self, world):
+        entities = []
+        for i in range(4):
+            entity = world.create_entity()
+            world.add_component(entity, Position(i, 0, 0))
+            world.add_component(entity, Health(i, 100))
+            entities.append(entity)
+
+        with SharedWorldWriter() as writer:
+            writer.publish(world.export_columns(Position, Health))
+
+            with SharedWorldReader(writer.name) as reader:
+                frame = reader.read()
+                archetype = frame.archetypes[0]
+
+                assert frame.valid()
+                assert list(archetype.entities) == entities
+                assert archetype.column(Position, "x").tolist() == [0.0, 1.0, 2.0, 3.0]
+                assert archetype.column(Health, "current").tolist() == [0, 1, 2, 3]
+
+                del archetype, frame
+
+    def test_frame_stays_valid_for_one_more_publish(self, world, entity_with_components):
+        with SharedWorldWriter() as writer, SharedWorldReader(writer.name) as reader:
+            writer.publish(world.export_columns(Position))
+            frame = reader.read()
+
+            writer.publish(world.export_columns(Position))
+            assert frame.valid()
+
+            writer.publish(world.export_columns(Position))
+            assert not frame.valid()
+
+            del frame
+
+    def test_malformed_layout_is_rejected(self):
+        with SharedWorldWriter() as writer, SharedWorldReader(writer.name) as reader:
+            layout = b'{"segment": 1, "archetypes": []}'
+            offset = struct.calcsize(HEADER_FORMAT)
+            writer.header.buf[offset : offset + len(layout)] = layout
+            struct.pack_into(HEADER_FORMAT, writer.header.buf, 0, 2, len(layout))
+
+            with pytest.raises(OperationFailedError):
+                reader.read()
+
+    def test_reader_follows_segment_growth(self, world):
+        with SharedWorldWriter() as writer, SharedWorldReader(writer.name) as reader:
+            writer.publish(world.export_columns(Position))
+
+            for i in range(1000):
+                entity = world.create_entity()
+                world.add_component(entity, Position(i, 0, 0))
+
+            writer.publish(world.export_columns(Position))
+            frame = reader.read()
+
+            assert len(frame.archetypes[0].entities) == 1000
+            assert frame.archetypes[0].column(Position, "x")[999] == 999.0
+
+            del frame
+
+    def test_reader_closes_segments_the_writer_replaced(self, world):
+        with SharedWorldWriter() as writer, SharedWorldReader(writer.name) as reader:
+            for size in (1, 200, 2000, 20000):
+                for i in range(size - len(world.entity_manager.alive_entities)):
+                    entity = world.create_entity()
+                    world.add_component(entity, Position(i, 0, 0))
+
+                writer.publish(world.export_columns(Position))
+                frame = reader.read()
+                del frame
+
+            assert len(reader._segments) == 2
+            assert not reader._stale
+
+
+class TestWorldSharing:
+    def test_update_publishes_new_frame(self, world, entity_with_components):
+        writer = world.share_columns(Position, Velocity)
+
+        try:
+            with SharedWorldReader(writer.name) as reader:
+                assert reader.read().sequence == 2
+
+                world.get_component(entity_with_components, Position).x = 8.0
+                world.update(0.016)
+
+                frame = reader.read()
+                assert frame.sequence == 4
+                assert frame.archetypes[0].column(Position, "x").tolist() == [8.0]
+
+                del frame
+        finally:
+            world.stop_sharing()
+
+        assert world.shared_writer is None
+
+    def test_fork_is_not_shared(self, world):
+        world.share_columns(Position)
+
+        try:
+            assert world.fork().shared_writer is None
+        finally:
+            world.stop_sharing()
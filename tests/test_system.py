@@ -1,7 +1,13 @@
+import asyncio
+
+import pytest
+
 from pyecs import ECSWorld
+from pyecs.exceptions import OperationFailedError, SystemOrderError
+from pyecs.processing.Parallel import RowChunk, partition_rows
 from pyecs.processing.System import System
 
-from .conftest import Position, Velocity
+from .conftest import Health, Position, Velocity
 
 
 class MovementSystem(System):
@@ -50,6 +56,49 @@ class CountingSystem(System):
         self.entity_count = len(entities)
 
 
+class ParallelMovementSystem:
+    process_parallel = True
+
+    def __init__(self, chunk_size: int = 4096):
+        self.chunk_size = chunk_size
+        self.update_called = False
+
+    @property
+    def required_components(self) -> set[type]:
+        return {Position, Velocity}
+
+    @staticmethod
+    def kernel(chunk: RowChunk, dt: float) -> dict[type, list]:
+        positions = [
+            Position(pos.x + vel.dx * dt, pos.y + vel.dy * dt, pos.z + vel.dz * dt)
+            for pos, vel in zip(chunk.columns[Position], chunk.columns[Velocity], strict=True)
+        ]
+        return {Position: positions}
+
+    def init(self, world: ECSWorld):
+        pass
+
+    def update(self, world: ECSWorld, dt: float):
+        self.update_called = True
+
+    def cleanup(self, world: ECSWorld):
+        pass
+
+
+class MutatingParallelSystem(ParallelMovementSystem):
+    @staticmethod
+    def kernel(chunk: RowChunk, dt: float) -> dict[type, list]:
+        for position in chunk.columns[Position]:
+            position.x = -1
+        return {}
+
+
+class ShortParallelSystem(ParallelMovementSystem):
+    @staticmethod
+    def kernel(chunk: RowChunk, dt: float) -> dict[type, list]:
+        return {Position: chunk.columns[Position][1:]}
+
+
 class TestSystemLifecycle:
     def test_system_init_called_on_add(self, world):
         system = MovementSystem()
@@ -250,3 +299,520 @@ class TestSystemEdgeCases:
         assert abs(pos.x - 1.0) < 0.001
         assert abs(pos.y - 1.0) < 0.001
         assert abs(pos.z - 1.0) < 0.001
+
+
+class TestProcessParallelSystems:
+    def _populate(self, world, count):
+        entities = []
+        for i in range(count):
+            entity = world.create_entity()
+            world.add_component(entity, Position(i, 0, 0))
+            world.add_component(entity, Velocity(1, 2, 3))
+            entities.append(entity)
+        return entities
+
+    def test_single_chunk_runs_kernel_in_process(self, world):
+        system = ParallelMovementSystem()
+        world.add_system(system)
+        entities = self._populate(world, 10)
+
+        world.update(1.0)
+
+        assert not system.update_called
+        assert world.system_manager._process_pool is None
+        for i, entity in enumerate(entities):
+            pos = world.get_component(entity, Position)
+            assert (pos.x, pos.y, pos.z) == (i + 1, 2, 3)
+
+    def test_chunks_run_in_process_pool_and_merge_back(self, world):
+        world.system_manager.process_start_method = "spawn"
+        world.add_system(ParallelMovementSystem(chunk_size=8))
+        entities = self._populate(world, 50)
+        still = world.create_entity()
+        world.add_component(still, Position(7, 7, 7))
+
+        try:
+            world.update(0.5)
+        finally:
+            world.system_manager.shutdown_process_pool()
+
+        for i, entity in enumerate(entities):
+            pos = world.get_component(entity, Position)
+            assert (pos.x, pos.y, pos.z) == (i + 0.5, 1.0, 1.5)
+        assert world.get_component(still, Position).x == 7
+
+    def test_parallel_writes_do_not_leak_into_fork(self, world):
+        world.add_system(ParallelMovementSystem())
+        entity = self._populate(world, 1)[0]
+        forked = world.fork()
+
+        forked.update(1.0)
+
+        assert forked.get_component(entity, Position).x == 1
+        assert world.get_component(entity, Position).x == 0
+
+    def test_disabled_rows_are_not_processed(self, world):
+        world.add_system(ParallelMovementSystem())
+        entities = self._populate(world, 4)
+        world.set_enabled(entities[3], False)
+
+        world.update(1.0)
+
+        assert [world.get_component(entity, Position).x for entity in entities] == [1, 2, 3, 3]
+
+    def test_partitions_follow_runs_of_enabled_rows(self, world):
+        entities = self._populate(world, 6)
+        world.set_enabled(entities[2], False)
+        archetype = world.component_storage.archetypes[frozenset({Position, Velocity})]
+
+        chunks = list(partition_rows(archetype, frozenset({Position}), 3))
+
+        assert [(start, chunk.entities) for start, chunk in chunks] == [
+            (0, entities[0:2]),
+            (3, entities[3:6]),
+        ]
+
+    def test_kernels_in_process_get_copies(self, world):
+        world.add_system(MutatingParallelSystem())
+        entity = self._populate(world, 1)[0]
+
+        world.update(1.0)
+
+        assert world.get_component(entity, Position).x == 0
+
+    def test_kernel_results_of_the_wrong_length_raise(self, world):
+        world.add_system(ShortParallelSystem())
+        entities = self._populate(world, 3)
+
+        with pytest.raises(OperationFailedError):
+            world.update(1.0)
+        assert [world.get_component(entity, Position).x for entity in entities] == [0, 1, 2]
+
+
+class ScheduledSystem(System):
+    def __init__(self, tick_interval=None, time_interval=None, run_if=None):
+        self.tick_interval = tick_interval
+        self.time_interval = time_interval
+        if run_if is not None:
+            self.run_if = run_if
+        self.calls: list[float] = []
+
+    @property
+    def required_components(self) -> set[type]:
+        return set()
+
+    def init(self, world: ECSWorld):
+        pass
+
+    def update(self, world: ECSWorld, dt: float):
+        self.calls.append(dt)
+
+    def cleanup(self, world: ECSWorld):
+        pass
+
+
+class TestSystemSchedules:
+    def test_unscheduled_systems_have_no_schedule(self, world):
+        world.add_system(CountingSystem())
+
+        assert world.system_manager.schedules == {}
+
+    def test_tick_interval_runs_every_nth_update_with_accumulated_dt(self, world):
+        system = ScheduledSystem(tick_interval=3)
+        world.add_system(system)
+
+        for _ in range(9):
+            world.update(0.5)
+
+        assert system.calls == [1.5, 1.5, 1.5]
+
+    def test_time_interval_waits_for_elapsed_time(self, world):
+        system = ScheduledSystem(time_interval=1.0)
+        world.add_system(system)
+
+        for _ in range(10):
+            world.update(0.25)
+
+        assert system.calls == [1.0, 1.0]
+
+    def test_run_condition_is_evaluated_with_the_world(self, world):
+        seen = []
+        system = ScheduledSystem(run_if=lambda w: seen.append(w) or len(seen) % 2 == 0)
+        world.add_system(system)
+
+        for _ in range(4):
+            world.update(0.1)
+
+        assert seen == [world] * 4
+        assert len(system.calls) == 2
+        assert system.calls[0] == pytest.approx(0.2)
+
+    def test_interval_systems_are_staggered(self, world):
+        systems = [ScheduledSystem(tick_interval=4) for _ in range(4)]
+        for system in systems:
+            world.add_system(system)
+
+        runs_per_frame = []
+        for _ in range(8):
+            before = sum(len(system.calls) for system in systems)
+            world.update(0.1)
+            runs_per_frame.append(sum(len(system.calls) for system in systems) - before)
+
+        assert runs_per_frame == [1] * 8
+
+    def test_staggered_time_intervals_receive_real_elapsed_time(self, world):
+        systems = [ScheduledSystem(time_interval=1.0) for _ in range(3)]
+        for system in systems:
+            world.add_system(system)
+
+        for _ in range(8):
+            world.update(0.25)
+
+        assert [system.calls[0] for system in systems] == [1.0, 0.5, 1.0]
+        assert all(sum(system.calls) <= 2.0 for system in systems)
+        assert world.system_manager.schedules[systems[1]].head_start == 0.0
+
+    def test_tick_interval_below_one_is_rejected(self, world):
+        with pytest.raises(ValueError):
+            world.add_system(ScheduledSystem(tick_interval=0))
+        assert not world.system_manager.systems
+
+    def test_removed_system_drops_its_schedule(self, world):
+        system = ScheduledSystem(tick_interval=2)
+        world.add_system(system)
+        world.remove_system(system)
+
+        assert world.system_manager.schedules == {}
+
+    def test_fork_copies_schedule_progress(self, world):
+        system = ScheduledSystem(tick_interval=2)
+        world.add_system(system)
+        world.update(0.1)
+
+        forked = world.fork()
+        forked.update(0.1)
+
+        assert len(system.calls) == 1
+        assert world.system_manager.schedules[system].calls == 1
+
+
+class OrderedSystem(System):
+    def __init__(self, log: list, name: str, stage=None, before=(), after=()):
+        self.log = log
+        self.name = name
+        self.stage = stage
+        self.before = before
+        self.after = after
+
+    @property
+    def required_components(self) -> set[type]:
+        return set()
+
+    def init(self, world: ECSWorld):
+        pass
+
+    def update(self, world: ECSWorld, dt: float):
+        self.log.append(self.name)
+
+    def cleanup(self, world: ECSWorld):
+        pass
+
+
+class PhysicsSystem(OrderedSystem):
+    pass
+
+
+class TestSystemOrdering:
+    def test_unconstrained_systems_keep_registration_order(self, world):
+        log = []
+        for name in "abc":
+            world.add_system(OrderedSystem(log, name))
+
+        world.update(0.1)
+
+        assert log == ["a", "b", "c"]
+
+    def test_stages_run_in_order(self, world):
+        log = []
+        world.add_system(OrderedSystem(log, "late", stage="post_update"))
+        world.add_system(OrderedSystem(log, "main"))
+        world.add_system(OrderedSystem(log, "early", stage="pre_update"))
+
+        world.update(0.1)
+
+        assert log == ["early", "main", "late"]
+        stages = [stage for stage, _ in world.system_manager.execution_plan()]
+        assert stages == ["pre_update", "update", "post_update"]
+
+    def test_before_and_after_accept_instances_and_classes(self, world):
+        log = []
+        render = OrderedSystem(log, "render", after=(PhysicsSystem,))
+        world.add_system(render)
+        world.add_system(OrderedSystem(log, "input", before=(render,)))
+        world.add_system(PhysicsSystem(log, "physics"))
+
+        world.update(0.1)
+
+        assert log == ["input", "physics", "render"]
+
+    def test_plan_is_cached_until_systems_change(self, world):
+        log = []
+        world.add_system(OrderedSystem(log, "a"))
+        plan = world.system_manager.execution_plan()
+
+        world.update(0.1)
+        assert world.system_manager.execution_plan() is plan
+
+        world.add_system(OrderedSystem(log, "b"))
+        assert world.system_manager.execution_plan() is not plan
+
+    def test_execution_order_cannot_change_the_plan(self, world):
+        log = []
+        world.add_system(OrderedSystem(log, "a"))
+        world.add_system(OrderedSystem(log, "b"))
+        forked = world.fork()
+
+        order = world.system_manager.execution_order()
+
+        assert isinstance(order, tuple)
+        assert world.system_manager.systems == order
+        assert forked.system_manager.execution_order() == order
+
+    def test_cycles_raise(self, world):
+        log = []
+        first = OrderedSystem(log, "first")
+        second = OrderedSystem(log, "second", before=(first,))
+        first.before = (second,)
+        world.add_system(first)
+        world.add_system(second)
+
+        with pytest.raises(SystemOrderError):
+            world.update(0.1)
+
+    def test_relations_against_stage_order_raise(self, world):
+        log = []
+        late = OrderedSystem(log, "late", stage="post_update")
+        world.add_system(late)
+        world.add_system(OrderedSystem(log, "early", stage="pre_update", after=(late,)))
+
+        with pytest.raises(SystemOrderError):
+            world.system_manager.execution_plan()
+
+    def test_unknown_stage_raises(self, world):
+        world.add_system(OrderedSystem([], "odd", stage="render"))
+
+        with pytest.raises(SystemOrderError):
+            world.update(0.1)
+
+    def test_removal_rebuilds_plan(self, world):
+        log = []
+        first = OrderedSystem(log, "first")
+        world.add_system(first)
+        world.add_system(OrderedSystem(log, "second", after=(first,)))
+        world.remove_system(first)
+
+        world.update(0.1)
+
+        assert log == ["second"]
+
+
+class ArchetypeSystem(System):
+    def __init__(self):
+        self.seen: list[list] = []
+
+    @property
+    def required_components(self) -> set[type]:
+        return {Position}
+
+    def init(self, world: ECSWorld):
+        pass
+
+    def update(self, world: ECSWorld, dt: float, archetypes=None):
+        self.seen.append(archetypes)
+        for archetype in archetypes:
+            for chunk in archetype.chunks:
+                for position in chunk.column(Position):
+                    position.x += dt
+
+    def cleanup(self, world: ECSWorld):
+        pass
+
+
+class TestCachedQueries:
+    def _spawn(self, world, *components):
+        entity = world.create_entity()
+        for component in components:
+            world.add_component(entity, component)
+        return entity
+
+    def test_required_components_become_a_cached_query(self, world):
+        system = ArchetypeSystem()
+        world.add_system(system)
+
+        assert world.system_manager.queries[system].with_types == frozenset({Position})
+        assert system in world.system_manager.archetype_systems
+
+    def test_systems_without_requirements_get_no_query(self, world):
+        system = CountingSystem()
+        world.add_system(system)
+        world.update(0.1)
+
+        assert world.system_manager.queries == {}
+
+    def test_archetypes_are_passed_to_systems_that_take_them(self, world):
+        system = ArchetypeSystem()
+        world.add_system(system)
+        moving = self._spawn(world, Position(), Velocity())
+        still = self._spawn(world, Position())
+        self._spawn(world, Health())
+
+        world.update(1.0)
+
+        assert len(system.seen[0]) == 2
+        assert world.get_component(moving, Position).x == 1
+        assert world.get_component(still, Position).x == 1
+
+    def test_cache_only_scans_new_archetypes(self, world):
+        system = ArchetypeSystem()
+        world.add_system(system)
+        self._spawn(world, Position())
+        world.update(0.1)
+        query = world.system_manager.queries[system]
+        scanned = query.scanned
+
+        world.update(0.1)
+        assert query.scanned == scanned
+
+        self._spawn(world, Position(), Health())
+        world.update(0.1)
+
+        assert query.scanned > scanned
+        assert len(system.seen[-1]) == 2
+        assert system.seen[0] is system.seen[-1]
+
+    def test_cached_entities_skip_disabled_rows(self, world):
+        system = ArchetypeSystem()
+        world.add_system(system)
+        enabled = self._spawn(world, Position())
+        disabled = self._spawn(world, Position())
+        world.set_enabled(disabled, False)
+        world.update(0.1)
+
+        assert world.system_manager.queries[system].entities() == [enabled]
+
+    def test_removed_system_drops_its_query(self, world):
+        system = ArchetypeSystem()
+        world.add_system(system)
+        world.remove_system(system)
+
+        assert world.system_manager.queries == {}
+        assert world.system_manager.archetype_systems == set()
+
+    def test_fork_rebuilds_queries_against_its_own_storage(self, world):
+        system = ArchetypeSystem()
+        world.add_system(system)
+        entity = self._spawn(world, Position())
+        world.update(1.0)
+
+        forked = world.fork()
+        forked.update(1.0)
+
+        assert forked.get_component(entity, Position).x == 2
+        assert world.get_component(entity, Position).x == 1
+        assert forked.system_manager.queries[system].storage is forked.component_storage
+        assert world.system_manager.queries[system].storage is world.component_storage
+
+
+class AsyncSystem(System):
+    def __init__(self, log: list, name: str, wait_for=None, release=None, after=()):
+        self.log = log
+        self.name = name
+        self.wait_for = wait_for
+        self.release = release
+        self.after = after
+
+    @property
+    def required_components(self) -> set[type]:
+        return set()
+
+    def init(self, world: ECSWorld):
+        pass
+
+    async def update(self, world: ECSWorld, dt: float):
+        self.log.append(f"{self.name} start")
+        if self.release is not None:
+            self.release.set()
+        if self.wait_for is not None:
+            await asyncio.wait_for(self.wait_for.wait(), 1.0)
+        await asyncio.sleep(0)
+        self.log.append(f"{self.name} end")
+
+    def cleanup(self, world: ECSWorld):
+        pass
+
+
+class TestAsyncSystems:
+    def test_async_systems_are_detected(self, world):
+        system = AsyncSystem([], "io")
+        world.add_system(system)
+        world.add_system(CountingSystem())
+
+        assert world.system_manager.async_systems == {system}
+
+    def test_independent_async_systems_run_concurrently(self, world):
+        async def run():
+            log = []
+            ready = asyncio.Event()
+            world.add_system(AsyncSystem(log, "waiter", wait_for=ready))
+            world.add_system(AsyncSystem(log, "releaser", release=ready))
+            await world.update_async(0.1)
+            return log
+
+        log = asyncio.run(run())
+
+        assert log[:2] == ["waiter start", "releaser start"]
+        assert sorted(log[2:]) == ["releaser end", "waiter end"]
+
+    def test_ordered_async_systems_do_not_overlap(self, world):
+        log = []
+        first = AsyncSystem(log, "first")
+        world.add_system(first)
+        world.add_system(AsyncSystem(log, "second", after=(first,)))
+
+        asyncio.run(world.update_async(0.1))
+
+        assert log == ["first start", "first end", "second start", "second end"]
+        assert [len(batch) for _, batch in world.system_manager.execution_batches()] == [1, 1]
+
+    def test_sync_systems_separate_async_batches(self, world):
+        log = []
+        world.add_system(AsyncSystem(log, "a"))
+        world.add_system(OrderedSystem(log, "sync"))
+        world.add_system(AsyncSystem(log, "b"))
+
+        asyncio.run(world.update_async(0.1))
+
+        assert log == ["a start", "a end", "sync", "b start", "b end"]
+        assert [concurrent for concurrent, _ in world.system_manager.execution_batches()] == [
+            True,
+            False,
+            True,
+        ]
+
+    def test_update_async_closes_the_frame(self, world):
+        world.add_system(AsyncSystem([], "io"))
+        world.set_profiling(True)
+
+        asyncio.run(world.update_async(0.1))
+
+        assert world.component_storage.counters.ticks == 1
+        assert world.stats()["frames"] == 1
+        assert world.stats()["systems"][0]["name"] == "AsyncSystem"
+
+    def test_sync_update_runs_async_systems_to_completion(self, world):
+        log = []
+        world.add_system(AsyncSystem(log, "io"))
+
+        world.update(0.1)
+
+        assert log == ["io start", "io end"]
@@ -0,0 +1,141 @@
+import io
+
+import pytest
+
+from pyecs.common.Relationship import ChildOf, Relationship
+from pyecs.profiling.Trace import TraceOp, TraceRecorder, read_trace
+from pyecs.querying.Query import Query
+
+from .conftest import Health, Name, Position, Velocity
+
+
+def _records(stream: io.BytesIO) -> list[tuple[TraceOp, tuple]]:
+    stream.seek(0)
+    return list(read_trace(stream))
+
+
+class TestTraceRecorder:
+    def test_records_round_trip(self):
+        stream = io.BytesIO()
+        recorder = TraceRecorder(stream)
+        recorder.record_create("a")
+        recorder.record_add("a", Position(1.0, 2.0, 3.0))
+        recorder.record_get("a", (Position, Velocity))
+        recorder.record_query((Position,), (Velocity,))
+        recorder.record_enabled("a", False)
+        recorder.record_remove("a", Position)
+        recorder.record_update(0.5)
+        recorder.record_destroy("a")
+
+        records = _records(stream)
+
+        assert [op for op, _ in records] == [
+            TraceOp.CREATE,
+            TraceOp.ADD,
+            TraceOp.GET,
+            TraceOp.QUERY,
+            TraceOp.ENABLE,
+            TraceOp.REMOVE,
+            TraceOp.UPDATE,
+            TraceOp.DESTROY,
+        ]
+        assert recorder.operations == 8
+        _, (entity, component) = records[1]
+        assert entity == 0
+        assert type(component).__name__ == "Position"
+        assert (component.x, component.y, component.z) == (1.0, 2.0, 3.0)
+        assert records[6][1] == (0.5,)
+
+    def test_recorded_types_share_one_stand_in(self):
+        stream = io.BytesIO()
+        recorder = TraceRecorder(stream)
+        recorder.record_remove("a", Health)
+        recorder.record_add("a", Health(5, 10))
+        recorder.record_add("b", Health(7, 10))
+
+        records = _records(stream)
+
+        stand_in = records[0][1][1]
+        assert type(records[1][1][1]) is stand_in
+        assert type(records[2][1][1]) is stand_in
+        assert records[2][1][1].current == 7
+
+    def test_relationship_targets_round_trip_as_trace_ids(self):
+        stream = io.BytesIO()
+        recorder = TraceRecorder(stream)
+        recorder.record_create("parent")
+        recorder.record_create("child")
+        recorder.record_add("child", ChildOf("parent"))
+
+        [_, _, (_, (entity, component))] = _records(stream)
+
+        assert entity == 1
+        assert isinstance(component, Relationship)
+        assert type(component).__name__ == "ChildOf"
+        assert type(component).cascade
+        assert component.target == 0
+
+    def test_unencodable_values_become_none(self):
+        stream = io.BytesIO()
+        recorder = TraceRecorder(stream)
+        recorder.record_add("a", Name(object()))  # pyright: ignore[reportArgumentType]
+
+        [(_, (_, component))] = _records(stream)
+
+        assert component.value is None
+
+    def test_rejects_foreign_streams(self):
+        with pytest.raises(ValueError):
+            list(read_trace(io.BytesIO(b"not a trace")))
+
+
+class TestWorldRecording:
+    def test_snapshot_prologue_precedes_operations(self, world):
+        existing = world.create_entity()
+        world.add_component(existing, Position())
+        world.set_enabled(existing, False)
+        world.create_entity()
+        stream = io.BytesIO()
+
+        world.start_recording(stream)
+        world.add_component(existing, Velocity())
+        world.stop_recording()
+
+        ops = [op for op, _ in _records(stream)]
+        snapshot = ops.index(TraceOp.SNAPSHOT)
+        assert ops[:snapshot].count(TraceOp.CREATE) == 2
+        assert TraceOp.ENABLE in ops[:snapshot]
+        assert ops[snapshot + 1 :] == [TraceOp.ADD]
+        assert world.trace_recorder is None
+
+    def test_public_calls_are_recorded_in_order(self, world):
+        stream = io.BytesIO()
+        world.start_recording(stream)
+
+        entity = world.create_entity()
+        world.add_component(entity, Position())
+        world.add_component(entity, Velocity())
+        world.get_components(entity, Position, Velocity)
+        Query().with_components(Position).execute(world)
+        world.remove_component(entity, Velocity)
+        world.update(1 / 60)
+        world.destroy_entity(entity)
+        world.destroy_entity(entity)
+
+        ops = [op for op, _ in _records(stream)]
+        assert ops == [
+            TraceOp.SNAPSHOT,
+            TraceOp.CREATE,
+            TraceOp.ADD,
+            TraceOp.ADD,
+            TraceOp.GET,
+            TraceOp.QUERY,
+            TraceOp.REMOVE,
+            TraceOp.UPDATE,
+            TraceOp.DESTROY,
+        ]
+
+    def test_fork_is_not_recorded(self, world):
+        world.start_recording(io.BytesIO())
+
+        assert world.fork().trace_recorder is None
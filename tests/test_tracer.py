@@ -0,0 +1,133 @@
+import asyncio
+import json
+import sys
+
+import pytest
+
+from pyecs.profiling.Tracer import MonitoringTracer, code_objects
+
+from .conftest import Position, Velocity
+from .test_system import AsyncSystem, MovementSystem
+
+
+@pytest.fixture
+def tracer():
+    tracer = MonitoringTracer()
+    yield tracer
+    tracer.detach()
+
+
+def _moving_world(world):
+    for _ in range(3):
+        entity = world.create_entity()
+        world.add_component(entity, Position())
+        world.add_component(entity, Velocity(1.0, 1.0))
+    world.add_system(MovementSystem())
+    return world
+
+
+class TestMonitoringTracer:
+    def test_code_objects_unwrap_classes_and_properties(self):
+        class Example:
+            @property
+            def value(self):
+                return 1
+
+            def method(self):
+                return 2
+
+        names = {code.co_name for code in code_objects(Example)}
+
+        assert names == {"value", "method"}
+
+    def test_updates_close_frames(self, world, tracer):
+        _moving_world(world)
+        tracer.attach(world)
+
+        world.update(0.1)
+        world.update(0.1)
+
+        assert len(tracer.frames) == 2
+        names = {span.name for span in tracer.frames[0]}
+        assert {"ECSWorld.update", "MovementSystem.update", "Query.execute"} <= names
+        assert tracer.frames[0][-1].name == "ECSWorld.update"
+        assert tracer.frames[0][-1].depth == 0
+
+    def test_fixed_steps_close_frames(self, world, tracer):
+        _moving_world(world)
+        tracer.attach(world)
+
+        for _ in range(3):
+            world.step(world.scheduler.step)
+
+        assert len(tracer.frames) == 3
+        assert tracer.frames[0][-1].name == "ECSWorld.step"
+        assert tracer.spans()[-1].name == "ECSWorld.step"
+
+    def test_async_updates_close_frames(self, world, tracer):
+        _moving_world(world)
+        world.add_system(AsyncSystem([], "io"))
+        tracer.attach(world)
+
+        async def run():
+            for _ in range(2):
+                await world.update_async(0.1)
+                await asyncio.sleep(0)
+
+        asyncio.run(run())
+
+        assert len(tracer.frames) == 2
+        assert tracer.frames[0][-1].name == "ECSWorld.update_async"
+
+    def test_detached_tracer_records_nothing(self, world, tracer):
+        _moving_world(world)
+        tracer.attach(world)
+        tool_id = tracer.tool_id
+        tracer.detach()
+
+        world.update(0.1)
+
+        assert not tracer.attached
+        assert sys.monitoring.get_tool(tool_id) is None
+        assert tracer.spans() == []
+
+    def test_self_time_excludes_children(self, world, tracer):
+        _moving_world(world)
+        tracer.attach(world)
+
+        world.update(0.1)
+
+        frame = tracer.frames[0]
+        update = frame[-1]
+        children = sum(span.duration_ns for span in frame if span.depth == 1)
+        assert update.self_ns == update.duration_ns - children
+
+    def test_chrome_trace_is_json(self, world, tracer):
+        _moving_world(world)
+        tracer.attach(world)
+        world.update(0.1)
+
+        trace = json.loads(json.dumps(tracer.to_chrome_trace()))
+
+        phases = {event["ph"] for event in trace["traceEvents"]}
+        assert phases == {"X", "i"}
+
+    def test_collapsed_stacks_nest_system_updates(self, world, tracer):
+        _moving_world(world)
+        tracer.attach(world)
+        world.update(0.1)
+
+        lines = tracer.to_collapsed().splitlines()
+
+        stack = ";".join(
+            [
+                "ECSWorld.update",
+                "SystemManager.update_all",
+                "SystemManager._update_systems",
+                "SystemManager._run",
+                "SystemManager.invoke",
+                "MovementSystem.update",
+            ]
+        )
+        assert any(line.startswith(f"{stack} ") for line in lines)
+        assert all(int(line.rsplit(" ", 1)[1]) >= 0 for line in lines)
@@ -0,0 +1,142 @@
+import math
+
+import pytest
+from pyecs import ChildOf, GlobalTransform, LocalTransform, TransformSystem
+
+from .conftest import Health
+
+
+def spawn(world, local, parent=None):
+    entity = world.create_entity()
+    world.add_component(entity, local)
+    if parent is not None:
+        world.add_component(entity, ChildOf(parent))
+    return entity
+
+
+def global_of(world, entity):
+    return world.get_component(entity, GlobalTransform)
+
+
+class TestTransform:
+    def test_compose_scales_rotates_and_offsets(self):
+        parent = GlobalTransform(10, 0, math.pi / 2, 2)
+
+        result = parent.compose(LocalTransform(1, 0, 0.5, 3))
+
+        assert result.x == pytest.approx(10)
+        assert result.y == pytest.approx(2)
+        assert result.rotation == pytest.approx(math.pi / 2 + 0.5)
+        assert result.scale == 6
+
+
+class TestTransformSystem:
+    @pytest.fixture
+    def system(self, world):
+        system = TransformSystem()
+        world.add_system(system)
+        return system
+
+    def test_hierarchy_is_propagated(self, world, system):
+        root = spawn(world, LocalTransform(1, 2))
+        child = spawn(world, LocalTransform(3, 0), root)
+        grandchild = spawn(world, LocalTransform(0, 1), child)
+
+        world.update(0.1)
+
+        assert global_of(world, root) == GlobalTransform(1, 2)
+        assert global_of(world, child) == GlobalTransform(4, 2)
+        assert global_of(world, grandchild) == GlobalTransform(4, 3)
+        assert [len(level) for level in system.levels] == [1, 1, 1]
+
+    def test_unchanged_frames_do_no_work(self, world, system):
+        root = spawn(world, LocalTransform())
+        spawn(world, LocalTransform(1, 0), root)
+        world.update(0.1)
+
+        world.update(0.1)
+
+        assert system.last_updated == 0
+        assert system.rebuilds == 1
+
+    def test_only_changed_subtrees_are_recomputed(self, world, system):
+        first = spawn(world, LocalTransform())
+        second = spawn(world, LocalTransform(0, 5))
+        child = spawn(world, LocalTransform(1, 0), first)
+        spawn(world, LocalTransform(1, 0), second)
+        world.update(0.1)
+
+        world.add_component(first, LocalTransform(10, 0))
+        world.update(0.1)
+
+        assert system.last_updated == 2
+        assert system.rebuilds == 1
+        assert global_of(world, child) == GlobalTransform(11, 0)
+        assert global_of(world, second) == GlobalTransform(0, 5)
+
+    def test_unrelated_writes_to_a_chunk_change_nothing(self, world, system):
+        entity = spawn(world, LocalTransform())
+        world.add_component(entity, Health())
+        world.update(0.1)
+
+        world.add_component(entity, Health(5))
+        world.update(0.1)
+
+        assert system.last_updated == 0
+
+    def test_existing_global_transforms_are_written_in_their_column(self, world, system):
+        entity = spawn(world, LocalTransform())
+        world.update(0.1)
+        archetype = world.component_storage.archetypes[frozenset({LocalTransform, GlobalTransform})]
+        chunk = archetype.chunks[0]
+        version = chunk.version
+
+        world.add_component(entity, LocalTransform(2, 3))
+        world.update(0.1)
+
+        assert chunk.read_column(GlobalTransform) == [GlobalTransform(2, 3)]
+        assert chunk.version > version + 1
+
+    def test_reparenting_rebuilds_the_hierarchy(self, world, system):
+        first = spawn(world, LocalTransform(1, 0))
+        second = spawn(world, LocalTransform(2, 0))
+        child = spawn(world, LocalTransform(0, 1), first)
+        world.update(0.1)
+
+        world.add_component(child, ChildOf(second))
+        world.update(0.1)
+
+        assert system.rebuilds == 2
+        assert global_of(world, child) == GlobalTransform(2, 1)
+
+    def test_destroyed_entities_leave_the_hierarchy(self, world, system):
+        root = spawn(world, LocalTransform())
+        spawn(world, LocalTransform(), root)
+        other = spawn(world, LocalTransform(3, 3))
+        world.update(0.1)
+
+        world.destroy_entity(root)
+        world.update(0.1)
+
+        assert system.levels == [[other]]
+        assert list(system.globals) == [other]
+
+    def test_parents_without_transforms_make_roots(self, world, system):
+        parent = world.create_entity()
+        child = spawn(world, LocalTransform(1, 1), parent)
+
+        world.update(0.1)
+
+        assert global_of(world, child) == GlobalTransform(1, 1)
+
+    def test_fork_is_propagated_separately(self, world, system):
+        root = spawn(world, LocalTransform())
+        child = spawn(world, LocalTransform(1, 0), root)
+        world.update(0.1)
+        forked = world.fork()
+
+        forked.add_component(root, LocalTransform(5, 0))
+        system.update(forked, 0.1)
+
+        assert global_of(forked, child) == GlobalTransform(6, 0)
+        assert global_of(world, child) == GlobalTransform(1, 0)
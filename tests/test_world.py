@@ -1,9 +1,12 @@
+import asyncio
+
 import pytest
 
-from pyecs import StatusCodes
+from pyecs import ECSWorld, StatusCodes
 from pyecs.exceptions import ComponentNotFoundError
+from pyecs.processing.System import System
 
-from .conftest import Health, Position, Velocity
+from .conftest import Health, Name, Position, Velocity
 
 
 class TestWorldEntityManagement:
@@ -181,3 +184,231 @@ class TestWorldOrRaiseMethods:
             ComponentNotFoundError, match="Component operation 'get_components' failed"
         ):
             world.get_components_or_raise(entity, Position)
+
+
+class TestWorldFork:
+    def test_fork_has_same_entities_and_components(self, world, entity_with_components):
+        forked = world.fork()
+
+        assert forked.entity_manager.is_alive(entity_with_components)
+        assert forked.get_component(entity_with_components, Position).x == 1.0
+        assert forked.get_component(entity_with_components, Health).current == 75
+
+    def test_fork_component_changes_do_not_leak(self, world, entity_with_components):
+        forked = world.fork()
+
+        forked.get_component(entity_with_components, Position).x = 42
+        forked.add_component(entity_with_components, Name("forked"))
+        forked.remove_component(entity_with_components, Velocity)
+
+        assert world.get_component(entity_with_components, Position).x == 1.0
+        assert world.get_component(entity_with_components, Name) == StatusCodes.FAILURE
+        assert isinstance(world.get_component(entity_with_components, Velocity), Velocity)
+
+    def test_parent_changes_do_not_leak_into_fork(self, world, entity_with_components):
+        forked = world.fork()
+
+        world.get_component(entity_with_components, Position).x = 42
+        world.destroy_entity(entity_with_components)
+        new_entity = world.create_entity()
+
+        assert forked.entity_manager.is_alive(entity_with_components)
+        assert not forked.entity_manager.is_alive(new_entity)
+        assert forked.get_component(entity_with_components, Position).x == 1.0
+
+    def test_fork_runs_shared_systems(self, world, entity_with_components):
+        class DriftSystem(System):
+            def update(self, world, dt: float):
+                world.get_component(entity_with_components, Position).x += dt
+
+        world.add_system(DriftSystem())
+        forked = world.fork()
+
+        forked.update(1.0)
+
+        assert forked.get_component(entity_with_components, Position).x == 2.0
+        assert world.get_component(entity_with_components, Position).x == 1.0
+
+
+class TestWorldChunkedStorage:
+    def test_chunk_capacity_is_passed_to_archetypes(self):
+        world = ECSWorld(chunk_capacity=2)
+        entities = [world.create_entity() for _ in range(5)]
+        for entity in entities:
+            world.add_component(entity, Position())
+
+        archetype = world.component_storage.archetypes[frozenset([Position])]
+
+        assert [len(chunk) for chunk in archetype.chunks] == [2, 2, 1]
+        assert world.fork().component_storage.chunk_capacity == 2
+
+    def test_set_enabled_keeps_components(self, world):
+        entity = world.create_entity()
+        world.add_component(entity, Position(1, 2, 3))
+
+        world.set_enabled(entity, False)
+
+        assert world.get_component(entity, Position).x == 1
+        assert world.component_storage.has_component(entity, Position)
+
+
+class TestWorldMetrics:
+    def test_update_closes_counter_tick(self, world):
+        world.update(0.016)
+        entity = world.create_entity()
+        world.add_component(entity, Position())
+        world.add_component(entity, Velocity())
+        world.update(0.016)
+
+        metrics = world.metrics()
+
+        assert metrics["ticks"] == 2
+        assert metrics["last_tick"]["archetype_moves"] == 2
+        assert metrics["totals"]["archetypes_created"] == 3
+
+
+class PhaseRecorder(System):
+    def __init__(self, log: list, name: str, phase: str | None = None):
+        self.log = log
+        self.name = name
+        if phase is not None:
+            self.phase = phase
+
+    @property
+    def required_components(self) -> set[type]:
+        return set()
+
+    def init(self, world):
+        pass
+
+    def update(self, world, dt):
+        self.log.append((self.name, round(dt, 6)))
+
+    def cleanup(self, world):
+        pass
+
+
+class TestWorldFixedStep:
+    def test_step_runs_fixed_systems_per_step_and_frame_systems_once(self, world):
+        log = []
+        world.add_system(PhaseRecorder(log, "physics"))
+        world.add_system(PhaseRecorder(log, "render", "frame"))
+        world.set_timestep(tick_rate=10)
+
+        steps = world.step(0.25)
+
+        assert steps == 2
+        assert log == [("physics", 0.1), ("physics", 0.1), ("render", 0.25)]
+        assert world.scheduler.alpha == pytest.approx(0.5)
+
+    def test_update_still_runs_every_system(self, world):
+        log = []
+        world.add_system(PhaseRecorder(log, "physics"))
+        world.add_system(PhaseRecorder(log, "render", "frame"))
+
+        world.update(0.5)
+
+        assert [name for name, _ in log] == ["physics", "render"]
+
+    def test_step_closes_one_counter_tick(self, world):
+        world.set_timestep(tick_rate=100, max_steps=2)
+
+        world.step(0.1)
+
+        assert world.metrics()["ticks"] == 1
+        assert world.scheduler.dropped_steps == 8
+
+    def test_fork_continues_accumulated_time(self, world):
+        world.set_timestep(tick_rate=10)
+        world.step(0.05)
+
+        assert world.fork().step(0.05) == 1
+
+
+class SpikeSystem(PhaseRecorder):
+    def __init__(self, log: list, spikes: list[bool]):
+        super().__init__(log, "spike")
+        self.spikes = spikes
+
+    def update(self, world, dt):
+        super().update(world, dt)
+        if self.spikes.pop(0) and world.system_manager.budget is not None:
+            world.system_manager.budget.frame_start -= 1_000_000_000
+
+
+class TestWorldFrameBudget:
+    def _systems(self, world, spikes):
+        log = []
+        cosmetic = PhaseRecorder(log, "cosmetic")
+        cosmetic.priority = -1
+        world.add_system(SpikeSystem(log, spikes))
+        world.add_system(cosmetic)
+        return log
+
+    def test_without_budget_every_system_runs(self, world):
+        log = self._systems(world, [True])
+
+        world.update(0.1)
+
+        assert [name for name, _ in log] == ["spike", "cosmetic"]
+
+    def test_low_priority_systems_are_deferred_on_overrun(self, world):
+        world.set_frame_budget(0.5)
+        log = self._systems(world, [True, False])
+
+        world.update(0.1)
+        world.update(0.1)
+
+        assert log == [("spike", 0.1), ("spike", 0.1), ("cosmetic", 0.2)]
+        assert world.system_manager.budget.snapshot()["overruns"] == 1
+        assert world.system_manager.budget.deferrals == 1
+
+    def test_profiled_updates_defer_the_same_way(self, world):
+        world.set_frame_budget(0.5)
+        world.set_profiling(True)
+        log = self._systems(world, [True, False])
+
+        world.update(0.1)
+        world.update(0.1)
+
+        assert log == [("spike", 0.1), ("spike", 0.1), ("cosmetic", 0.2)]
+        assert world.system_manager.budget.deferrals == 1
+
+    def test_awaited_updates_defer_the_same_way(self, world):
+        world.set_frame_budget(0.5)
+        log = self._systems(world, [True, False])
+
+        asyncio.run(world.update_async(0.1))
+        asyncio.run(world.update_async(0.1))
+
+        assert log == [("spike", 0.1), ("spike", 0.1), ("cosmetic", 0.2)]
+        assert world.system_manager.budget.deferrals == 1
+
+    def test_deferred_systems_cannot_starve(self, world):
+        world.set_frame_budget(0.5, max_deferred=1)
+        log = self._systems(world, [True, True])
+
+        world.update(0.1)
+        world.update(0.1)
+
+        assert log[-1] == ("cosmetic", 0.2)
+
+    def test_removing_the_budget_runs_everything_again(self, world):
+        world.set_frame_budget(0.5)
+        log = self._systems(world, [True, True])
+        world.update(0.1)
+
+        world.set_frame_budget(None)
+        world.update(0.1)
+
+        assert log[-1] == ("cosmetic", 0.1)
+
+    def test_fork_copies_owed_time(self, world):
+        world.set_frame_budget(0.5)
+        log = self._systems(world, [True, False])
+        world.update(0.1)
+
+        world.fork().update(0.1)
+
+        assert log[-1] == ("cosmetic", 0.2)
+        assert list(world.system_manager.budget.owed.values()) == [0.1]
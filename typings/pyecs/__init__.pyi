@@ -1,10 +1,17 @@
+from .common.Relationship import ChildOf as ChildOf, Relationship as Relationship
+from .common.Transform import GlobalTransform as GlobalTransform, LocalTransform as LocalTransform
 from .common.Types import Component as Component, Entity as Entity, SuccessOrFailure as SuccessOrFailure, UUID4 as UUID4
 from .containers.Archetype import Archetype as Archetype
 from .containers.ComponentStorage import ComponentStorage as ComponentStorage
+from .containers.Prefab import Prefab as Prefab
 from .core.World import ECSWorld as ECSWorld
-from .exceptions import ComponentNotFoundError as ComponentNotFoundError, EntityNotFoundError as EntityNotFoundError, OperationFailedError as OperationFailedError, PyECSError as PyECSError
+from .exceptions import ComponentNotFoundError as ComponentNotFoundError, EntityNotFoundError as EntityNotFoundError, OperationFailedError as OperationFailedError, PyECSError as PyECSError, SystemOrderError as SystemOrderError
+from .exporting.Export import ArchetypeExport as ArchetypeExport
 from .helpers.Statuses import StatusCodes as StatusCodes
 from .managers.EntityManager import EntityManager as EntityManager
+from .processing.TransformSystem import TransformSystem as TransformSystem
 from .querying.Query import Query as Query
 
-__all__ = ['UUID4', 'Archetype', 'Component', 'ComponentNotFoundError', 'ComponentStorage', 'ECSWorld', 'Entity', 'EntityManager', 'EntityNotFoundError', 'OperationFailedError', 'PyECSError', 'Query', 'StatusCodes', 'SuccessOrFailure']
+__all__ = ['UUID4', 'Archetype', 'ArchetypeExport', 'ChildOf', 'Component', 'ComponentNotFoundError', 'ComponentStorage', 'ECSWorld', 'Entity', 'EntityManager', 'EntityNotFoundError', 'GlobalTransform', 'LocalTransform', 'OperationFailedError', 'Prefab', 'PyECSError', 'Query', 'Relationship', 'StatusCodes', 'SuccessOrFailure', 'SystemOrderError', 'TransformSystem', '__version__']
+
+__version__: str
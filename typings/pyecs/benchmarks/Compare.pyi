@@ -0,0 +1,18 @@
+from dataclasses import dataclass
+from pyecs.benchmarks.Results import SuiteResults as SuiteResults
+from typing import Literal
+
+type Verdict = Literal['regressed', 'improved', 'unchanged', 'missing']
+DEFAULT_THRESHOLD: float
+
+@dataclass(frozen=True)
+class Comparison:
+    scenario: str
+    size: str
+    baseline: float
+    candidate: float
+    ratio: float
+    verdict: Verdict
+
+def compare(baseline: SuiteResults, candidate: SuiteResults, threshold: float = ...) -> list[Comparison]: ...
+def format_table(comparisons: list[Comparison]) -> str: ...
@@ -0,0 +1,45 @@
+from dataclasses import dataclass
+
+@dataclass
+class Position:
+    x: float = ...
+    y: float = ...
+    z: float = ...
+
+@dataclass
+class Velocity:
+    dx: float = ...
+    dy: float = ...
+    dz: float = ...
+
+@dataclass
+class Health:
+    current: int = ...
+    max: int = ...
+
+@dataclass
+class Name:
+    value: str = ...
+
+@dataclass
+class Boid:
+    flock: int = ...
+
+@dataclass
+class Lifetime:
+    frames: int = ...
+
+@dataclass
+class StatusEffect:
+    remaining: int = ...
+
+@dataclass
+class Burning(StatusEffect): ...
+@dataclass
+class Frozen(StatusEffect): ...
+@dataclass
+class Poisoned(StatusEffect): ...
+@dataclass
+class Hasted(StatusEffect): ...
+@dataclass
+class Shielded(StatusEffect): ...
@@ -0,0 +1,23 @@
+import random
+from collections.abc import Callable as Callable
+from pyecs.benchmarks.Components import Health as Health, Name as Name, Position as Position, Velocity as Velocity
+from pyecs.benchmarks.Registry import scenario as scenario
+from pyecs.common.Types import Entity as Entity
+from pyecs.core.World import ECSWorld as ECSWorld
+from pyecs.helpers.Statuses import StatusCodes as StatusCodes
+from pyecs.querying.Query import Query as Query
+
+ENTITY_SIZES: tuple[int, ...]
+QUICK_ENTITY_SIZES: tuple[int, ...]
+OPERATION_SIZES: tuple[int, ...]
+QUICK_OPERATION_SIZES: tuple[int, ...]
+
+def populate(world: ECSWorld, count: int, rng: random.Random) -> list[Entity]: ...
+def entity_creation(size: int, rng: random.Random) -> Callable[[], object]: ...
+def query_single(size: int, rng: random.Random) -> Callable[[], object]: ...
+def query_two(size: int, rng: random.Random) -> Callable[[], object]: ...
+def query_three(size: int, rng: random.Random) -> Callable[[], object]: ...
+def add_component(size: int, rng: random.Random) -> Callable[[], object]: ...
+def remove_component(size: int, rng: random.Random) -> Callable[[], object]: ...
+def get_component(size: int, rng: random.Random) -> Callable[[], object]: ...
+def memory(size: int, rng: random.Random) -> Callable[[], object]: ...
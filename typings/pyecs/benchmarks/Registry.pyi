@@ -0,0 +1,22 @@
+import random
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Literal
+
+type Metric = Literal['seconds', 'bytes']
+type Setup = Callable[[int, random.Random], Callable[[], object]]
+SCENARIOS: dict[str, 'Scenario']
+
+@dataclass(frozen=True)
+class Scenario:
+    name: str
+    setup: Setup
+    sizes: tuple[int, ...]
+    quick_sizes: tuple[int, ...]
+    metric: Metric = ...
+    description: str = ...
+    repeats: int | None = ...
+    warmup: int | None = ...
+
+def scenario(name: str, sizes: tuple[int, ...], quick_sizes: tuple[int, ...] | None = None, metric: Metric = 'seconds', repeats: int | None = None, warmup: int | None = None) -> Callable[[Setup], Setup]: ...
+def select(patterns: list[str] | None = None) -> list[Scenario]: ...
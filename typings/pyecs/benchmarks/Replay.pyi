@@ -0,0 +1,18 @@
+from collections.abc import Callable as Callable
+from pathlib import Path
+from pyecs.benchmarks.Registry import Scenario as Scenario
+from pyecs.common.Relationship import Relationship as Relationship
+from pyecs.common.Types import Entity as Entity
+from pyecs.core.World import ECSWorld as ECSWorld
+from pyecs.helpers.Statuses import StatusCodes as StatusCodes
+from pyecs.profiling.Histogram import LatencyHistogram as LatencyHistogram
+from pyecs.profiling.Trace import TraceOp as TraceOp, TraceRecord as TraceRecord, read_trace as read_trace
+from pyecs.querying.Query import Query as Query
+
+REPLAY_CHUNK_CAPACITIES: tuple[int, ...]
+
+def load_trace(path: str | Path) -> tuple[list[TraceRecord], list[TraceRecord]]: ...
+def apply(world: ECSWorld, records: list[TraceRecord], entities: dict[object, Entity], timings: dict[str, LatencyHistogram] | None = None) -> int: ...
+def prepare(prologue: list[TraceRecord], chunk_capacity: int) -> tuple[ECSWorld, dict[object, Entity]]: ...
+def replay_scenario(path: str | Path, chunk_capacities: tuple[int, ...]) -> Scenario: ...
+def replay_breakdown(path: str | Path, chunk_capacity: int) -> dict[str, dict[str, float | int]]: ...
@@ -0,0 +1,13 @@
+from collections.abc import Callable as Callable
+from pyecs.benchmarks.Registry import Scenario as Scenario
+from pyecs.benchmarks.Results import Details as Details, Measurement as Measurement, Metadata as Metadata, ScenarioResults as ScenarioResults, SuiteResults as SuiteResults
+from pyecs.benchmarks.Statistics import summarize as summarize
+
+DEFAULT_SEED: int
+DEFAULT_REPEATS: int
+DEFAULT_WARMUP: int
+
+def measure(timed: Callable[[], object], metric: str) -> tuple[float, object]: ...
+def run_scenario(scenario: Scenario, size: int, repeats: int = ..., warmup: int = ..., seed: int = ...) -> tuple[list[float], Details]: ...
+def metadata(repeats: int, warmup: int, seed: int, quick: bool) -> Metadata: ...
+def run(scenarios: list[Scenario], repeats: int = ..., warmup: int = ..., seed: int = ..., quick: bool = False, report: Callable[[str], None] | None = None) -> SuiteResults: ...
@@ -0,0 +1,56 @@
+import random
+from collections.abc import Callable as Callable
+from dataclasses import dataclass
+from pyecs.benchmarks.Components import Health as Health, Position as Position, Velocity as Velocity
+from pyecs.benchmarks.Registry import Scenario as Scenario, Setup as Setup
+from pyecs.benchmarks.Results import Measurement as Measurement, ScalingRow as ScalingRow, ScalingVerdict as ScalingVerdict, ScenarioResults as ScenarioResults, SuiteResults as SuiteResults
+from pyecs.benchmarks.Runner import metadata as metadata, run_scenario as run_scenario
+from pyecs.benchmarks.Statistics import summarize as summarize
+from pyecs.common.Types import Entity as Entity
+from pyecs.core.World import ECSWorld as ECSWorld
+from pyecs.helpers.Statuses import StatusCodes as StatusCodes
+from pyecs.querying.Query import Query as Query
+from typing import Literal
+
+type Dimension = Literal['entities', 'archetypes', 'systems']
+SCALING_SIZES: dict[Dimension, tuple[int, ...]]
+QUICK_SCALING_SIZES: dict[Dimension, tuple[int, ...]]
+SCALING_CALLS: int
+SCALING_REPEATS: int
+SCALING_TOLERANCE: float
+ARCHETYPE_ENTITIES: int
+TAGS: tuple[type[object], ...]
+SCALING_CASES: dict[str, 'ScalingCase']
+
+@dataclass(frozen=True)
+class ScalingCase:
+    name: str
+    dimension: Dimension
+    expected: float
+    setup: Setup
+    description: str = ...
+
+def scaling_case(name: str, dimension: Dimension, expected: float = 0.0) -> Callable[[Setup], Setup]: ...
+def fit_exponent(sizes: list[int], costs: list[float]) -> float: ...
+def run_scaling(cases: list[ScalingCase], quick: bool = False, repeats: int = ..., tolerance: float = ..., seed: int = 0, report: Callable[[str], None] | None = None) -> SuiteResults: ...
+def format_scaling_table(rows: list[ScalingRow]) -> str: ...
+def populated(size: int, rng: random.Random) -> tuple[ECSWorld, list[Entity]]: ...
+def tagged(archetypes: int, rng: random.Random) -> tuple[ECSWorld, list[Entity]]: ...
+def create_entity(size: int, rng: random.Random) -> Callable[[], object]: ...
+def destroy_entity(size: int, rng: random.Random) -> Callable[[], object]: ...
+def add_component(size: int, rng: random.Random) -> Callable[[], object]: ...
+def remove_component(size: int, rng: random.Random) -> Callable[[], object]: ...
+def get_component(size: int, rng: random.Random) -> Callable[[], object]: ...
+def update_component(size: int, rng: random.Random) -> Callable[[], object]: ...
+def query_all(size: int, rng: random.Random) -> Callable[[], object]: ...
+def query_one_archetype(size: int, rng: random.Random) -> Callable[[], object]: ...
+def move_between_archetypes(size: int, rng: random.Random) -> Callable[[], object]: ...
+
+class IdleSystem:
+    @property
+    def required_components(self) -> set[type]: ...
+    def init(self, world: ECSWorld) -> None: ...
+    def update(self, world: ECSWorld, dt: float) -> None: ...
+    def cleanup(self, world: ECSWorld) -> None: ...
+
+def remove_system(size: int, rng: random.Random) -> Callable[[], object]: ...
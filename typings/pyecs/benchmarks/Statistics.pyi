@@ -0,0 +1,8 @@
+from collections.abc import Sequence
+from pyecs.benchmarks.Results import Summary as Summary
+
+T_CRITICAL_95: tuple[float, ...]
+Z_95: float
+
+def t_critical(degrees_of_freedom: int) -> float: ...
+def summarize(samples: Sequence[float]) -> Summary: ...
@@ -0,0 +1,21 @@
+from pathlib import Path
+from pyecs.benchmarks.Results import SuiteResults as SuiteResults
+from types import ModuleType
+from typing import Protocol
+
+type Samples = dict[str, list[float]]
+VISUALIZER_PATH: Path
+LEGACY_SECTIONS: dict[str, tuple[str, str | None]]
+
+class Figure(Protocol):
+    def savefig(self, fname: Path, *, dpi: int, bbox_inches: str) -> None: ...
+
+class Renderer(Protocol):
+    def generate_report(self, data: dict[str, object], output_dir: str | Path) -> None: ...
+    def plot_comparison(self, datasets: dict[str, dict[str, Samples]], benchmark_type: str) -> Figure: ...
+
+def to_visualizer(results: SuiteResults) -> dict[str, object]: ...
+def load_visualizer() -> ModuleType: ...
+def renderer(visualizer: ModuleType) -> Renderer: ...
+def plot(results: SuiteResults, output_dir: str | Path) -> None: ...
+def plot_scaling(results: SuiteResults, output_dir: str | Path) -> None: ...
@@ -0,0 +1,102 @@
+import random
+from collections.abc import Callable as Callable
+from pyecs.benchmarks.Components import Boid as Boid, Burning as Burning, Frozen as Frozen, Hasted as Hasted, Health as Health, Lifetime as Lifetime, Poisoned as Poisoned, Position as Position, Shielded as Shielded, StatusEffect as StatusEffect, Velocity as Velocity
+from pyecs.benchmarks.Registry import scenario as scenario
+from pyecs.common.Types import Entity as Entity
+from pyecs.core.World import ECSWorld as ECSWorld
+from pyecs.helpers.Statuses import StatusCodes as StatusCodes
+from pyecs.profiling.Histogram import LatencyHistogram as LatencyHistogram
+from pyecs.querying.Query import Query as Query
+from typing import TypedDict
+
+DT: float
+BOID_FRAMES: int
+PARTICLE_FRAMES: int
+CHURN_FRAMES: int
+SOAK_SAMPLES: int
+EFFECTS: tuple[type[StatusEffect], ...]
+
+class SystemTiming(TypedDict):
+    mean_ns: float
+    p99_ns: int
+    share: float
+
+class WorkloadDetails(TypedDict):
+    frames: int
+    frame_ns: dict[str, float | int]
+    systems: dict[str, SystemTiming]
+    entities: int
+
+class SoakSample(TypedDict):
+    tick: int
+    frame_p50_ns: int
+    frame_p99_ns: int
+    storage_bytes: int
+    archetypes: int
+    entities: int
+
+class SoakDetails(WorkloadDetails):
+    timeline: list[SoakSample]
+
+class MovementSystem:
+    bounds: float
+    def __init__(self, bounds: float = 0.0) -> None: ...
+    @property
+    def required_components(self) -> set[type]: ...
+    def init(self, world: ECSWorld) -> None: ...
+    def update(self, world: ECSWorld, dt: float) -> None: ...
+    def cleanup(self, world: ECSWorld) -> None: ...
+
+class BoidsSystem:
+    radius: float
+    max_neighbours: int
+    def __init__(self, radius: float = 5.0, max_neighbours: int = 16) -> None: ...
+    @property
+    def required_components(self) -> set[type]: ...
+    def init(self, world: ECSWorld) -> None: ...
+    def update(self, world: ECSWorld, dt: float) -> None: ...
+    def cleanup(self, world: ECSWorld) -> None: ...
+
+class EmitterSystem:
+    rate: int
+    rng: random.Random
+    def __init__(self, rate: int, rng: random.Random) -> None: ...
+    @property
+    def required_components(self) -> set[type]: ...
+    def init(self, world: ECSWorld) -> None: ...
+    def update(self, world: ECSWorld, dt: float) -> None: ...
+    def cleanup(self, world: ECSWorld) -> None: ...
+
+class LifetimeSystem:
+    @property
+    def required_components(self) -> set[type]: ...
+    def init(self, world: ECSWorld) -> None: ...
+    def update(self, world: ECSWorld, dt: float) -> None: ...
+    def cleanup(self, world: ECSWorld) -> None: ...
+
+class ChurnSystem:
+    entities: list[Entity]
+    rate: float
+    rng: random.Random
+    def __init__(self, entities: list[Entity], rate: float, rng: random.Random) -> None: ...
+    @property
+    def required_components(self) -> set[type]: ...
+    def init(self, world: ECSWorld) -> None: ...
+    def update(self, world: ECSWorld, dt: float) -> None: ...
+    def cleanup(self, world: ECSWorld) -> None: ...
+
+class EffectSystem:
+    @property
+    def required_components(self) -> set[type]: ...
+    def init(self, world: ECSWorld) -> None: ...
+    def update(self, world: ECSWorld, dt: float) -> None: ...
+    def cleanup(self, world: ECSWorld) -> None: ...
+
+def system_details(world: ECSWorld, frames: int) -> WorkloadDetails: ...
+def run_frames(world: ECSWorld, frames: int) -> Callable[[], WorkloadDetails]: ...
+def flock(world: ECSWorld, count: int, rng: random.Random) -> float: ...
+def afflicted(world: ECSWorld, count: int, rng: random.Random) -> list[Entity]: ...
+def boids(size: int, rng: random.Random) -> Callable[[], object]: ...
+def particles(size: int, rng: random.Random) -> Callable[[], object]: ...
+def status_effects(size: int, rng: random.Random) -> Callable[[], object]: ...
+def soak(size: int, rng: random.Random) -> Callable[[], object]: ...
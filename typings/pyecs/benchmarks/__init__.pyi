@@ -0,0 +1,6 @@
+from .Compare import Comparison as Comparison, compare as compare, format_table as format_table
+from .Registry import SCENARIOS as SCENARIOS, Scenario as Scenario, scenario as scenario, select as select
+from .Runner import run as run, run_scenario as run_scenario
+from .Statistics import summarize as summarize
+
+__all__ = ['SCENARIOS', 'Comparison', 'Scenario', 'compare', 'format_table', 'run', 'run_scenario', 'scenario', 'select', 'summarize']
@@ -0,0 +1,12 @@
+from dataclasses import dataclass
+from pyecs.common.Types import Entity as Entity
+from typing import ClassVar
+
+@dataclass(frozen=True, slots=True)
+class Relationship:
+    target: Entity
+    cascade: ClassVar[bool] = ...
+
+@dataclass(frozen=True, slots=True)
+class ChildOf(Relationship):
+    cascade: ClassVar[bool] = ...
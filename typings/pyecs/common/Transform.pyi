@@ -0,0 +1,14 @@
+from dataclasses import dataclass
+
+@dataclass(frozen=True, slots=True)
+class Transform:
+    x: float | int = ...
+    y: float | int = ...
+    rotation: float | int = ...
+    scale: float | int = ...
+    def compose(self, local: Transform) -> GlobalTransform: ...
+
+@dataclass(frozen=True, slots=True)
+class LocalTransform(Transform): ...
+@dataclass(frozen=True, slots=True)
+class GlobalTransform(Transform): ...
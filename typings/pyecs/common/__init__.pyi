@@ -1,3 +1,5 @@
+from .Relationship import ChildOf as ChildOf, Relationship as Relationship
+from .Transform import GlobalTransform as GlobalTransform, LocalTransform as LocalTransform, Transform as Transform
 from .Types import Component as Component, Entity as Entity, SuccessOrFailure as SuccessOrFailure, UUID4 as UUID4
 
-__all__ = ['UUID4', 'Component', 'Entity', 'SuccessOrFailure']
+__all__ = ['UUID4', 'ChildOf', 'Component', 'Entity', 'GlobalTransform', 'LocalTransform', 'Relationship', 'SuccessOrFailure', 'Transform']
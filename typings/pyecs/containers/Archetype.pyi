@@ -1,15 +1,64 @@
-from collections.abc import Iterator
+from collections.abc import Iterator, Mapping, Sequence
 from pyecs.common.Types import Component as Component, Entity as Entity, SuccessOrFailure as SuccessOrFailure, UUID4 as UUID4
+from pyecs.containers.ArchetypeChunk import ArchetypeChunk as ArchetypeChunk, CHUNK_CAPACITY as CHUNK_CAPACITY, is_frozen as is_frozen
 from pyecs.helpers.Statuses import StatusCodes as StatusCodes
-from typing import Literal
+from typing import Literal, overload, override
+
+class ArchetypeEntities(Sequence[Entity]):
+    def __init__(self, archetype: Archetype) -> None: ...
+    @override
+    def __len__(self) -> int: ...
+    @override
+    def __contains__(self, entity: object) -> bool: ...
+    @override
+    def __iter__(self) -> Iterator[Entity]: ...
+    @overload
+    def __getitem__(self, index: int) -> Entity: ...
+    @overload
+    def __getitem__(self, index: slice) -> list[Entity]: ...
+
+class ArchetypeColumn(Sequence[Component]):
+    def __init__(self, archetype: Archetype, component_type: type[Component]) -> None: ...
+    @override
+    def __len__(self) -> int: ...
+    @override
+    def __iter__(self) -> Iterator[Component]: ...
+    @overload
+    def __getitem__(self, index: int) -> Component: ...
+    @overload
+    def __getitem__(self, index: slice) -> list[Component]: ...
+
+class ArchetypeColumns(Mapping[type, ArchetypeColumn]):
+    def __init__(self, archetype: Archetype) -> None: ...
+    @override
+    def __len__(self) -> int: ...
+    @override
+    def __iter__(self) -> Iterator[type]: ...
+    @override
+    def __getitem__(self, component_type: type) -> ArchetypeColumn: ...
 
 class Archetype:
-    entities: list[UUID4]
+    chunk_capacity: int
+    chunks: list[ArchetypeChunk]
     entity_indices: dict[UUID4, int]
-    components: dict[type, list[Component]]
-    def __init__(self) -> None: ...
+    component_types: list[type]
+    def __init__(self, chunk_capacity: int = ...) -> None: ...
+    @property
+    def entities(self) -> ArchetypeEntities: ...
+    @property
+    def components(self) -> ArchetypeColumns: ...
+    def row_count(self) -> int: ...
+    def locate(self, row: int) -> tuple[ArchetypeChunk, int]: ...
     def add_entity(self, entity: Entity, components: list[Component]) -> SuccessOrFailure: ...
+    def add_entities(self, entities: list[Entity], columns: dict[type, list[Component]]) -> SuccessOrFailure: ...
     def remove_entity(self, entity: Entity) -> SuccessOrFailure: ...
     def get_component(self, entity: Entity, component_type: type[Component]) -> Component | Literal[StatusCodes.FAILURE]: ...
+    def set_component(self, entity: Entity, component: Component) -> SuccessOrFailure: ...
+    def set_enabled(self, entity: Entity, enabled: bool) -> SuccessOrFailure: ...
+    def is_enabled(self, entity: Entity) -> bool: ...
     def iter_entities(self) -> Iterator[Entity]: ...
     def iter_components(self, component_type: type) -> Iterator[Component]: ...
+    def slice_column(self, component_type: type[Component], start: int, stop: int) -> list[Component] | Literal[StatusCodes.FAILURE]: ...
+    def write_column(self, component_type: type[Component], start: int, components: list[Component]) -> SuccessOrFailure: ...
+    def handout_column(self, chunk: ArchetypeChunk, component_type: type[Component]) -> list[Component]: ...
+    def fork(self) -> Archetype: ...
@@ -0,0 +1,22 @@
+import functools
+from pyecs.common.Types import Component as Component, UUID4 as UUID4
+
+CHUNK_CAPACITY: int
+
+@functools.cache
+def is_frozen(component_type: type) -> bool: ...
+
+class ArchetypeChunk:
+    capacity: int
+    entities: list[UUID4]
+    enabled: bytearray
+    columns: dict[type, list[Component]]
+    version: int
+    def __init__(self, capacity: int = ...) -> None: ...
+    def __len__(self) -> int: ...
+    def is_full(self) -> bool: ...
+    def read_column(self, component_type: type[Component]) -> list[Component]: ...
+    def column(self, component_type: type[Component]) -> list[Component]: ...
+    def set_enabled(self, row: int, enabled: bool) -> None: ...
+    def detach(self) -> None: ...
+    def fork(self) -> ArchetypeChunk: ...
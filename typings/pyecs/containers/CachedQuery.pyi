@@ -0,0 +1,15 @@
+from pyecs.common.Types import Entity as Entity
+from pyecs.containers.Archetype import Archetype as Archetype
+from pyecs.containers.ComponentStorage import ComponentStorage as ComponentStorage
+
+class CachedQuery:
+    with_types: frozenset[type]
+    without_types: frozenset[type]
+    archetypes: list[Archetype]
+    storage: ComponentStorage | None
+    scanned: int
+    def __init__(self, with_types: frozenset[type], without_types: frozenset[type] | None = None) -> None: ...
+    def matches(self, mask: frozenset[type]) -> bool: ...
+    def refresh(self, storage: ComponentStorage) -> list[Archetype]: ...
+    def entities(self) -> list[Entity]: ...
+    def row_count(self) -> int: ...
@@ -1,17 +1,36 @@
+from pyecs.common.Relationship import Relationship as Relationship
 from pyecs.common.Types import Component as Component, Entity as Entity, SuccessOrFailure as SuccessOrFailure, UUID4 as UUID4
 from pyecs.containers.Archetype import Archetype as Archetype
+from pyecs.containers.ArchetypeChunk import CHUNK_CAPACITY as CHUNK_CAPACITY
+from pyecs.containers.Observer import Observer as Observer
+from pyecs.containers.RelationshipIndex import RelationshipIndex as RelationshipIndex
+from pyecs.containers.StorageCounters import StorageCounters as StorageCounters
 from pyecs.helpers.Deprecation import deprecated_external as deprecated_external
 from pyecs.helpers.Statuses import StatusCodes as StatusCodes
 from typing import Literal
 
 class ComponentStorage:
+    chunk_capacity: int
     archetypes: dict[frozenset[type], Archetype]
     entity_to_archetype: dict[UUID4, frozenset[type]]
-    def __init__(self) -> None: ...
+    counters: StorageCounters
+    on_add: dict[type, list[Observer]]
+    on_remove: dict[type, list[Observer]]
+    relationships: RelationshipIndex
+    def __init__(self, chunk_capacity: int = ...) -> None: ...
     def add_component(self, entity: Entity, component: Component) -> Literal[StatusCodes.COMPONENT_ADDED, StatusCodes.COMPONENT_UPDATED, StatusCodes.FAILURE]: ...
     def remove_component[T: Component](self, entity: Entity, component_type: type[T]) -> Literal[StatusCodes.COMPONENT_REMOVED, StatusCodes.FAILURE]: ...
     def get_component[T: Component](self, entity: Entity, component_type: type[T]) -> Component | Literal[StatusCodes.FAILURE]: ...
     def has_component[T: Component](self, entity: Entity, component_type: type[T]) -> bool: ...
+    def set_enabled(self, entity: Entity, enabled: bool) -> SuccessOrFailure: ...
     def move_entity_to_archetype(self, entity: Entity, new_mask: frozenset[type], components: list[Component] | None = None) -> SuccessOrFailure: ...
+    def get_or_create_archetype(self, mask: frozenset[type]) -> Archetype: ...
+    def add_entities(self, entities: list[Entity], columns: dict[type, list[Component]]) -> SuccessOrFailure: ...
     def remove_entity(self, entity: Entity) -> SuccessOrFailure: ...
+    def add_observer(self, observer: Observer) -> None: ...
+    def remove_observer(self, observer: Observer) -> SuccessOrFailure: ...
+    def flush_observers(self) -> None: ...
     def get_entity_components(self, entity: Entity) -> list[Component]: ...
+    def column_bytes(self) -> dict[str, int]: ...
+    def metrics(self) -> dict[str, object]: ...
+    def fork(self) -> ComponentStorage: ...
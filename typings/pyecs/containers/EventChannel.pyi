@@ -0,0 +1,48 @@
+from _typeshed import Incomplete
+from array import array
+from collections.abc import Iterable, Iterator
+from pyecs.exporting.Export import component_schema as component_schema
+from typing import override
+
+type Column = array[int] | array[float]
+class EventChannel[T]:
+    event_type: type[T]
+    front: list[T]
+    back: list[T]
+    readable: int
+    pending: int
+    sent: int
+    def __init__(self, event_type: type[T]) -> None: ...
+    def __len__(self) -> int: ...
+    def send(self, event: T) -> None: ...
+    def send_batch(self, events: Iterable[T]) -> None: ...
+    def read(self) -> Iterator[T]: ...
+    def swap(self) -> None: ...
+    def clear(self) -> None: ...
+    def fork(self) -> EventChannel[T]: ...
+
+class SchemaEventChannel[T](EventChannel[T]):
+    schema: dict[str, str]
+    fields: tuple[str, ...]
+    front_columns: dict[str, Column]
+    back_columns: dict[str, Column]
+    front_capacity: int
+    back_capacity: int
+    def __init__(self, event_type: type[T]) -> None: ...
+    @override
+    def send(self, event: T) -> None: ...
+    pending: Incomplete
+    def send_values(self, *values: object) -> None: ...
+    def send_columns(self, **columns: Iterable[int | float]) -> None: ...
+    @override
+    def read(self) -> Iterator[T]: ...
+    def column(self, field: str) -> memoryview: ...
+    readable: Incomplete
+    @override
+    def swap(self) -> None: ...
+    @override
+    def clear(self) -> None: ...
+    @override
+    def fork(self) -> SchemaEventChannel[T]: ...
+
+def event_channel[T](event_type: type[T]) -> EventChannel[T]: ...
@@ -0,0 +1,16 @@
+from collections.abc import Callable
+from pyecs.common.Types import Component as Component, Entity as Entity
+from typing import Literal
+
+type ObserverEvent = Literal['add', 'remove']
+type ObserverCallback = Callable[..., object]
+class Observer:
+    event: ObserverEvent
+    component_type: type
+    callback: ObserverCallback
+    batched: bool
+    pending: list[tuple[Entity, Component]]
+    notified: int
+    def __init__(self, event: ObserverEvent, component_type: type, callback: ObserverCallback, batched: bool = False) -> None: ...
+    def notify(self, entity: Entity, component: Component) -> None: ...
+    def flush(self) -> None: ...
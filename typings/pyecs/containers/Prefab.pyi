@@ -0,0 +1,14 @@
+from collections.abc import Callable
+from pyecs.common.Types import Component as Component
+from pyecs.containers.ArchetypeChunk import is_frozen as is_frozen
+
+type Cloner = Callable[[int], list[Component]]
+def prototype_cloner(prototype: Component) -> Cloner: ...
+
+class Prefab:
+    prototypes: dict[type, Component]
+    mask: frozenset[type]
+    cloners: dict[type, Cloner]
+    def __init__(self, *components: Component) -> None: ...
+    def variant(self, *components: Component) -> Prefab: ...
+    def columns(self, count: int) -> dict[type, list[Component]]: ...
@@ -0,0 +1,16 @@
+from collections.abc import Iterable
+from pyecs.common.Relationship import Relationship as Relationship
+from pyecs.common.Types import Entity as Entity
+
+class RelationshipIndex:
+    targets: dict[type[Relationship], dict[Entity, Entity]]
+    sources: dict[type[Relationship], dict[Entity, dict[Entity, None]]]
+    version: int
+    def __init__(self) -> None: ...
+    def link(self, source: Entity, relationship: Relationship) -> None: ...
+    def unlink(self, source: Entity, relation_type: type) -> None: ...
+    def unlink_all(self, source: Entity, relation_types: Iterable[type]) -> None: ...
+    def target_of(self, source: Entity, relation_type: type) -> Entity | None: ...
+    def sources_of(self, relation_type: type, target: Entity) -> list[Entity]: ...
+    def relations_to(self, target: Entity) -> list[tuple[type[Relationship], list[Entity]]]: ...
+    def fork(self) -> RelationshipIndex: ...
@@ -0,0 +1,17 @@
+COUNTER_FIELDS: tuple[str, ...]
+
+class StorageCounters:
+    archetype_moves: int
+    archetypes_created: int
+    components_copied: int
+    queries: int
+    archetypes_scanned: int
+    archetypes_matched: int
+    rows_matched: int
+    ticks: int
+    last_tick: dict[str, int]
+    def __init__(self) -> None: ...
+    def totals(self) -> dict[str, int]: ...
+    def end_tick(self) -> None: ...
+    def reset(self) -> None: ...
+    def snapshot(self) -> dict[str, object]: ...
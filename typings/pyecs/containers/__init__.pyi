@@ -1,4 +1,11 @@
-from .Archetype import Archetype as Archetype
+from .Archetype import Archetype as Archetype, ArchetypeColumn as ArchetypeColumn, ArchetypeColumns as ArchetypeColumns, ArchetypeEntities as ArchetypeEntities
+from .ArchetypeChunk import ArchetypeChunk as ArchetypeChunk, CHUNK_CAPACITY as CHUNK_CAPACITY
+from .CachedQuery import CachedQuery as CachedQuery
 from .ComponentStorage import ComponentStorage as ComponentStorage
+from .EventChannel import EventChannel as EventChannel, SchemaEventChannel as SchemaEventChannel, event_channel as event_channel
+from .Observer import Observer as Observer, ObserverCallback as ObserverCallback, ObserverEvent as ObserverEvent
+from .Prefab import Cloner as Cloner, Prefab as Prefab, prototype_cloner as prototype_cloner
+from .RelationshipIndex import RelationshipIndex as RelationshipIndex
+from .StorageCounters import COUNTER_FIELDS as COUNTER_FIELDS, StorageCounters as StorageCounters
 
-__all__ = ['Archetype', 'ComponentStorage']
+__all__ = ['CHUNK_CAPACITY', 'COUNTER_FIELDS', 'Archetype', 'ArchetypeChunk', 'ArchetypeColumn', 'ArchetypeColumns', 'ArchetypeEntities', 'CachedQuery', 'Cloner', 'ComponentStorage', 'EventChannel', 'Observer', 'ObserverCallback', 'ObserverEvent', 'Prefab', 'RelationshipIndex', 'SchemaEventChannel', 'StorageCounters', 'event_channel', 'prototype_cloner']
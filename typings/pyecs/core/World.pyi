@@ -1,25 +1,66 @@
+from collections.abc import Iterator, Mapping, Sequence
+from pyecs.common.Relationship import ChildOf as ChildOf, Relationship as Relationship
 from pyecs.common.Types import Component as Component, Entity as Entity
-from pyecs.containers.Archetype import Archetype as Archetype
+from pyecs.containers.ArchetypeChunk import CHUNK_CAPACITY as CHUNK_CAPACITY
 from pyecs.containers.ComponentStorage import ComponentStorage as ComponentStorage
+from pyecs.containers.EventChannel import EventChannel as EventChannel
+from pyecs.containers.Observer import Observer as Observer, ObserverCallback as ObserverCallback
+from pyecs.containers.Prefab import Prefab as Prefab
+from pyecs.exporting.Export import ArchetypeExport as ArchetypeExport
+from pyecs.exporting.Shared import SharedWorldWriter as SharedWorldWriter
 from pyecs.helpers.Deprecation import warn_deprecated as warn_deprecated
 from pyecs.helpers.Statuses import StatusCodes as StatusCodes
 from pyecs.helpers.Unsafe import auto_unsafe as auto_unsafe
 from pyecs.managers.EntityManager import EntityManager as EntityManager
+from pyecs.managers.EventManager import EventManager as EventManager
 from pyecs.managers.SystemManager import SystemManager as SystemManager
+from pyecs.processing.FrameBudget import FrameBudget as FrameBudget, MAX_DEFERRED_FRAMES as MAX_DEFERRED_FRAMES
+from pyecs.processing.Scheduler import DEFAULT_TICK_RATE as DEFAULT_TICK_RATE, FixedStepScheduler as FixedStepScheduler, MAX_CATCH_UP_STEPS as MAX_CATCH_UP_STEPS
 from pyecs.processing.System import System as System
+from pyecs.profiling.Memory import MEMORY_SAMPLE_SIZE as MEMORY_SAMPLE_SIZE, memory_report as memory_report
+from pyecs.profiling.Trace import TraceRecorder as TraceRecorder, TraceStream as TraceStream
 from typing import Literal
 
 class ECSWorld:
     entity_manager: EntityManager
     component_storage: ComponentStorage
     system_manager: SystemManager
-    def __init__(self) -> None: ...
+    event_manager: EventManager
+    shared_writer: SharedWorldWriter | None
+    shared_component_types: tuple[type[Component], ...]
+    trace_recorder: TraceRecorder | None
+    scheduler: FixedStepScheduler
+    def __init__(self, chunk_capacity: int = ...) -> None: ...
     def create_entity(self) -> Entity | Literal[StatusCodes.FAILURE]: ...
+    def instantiate(self, prefab: Prefab, count: int = 1, overrides: Mapping[type[Component], Sequence[Component]] | None = None) -> list[Entity] | Literal[StatusCodes.FAILURE]: ...
     def destroy_entity(self, entity: Entity) -> None: ...
     def add_component(self, entity: Entity, component: Component) -> None: ...
     def remove_component(self, entity: Entity, component_type: type[Component]) -> None: ...
+    def set_enabled(self, entity: Entity, enabled: bool) -> None: ...
     def get_component(self, entity: Entity, component_type: type[Component]) -> Component | Literal[StatusCodes.FAILURE]: ...
     def get_components(self, entity: Entity, *component_types: type[Component]) -> tuple[Component, ...] | Literal[StatusCodes.FAILURE]: ...
+    def send_event(self, event: object) -> None: ...
+    def read_events[T](self, event_type: type[T]) -> Iterator[T]: ...
+    def event_channel[T](self, event_type: type[T]) -> EventChannel[T]: ...
+    def children_of(self, parent: Entity, relation_type: type[Relationship] = ...) -> list[Entity]: ...
+    def parent_of(self, child: Entity, relation_type: type[Relationship] = ...) -> Entity | None: ...
+    def observe(self, callback: ObserverCallback, *, on_add: type[Component] | None = None, on_remove: type[Component] | None = None, batched: bool = False) -> Observer: ...
+    def unobserve(self, observer: Observer) -> None: ...
+    def flush_observers(self) -> None: ...
     def add_system(self, system: System) -> None: ...
     def remove_system(self, system: System) -> None: ...
     def update(self, dt: float) -> None: ...
+    async def update_async(self, dt: float) -> None: ...
+    def step(self, elapsed: float | int) -> int: ...
+    def set_timestep(self, tick_rate: float | int = ..., max_steps: int = ...) -> None: ...
+    def set_frame_budget(self, budget: float | int | None, max_deferred: int = ...) -> None: ...
+    def set_profiling(self, enabled: bool) -> None: ...
+    def stats(self) -> dict[str, object]: ...
+    def metrics(self) -> dict[str, object]: ...
+    def memory_report(self, sample_size: int = ...) -> dict[str, object]: ...
+    def export_columns(self, *component_types: type[Component]) -> list[ArchetypeExport]: ...
+    def share_columns(self, *component_types: type[Component], name: str | None = None) -> SharedWorldWriter: ...
+    def stop_sharing(self) -> None: ...
+    def start_recording(self, stream: TraceStream) -> TraceRecorder: ...
+    def stop_recording(self) -> None: ...
+    def fork(self) -> ECSWorld: ...
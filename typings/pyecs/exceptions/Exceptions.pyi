@@ -2,3 +2,4 @@ class PyECSError(Exception): ...
 class EntityNotFoundError(PyECSError): ...
 class ComponentNotFoundError(PyECSError): ...
 class OperationFailedError(PyECSError): ...
+class SystemOrderError(PyECSError): ...
@@ -1,3 +1,3 @@
-from .Exceptions import ComponentNotFoundError as ComponentNotFoundError, EntityNotFoundError as EntityNotFoundError, OperationFailedError as OperationFailedError, PyECSError as PyECSError
+from .Exceptions import ComponentNotFoundError as ComponentNotFoundError, EntityNotFoundError as EntityNotFoundError, OperationFailedError as OperationFailedError, PyECSError as PyECSError, SystemOrderError as SystemOrderError
 
-__all__ = ['ComponentNotFoundError', 'EntityNotFoundError', 'OperationFailedError', 'PyECSError']
+__all__ = ['ComponentNotFoundError', 'EntityNotFoundError', 'OperationFailedError', 'PyECSError', 'SystemOrderError']
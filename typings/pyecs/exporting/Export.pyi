@@ -0,0 +1,21 @@
+import numpy
+import pyarrow
+from collections.abc import Iterable, Sequence
+from pyecs.common.Types import Component as Component, Entity as Entity
+from pyecs.containers.Archetype import Archetype as Archetype
+from pyecs.exceptions import OperationFailedError as OperationFailedError
+
+FIELD_TYPECODES: dict[type, str]
+
+def component_schema(component_type: type[Component]) -> dict[str, str]: ...
+def pack_column(components: Iterable[Component], field: str, typecode: str) -> memoryview: ...
+
+class ArchetypeExport:
+    entities: Sequence[Entity]
+    columns: dict[str, memoryview]
+    def __init__(self, entities: Sequence[Entity], columns: dict[str, memoryview]) -> None: ...
+    @classmethod
+    def from_archetype(cls, archetype: Archetype, component_types: Iterable[type[Component]]) -> ArchetypeExport: ...
+    def column(self, component_type: type[Component], field: str) -> memoryview: ...
+    def to_numpy(self) -> dict[str, numpy.ndarray]: ...
+    def to_arrow(self) -> pyarrow.RecordBatch: ...
@@ -0,0 +1,57 @@
+from collections.abc import Sequence
+from multiprocessing.shared_memory import SharedMemory
+from pyecs.common.Types import Entity as Entity
+from pyecs.exceptions import OperationFailedError as OperationFailedError
+from pyecs.exporting.Export import ArchetypeExport as ArchetypeExport
+from types import TracebackType
+from typing import TypedDict, overload, override
+
+HEADER_SIZE: int
+HEADER_FORMAT: str
+ENTITY_ID_SIZE: int
+ALIGNMENT: int
+
+class ArchetypeLayout(TypedDict):
+    count: int
+    entities: int
+    columns: dict[str, tuple[int, str]]
+
+class FrameLayout(TypedDict):
+    segment: str
+    archetypes: list[ArchetypeLayout]
+
+class SharedEntityIds(Sequence[Entity]):
+    def __init__(self, view: memoryview, count: int) -> None: ...
+    @override
+    def __len__(self) -> int: ...
+    @overload
+    def __getitem__(self, index: int) -> Entity: ...
+    @overload
+    def __getitem__(self, index: slice) -> list[Entity]: ...
+
+class SharedWorldWriter:
+    header: SharedMemory
+    name: str
+    sequence: int
+    def __init__(self, name: str | None = None, header_size: int = ...) -> None: ...
+    def publish(self, exports: list[ArchetypeExport]) -> int: ...
+    def close(self) -> None: ...
+    def __enter__(self) -> SharedWorldWriter: ...
+    def __exit__(self, exc_type: type[BaseException] | None, exc_value: BaseException | None, traceback: TracebackType | None) -> None: ...
+
+class SharedFrame:
+    reader: SharedWorldReader
+    sequence: int
+    archetypes: list[ArchetypeExport]
+    def __init__(self, reader: SharedWorldReader, sequence: int, archetypes: list[ArchetypeExport]) -> None: ...
+    def valid(self) -> bool: ...
+
+class SharedWorldReader:
+    name: str
+    header: SharedMemory
+    def __init__(self, name: str) -> None: ...
+    def current_sequence(self) -> int: ...
+    def read(self, timeout: float | None = None) -> SharedFrame: ...
+    def close(self) -> None: ...
+    def __enter__(self) -> SharedWorldReader: ...
+    def __exit__(self, exc_type: type[BaseException] | None, exc_value: BaseException | None, traceback: TracebackType | None) -> None: ...
@@ -0,0 +1,4 @@
+from .Export import ArchetypeExport as ArchetypeExport, component_schema as component_schema, pack_column as pack_column
+from .Shared import SharedEntityIds as SharedEntityIds, SharedFrame as SharedFrame, SharedWorldReader as SharedWorldReader, SharedWorldWriter as SharedWorldWriter
+
+__all__ = ['ArchetypeExport', 'SharedEntityIds', 'SharedFrame', 'SharedWorldReader', 'SharedWorldWriter', 'component_schema', 'pack_column']
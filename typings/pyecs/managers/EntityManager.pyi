@@ -6,5 +6,7 @@ class EntityManager:
     alive_entities: set[UUID4]
     def __init__(self) -> None: ...
     def create_entity(self) -> tuple[Literal[StatusCodes.ENTITY_CREATED], Entity] | Literal[StatusCodes.FAILURE]: ...
+    def create_entities(self, count: int) -> list[Entity]: ...
     def destroy_entity(self, entity: Entity) -> Literal[StatusCodes.ENTITY_DESTROYED, StatusCodes.FAILURE]: ...
     def is_alive(self, entity: Entity) -> bool: ...
+    def fork(self) -> EntityManager: ...
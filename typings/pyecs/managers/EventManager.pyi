@@ -0,0 +1,11 @@
+from collections.abc import Iterator
+from pyecs.containers.EventChannel import EventChannel as EventChannel, event_channel as event_channel
+
+class EventManager:
+    channels: dict[type, EventChannel[object]]
+    def __init__(self) -> None: ...
+    def channel[T](self, event_type: type[T]) -> EventChannel[T]: ...
+    def send(self, event: object) -> None: ...
+    def read[T](self, event_type: type[T]) -> Iterator[T]: ...
+    def swap(self) -> None: ...
+    def fork(self) -> EventManager: ...
@@ -1,14 +1,45 @@
-from pyecs.common.Types import UUID4 as UUID4
+from collections.abc import Coroutine
+from concurrent.futures import ProcessPoolExecutor
+from pyecs.common.Types import Component as Component, UUID4 as UUID4
+from pyecs.containers.Archetype import Archetype as Archetype
+from pyecs.containers.CachedQuery import CachedQuery as CachedQuery
 from pyecs.helpers.Statuses import StatusCodes as StatusCodes
-from pyecs.processing.System import System as System
+from pyecs.processing.ExecutionPlan import ExecutionPlan as ExecutionPlan, SystemBatch as SystemBatch, build_batches as build_batches, build_plan as build_plan
+from pyecs.processing.FrameBudget import DEFAULT_PRIORITY as DEFAULT_PRIORITY, FrameBudget as FrameBudget, system_priority as system_priority
+from pyecs.processing.Parallel import Kernel as Kernel, PROCESS_CHUNK_SIZE as PROCESS_CHUNK_SIZE, RowChunk as RowChunk, detached as detached, merge_rows as merge_rows, partition_rows as partition_rows
+from pyecs.processing.System import System as System, SystemPhase as SystemPhase, accepts_archetypes as accepts_archetypes, declared_components as declared_components, is_async_system as is_async_system, system_phase as system_phase
+from pyecs.processing.SystemSchedule import SystemSchedule as SystemSchedule, declared_schedule as declared_schedule
+from pyecs.profiling.SystemProfiler import SystemProfiler as SystemProfiler
 from typing import Literal
 
 class SystemManager:
-    systems: list[System]
     system_to_id: dict[System, UUID4]
     id_to_system: dict[UUID4, System]
-    def __init__(self) -> None: ...
+    process_workers: int | None
+    process_start_method: str | None
+    profiler: SystemProfiler
+    schedules: dict[System, SystemSchedule]
+    queries: dict[System, CachedQuery]
+    archetype_systems: set[System]
+    async_systems: set[System]
+    deferrable: set[System]
+    budget: FrameBudget | None
+    def __init__(self, process_workers: int | None = None, process_start_method: str | None = None) -> None: ...
+    @property
+    def systems(self) -> tuple[System, ...]: ...
+    def execution_plan(self) -> ExecutionPlan: ...
+    def execution_order(self) -> tuple[System, ...]: ...
+    def execution_batches(self) -> list[SystemBatch]: ...
     def register_system(self, system: System) -> tuple[Literal[StatusCodes.SYSTEM_REGISTERED], System] | Literal[StatusCodes.FAILURE]: ...
     def unregister_system(self, id: UUID4) -> Literal[StatusCodes.SYSTEM_UNREGISTERED, StatusCodes.FAILURE]: ...
     def remove_system(self, system: System) -> Literal[StatusCodes.SYSTEM_UNREGISTERED, StatusCodes.FAILURE]: ...
-    def update_all(self, world, dt: float) -> None: ...
+    def fork(self) -> SystemManager: ...
+    def start_frame(self) -> None: ...
+    def end_frame(self) -> None: ...
+    def update_all(self, world, dt: float, phase: SystemPhase | None = None) -> None: ...
+    def update_all_profiled(self, world, dt: float, phase: SystemPhase | None = None) -> None: ...
+    async def update_all_async(self, world, dt: float, phase: SystemPhase | None = None) -> None: ...
+    def invoke(self, system: System, world, dt: float) -> Coroutine[object, object, None] | None: ...
+    def run_process_parallel(self, system: System, world, dt: float) -> None: ...
+    def process_pool(self) -> ProcessPoolExecutor: ...
+    def shutdown_process_pool(self) -> None: ...
@@ -1,4 +1,5 @@
 from .EntityManager import EntityManager as EntityManager
+from .EventManager import EventManager as EventManager
 from .SystemManager import SystemManager as SystemManager
 
-__all__ = ['EntityManager', 'SystemManager']
+__all__ = ['EntityManager', 'EventManager', 'SystemManager']
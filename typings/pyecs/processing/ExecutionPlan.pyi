@@ -0,0 +1,13 @@
+from pyecs.exceptions import SystemOrderError as SystemOrderError
+from pyecs.processing.System import System as System
+from typing import Literal
+
+type SystemStage = Literal['pre_update', 'update', 'post_update']
+STAGES: tuple[SystemStage, ...]
+type ExecutionPlan = list[tuple[SystemStage, list[System]]]
+type SystemBatch = tuple[bool, list[System]]
+
+def system_stage(system: System) -> SystemStage: ...
+def constrained(first: System, second: System) -> bool: ...
+def build_plan(systems: list[System]) -> ExecutionPlan: ...
+def build_batches(plan: ExecutionPlan, async_systems: set[System]) -> list[SystemBatch]: ...
@@ -0,0 +1,27 @@
+DEFAULT_PRIORITY: int
+MAX_DEFERRED_FRAMES: int
+COST_SMOOTHING: float
+
+def system_priority(system: object) -> int: ...
+
+class FrameBudget:
+    budget: float | int
+    budget_ns: int
+    max_deferred: int
+    frame_start: int
+    costs: dict[object, float]
+    deferred: dict[object, int]
+    owed: dict[object, float | int]
+    frames: int
+    deferrals: int
+    overruns: int
+    last_frame_ns: int
+    def __init__(self, budget: float | int, max_deferred: int = ...) -> None: ...
+    def start_frame(self) -> None: ...
+    def end_frame(self) -> None: ...
+    def remaining(self) -> float: ...
+    def admit(self, system: object, dt: float | int) -> float | int | None: ...
+    def record(self, system: object, elapsed_ns: int) -> None: ...
+    def forget(self, system: object) -> None: ...
+    def snapshot(self) -> dict[str, object]: ...
+    def fork(self) -> FrameBudget: ...
@@ -0,0 +1,19 @@
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass, field
+from pyecs.common.Types import Component as Component, Entity as Entity
+from pyecs.containers.Archetype import Archetype as Archetype
+from pyecs.exceptions import OperationFailedError as OperationFailedError
+from pyecs.helpers.Statuses import StatusCodes as StatusCodes
+
+PROCESS_CHUNK_SIZE: int
+
+@dataclass
+class RowChunk:
+    entities: list[Entity]
+    columns: dict[type, list[Component]] = field(default_factory=dict)
+type Kernel = Callable[[RowChunk, float], dict[type, list[Component]]]
+
+def partition_rows(archetype: Archetype, component_types: frozenset[type], chunk_size: int) -> Iterator[tuple[int, RowChunk]]: ...
+def enabled_runs(enabled: bytearray) -> Iterator[tuple[int, int]]: ...
+def detached(chunk: RowChunk) -> RowChunk: ...
+def merge_rows(archetype: Archetype, start: int, count: int, written: dict[type, list[Component]]) -> None: ...
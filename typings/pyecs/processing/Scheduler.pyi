@@ -0,0 +1,16 @@
+DEFAULT_TICK_RATE: int
+MAX_CATCH_UP_STEPS: int
+STEP_EPSILON: float
+
+class FixedStepScheduler:
+    tick_rate: float | int
+    step: float
+    max_steps: int
+    accumulator: float
+    alpha: float
+    ticks: int
+    frames: int
+    dropped_steps: int
+    def __init__(self, tick_rate: float | int = ..., max_steps: int = ...) -> None: ...
+    def advance(self, elapsed: float | int) -> int: ...
+    def fork(self) -> FixedStepScheduler: ...
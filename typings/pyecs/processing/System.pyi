@@ -1,9 +1,15 @@
 from pyecs.core.World import ECSWorld as ECSWorld
-from typing import Protocol
+from typing import Literal, Protocol
 
+type SystemPhase = Literal['fixed', 'frame']
 class System(Protocol):
     @property
     def required_components(self) -> set[type]: ...
     def init(self, world) -> None: ...
     def update(self, world, dt: float) -> None: ...
     def cleanup(self, world) -> None: ...
+
+def declared_components(system: System) -> frozenset[type] | None: ...
+def system_phase(system: System) -> SystemPhase: ...
+def accepts_archetypes(system: System) -> bool: ...
+def is_async_system(system: System) -> bool: ...
@@ -0,0 +1,20 @@
+from collections.abc import Callable
+
+STAGGER_RATIO: float
+type RunCondition = Callable[..., bool]
+
+class SystemSchedule:
+    tick_interval: int
+    time_interval: float | int
+    condition: RunCondition | None
+    offset: int
+    calls: int
+    elapsed: float | int
+    head_start: float | int
+    runs: int
+    def __init__(self, tick_interval: int = 1, time_interval: float | int = 0.0, condition: RunCondition | None = None, offset: int = 0, elapsed: float | int = 0.0, head_start: float | int = 0.0) -> None: ...
+    def stagger(self, index: int) -> None: ...
+    def due(self, world: object, dt: float | int) -> float | int | None: ...
+    def fork(self) -> SystemSchedule: ...
+
+def declared_schedule(system: object) -> SystemSchedule | None: ...
@@ -0,0 +1,30 @@
+from pyecs.common.Relationship import ChildOf as ChildOf
+from pyecs.common.Transform import GlobalTransform as GlobalTransform, LocalTransform as LocalTransform
+from pyecs.common.Types import Entity as Entity
+from pyecs.containers.Archetype import Archetype as Archetype
+from pyecs.containers.ArchetypeChunk import ArchetypeChunk as ArchetypeChunk
+from pyecs.containers.CachedQuery import CachedQuery as CachedQuery
+from pyecs.containers.ComponentStorage import ComponentStorage as ComponentStorage
+from pyecs.core.World import ECSWorld as ECSWorld
+from pyecs.processing.ExecutionPlan import SystemStage as SystemStage
+
+class TransformSystem:
+    stage: SystemStage
+    query: CachedQuery
+    storage: ComponentStorage | None
+    relationships_version: int
+    versions: dict[ArchetypeChunk, int]
+    locals: dict[Entity, LocalTransform]
+    globals: dict[Entity, GlobalTransform]
+    parents: dict[Entity, Entity | None]
+    children: dict[Entity, list[Entity]]
+    depths: dict[Entity, int]
+    levels: list[list[Entity]]
+    rebuilds: int
+    last_updated: int
+    def __init__(self) -> None: ...
+    @property
+    def required_components(self) -> set[type]: ...
+    def init(self, world: ECSWorld) -> None: ...
+    def update(self, world: ECSWorld, dt: float | int, archetypes: list[Archetype] | None = None) -> None: ...
+    def cleanup(self, world: ECSWorld) -> None: ...
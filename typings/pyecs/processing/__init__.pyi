@@ -1,3 +1,8 @@
-from .System import System as System
+from .ExecutionPlan import ExecutionPlan as ExecutionPlan, STAGES as STAGES, SystemBatch as SystemBatch, SystemStage as SystemStage, build_batches as build_batches, build_plan as build_plan, constrained as constrained, system_stage as system_stage
+from .FrameBudget import DEFAULT_PRIORITY as DEFAULT_PRIORITY, FrameBudget as FrameBudget, MAX_DEFERRED_FRAMES as MAX_DEFERRED_FRAMES, system_priority as system_priority
+from .Parallel import Kernel as Kernel, PROCESS_CHUNK_SIZE as PROCESS_CHUNK_SIZE, RowChunk as RowChunk, detached as detached, enabled_runs as enabled_runs, merge_rows as merge_rows, partition_rows as partition_rows
+from .Scheduler import DEFAULT_TICK_RATE as DEFAULT_TICK_RATE, FixedStepScheduler as FixedStepScheduler, MAX_CATCH_UP_STEPS as MAX_CATCH_UP_STEPS
+from .System import System as System, SystemPhase as SystemPhase, accepts_archetypes as accepts_archetypes, declared_components as declared_components, is_async_system as is_async_system, system_phase as system_phase
+from .SystemSchedule import RunCondition as RunCondition, SystemSchedule as SystemSchedule, declared_schedule as declared_schedule
 
-__all__ = ['System']
+__all__ = ['DEFAULT_PRIORITY', 'DEFAULT_TICK_RATE', 'MAX_CATCH_UP_STEPS', 'MAX_DEFERRED_FRAMES', 'PROCESS_CHUNK_SIZE', 'STAGES', 'ExecutionPlan', 'FixedStepScheduler', 'FrameBudget', 'Kernel', 'RowChunk', 'RunCondition', 'System', 'SystemBatch', 'SystemPhase', 'SystemSchedule', 'SystemStage', 'accepts_archetypes', 'build_batches', 'build_plan', 'constrained', 'declared_components', 'declared_schedule', 'detached', 'enabled_runs', 'is_async_system', 'merge_rows', 'partition_rows', 'system_phase', 'system_priority', 'system_stage']
@@ -0,0 +1,15 @@
+SUB_BUCKET_BITS: int
+SUB_BUCKETS: int
+
+class LatencyHistogram:
+    counts: list[int]
+    count: int
+    total: int
+    min: int
+    max: int
+    def __init__(self) -> None: ...
+    def record(self, value: int) -> None: ...
+    def percentile(self, percent: float | int) -> int: ...
+    def mean(self) -> float: ...
+    def merge(self, other: LatencyHistogram) -> None: ...
+    def to_dict(self) -> dict[str, float | int]: ...
@@ -0,0 +1,12 @@
+from pyecs.containers.Archetype import Archetype as Archetype
+from pyecs.containers.ComponentStorage import ComponentStorage as ComponentStorage
+
+MEMORY_SAMPLE_SIZE: int
+POINTER_SIZE: int
+
+def deep_sizeof(obj: object, seen: set[int] | None = None) -> int: ...
+def sampled_sizeof(items: list[object], sample_size: int = ..., seen: set[int] | None = None) -> tuple[int, bool]: ...
+def list_capacity(items: list[object]) -> int: ...
+def column_report(archetype: Archetype, sample_size: int = ...) -> dict[str, dict[str, int]]: ...
+def archetype_report(archetype: Archetype, sample_size: int = ...) -> dict[str, object]: ...
+def memory_report(storage: ComponentStorage, sample_size: int = ...) -> dict[str, object]: ...
@@ -0,0 +1,28 @@
+from collections import deque
+from pyecs.common.Types import UUID4 as UUID4
+from pyecs.profiling.Histogram import LatencyHistogram as LatencyHistogram
+
+FRAME_HISTORY: int
+
+class SystemStats:
+    system_id: UUID4
+    name: str
+    calls: int
+    entities: int
+    last_ns: int
+    histogram: LatencyHistogram
+    def __init__(self, system_id: UUID4, name: str) -> None: ...
+    def to_dict(self) -> dict[str, object]: ...
+
+class SystemProfiler:
+    enabled: bool
+    frames: int
+    systems: dict[UUID4, SystemStats]
+    frame_histogram: LatencyHistogram
+    history: deque[dict[str, int]]
+    def __init__(self, enabled: bool = False, frame_history: int = ...) -> None: ...
+    def record_system(self, system_id: UUID4, name: str, elapsed_ns: int, entities: int) -> None: ...
+    def record_frame(self, elapsed_ns: int) -> None: ...
+    def reset(self) -> None: ...
+    def snapshot(self) -> dict[str, object]: ...
+    def to_json(self, indent: int | None = None) -> str: ...
@@ -0,0 +1,52 @@
+import io
+from collections.abc import Iterable, Iterator
+from enum import IntEnum
+from pyecs.common.Relationship import Relationship as Relationship
+from pyecs.common.Types import Component as Component, Entity as Entity
+from pyecs.containers.ComponentStorage import ComponentStorage as ComponentStorage
+
+TRACE_MAGIC: bytes
+TRACE_VERSION: int
+MARSHAL_VERSION: int
+TYPE_RELATIONSHIP: int
+TYPE_CASCADE: int
+type TraceRecord = tuple['TraceOp', tuple[object, ...]]
+type TraceStream = io.BufferedIOBase | io.RawIOBase
+
+class TraceOp(IntEnum):
+    TYPE = 1
+    CREATE = 2
+    DESTROY = 3
+    ADD = 4
+    REMOVE = 5
+    GET = 6
+    ENABLE = 7
+    QUERY = 8
+    UPDATE = 9
+    SNAPSHOT = 10
+    FIELDS = 11
+
+def component_fields(component: Component) -> tuple[str, ...]: ...
+def encode_values(values: list[object]) -> bytes: ...
+
+class TraceRecorder:
+    stream: TraceStream
+    entity_ids: dict[Entity, int]
+    type_ids: dict[type, int]
+    type_fields: dict[type, tuple[str, ...]]
+    operations: int
+    def __init__(self, stream: TraceStream) -> None: ...
+    def record_create(self, entity: Entity) -> None: ...
+    def record_destroy(self, entity: Entity) -> None: ...
+    def record_add(self, entity: Entity, component: Component) -> None: ...
+    def record_remove(self, entity: Entity, component_type: type[Component]) -> None: ...
+    def record_get(self, entity: Entity, component_types: Iterable[type[Component]]) -> None: ...
+    def record_enabled(self, entity: Entity, enabled: bool) -> None: ...
+    def record_query(self, with_types: Iterable[type[Component]], without_types: Iterable[type[Component]]) -> None: ...
+    def record_update(self, dt: float | int) -> None: ...
+    def snapshot(self, storage: ComponentStorage) -> None: ...
+    def flush(self) -> None: ...
+
+def stand_in_type(name: str, flags: int = 0) -> type: ...
+def decode_component(component_type: type, fields: tuple[str, ...], values: tuple[object, ...]) -> Component: ...
+def read_trace(stream: TraceStream) -> Iterator[TraceRecord]: ...
@@ -0,0 +1,51 @@
+from _typeshed import Incomplete
+from collections import deque
+from pyecs.containers.Archetype import Archetype as Archetype
+from pyecs.containers.ComponentStorage import ComponentStorage as ComponentStorage
+from pyecs.core.World import ECSWorld as ECSWorld
+from pyecs.managers.SystemManager import SystemManager as SystemManager
+from pyecs.profiling.SystemProfiler import FRAME_HISTORY as FRAME_HISTORY
+from pyecs.querying.Query import Query as Query
+from types import CodeType
+from typing import Literal, NamedTuple
+
+type TraceFormat = Literal['chrome', 'collapsed']
+MONITORING: Incomplete
+SPAN_EVENTS: int
+unchecked: Incomplete
+
+class Span(NamedTuple):
+    name: str
+    thread: int
+    start_ns: int
+    duration_ns: int
+    self_ns: int
+    depth: int
+    stack: tuple[str, ...]
+
+class OpenSpan:
+    code: CodeType
+    start_ns: int
+    children_ns: int
+    path: tuple[str, ...]
+    def __init__(self, code: CodeType, start_ns: int, path: tuple[str, ...]) -> None: ...
+
+def traced_classes() -> tuple[type, ...]: ...
+def code_objects(target: object) -> list[CodeType]: ...
+
+class MonitoringTracer:
+    tool_id: int | None
+    codes: dict[CodeType, str]
+    frame_codes: set[CodeType]
+    frames: deque[list[Span]]
+    def __init__(self, frame_history: int = ...) -> None: ...
+    @property
+    def attached(self) -> bool: ...
+    def instrument(self, *targets: object) -> None: ...
+    def attach(self, world: ECSWorld | None = None) -> None: ...
+    def detach(self) -> None: ...
+    def reset(self) -> None: ...
+    def spans(self) -> list[Span]: ...
+    def to_chrome_trace(self) -> dict[str, object]: ...
+    def to_collapsed(self) -> str: ...
+    def save(self, path: str, format: TraceFormat = 'chrome') -> None: ...
@@ -0,0 +1,6 @@
+from .Histogram import LatencyHistogram as LatencyHistogram
+from .Memory import MEMORY_SAMPLE_SIZE as MEMORY_SAMPLE_SIZE, archetype_report as archetype_report, column_report as column_report, deep_sizeof as deep_sizeof, memory_report as memory_report, sampled_sizeof as sampled_sizeof
+from .SystemProfiler import SystemProfiler as SystemProfiler, SystemStats as SystemStats
+from .Trace import TraceOp as TraceOp, TraceRecorder as TraceRecorder, read_trace as read_trace
+
+__all__ = ['MEMORY_SAMPLE_SIZE', 'LatencyHistogram', 'SystemProfiler', 'SystemStats', 'TraceOp', 'TraceRecorder', 'archetype_report', 'column_report', 'deep_sizeof', 'memory_report', 'read_trace', 'sampled_sizeof']
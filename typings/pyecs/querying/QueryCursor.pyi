@@ -0,0 +1,23 @@
+from collections.abc import Iterable, Iterator
+from pyecs.common.Types import Entity as Entity
+from pyecs.containers.Archetype import Archetype as Archetype
+from pyecs.containers.ArchetypeChunk import ArchetypeChunk as ArchetypeChunk
+from pyecs.containers.CachedQuery import CachedQuery as CachedQuery
+from pyecs.core.World import ECSWorld as ECSWorld
+from typing import NamedTuple
+
+class CursorSlice(NamedTuple):
+    archetype: Archetype
+    chunk: ArchetypeChunk
+    start: int
+    stop: int
+    def entities(self) -> list[Entity]: ...
+
+class QueryCursor:
+    query: CachedQuery
+    archetype_index: int
+    row: int | None
+    sweeps: int
+    def __init__(self, with_types: Iterable[type], without_types: Iterable[type] = ()) -> None: ...
+    def reset(self) -> None: ...
+    def advance(self, world: ECSWorld, max_rows: int | None = None, max_time: float | int | None = None) -> Iterator[CursorSlice]: ...
@@ -1,3 +1,4 @@
 from .Query import Query as Query
+from .QueryCursor import CursorSlice as CursorSlice, QueryCursor as QueryCursor
 
-__all__ = ['Query']
+__all__ = ['CursorSlice', 'Query', 'QueryCursor']